@@ -11,3 +11,9 @@ class AdminToolsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.admin_tools"
     verbose_name = "Admin Tools"
+
+    def ready(self):
+        """Connect Celery task profiling hooks."""
+        from .profiling import connect_task_signals
+
+        connect_task_signals()
@@ -0,0 +1,277 @@
+"""
+Request and database query metrics.
+
+PerformanceMonitoringMiddleware installs a QueryCollector on the database
+connections for the duration of each request (connection.execute_wrapper), so
+queries are counted and timed without DEBUG or connection.queries. Statements
+are fingerprinted to spot the same query repeated many times in one request,
+which is how N+1 access patterns show up.
+
+Per-view latency and query histograms are rendered in the Prometheus text
+format by metrics_view. Production runs several gunicorn workers behind one
+scrape target, so with the Redis cache backend the series are shared: every
+request adds its observations to one Redis hash per metric (HINCRBYFLOAT, one
+pipelined round trip), and whichever worker answers the scrape reports the
+totals of all of them. Other cache backends (tests, local development) fall
+back to a process-local registry, which is only complete with a single
+process.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_sql(sql: str) -> str:
+    """
+    Normalize a statement so repeats with different values compare equal.
+
+    Django passes SQL with %s placeholders, so mostly IN lists of varying
+    length and inlined literals need collapsing.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryCollector:
+    """connection.execute_wrapper that counts and times a request's queries."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint_sql(sql)] += 1
+
+    def repeated(self, threshold: int) -> Optional[Tuple[str, int]]:
+        """Most repeated statement if it ran at least threshold times."""
+        if not self.fingerprints:
+            return None
+        sql, count = self.fingerprints.most_common(1)[0]
+        return (sql, count) if count >= threshold else None
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+
+def _redis_client():
+    """Raw redis-py client of the default cache, if it is Redis-backed."""
+    try:
+        from django.core.cache.backends.redis import RedisCache
+    except ImportError:  # pragma: no cover
+        return None
+
+    if not isinstance(cache, RedisCache):
+        return None
+    return cache._cache.get_client(write=True)
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    parts = []
+    for name, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        parts.append(f'{name}="{value}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # labels -> [bucket counts..., count, sum]
+        self._series: Dict[tuple, list] = {}
+
+    def increments(self, value: float) -> List[Tuple[int, float]]:
+        """(slot, amount) pairs that one observation adds to its series."""
+        slots = [
+            (index, 1) for index, bound in enumerate(self.buckets) if value <= bound
+        ]
+        return slots + [(len(self.buckets), 1), (len(self.buckets) + 1, value)]
+
+    def add(self, labels: tuple, slot: int, amount: float):
+        # Caller holds the registry lock
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[slot] += amount if slot > len(self.buckets) else int(amount)
+
+    def observe(self, labels: tuple, value: float):
+        for slot, amount in self.increments(value):
+            self.add(labels, slot, amount)
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, series in sorted(self._series.items()):
+            pairs = list(zip(self.label_names, labels))
+            for bound, count in zip(self.buckets, series):
+                bucket_labels = _format_labels(pairs + [("le", bound)])
+                yield f"{self.name}_bucket{bucket_labels} {count}"
+            inf_labels = _format_labels(pairs + [("le", "+Inf")])
+            yield f"{self.name}_bucket{inf_labels} {series[-2]}"
+            yield f"{self.name}_count{_format_labels(pairs)} {series[-2]}"
+            yield f"{self.name}_sum{_format_labels(pairs)} {series[-1]:.6f}"
+
+
+class CounterMetric:
+    def __init__(self, name: str, help_text: str, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._series: Dict[tuple, float] = {}
+
+    def add(self, labels: tuple, slot: int, amount: float):
+        self._series[labels] = self._series.get(labels, 0) + amount
+
+    def inc(self, labels: tuple, amount: float = 1):
+        self.add(labels, 0, amount)
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in sorted(self._series.items()):
+            pairs = list(zip(self.label_names, labels))
+            yield f"{self.name}{_format_labels(pairs)} {value:g}"
+
+
+class RequestMetrics:
+    """Request metrics, shared across processes through Redis when available."""
+
+    KEY = "request_metrics:{name}"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "Request latency by view.",
+            ("view", "method", "status"),
+            DURATION_BUCKETS,
+        )
+        self.request_queries = Histogram(
+            "http_request_db_queries",
+            "Database queries per request by view.",
+            ("view", "method"),
+            QUERY_COUNT_BUCKETS,
+        )
+        self.query_duration = CounterMetric(
+            "http_request_db_query_seconds_total",
+            "Time spent in database queries by view.",
+            ("view", "method"),
+        )
+        self.repeated_queries = CounterMetric(
+            "http_request_repeated_queries_total",
+            "Requests that ran one statement at least N_PLUS_ONE_THRESHOLD times.",
+            ("view", "method"),
+        )
+
+    @property
+    def metrics(self):
+        return (
+            self.request_duration,
+            self.request_queries,
+            self.query_duration,
+            self.repeated_queries,
+        )
+
+    def _key(self, metric) -> str:
+        return cache.make_key(self.KEY.format(name=metric.name))
+
+    def record(
+        self,
+        view: str,
+        method: str,
+        status: int,
+        duration: float,
+        collector: QueryCollector,
+        repeated: bool = False,
+    ):
+        status_class = f"{status // 100}xx"
+        updates = [
+            (self.request_duration, (view, method, status_class), slot, amount)
+            for slot, amount in self.request_duration.increments(duration)
+        ]
+        updates += [
+            (self.request_queries, (view, method), slot, amount)
+            for slot, amount in self.request_queries.increments(collector.count)
+        ]
+        updates.append((self.query_duration, (view, method), 0, collector.duration))
+        if repeated:
+            updates.append((self.repeated_queries, (view, method), 0, 1))
+
+        client = _redis_client()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for metric, labels, slot, amount in updates:
+                    pipe.hincrbyfloat(
+                        self._key(metric), json.dumps([*labels, slot]), amount
+                    )
+                pipe.execute()
+            except Exception as e:
+                logger.debug(f"[METRICS] Could not record request metrics: {e}")
+            return
+
+        with self._lock:
+            for metric, labels, slot, amount in updates:
+                metric.add(labels, slot, amount)
+
+    def render(self) -> str:
+        client = _redis_client()
+        if client is not None:
+            # Build the series of all workers in a fresh registry
+            shared = RequestMetrics()
+            for metric in shared.metrics:
+                for field, value in client.hgetall(self._key(metric)).items():
+                    *labels, slot = json.loads(field)
+                    metric.add(tuple(labels), slot, float(value))
+            return shared._render()
+
+        with self._lock:
+            return self._render()
+
+    def _render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        client = _redis_client()
+        if client is not None:
+            client.delete(*(self._key(metric) for metric in self.metrics))
+        self.__init__()
+
+
+request_metrics = RequestMetrics()
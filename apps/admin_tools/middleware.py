@@ -6,48 +6,73 @@ Tracks API request performance and logs slow requests.
 
 import logging
 import time
+import uuid
+from contextlib import ExitStack
 
+from django.conf import settings
+from django.db import connections
 from django.utils.deprecation import MiddlewareMixin
 
+from .metrics import QueryCollector, request_metrics
+from .profiling import ProfilingSession, should_profile
+
 logger = logging.getLogger(__name__)
 
 
-class PerformanceMonitoringMiddleware(MiddlewareMixin):
+class PerformanceMonitoringMiddleware:
     """
     Monitor API request performance and log slow requests.
 
-    Adds X-Response-Time header to all responses and logs warnings
-    for requests exceeding performance thresholds.
+    Adds X-Response-Time and X-DB-Queries headers to all responses, records
+    per-view metrics (see apps.admin_tools.metrics) and logs warnings for
+    requests exceeding performance thresholds. Queries are counted with an
+    execute wrapper, so this works with DEBUG off.
     """
 
-    def process_request(self, request):
-        """Record request start time."""
-        request._start_time = time.time()
-        request._db_queries_start = self._get_db_query_count()
+    def __init__(self, get_response):
+        self.get_response = get_response
 
-    def process_response(self, request, response):
-        """Calculate and log request duration."""
-        if not hasattr(request, "_start_time"):
-            return response
+    def __call__(self, request):
+        collector = QueryCollector()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(collector))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        self._report(request, response, duration, collector)
+        return response
 
-        # Calculate metrics
-        duration = time.time() - request._start_time
-        db_queries = self._get_db_query_count() - request._db_queries_start
+    def _report(self, request, response, duration, collector):
+        db_queries = collector.count
+        repeated = collector.repeated(getattr(settings, "N_PLUS_ONE_THRESHOLD", 10))
+        view = self._view_name(request)
 
         # Add performance headers
         response["X-Response-Time"] = f"{duration:.3f}s"
         response["X-DB-Queries"] = str(db_queries)
 
-        # Log slow requests (> 2 seconds)
-        if duration > 2.0:
+        request_metrics.record(
+            view,
+            request.method,
+            response.status_code,
+            duration,
+            collector,
+            repeated=repeated is not None,
+        )
+
+        # Log slow requests
+        if duration > getattr(settings, "SLOW_REQUEST_SECONDS", 2.0):
             logger.warning(
                 f"SLOW REQUEST: {request.method} {request.path} "
-                f"took {duration:.2f}s with {db_queries} DB queries - "
+                f"took {duration:.2f}s with {db_queries} DB queries "
+                f"({collector.duration:.2f}s in DB) - "
                 f"Status: {response.status_code}"
             )
 
-        # Log requests with many DB queries (> 50)
-        elif db_queries > 50:
+        # Log requests with many DB queries
+        elif db_queries > getattr(settings, "HIGH_DB_QUERY_COUNT", 50):
             logger.warning(
                 f"HIGH DB QUERIES: {request.method} {request.path} "
                 f"executed {db_queries} queries in {duration:.2f}s - "
@@ -62,16 +87,88 @@ class PerformanceMonitoringMiddleware(MiddlewareMixin):
                 f"Status: {response.status_code}"
             )
 
-        return response
+        if repeated is not None:
+            sql, count = repeated
+            logger.warning(
+                f"REPEATED QUERY: {request.method} {request.path} ran the same "
+                f"statement {count} times - Possible N+1 issue: {sql[:300]}"
+            )
+
+    @staticmethod
+    def _view_name(request):
+        """Route pattern of the view, which keeps metric labels bounded."""
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return "unmatched"
+        return match.route or match.view_name or "unknown"
+
+
+class ProfilingMiddleware(MiddlewareMixin):
+    """
+    Profile sampled calls to the views in PROFILE_ENDPOINTS.
+
+    Staff can force a profile with "X-Profile: 1"; the header is ignored for
+    everyone else. JWT users are only authenticated later by DRF, so the
+    bearer token is checked here before any profiler starts. The request ID
+    (from X-Request-ID, or generated) is returned in the response and names
+    the stored profile. See apps.admin_tools.profiling.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        names = self._endpoint_names(request, view_func)
+        forced = request.META.get("HTTP_X_PROFILE") == "1" and self._is_staff(request)
+        targets = getattr(settings, "PROFILE_ENDPOINTS", [])
+        endpoint = next((name for name in names if name in targets), names[0])
+        if not should_profile(endpoint, targets, forced=forced):
+            return None
 
-    def _get_db_query_count(self):
-        """Get current database query count."""
         try:
-            from django.db import connection
+            request._profiling_session = ProfilingSession(endpoint)
+        except ValueError as e:
+            # Another profiler is already active in this thread
+            logger.warning(f"[PROFILING] Could not profile {endpoint}: {e}")
+            return None
+        return None
+
+    def process_response(self, request, response):
+        session = getattr(request, "_profiling_session", None)
+        if session is None:
+            return response
+
+        request_id = request.META.get("HTTP_X_REQUEST_ID") or uuid.uuid4().hex
+        if session.finish(request_id) is not None:
+            response["X-Request-ID"] = request_id
+        return response
 
-            return len(connection.queries)
-        except Exception:
-            return 0
+    @staticmethod
+    def _is_staff(request) -> bool:
+        """Staff check from the session user or, failing that, the JWT."""
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return user.is_staff
+
+        from rest_framework.exceptions import AuthenticationFailed
+        from rest_framework_simplejwt.authentication import JWTAuthentication
+
+        try:
+            result = JWTAuthentication().authenticate(request)
+        except AuthenticationFailed:
+            return False
+        return result is not None and result[0].is_staff
+
+    @staticmethod
+    def _endpoint_names(request, view_func):
+        """ "ViewSet.action" for DRF viewsets, then the URL name."""
+        names = []
+        cls = getattr(view_func, "cls", None)
+        actions = getattr(view_func, "actions", None) or {}
+        action = actions.get(request.method.lower())
+        if cls is not None and action:
+            names.append(f"{cls.__name__}.{action}")
+        match = getattr(request, "resolver_match", None)
+        if match is not None and match.url_name:
+            names.append(match.url_name)
+        return names or [getattr(view_func, "__name__", "unknown")]
 
 
 class RequestLoggingMiddleware(MiddlewareMixin):
@@ -0,0 +1,245 @@
+"""
+Opt-in profiling of selected endpoints and Celery tasks.
+
+With PROFILING_ENABLED on, a fraction (PROFILE_SAMPLE_RATE) of calls to the
+views listed in PROFILE_ENDPOINTS ("DiagramViewSet.generate" or a URL name)
+and the tasks listed in PROFILE_TASKS are profiled. Staff users can profile a
+single request by sending "X-Profile: 1".
+
+Two profilers are available (PROFILER):
+
+- "sampling" (default): a background thread samples the call stack of the
+  profiled thread every PROFILE_SAMPLE_INTERVAL_MS and writes folded stacks
+  ("a;b;c 12" per line), which flamegraph.pl, speedscope and similar tools
+  read directly. Overhead is low and independent of call counts.
+- "cprofile": deterministic cProfile, saved as a pstats file (snakeviz,
+  flameprof). More detail, noticeably slower calls.
+
+Profiles are written to PROFILE_OUTPUT_DIR/<endpoint>/ named after the
+duration and the request or task ID; only the PROFILE_KEEP_TOP_N slowest are
+kept per endpoint.
+"""
+
+import cProfile
+import logging
+import marshal
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+# ----------------------------------------------------------------------
+# Settings
+# ----------------------------------------------------------------------
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "PROFILING_ENABLED", False)
+
+
+def should_profile(name: str, targets: List[str], forced: bool = False) -> bool:
+    """Whether to profile this call: forced, or a listed target and sampled."""
+    if not is_enabled():
+        return False
+    if forced:
+        return True
+    if name not in targets:
+        return False
+    return random.random() < getattr(settings, "PROFILE_SAMPLE_RATE", 0.01)
+
+
+# ----------------------------------------------------------------------
+# Profilers
+# ----------------------------------------------------------------------
+
+
+class SamplingProfiler:
+    """Samples one thread's stack from a background thread."""
+
+    extension = "folded"
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = None):
+        self.thread_id = thread_id or threading.get_ident()
+        if interval is None:
+            interval = getattr(settings, "PROFILE_SAMPLE_INTERVAL_MS", 5) / 1000
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="profiler-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> bytes:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        return ("\n".join(lines) + "\n").encode()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.stacks[self._fold(frame)] += 1
+
+    @staticmethod
+    def _fold(frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(
+                f"{code.co_name} ({os.path.basename(code.co_filename)}:"
+                f"{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+class DeterministicProfiler:
+    """cProfile of the calling thread, saved in the pstats format."""
+
+    extension = "prof"
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self) -> bytes:
+        self.profile.disable()
+        self.profile.create_stats()
+        return marshal.dumps(self.profile.stats)
+
+
+def make_profiler():
+    if getattr(settings, "PROFILER", "sampling") == "cprofile":
+        return DeterministicProfiler()
+    return SamplingProfiler()
+
+
+# ----------------------------------------------------------------------
+# Storage
+# ----------------------------------------------------------------------
+
+
+class ProfileStore:
+    """Keeps the slowest profiles per endpoint as files."""
+
+    def __init__(self, root: Optional[Path] = None, keep: Optional[int] = None):
+        self.root = Path(
+            root or getattr(settings, "PROFILE_OUTPUT_DIR", "logs/profiles")
+        )
+        self.keep = keep or getattr(settings, "PROFILE_KEEP_TOP_N", 10)
+
+    def directory(self, endpoint: str) -> Path:
+        return self.root / _UNSAFE_CHARS.sub("_", endpoint)
+
+    def profiles(self, endpoint: str) -> List[Path]:
+        """Stored profiles of an endpoint, slowest first."""
+        directory = self.directory(endpoint)
+        if not directory.is_dir():
+            return []
+        # Names start with the zero-padded duration, so they sort by it
+        return sorted(
+            (path for path in directory.iterdir() if path.is_file()), reverse=True
+        )
+
+    def save(
+        self, endpoint: str, request_id: str, duration: float, data: bytes, ext: str
+    ) -> Optional[Path]:
+        """Store a profile if it is among the slowest; returns its path."""
+        existing = self.profiles(endpoint)
+        name = f"{int(duration * 1000):09d}ms_{_UNSAFE_CHARS.sub('_', request_id)}"
+        if len(existing) >= self.keep and f"{name}.{ext}" <= existing[-1].name:
+            return None
+
+        directory = self.directory(endpoint)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{name}.{ext}"
+        path.write_bytes(data)
+
+        for stale in self.profiles(endpoint)[self.keep :]:
+            stale.unlink(missing_ok=True)
+        return path
+
+
+# ----------------------------------------------------------------------
+# Session
+# ----------------------------------------------------------------------
+
+
+class ProfilingSession:
+    """One profiled call: start, then finish with its identifiers."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.profiler = make_profiler()
+        self.started = time.perf_counter()
+        self.profiler.start()
+
+    def finish(self, request_id: str) -> Optional[Path]:
+        data = self.profiler.stop()
+        duration = time.perf_counter() - self.started
+        try:
+            path = ProfileStore().save(
+                self.endpoint, request_id, duration, data, self.profiler.extension
+            )
+        except OSError as e:
+            logger.error(
+                f"[PROFILING] Failed to store profile for {self.endpoint}: {e}"
+            )
+            return None
+        if path is not None:
+            logger.info(
+                f"[PROFILING] {self.endpoint} took {duration:.2f}s, "
+                f"profile saved to {path}"
+            )
+        return path
+
+
+# ----------------------------------------------------------------------
+# Celery hooks
+# ----------------------------------------------------------------------
+
+_task_sessions = {}
+
+
+def _task_prerun(sender=None, task_id=None, task=None, **kwargs):
+    name = getattr(task, "name", None) or getattr(sender, "name", "")
+    if should_profile(name, getattr(settings, "PROFILE_TASKS", [])):
+        try:
+            _task_sessions[task_id] = ProfilingSession(name)
+        except ValueError as e:
+            # Another profiler is already active in this thread
+            logger.warning(f"[PROFILING] Could not profile task {name}: {e}")
+
+
+def _task_postrun(sender=None, task_id=None, **kwargs):
+    session = _task_sessions.pop(task_id, None)
+    if session is not None:
+        session.finish(task_id)
+
+
+def connect_task_signals():
+    from celery.signals import task_postrun, task_prerun
+
+    task_prerun.connect(_task_prerun, weak=False, dispatch_uid="profiling_prerun")
+    task_postrun.connect(_task_postrun, weak=False, dispatch_uid="profiling_postrun")
@@ -0,0 +1,151 @@
+"""
+Tests for request performance instrumentation and the metrics endpoint.
+"""
+
+from unittest.mock import patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+import pytest
+
+from apps.admin_tools.metrics import (
+    QueryCollector,
+    RequestMetrics,
+    fingerprint_sql,
+    request_metrics,
+)
+from apps.admin_tools.middleware import PerformanceMonitoringMiddleware
+from apps.authentication.models import User
+from apps.authentication.tests.factories import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    request_metrics.reset()
+    yield
+    request_metrics.reset()
+
+
+def run_queries(count):
+    def view(request):
+        for index in range(count):
+            list(User.objects.filter(pk=index))
+        return HttpResponse("ok")
+
+    return view
+
+
+class TestFingerprint:
+    def test_collapses_literals_and_in_lists(self):
+        first = fingerprint_sql("SELECT * FROM t WHERE id IN (%s, %s) AND n = 5")
+        second = fingerprint_sql("SELECT *  FROM t WHERE id IN (%s) AND n = 7")
+        assert first == second == "SELECT * FROM t WHERE id IN (...) AND n = ?"
+
+    def test_collector_reports_repeats_over_threshold(self):
+        collector = QueryCollector()
+        collector.fingerprints.update({"SELECT a": 3, "SELECT b": 12})
+        assert collector.repeated(10) == ("SELECT b", 12)
+        assert collector.repeated(20) is None
+
+
+@pytest.mark.django_db
+class TestPerformanceMonitoringMiddleware:
+    def test_counts_queries_without_debug(self, settings):
+        settings.DEBUG = False
+        middleware = PerformanceMonitoringMiddleware(run_queries(3))
+
+        response = middleware(RequestFactory().get("/api/v1/things/"))
+
+        assert response["X-DB-Queries"] == "3"
+        assert "http_request_db_queries_count" in request_metrics.render()
+
+    @patch("apps.admin_tools.middleware.logger")
+    def test_repeated_statement_is_flagged(self, mock_logger, settings):
+        settings.N_PLUS_ONE_THRESHOLD = 5
+        middleware = PerformanceMonitoringMiddleware(run_queries(6))
+
+        middleware(RequestFactory().get("/api/v1/things/"))
+
+        message = mock_logger.warning.call_args[0][0]
+        assert message.startswith("REPEATED QUERY")
+        assert "6 times" in message
+        assert (
+            'http_request_repeated_queries_total{view="unmatched",method="GET"} 1'
+            in request_metrics.render()
+        )
+
+
+class FakeRedis:
+    """The hash commands RequestMetrics uses, shared like one Redis server."""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def hincrbyfloat(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = values.get(field, 0) + amount
+
+    def execute(self):
+        pass
+
+    def hgetall(self, key):
+        return {
+            field.encode(): repr(value).encode()
+            for field, value in self.hashes.get(key, {}).items()
+        }
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+
+
+class TestSharedRegistry:
+    def test_scrape_reports_requests_of_every_worker(self):
+        redis = FakeRedis()
+        first_worker, second_worker = RequestMetrics(), RequestMetrics()
+        collector = QueryCollector()
+
+        with patch("apps.admin_tools.metrics._redis_client", return_value=redis):
+            first_worker.record("issues/", "GET", 200, 0.02, collector)
+            second_worker.record("issues/", "GET", 200, 0.3, collector, True)
+            output = first_worker.render()
+
+        series = 'view="issues/",method="GET",status="2xx"'
+        assert f"http_request_duration_seconds_count{{{series}}} 2" in output
+        assert f"http_request_duration_seconds_sum{{{series}}} 0.320000" in output
+        assert (
+            'http_request_repeated_queries_total{view="issues/",method="GET"} 1'
+            in output
+        )
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    def test_requires_token_or_staff(self, client, settings):
+        settings.METRICS_AUTH_TOKEN = "secret"
+
+        assert client.get("/metrics/").status_code == 403
+        assert (
+            client.get("/metrics/", HTTP_AUTHORIZATION="Bearer wrong").status_code
+            == 403
+        )
+
+    def test_prometheus_text_format(self, client, settings):
+        settings.METRICS_AUTH_TOKEN = "secret"
+        client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+
+        response = client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.content.decode()
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert 'view="metrics/",method="GET",status="2xx",le="+Inf"} 1' in body
+
+    def test_staff_session_is_allowed(self, client):
+        client.force_login(UserFactory(is_staff=True))
+        assert client.get("/metrics/").status_code == 200
@@ -0,0 +1,157 @@
+"""
+Tests for opt-in endpoint and task profiling.
+"""
+
+import marshal
+import time
+from unittest.mock import MagicMock
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+import pytest
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.admin_tools.middleware import ProfilingMiddleware
+from apps.admin_tools.profiling import (
+    ProfileStore,
+    SamplingProfiler,
+    _task_postrun,
+    _task_prerun,
+)
+from apps.authentication.tests.factories import UserFactory
+
+
+@pytest.fixture
+def profiling(settings, tmp_path):
+    settings.PROFILING_ENABLED = True
+    settings.PROFILE_OUTPUT_DIR = str(tmp_path)
+    settings.PROFILE_SAMPLE_RATE = 1.0
+    settings.PROFILE_ENDPOINTS = ["DiagramViewSet.generate"]
+    settings.PROFILE_TASKS = ["apps.ml.tasks.retrain_ml_models"]
+    return settings
+
+
+def viewset_view(name, action):
+    view = MagicMock()
+    view.cls = type(name, (), {})
+    view.actions = {"post": action}
+    return view
+
+
+def run_request(middleware, view_func, user, headers=None):
+    request = RequestFactory().post("/", **(headers or {}))
+    request.user = user
+    middleware.process_view(request, view_func, (), {})
+    time.sleep(0.02)
+    return middleware.process_response(request, HttpResponse())
+
+
+class TestSamplingProfiler:
+    def test_writes_folded_stacks(self):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        deadline = time.time() + 0.05
+        while time.time() < deadline:
+            sum(range(1000))
+        output = profiler.stop().decode()
+
+        line = output.splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert "test_writes_folded_stacks (test_profiling.py:" in stack
+        assert int(count) > 0
+
+
+class TestProfileStore:
+    def test_keeps_only_slowest(self, tmp_path):
+        store = ProfileStore(root=tmp_path, keep=2)
+        for request_id, duration in [("a", 0.5), ("b", 1.5), ("c", 0.1), ("d", 2)]:
+            store.save("View.action", request_id, duration, b"x 1\n", "folded")
+
+        names = [path.name for path in store.profiles("View.action")]
+        assert names == ["000002000ms_d.folded", "000001500ms_b.folded"]
+
+
+class TestProfilingMiddleware:
+    def test_profiles_listed_endpoint(self, profiling, tmp_path):
+        response = run_request(
+            ProfilingMiddleware(lambda request: HttpResponse()),
+            viewset_view("DiagramViewSet", "generate"),
+            MagicMock(is_staff=False),
+            {"HTTP_X_REQUEST_ID": "req-1"},
+        )
+
+        assert response["X-Request-ID"] == "req-1"
+        [path] = (tmp_path / "DiagramViewSet.generate").iterdir()
+        assert path.name.endswith("_req-1.folded")
+
+    def test_skips_unlisted_endpoint(self, profiling, tmp_path):
+        response = run_request(
+            ProfilingMiddleware(lambda request: HttpResponse()),
+            viewset_view("ReportViewSet", "dashboard"),
+            MagicMock(is_staff=False),
+        )
+
+        assert "X-Request-ID" not in response
+        assert not any(tmp_path.iterdir())
+
+    def test_header_only_honoured_for_staff(self, profiling, tmp_path):
+        middleware = ProfilingMiddleware(lambda request: HttpResponse())
+        view = viewset_view("ReportViewSet", "dashboard")
+        header = {"HTTP_X_PROFILE": "1"}
+
+        run_request(middleware, view, MagicMock(is_staff=False), header)
+        assert not any(tmp_path.iterdir())
+
+        run_request(middleware, view, MagicMock(is_staff=True), header)
+        assert len(list((tmp_path / "ReportViewSet.dashboard").iterdir())) == 1
+
+    def test_anonymous_header_does_not_start_profiler(self, profiling):
+        request = RequestFactory().post("/", HTTP_X_PROFILE="1")
+        request.user = AnonymousUser()
+
+        ProfilingMiddleware(lambda request: HttpResponse()).process_view(
+            request, viewset_view("ReportViewSet", "dashboard"), (), {}
+        )
+
+        assert not hasattr(request, "_profiling_session")
+
+    @pytest.mark.django_db
+    def test_header_honoured_for_staff_jwt(self, profiling, tmp_path):
+        token = AccessToken.for_user(UserFactory(is_staff=True))
+        headers = {"HTTP_X_PROFILE": "1", "HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+        run_request(
+            ProfilingMiddleware(lambda request: HttpResponse()),
+            viewset_view("ReportViewSet", "dashboard"),
+            AnonymousUser(),
+            headers,
+        )
+
+        assert len(list((tmp_path / "ReportViewSet.dashboard").iterdir())) == 1
+
+    def test_disabled_by_default(self, settings, tmp_path):
+        settings.PROFILE_OUTPUT_DIR = str(tmp_path)
+        run_request(
+            ProfilingMiddleware(lambda request: HttpResponse()),
+            viewset_view("DiagramViewSet", "generate"),
+            MagicMock(is_staff=True),
+            {"HTTP_X_PROFILE": "1"},
+        )
+        assert not any(tmp_path.iterdir())
+
+
+class TestTaskProfiling:
+    def test_cprofile_output_for_listed_task(self, profiling, tmp_path):
+        profiling.PROFILER = "cprofile"
+        task = MagicMock()
+        task.name = "apps.ml.tasks.retrain_ml_models"
+
+        _task_prerun(task_id="task-1", task=task)
+        sum(range(1000))
+        _task_postrun(task_id="task-1", task=task)
+
+        [path] = (tmp_path / "apps.ml.tasks.retrain_ml_models").iterdir()
+        assert path.name.endswith("_task-1.prof")
+        assert isinstance(marshal.loads(path.read_bytes()), dict)
@@ -0,0 +1,29 @@
+"""
+Views for admin tools app.
+"""
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+from .metrics import request_metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Request metrics in the Prometheus text format.
+
+    Scrapers authenticate with "Authorization: Bearer <METRICS_AUTH_TOKEN>";
+    staff users with a session can read it from the browser.
+    """
+    token = getattr(settings, "METRICS_AUTH_TOKEN", "")
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    authorized = bool(token) and constant_time_compare(header, f"Bearer {token}")
+    if not authorized and not getattr(request.user, "is_staff", False):
+        return HttpResponseForbidden()
+
+    return HttpResponse(request_metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,17 +1,18 @@
 """
-Signals for automatic issue indexing in Pinecone.
+Outbox handlers for automatic issue and sprint indexing in Pinecone.
 
-Automatically indexes issues when created/updated and removes them when deleted.
+Issues and sprints are indexed when created or when semantic fields change,
+and removed from the index when deleted. Handlers run after commit from the
+projects outbox (see apps.projects.services.outbox_service); a failed Pinecone
+call raises so the event is retried.
 Includes anti-duplication logic to prevent redundant reindexing.
 """
 
 import logging
 
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save, pre_save
-from django.dispatch import receiver
 
-from apps.projects.models import Issue, Sprint
+from apps.projects.services.outbox_service import outbox_handler
 
 logger = logging.getLogger(__name__)
 
@@ -29,218 +30,117 @@ ISSUE_SEMANTIC_FIELDS = {
 SPRINT_SEMANTIC_FIELDS = {"name", "goal", "status", "start_date", "end_date"}
 
 
-@receiver(pre_save, sender=Issue)
-def store_issue_old_values(sender, instance, **kwargs):
-    """
-    Store old values before save to detect changes in post_save.
+def _get_rag_service():
+    """Return the RAG service, or None when Pinecone is not configured."""
+    from apps.ai_assistant.services import RAGService
 
-    Args:
-        sender: Issue model
-        instance: Issue instance
-        **kwargs: Additional arguments
-    """
-    if instance.pk:
-        try:
-            old_instance = Issue.objects.get(pk=instance.pk)
-            instance._old_values = {
-                "title": old_instance.title,
-                "description": old_instance.description,
-                "status_id": old_instance.status_id,
-                "priority": old_instance.priority,
-                "assignee_id": old_instance.assignee_id,
-                "sprint_id": old_instance.sprint_id,
-                "issue_type_id": old_instance.issue_type_id,
-            }
-        except Issue.DoesNotExist:
-            instance._old_values = {}
-    else:
-        instance._old_values = {}
-
-
-@receiver(post_save, sender=Issue)
-def auto_index_issue(sender, instance, created, **kwargs):
+    rag_service = RAGService()
+    if not rag_service.available:
+        logger.debug("Skipping Pinecone sync (RAG service unavailable)")
+        return None
+    return rag_service
+
+
+def _needs_reindex(event, semantic_fields):
+    if event.event_type == "created":
+        return True
+    changed = set(event.payload.get("changes", {})) & semantic_fields
+    if changed:
+        logger.debug(
+            f"{event.aggregate_type.title()} {event.aggregate_id} semantic fields changed: {changed}"  # noqa: E501
+        )
+    return bool(changed)
+
+
+@outbox_handler("issue")
+def sync_issue_index(event):
     """
-    Automatically index issues in Pinecone when created or updated.
+    Index created/changed issues in Pinecone and remove deleted ones.
 
     Only reindexes if semantic fields changed to avoid redundant API calls.
     Uses cache-based debouncing to prevent duplicate reindexing within 30 seconds.
 
     Args:
-        sender: Issue model
-        instance: Issue instance
-        created: True if newly created
-        **kwargs: Additional arguments
+        event: OutboxEvent for the issue
     """
+    issue_id = str(event.aggregate_id)
+
+    if event.event_type == "deleted":
+        rag_service = _get_rag_service()
+        if rag_service:
+            rag_service.delete_issue_embedding(issue_id)
+            logger.info(f"Removed issue {issue_id} from Pinecone index")
+        return
+
     # Check cache to prevent duplicate reindexing within 30 seconds
-    cache_key = f"pinecone_reindex_issue_{instance.id}"
+    cache_key = f"pinecone_reindex_issue_{issue_id}"
     if cache.get(cache_key):
-        logger.debug(f"Skipping reindex for issue {instance.id} (debounced)")
+        logger.debug(f"Skipping reindex for issue {issue_id} (debounced)")
         return
 
-    # Determine if reindex is needed
-    should_reindex = created
-
-    if not created and hasattr(instance, "_old_values"):
-        # Check if any semantic fields changed
-        old_values = instance._old_values
-        for field in ISSUE_SEMANTIC_FIELDS:
-            old_val = old_values.get(field)
-            new_val = getattr(instance, field, None)
-            if old_val != new_val:
-                logger.debug(
-                    f"Issue {instance.id} field '{field}' changed: {old_val} -> {new_val}"  # noqa: E501
-                )
-                should_reindex = True
-                break
-
-    if not should_reindex:
-        logger.debug(f"Skipping reindex for issue {instance.id} (no semantic changes)")
+    if not _needs_reindex(event, ISSUE_SEMANTIC_FIELDS):
+        logger.debug(f"Skipping reindex for issue {issue_id} (no semantic changes)")
         return
 
-    # Perform reindexing
-    try:
-        from apps.ai_assistant.services import RAGService
-
-        rag_service = RAGService()
-        rag_service.index_issue(str(instance.id))
-
-        # Set cache to prevent duplicate reindexing
-        cache.set(cache_key, True, 30)  # 30 second debounce
-
-        logger.info(f"Auto-indexed issue {instance.id} in Pinecone")
-    except Exception as e:
-        logger.exception(f"Failed to auto-index issue {instance.id}: {str(e)}")
-
-
-@receiver(post_delete, sender=Issue)
-def remove_issue_from_index(sender, instance, **kwargs):
-    """
-    Remove deleted issues from Pinecone index.
-
-    Args:
-        sender: Issue model
-        instance: Issue instance
-        **kwargs: Additional arguments
-    """
-    try:
-        from apps.ai_assistant.services import RAGService
-
-        rag_service = RAGService()
-        rag_service.delete_issue_embedding(str(instance.id))
+    rag_service = _get_rag_service()
+    if rag_service is None:
+        return
 
-        logger.info(f"Removed issue {instance.id} from Pinecone index")
-    except Exception as e:
-        logger.exception(f"Failed to remove issue {instance.id} from index: {str(e)}")
+    success, error = rag_service.index_issue(issue_id)
+    if not success:
+        from apps.projects.models import Issue
 
+        if not Issue.objects.filter(id=issue_id).exists():
+            # Deleted since; its own event removes it from the index
+            return
+        raise RuntimeError(f"Failed to auto-index issue {issue_id}: {error}")
 
-# ============================================================================
-# SPRINT SIGNALS
-# ============================================================================
+    # Set cache to prevent duplicate reindexing
+    cache.set(cache_key, True, 30)  # 30 second debounce
+    logger.info(f"Auto-indexed issue {issue_id} in Pinecone")
 
 
-@receiver(pre_save, sender=Sprint)
-def store_sprint_old_values(sender, instance, **kwargs):
+@outbox_handler("sprint")
+def sync_sprint_index(event):
     """
-    Store old values before save to detect changes in post_save.
+    Index created/changed sprints in Pinecone and remove deleted ones.
 
     Args:
-        sender: Sprint model
-        instance: Sprint instance
-        **kwargs: Additional arguments
+        event: OutboxEvent for the sprint
     """
-    if instance.pk:
-        try:
-            old_instance = Sprint.objects.get(pk=instance.pk)
-            instance._old_values = {
-                "name": old_instance.name,
-                "goal": old_instance.goal,
-                "status": old_instance.status,
-                "start_date": old_instance.start_date,
-                "end_date": old_instance.end_date,
-            }
-        except Sprint.DoesNotExist:
-            instance._old_values = {}
-    else:
-        instance._old_values = {}
-
-
-@receiver(post_save, sender=Sprint)
-def auto_index_sprint(sender, instance, created, **kwargs):
-    """
-    Automatically index sprints in Pinecone when created or updated.
+    sprint_id = str(event.aggregate_id)
 
-    Only reindexes if semantic fields changed.
+    if event.event_type == "deleted":
+        rag_service = _get_rag_service()
+        # Delete sprint vector from "sprints" namespace
+        if rag_service and rag_service.index:
+            rag_service.index.delete(ids=[f"sprint_{sprint_id}"], namespace="sprints")
+            logger.info(f"Removed sprint {sprint_id} from Pinecone index")
+        return
 
-    Args:
-        sender: Sprint model
-        instance: Sprint instance
-        created: True if newly created
-        **kwargs: Additional arguments
-    """
     # Check cache to prevent duplicate reindexing within 30 seconds
-    cache_key = f"pinecone_reindex_sprint_{instance.id}"
+    cache_key = f"pinecone_reindex_sprint_{sprint_id}"
     if cache.get(cache_key):
-        logger.debug(f"Skipping reindex for sprint {instance.id} (debounced)")
+        logger.debug(f"Skipping reindex for sprint {sprint_id} (debounced)")
         return
 
-    # Determine if reindex is needed
-    should_reindex = created
-
-    if not created and hasattr(instance, "_old_values"):
-        # Check if any semantic fields changed
-        old_values = instance._old_values
-        for field in SPRINT_SEMANTIC_FIELDS:
-            old_val = old_values.get(field)
-            new_val = getattr(instance, field, None)
-            if old_val != new_val:
-                logger.debug(
-                    f"Sprint {instance.id} field '{field}' changed: {old_val} -> {new_val}"  # noqa: E501
-                )
-                should_reindex = True
-                break
-
-    if not should_reindex:
-        logger.debug(f"Skipping reindex for sprint {instance.id} (no semantic changes)")
+    if not _needs_reindex(event, SPRINT_SEMANTIC_FIELDS):
+        logger.debug(f"Skipping reindex for sprint {sprint_id} (no semantic changes)")
         return
 
-    # Perform reindexing
-    try:
-        from apps.ai_assistant.services import RAGService
-
-        rag_service = RAGService()
-
-        # Index the sprint
-        success, error = rag_service.index_sprint(sprint_id=str(instance.id))
-
-        if success:
-            # Set cache to prevent duplicate reindexing
-            cache.set(cache_key, True, 30)  # 30 second debounce
-            logger.info(f"Auto-indexed sprint {instance.id} in Pinecone")
-        else:
-            logger.error(f"Failed to auto-index sprint {instance.id}: {error}")
-    except Exception as e:
-        logger.exception(f"Failed to auto-index sprint {instance.id}: {str(e)}")
-
-
-@receiver(post_delete, sender=Sprint)
-def remove_sprint_from_index(sender, instance, **kwargs):
-    """
-    Remove deleted sprints from Pinecone index.
+    rag_service = _get_rag_service()
+    if rag_service is None:
+        return
 
-    Args:
-        sender: Sprint model
-        instance: Sprint instance
-        **kwargs: Additional arguments
-    """
-    try:
-        from apps.ai_assistant.services import RAGService
+    success, error = rag_service.index_sprint(sprint_id=sprint_id)
+    if not success:
+        from apps.projects.models import Sprint
 
-        rag_service = RAGService()
+        if not Sprint.objects.filter(id=sprint_id).exists():
+            # Deleted since; its own event removes it from the index
+            return
+        raise RuntimeError(f"Failed to auto-index sprint {sprint_id}: {error}")
 
-        # Delete sprint vector from "sprints" namespace
-        if rag_service.available and rag_service.index:
-            vector_id = f"sprint_{instance.id}"
-            rag_service.index.delete(ids=[vector_id], namespace="sprints")
-            logger.info(f"Removed sprint {instance.id} from Pinecone index")
-    except Exception as e:
-        logger.exception(f"Failed to remove sprint {instance.id} from index: {str(e)}")
+    # Set cache to prevent duplicate reindexing
+    cache.set(cache_key, True, 30)  # 30 second debounce
+    logger.info(f"Auto-indexed sprint {sprint_id} in Pinecone")
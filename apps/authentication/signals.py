@@ -1,12 +1,13 @@
 import logging
 
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.text import slugify
 
 from apps.authentication.models import User, UserProfile
+from base.utils.access_scope import AccessScope
 
 logger = logging.getLogger(__name__)
 
@@ -205,3 +206,17 @@ def create_personal_resources(sender, instance, created, **kwargs):
             exc_info=True,
         )
         # Don't re-raise - user creation should succeed even if personal resources fail
+
+
+@receiver(post_save, sender="projects.ProjectTeamMember")
+@receiver(post_delete, sender="projects.ProjectTeamMember")
+@receiver(post_save, sender="workspaces.WorkspaceMember")
+@receiver(post_delete, sender="workspaces.WorkspaceMember")
+@receiver(post_save, sender="organizations.OrganizationMembership")
+@receiver(post_delete, sender="organizations.OrganizationMembership")
+def invalidate_access_scope(sender, instance, **kwargs):
+    """Rebuild the member's cached AccessScope after membership changes."""
+    user_id = instance.user_id
+    AccessScope.invalidate(user_id)
+    # Another process may rebuild from the old rows before the commit
+    transaction.on_commit(lambda: AccessScope.invalidate(user_id))
@@ -0,0 +1,71 @@
+"""
+Alert rule inputs that do not need database queries.
+
+Alert rules used to be loaded, and error_count rules answered with a COUNT over
+ErrorLog, every time a security event or critical error was logged. Event
+counts now live in per-minute cache buckets (SlidingWindowCounter), and active
+rules are cached for ALERT_RULE_CACHE_SECONDS.
+"""
+
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+BUCKET_SECONDS = 60
+
+
+class SlidingWindowCounter:
+    """Event count over the last N minutes, kept in per-minute cache buckets."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @staticmethod
+    def max_window_minutes() -> int:
+        return getattr(settings, "ALERT_COUNTER_MAX_WINDOW_MINUTES", 1440)
+
+    def _key(self, bucket: int) -> str:
+        return f"log_counter:{self.name}:{bucket}"
+
+    def incr(self, amount: int = 1, now: Optional[float] = None):
+        bucket = int((now if now is not None else time.time()) // BUCKET_SECONDS)
+        key = self._key(bucket)
+        # Buckets expire once no window can reach them
+        timeout = (self.max_window_minutes() + 1) * 60
+        cache.add(key, 0, timeout)
+        try:
+            cache.incr(key, amount)
+        except ValueError:
+            # Expired between add and incr
+            cache.set(key, amount, timeout)
+
+    def total(self, minutes: int, now: Optional[float] = None) -> int:
+        """Events in the last minutes (whole buckets, so up to a minute more)."""
+        minutes = max(1, min(int(minutes), self.max_window_minutes()))
+        current = int((now if now is not None else time.time()) // BUCKET_SECONDS)
+        keys = [
+            self._key(bucket) for bucket in range(current - minutes + 1, current + 1)
+        ]
+        return sum(cache.get_many(keys).values())
+
+
+def error_counter(severity: str) -> SlidingWindowCounter:
+    return SlidingWindowCounter(f"errors:{severity}")
+
+
+def active_alert_rules(condition_type: str) -> List:
+    """Active AlertRules of a condition type, cached briefly."""
+    from .models import AlertRule
+
+    key = f"alert_rules:{condition_type}"
+    rules = cache.get(key)
+    if rules is None:
+        rules = list(
+            AlertRule.objects.filter(
+                condition_type=condition_type, status="active", is_active=True
+            )
+        )
+        cache.set(key, rules, getattr(settings, "ALERT_RULE_CACHE_SECONDS", 60))
+    return rules
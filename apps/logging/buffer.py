@@ -0,0 +1,185 @@
+"""
+Buffered request logging.
+
+Request and security event logs used to be inserted one row per request, each
+in its own transaction, while the response waited. They are now queued as
+compact records in a bounded in-process buffer and written by a background
+thread with bulk_create, REQUEST_LOG_BATCH_SIZE rows at a time.
+
+- Successful GET requests are sampled at REQUEST_LOG_SAMPLE_RATE; the rate is
+  stored in the row metadata so counts can be scaled back up.
+- When the buffer is full, new records are dropped and counted instead of
+  blocking the request.
+- Alert rules for buffered security events are evaluated by the flusher,
+  after the rows are written.
+- Each record's created_at is taken when it is queued, so rows keep the time
+  of the request rather than of the flush.
+
+With REQUEST_LOG_BUFFER_ASYNC disabled (tests), records are written when they
+are queued.
+"""
+
+import atexit
+import logging
+import os
+import random
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLogBuffer:
+    """Bounded queue of SystemLog records drained by a background thread."""
+
+    def __init__(self):
+        self._records: deque = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.dropped = 0
+
+    # ------------------------------------------------------------------
+    # Settings
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_async() -> bool:
+        return getattr(settings, "REQUEST_LOG_BUFFER_ASYNC", True)
+
+    @staticmethod
+    def max_size() -> int:
+        return getattr(settings, "REQUEST_LOG_BUFFER_SIZE", 10000)
+
+    @staticmethod
+    def batch_size() -> int:
+        return getattr(settings, "REQUEST_LOG_BATCH_SIZE", 500)
+
+    @staticmethod
+    def flush_interval() -> float:
+        return getattr(settings, "REQUEST_LOG_FLUSH_INTERVAL_SECONDS", 2.0)
+
+    @staticmethod
+    def sample_rate() -> float:
+        return getattr(settings, "REQUEST_LOG_SAMPLE_RATE", 1.0)
+
+    # ------------------------------------------------------------------
+    # Queueing
+    # ------------------------------------------------------------------
+
+    def should_sample(self, method: str, status: Optional[int]) -> Optional[float]:
+        """
+        Sample rate that applies to a request, or None to skip logging it.
+
+        Only successful GET requests are sampled; everything else is kept.
+        """
+        if method != "GET" or status is None or not 200 <= status < 300:
+            return 1.0
+        rate = self.sample_rate()
+        if rate >= 1.0 or random.random() < rate:
+            return rate
+        return None
+
+    def enqueue(self, record: Dict[str, Any]) -> bool:
+        """Queue a SystemLog record; False if it was dropped."""
+        record.setdefault("created_at", timezone.now())
+        if not self.is_async():
+            self._write([record])
+            return True
+
+        self._ensure_thread()
+        with self._lock:
+            if len(self._records) >= self.max_size():
+                self.dropped += 1
+                if self.dropped % 1000 == 1:
+                    logger.warning(
+                        f"[LOGGING] Request log buffer full, {self.dropped} records dropped"  # noqa: E501
+                    )
+                return False
+            self._records.append(record)
+            pending = len(self._records)
+
+        if pending >= self.batch_size():
+            self._wakeup.set()
+        return True
+
+    def pending(self) -> int:
+        return len(self._records)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write all queued records; returns how many were written."""
+        written = 0
+        while True:
+            with self._lock:
+                batch = [
+                    self._records.popleft()
+                    for _ in range(min(self.batch_size(), len(self._records)))
+                ]
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def _write(self, records: List[Dict[str, Any]]) -> int:
+        from .models import SystemLog
+        from .services import LoggerService
+
+        alerts = [record.pop("alert", None) for record in records]
+        try:
+            SystemLog.objects.bulk_create(
+                [SystemLog(**record) for record in records],
+                batch_size=self.batch_size(),
+            )
+        except Exception as e:
+            logger.error(f"[LOGGING] Failed to write {len(records)} request logs: {e}")
+            return 0
+
+        # One rule check per kind of event in the batch
+        checked = set()
+        for alert in alerts:
+            if alert and (alert["action"], alert["severity"]) not in checked:
+                checked.add((alert["action"], alert["severity"]))
+                LoggerService._check_alert_rules("security_event", alert)
+        return len(records)
+
+    def _ensure_thread(self):
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._pid != pid:
+                # Forked worker: the parent's queue and thread are not ours
+                self._records.clear()
+                self._pid = pid
+                self._thread = None
+                atexit.register(self.flush)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="request-log-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval())
+            self._wakeup.clear()
+            try:
+                close_old_connections()
+                self.flush()
+            except Exception as e:
+                logger.error(f"[LOGGING] Request log flusher error: {e}")
+            finally:
+                close_old_connections()
+
+
+request_log_buffer = RequestLogBuffer()
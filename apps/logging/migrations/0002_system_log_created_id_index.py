@@ -0,0 +1,21 @@
+# Generated by Django 5.0.7 on 2026-10-18 21:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("logging", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="systemlog",
+            index=models.Index(
+                fields=["created_at", "id"], name="system_logs_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.7 on 2026-10-18 23:10
+
+from django.db import migrations
+
+from apps.logging.partitions import convert_to_partitioned, convert_to_regular
+
+TABLES = ["system_logs", "error_logs", "audit_logs"]
+
+
+def partition_tables(apps, schema_editor):
+    # Other backends (SQLite in development and tests) keep plain tables and
+    # expire rows with DELETE (see apps.logging.partitions)
+    for table in TABLES:
+        convert_to_partitioned(schema_editor, table)
+
+
+def unpartition_tables(apps, schema_editor):
+    for table in TABLES:
+        convert_to_regular(schema_editor, table)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("logging", "0002_system_log_created_id_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tables, reverse_code=unpartition_tables),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.7 on 2026-10-19 00:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("logging", "0003_partition_log_tables"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="systemlog",
+            name="created_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+    ]
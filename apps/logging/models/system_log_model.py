@@ -4,6 +4,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 
 
 class SystemLog(models.Model):
@@ -58,7 +59,8 @@ class SystemLog(models.Model):
 
     metadata = models.JSONField(default=dict, blank=True)
     stack_trace = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the record is queued, not when the buffer writes it
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         db_table = "system_logs"
@@ -70,6 +72,10 @@ class SystemLog(models.Model):
             models.Index(fields=["action_type", "created_at"]),
             models.Index(fields=["user", "created_at"]),
             models.Index(fields=["ip_address", "created_at"]),
+            # Unfiltered admin listing with keyset pagination
+            models.Index(
+                fields=["created_at", "id"], name="system_logs_created_id_idx"
+            ),
         ]
 
     def __str__(self):
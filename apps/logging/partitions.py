@@ -0,0 +1,361 @@
+"""
+Monthly range partitions for log tables.
+
+system_logs, error_logs, audit_logs and activity_logs are partitioned by
+created_at on Postgres, one partition per month plus a DEFAULT partition for
+rows outside the created months. Queries with created_at ranges only scan the
+matching partitions, and retention drops whole partitions instead of running
+DELETE scans.
+
+The partitioned tables have a (id, created_at) primary key, since Postgres
+requires the partition key in unique constraints; Django still addresses rows
+by id. No other table has a foreign key to them.
+
+maintain_log_partitions (Celery, daily) creates partitions ahead of time and
+drops expired ones, optionally archiving each to S3 as gzipped CSV first. On
+other databases the tables are not partitioned and expired rows are deleted.
+"""
+
+import gzip
+import logging
+import re
+import tempfile
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Dict, List, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Table -> (model label, retention setting, default retention in months)
+PARTITIONED_TABLES: Dict[str, Tuple[str, str, int]] = {
+    "system_logs": ("logging.SystemLog", "SYSTEM_LOG_RETENTION_MONTHS", 6),
+    "error_logs": ("logging.ErrorLog", "ERROR_LOG_RETENTION_MONTHS", 12),
+    "audit_logs": ("logging.AuditLog", "AUDIT_LOG_RETENTION_MONTHS", 24),
+    "activity_logs": ("reporting.ActivityLog", "ACTIVITY_LOG_RETENTION_MONTHS", 24),
+}
+
+PARTITION_KEY = "created_at"
+
+
+def month_start(moment: datetime) -> datetime:
+    return datetime(moment.year, moment.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(moment: datetime, months: int) -> datetime:
+    index = moment.year * 12 + moment.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def partition_name(table: str, start: datetime) -> str:
+    return f"{table}_p{start:%Y%m}"
+
+
+def is_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+# ----------------------------------------------------------------------
+# Partition management (Postgres)
+# ----------------------------------------------------------------------
+
+
+def is_partitioned(cursor, table: str) -> bool:
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table])
+    row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def list_partitions(cursor, table: str) -> List[Tuple[str, datetime]]:
+    """Monthly partitions of a table as (name, month start), oldest first."""
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.oid = to_regclass(%s)
+        """,
+        [table],
+    )
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+    partitions = []
+    for (name,) in cursor.fetchall():
+        match = pattern.match(name)
+        if match:
+            start = datetime(
+                int(match.group(1)), int(match.group(2)), 1, tzinfo=dt_timezone.utc
+            )
+            partitions.append((name, start))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_partition(cursor, table: str, start: datetime) -> bool:
+    """
+    Create the partition for one month; False if it already exists.
+
+    Rows of that month already in the DEFAULT partition are moved into it,
+    so months can be created after the fact.
+    """
+    name = partition_name(table, start)
+    cursor.execute("SELECT to_regclass(%s)", [name])
+    if cursor.fetchone()[0] is not None:
+        return False
+
+    end = add_months(start, 1)
+    qn = connection.ops.quote_name
+    with transaction.atomic():
+        cursor.execute(
+            f"CREATE TABLE {qn(name)} "
+            f"(LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {qn(table + '_default')} "
+            f"WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s RETURNING *) "
+            f"INSERT INTO {qn(name)} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+    logger.info(f"[PARTITIONS] Created {name}")
+    return True
+
+
+def ensure_partitions(table: str, months_ahead: int = None) -> List[str]:
+    """Create the partitions of the current month and the next months."""
+    if not is_supported():
+        return []
+    if months_ahead is None:
+        months_ahead = getattr(settings, "LOG_PARTITION_MONTHS_AHEAD", 3)
+
+    current = month_start(timezone.now())
+    created = []
+    with connection.cursor() as cursor:
+        if not is_partitioned(cursor, table):
+            logger.warning(f"[PARTITIONS] {table} is not partitioned")
+            return []
+        for offset in range(months_ahead + 1):
+            start = add_months(current, offset)
+            if create_partition(cursor, table, start):
+                created.append(partition_name(table, start))
+    return created
+
+
+def retention_cutoff(table: str) -> datetime:
+    """Start of the oldest month that is kept."""
+    _, setting, default = PARTITIONED_TABLES[table]
+    months = getattr(settings, setting, default)
+    return add_months(month_start(timezone.now()), -months)
+
+
+def drop_expired_partitions(table: str, archive: bool = True) -> List[str]:
+    """
+    Drop the partitions entirely before the retention cutoff.
+
+    Each partition is archived to LOG_ARCHIVE_S3_BUCKET when one is configured,
+    then detached and dropped. On other databases expired rows are deleted.
+    """
+    cutoff = retention_cutoff(table)
+
+    if not is_supported():
+        model = apps.get_model(PARTITIONED_TABLES[table][0])
+        deleted, _ = model.objects.filter(**{f"{PARTITION_KEY}__lt": cutoff}).delete()
+        if deleted:
+            logger.info(f"[PARTITIONS] Deleted {deleted} rows from {table}")
+        return []
+
+    qn = connection.ops.quote_name
+    dropped = []
+    with connection.cursor() as cursor:
+        if not is_partitioned(cursor, table):
+            return []
+
+        for name, start in list_partitions(cursor, table):
+            if add_months(start, 1) > cutoff:
+                break
+            if archive and getattr(settings, "LOG_ARCHIVE_S3_BUCKET", ""):
+                # Keep the partition if the upload fails; retried next run
+                if not archive_table(cursor, name, table):
+                    continue
+            cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+            cursor.execute(f"DROP TABLE {qn(name)}")
+            dropped.append(name)
+            logger.info(f"[PARTITIONS] Dropped {name}")
+
+        # Stray old rows that landed in the default partition
+        cursor.execute(
+            f"DELETE FROM {qn(table + '_default')} WHERE {PARTITION_KEY} < %s",
+            [cutoff],
+        )
+    return dropped
+
+
+def archive_table(cursor, name: str, table: str) -> bool:
+    """Upload a partition to S3 as gzipped CSV with a header row."""
+    import boto3
+
+    bucket = settings.LOG_ARCHIVE_S3_BUCKET
+    key = f"{getattr(settings, 'LOG_ARCHIVE_S3_PREFIX', 'log-archive')}/{table}/{name}.csv.gz"  # noqa: E501
+    try:
+        with tempfile.TemporaryFile() as handle:
+            with gzip.GzipFile(fileobj=handle, mode="wb") as compressed:
+                cursor.copy_expert(
+                    f"COPY {connection.ops.quote_name(name)} TO STDOUT WITH CSV HEADER",
+                    compressed,
+                )
+            handle.seek(0)
+            boto3.client(
+                "s3",
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_S3_REGION_NAME,
+            ).upload_fileobj(handle, bucket, key)
+    except Exception as e:
+        logger.error(
+            f"[PARTITIONS] Failed to archive {name} to s3://{bucket}/{key}: {e}"
+        )
+        return False
+
+    logger.info(f"[PARTITIONS] Archived {name} to s3://{bucket}/{key}")
+    return True
+
+
+# ----------------------------------------------------------------------
+# Conversion (migrations)
+# ----------------------------------------------------------------------
+
+
+def convert_to_partitioned(schema_editor, table: str):
+    """
+    Replace a regular table by a partitioned one with the same rows.
+
+    Columns, defaults and check constraints are copied with LIKE; indexes and
+    foreign keys are recreated from their definitions after the rows are
+    copied. Runs in the migration's transaction and locks the table for the
+    duration of the copy.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    qn = schema_editor.connection.ops.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        if is_partitioned(cursor, table):
+            return
+
+        cursor.execute(
+            """
+            SELECT pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE indrelid = to_regclass(%s) AND NOT indisprimary
+            """,
+            [table],
+        )
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f"SELECT MIN({PARTITION_KEY}) FROM {qn(table)}")
+        oldest = cursor.fetchone()[0] or timezone.now()
+
+        legacy = f"{table}_legacy"
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} "
+            f"(LIKE {qn(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({PARTITION_KEY})"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(table + '_default')} PARTITION OF {qn(table)} DEFAULT"
+        )
+
+        start = month_start(oldest)
+        last = add_months(
+            month_start(timezone.now()),
+            getattr(settings, "LOG_PARTITION_MONTHS_AHEAD", 3),
+        )
+        while start <= last:
+            end = add_months(start, 1)
+            cursor.execute(
+                f"CREATE TABLE {qn(partition_name(table, start))} "
+                f"PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)",
+                [start, end],
+            )
+            start = end
+
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(legacy)}")
+        # Frees the index and constraint names for the new table
+        cursor.execute(f"DROP TABLE {qn(legacy)}")
+
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(table + '_pkey')} "
+            f"PRIMARY KEY (id, {PARTITION_KEY})"
+        )
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}"
+            )
+
+
+def convert_to_regular(schema_editor, table: str):
+    """Reverse of convert_to_partitioned."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    qn = schema_editor.connection.ops.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        if not is_partitioned(cursor, table):
+            return
+
+        cursor.execute(
+            """
+            SELECT pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE indrelid = to_regclass(%s) AND NOT indisprimary
+            """,
+            [table],
+        )
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+
+        partitioned = f"{table}_partitioned"
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(partitioned)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} "
+            f"(LIKE {qn(partitioned)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(partitioned)}")
+        cursor.execute(f"DROP TABLE {qn(partitioned)} CASCADE")
+
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(table + '_pkey')} "
+            "PRIMARY KEY (id)"
+        )
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}"
+            )
@@ -4,8 +4,13 @@ from typing import Any, Dict, Optional
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import Case, Count, FloatField, Q, Sum, Value, When
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
 from django.utils import timezone
 
+from .alerting import active_alert_rules, error_counter
+from .buffer import request_log_buffer
 from .models import Alert, AlertRule, AuditLog, ErrorLog, SystemLog
 
 User = get_user_model()
@@ -94,6 +99,7 @@ class LoggerService:
                 request_data=details or {},
                 severity="medium",
             )
+            error_counter("medium").incr()
 
         except Exception as e:
             logger.error(f"Failed to log error: {str(e)}")
@@ -133,6 +139,7 @@ class LoggerService:
                 request_data=details or {},
                 severity="critical",
             )
+            error_counter("critical").incr()
 
             # Check for alert rules and trigger alerts
             LoggerService._check_alert_rules("error_count", {"error_log": error_log})
@@ -141,7 +148,6 @@ class LoggerService:
             logger.error(f"Failed to log critical error: {str(e)}")
 
     @staticmethod
-    @transaction.atomic
     def log_api_request(
         method: str,
         path: str,
@@ -152,20 +158,29 @@ class LoggerService:
         response_status: Optional[int] = None,
         execution_time: Optional[float] = None,
     ):
+        """Queue an API request log; successful GETs are sampled."""
         try:
-            SystemLog.objects.create(
-                level="INFO",
-                action=f"{method} {path}",
-                action_type="api_request",
-                message=f"API Request: {method} {path}",
-                user=user,
-                ip_address=ip_address,
-                user_agent=user_agent or "",
-                request_method=method,
-                request_path=path,
-                request_data=request_data or {},
-                response_status=response_status,
-                execution_time=execution_time,
+            sample_rate = request_log_buffer.should_sample(method, response_status)
+            if sample_rate is None:
+                return
+            request_log_buffer.enqueue(
+                {
+                    "level": "INFO",
+                    "action": f"{method} {path}"[:100],
+                    "action_type": "api_request",
+                    "message": f"API Request: {method} {path}",
+                    "user_id": user.pk if user else None,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent or "",
+                    "request_method": method,
+                    "request_path": path,
+                    "request_data": request_data or {},
+                    "response_status": response_status,
+                    "execution_time": execution_time,
+                    "metadata": (
+                        {"sample_rate": sample_rate} if sample_rate < 1.0 else {}
+                    ),
+                }
             )
         except Exception as e:
             logger.error(f"Failed to log API request: {str(e)}")
@@ -206,7 +221,6 @@ class LoggerService:
             logger.error(f"Failed to log audit: {str(e)}")
 
     @staticmethod
-    @transaction.atomic
     def log_security_event(
         action: str,
         user: Optional[User] = None,
@@ -214,39 +228,33 @@ class LoggerService:
         details: Optional[Dict[str, Any]] = None,
         severity: str = "medium",
     ):
+        """Queue a security event log; alert rules run when it is written."""
         try:
-            SystemLog.objects.create(
-                level="WARNING" if severity in ["low", "medium"] else "CRITICAL",
-                action=action,
-                action_type="security_event",
-                message=f"Security event: {action}",
-                user=user,
-                ip_address=ip_address,
-                metadata=details or {},
-            )
-
-            # Check for security-related alert rules
-            LoggerService._check_alert_rules(
-                "security_event",
+            request_log_buffer.enqueue(
                 {
+                    "level": "WARNING" if severity in ["low", "medium"] else "CRITICAL",
                     "action": action,
-                    "user": user,
+                    "action_type": "security_event",
+                    "message": f"Security event: {action}",
+                    "user_id": user.pk if user else None,
                     "ip_address": ip_address,
-                    "severity": severity,
-                },
+                    "metadata": details or {},
+                    # Checked against security-related alert rules after writing
+                    "alert": {
+                        "action": action,
+                        "user_id": str(user.pk) if user else None,
+                        "ip_address": ip_address,
+                        "severity": severity,
+                    },
+                }
             )
-
         except Exception as e:
             logger.error(f"Failed to log security event: {str(e)}")
 
     @staticmethod
     def _check_alert_rules(condition_type: str, data: Dict[str, Any]):
         try:
-            active_rules = AlertRule.objects.filter(
-                condition_type=condition_type, status="active", is_active=True
-            )
-
-            for rule in active_rules:
+            for rule in active_alert_rules(condition_type):
                 if LoggerService._evaluate_alert_condition(rule, data):
                     LoggerService._trigger_alert(rule, data)
 
@@ -262,13 +270,10 @@ class LoggerService:
                 threshold = config.get("threshold", 10)
                 time_window = config.get("time_window_minutes", 60)
 
-                from datetime import timedelta
-
-                since = timezone.now() - timedelta(minutes=time_window)
-
-                error_count = ErrorLog.objects.filter(
-                    created_at__gte=since, severity__in=["high", "critical"]
-                ).count()
+                error_count = sum(
+                    error_counter(severity).total(time_window)
+                    for severity in ("high", "critical")
+                )
 
                 return error_count >= threshold
 
@@ -321,10 +326,27 @@ class LoggerService:
             last_24h = now - timedelta(hours=24)
             last_hour = now - timedelta(hours=1)
 
+            # Sampled api_request rows stand for 1 / sample_rate requests each
+            logs_24h = SystemLog.objects.filter(created_at__gte=last_24h)
+            sampled = Q(metadata__has_key="sample_rate")
+            totals = logs_24h.aggregate(
+                estimated=Sum(
+                    Case(
+                        When(
+                            sampled,
+                            then=Value(1.0)
+                            / Cast(KT("metadata__sample_rate"), FloatField()),
+                        ),
+                        default=Value(1.0),
+                        output_field=FloatField(),
+                    )
+                ),
+                sampled=Count("id", filter=sampled),
+            )
+
             return {
-                "total_logs_24h": SystemLog.objects.filter(
-                    created_at__gte=last_24h
-                ).count(),
+                "total_logs_24h": round(totals["estimated"] or 0),
+                "sampled_logs_24h": totals["sampled"],
                 "error_logs_24h": SystemLog.objects.filter(
                     level__in=["ERROR", "CRITICAL"], created_at__gte=last_24h
                 ).count(),
@@ -335,9 +357,14 @@ class LoggerService:
                 "critical_errors_24h": ErrorLog.objects.filter(
                     severity="critical", created_at__gte=last_24h
                 ).count(),
-                "unique_users_24h": SystemLog.objects.filter(
-                    created_at__gte=last_24h, user__isnull=False
-                )
+                # Exact over fully logged rows; sampled rows miss some users,
+                # so the users seen in them are a lower bound, reported apart
+                "unique_users_24h": logs_24h.filter(user__isnull=False)
+                .exclude(sampled)
+                .values("user")
+                .distinct()
+                .count(),
+                "sampled_unique_users_24h": logs_24h.filter(sampled, user__isnull=False)
                 .values("user")
                 .distinct()
                 .count(),
@@ -0,0 +1,44 @@
+"""
+Celery tasks for logging app.
+
+Scheduled maintenance of the time-partitioned log tables.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="apps.logging.tasks.maintain_log_partitions")
+def maintain_log_partitions(self):
+    """
+    Create upcoming monthly log partitions and drop expired ones.
+
+    Runs daily. Partitions are created LOG_PARTITION_MONTHS_AHEAD months in
+    advance; partitions older than each table's retention setting are
+    archived to S3 (when LOG_ARCHIVE_S3_BUCKET is set) and dropped.
+
+    Returns:
+        dict: Created and dropped partitions per table
+    """
+    from apps.logging.partitions import (
+        PARTITIONED_TABLES,
+        drop_expired_partitions,
+        ensure_partitions,
+    )
+
+    results = {}
+    for table in PARTITIONED_TABLES:
+        try:
+            results[table] = {
+                "created": ensure_partitions(table),
+                "dropped": drop_expired_partitions(table),
+            }
+        except Exception as e:
+            logger.error(f"[PARTITIONS] Maintenance failed for {table}: {e}")
+            results[table] = {"error": str(e)}
+
+    logger.info(f"[PARTITIONS] Log partition maintenance: {results}")
+    return results
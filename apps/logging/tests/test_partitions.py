@@ -0,0 +1,66 @@
+"""
+Tests for log partition helpers and retention.
+"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.utils import timezone
+
+import pytest
+
+from apps.logging import partitions
+from apps.logging.models import ErrorLog, SystemLog
+from apps.logging.tasks import maintain_log_partitions
+
+
+def utc(year, month, day=1):
+    return datetime(year, month, day, tzinfo=dt_timezone.utc)
+
+
+class TestPartitionBounds:
+    def test_add_months_crosses_years(self):
+        assert partitions.add_months(utc(2026, 11), 3) == utc(2027, 2)
+        assert partitions.add_months(utc(2026, 1), -1) == utc(2025, 12)
+
+    def test_month_start_and_name(self):
+        start = partitions.month_start(utc(2026, 10, 18))
+        assert start == utc(2026, 10)
+        assert partitions.partition_name("system_logs", start) == "system_logs_p202610"
+
+    def test_retention_cutoff_uses_table_setting(self, settings, monkeypatch):
+        settings.ERROR_LOG_RETENTION_MONTHS = 12
+        monkeypatch.setattr(timezone, "now", lambda: utc(2026, 10, 18))
+        assert partitions.retention_cutoff("error_logs") == utc(2025, 10)
+
+
+@pytest.mark.django_db
+class TestRetentionFallback:
+    def _system_log(self, created_at):
+        log = SystemLog.objects.create(
+            level="INFO", action_type="api_request", action="GET /", message="m"
+        )
+        SystemLog.objects.filter(pk=log.pk).update(created_at=created_at)
+        return log
+
+    def test_drops_rows_before_cutoff(self, settings):
+        settings.SYSTEM_LOG_RETENTION_MONTHS = 6
+        cutoff = partitions.retention_cutoff("system_logs")
+        expired = self._system_log(cutoff - timedelta(days=1))
+        kept = self._system_log(cutoff + timedelta(days=1))
+
+        assert partitions.drop_expired_partitions("system_logs") == []
+
+        assert not SystemLog.objects.filter(pk=expired.pk).exists()
+        assert SystemLog.objects.filter(pk=kept.pk).exists()
+
+    def test_maintenance_task_covers_every_table(self):
+        ErrorLog.objects.create(
+            error_type="ValueError", error_message="boom", severity="low"
+        )
+
+        results = maintain_log_partitions()
+
+        assert set(results) == set(partitions.PARTITIONED_TABLES)
+        assert all("error" not in result for result in results.values())
+        assert ErrorLog.objects.count() == 1
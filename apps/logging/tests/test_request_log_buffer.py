@@ -0,0 +1,170 @@
+"""
+Tests for buffered request logging and counter-based alert rules.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+
+import pytest
+
+from apps.authentication.tests.factories import UserFactory
+from apps.logging.alerting import SlidingWindowCounter, error_counter
+from apps.logging.buffer import RequestLogBuffer
+from apps.logging.models import Alert, AlertRule, SystemLog
+from apps.logging.services import LoggerService
+
+
+def api_record(path="/api/v1/test/"):
+    return {
+        "level": "INFO",
+        "action": f"POST {path}",
+        "action_type": "api_request",
+        "message": f"API Request: POST {path}",
+        "request_method": "POST",
+        "request_path": path,
+        "response_status": 201,
+    }
+
+
+@pytest.fixture
+def buffer():
+    """An async buffer whose flusher thread is not started."""
+    buffer = RequestLogBuffer()
+    with patch.object(buffer, "_ensure_thread"), override_settings(
+        REQUEST_LOG_BUFFER_ASYNC=True,
+        REQUEST_LOG_BUFFER_SIZE=3,
+        REQUEST_LOG_BATCH_SIZE=2,
+    ):
+        yield buffer
+
+
+@pytest.mark.django_db
+class TestRequestLogBuffer:
+    def test_records_wait_for_flush(self, buffer):
+        assert buffer.enqueue(api_record())
+        assert SystemLog.objects.count() == 0
+
+        assert buffer.flush() == 1
+        assert SystemLog.objects.get().request_path == "/api/v1/test/"
+
+    def test_flush_writes_in_batches(self, buffer, django_assert_num_queries):
+        for index in range(3):
+            buffer.enqueue(api_record(f"/api/v1/{index}/"))
+
+        with django_assert_num_queries(2):
+            assert buffer.flush() == 3
+
+        assert buffer.pending() == 0
+
+    def test_rows_keep_the_time_they_were_queued(self, buffer):
+        queued_at = timezone.now() - timedelta(seconds=30)
+        with patch("apps.logging.buffer.timezone.now", return_value=queued_at):
+            buffer.enqueue(api_record())
+
+        buffer.flush()
+
+        assert SystemLog.objects.get().created_at == queued_at
+
+    def test_full_buffer_drops_instead_of_blocking(self, buffer):
+        results = [buffer.enqueue(api_record()) for _ in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert buffer.dropped == 2
+        assert buffer.flush() == 3
+
+    @override_settings(REQUEST_LOG_SAMPLE_RATE=0.0)
+    def test_successful_gets_are_sampled(self):
+        user = UserFactory()
+        LoggerService.log_api_request(
+            "GET", "/api/v1/a/", user=user, response_status=200
+        )
+        LoggerService.log_api_request(
+            "GET", "/api/v1/b/", user=user, response_status=404
+        )
+        LoggerService.log_api_request(
+            "POST", "/api/v1/c/", user=user, response_status=201
+        )
+
+        logged = SystemLog.objects.filter(action_type="api_request")
+        assert sorted(logged.values_list("request_path", flat=True)) == [
+            "/api/v1/b/",
+            "/api/v1/c/",
+        ]
+
+    @override_settings(REQUEST_LOG_SAMPLE_RATE=0.5)
+    def test_sample_rate_is_recorded(self):
+        with patch("apps.logging.buffer.random.random", return_value=0.1):
+            LoggerService.log_api_request("GET", "/api/v1/a/", response_status=200)
+
+        assert SystemLog.objects.get().metadata == {"sample_rate": 0.5}
+
+    @override_settings(REQUEST_LOG_SAMPLE_RATE=0.25)
+    def test_health_metrics_scale_sampled_requests(self):
+        sampled_user, other_user = UserFactory(), UserFactory()
+        with patch("apps.logging.buffer.random.random", return_value=0.1):
+            for _ in range(2):
+                LoggerService.log_api_request(
+                    "GET", "/api/v1/a/", user=sampled_user, response_status=200
+                )
+        LoggerService.log_api_request(
+            "POST", "/api/v1/b/", user=other_user, response_status=201
+        )
+
+        metrics = LoggerService.get_system_health_metrics()
+
+        assert metrics["total_logs_24h"] == 9
+        assert metrics["sampled_logs_24h"] == 2
+        assert metrics["unique_users_24h"] == 1
+        assert metrics["sampled_unique_users_24h"] == 1
+
+
+@pytest.mark.django_db
+class TestAlertCounters:
+    def setup_method(self):
+        cache.clear()
+
+    def test_sliding_window_total(self):
+        counter = SlidingWindowCounter("test")
+        now = 1_000_000 * 60.0
+        counter.incr(now=now - 5 * 60)
+        counter.incr(2, now=now - 60)
+        counter.incr(now=now)
+
+        assert counter.total(1, now=now) == 1
+        assert counter.total(2, now=now) == 3
+        assert counter.total(10, now=now) == 4
+
+    def test_error_count_rule_uses_counters(self, django_assert_max_num_queries):
+        rule = AlertRule.objects.create(
+            name="Critical errors",
+            condition_type="error_count",
+            condition_config={"threshold": 2, "time_window_minutes": 5},
+            created_by=UserFactory(),
+        )
+        error_counter("critical").incr(2)
+
+        # Rules are loaded once; no COUNT over error logs
+        with django_assert_max_num_queries(5) as captured:
+            LoggerService._check_alert_rules("error_count", {})
+
+        assert not any('FROM "error_logs"' in q["sql"] for q in captured)
+        assert Alert.objects.filter(rule=rule).count() == 1
+
+    def test_security_events_trigger_rules_when_written(self):
+        rule = AlertRule.objects.create(
+            name="Forbidden",
+            condition_type="security_event",
+            condition_config={"severity_threshold": "high"},
+            created_by=UserFactory(),
+        )
+
+        LoggerService.log_security_event(
+            action="forbidden_access_attempt", details={"path": "/x/"}, severity="high"
+        )
+
+        assert SystemLog.objects.filter(action_type="security_event").count() == 1
+        assert Alert.objects.get(rule=rule).details["severity"] == "high"
@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 
 from apps.logging.models import SystemLog
 from apps.logging.serializers import SystemLogSerializer
+from base.pagination import CursorOptInPagination
 
 
 @extend_schema_view(
@@ -27,6 +28,7 @@ class SystemLogViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ["level", "action_type", "user", "ip_address"]
     search_fields = ["action", "message", "user__email"]
     ordering = ["-created_at"]
+    pagination_class = CursorOptInPagination
 
     def get_queryset(self):
         queryset = super().get_queryset()
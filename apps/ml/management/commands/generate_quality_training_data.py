@@ -704,48 +704,42 @@ class Command(BaseCommand):
 
     def _disconnect_vectorization_signals(self) -> List[Tuple]:
         """
-        Temporarily disconnect Pinecone auto-indexing signals.
+        Temporarily disconnect issue/sprint outbox event signals.
+
+        Pinecone auto-indexing (and notifications/board broadcasts) run from
+        outbox events, so no events are recorded for generated data.
 
         Returns list of disconnected signals for later reconnection.
         """
-        from django.db.models.signals import post_delete, post_save, pre_save
+        from django.db.models.signals import post_delete, post_save
 
         disconnected = []
 
         try:
             # Import signal handlers
-            from apps.ai_assistant import signals as ai_signals
-
-            # Disconnect Issue signals
-            post_save.disconnect(ai_signals.auto_index_issue, sender=Issue)
-            disconnected.append(("post_save", ai_signals.auto_index_issue, Issue))
-
-            pre_save.disconnect(ai_signals.store_issue_old_values, sender=Issue)
-            disconnected.append(("pre_save", ai_signals.store_issue_old_values, Issue))
-
-            post_delete.disconnect(ai_signals.remove_issue_from_index, sender=Issue)
-            disconnected.append(
-                ("post_delete", ai_signals.remove_issue_from_index, Issue)
-            )
-
-            # Disconnect Sprint signals
-            post_save.disconnect(ai_signals.auto_index_sprint, sender=Sprint)
-            disconnected.append(("post_save", ai_signals.auto_index_sprint, Sprint))
-
-            pre_save.disconnect(ai_signals.store_sprint_old_values, sender=Sprint)
-            disconnected.append(
-                ("pre_save", ai_signals.store_sprint_old_values, Sprint)
-            )
-
-            post_delete.disconnect(ai_signals.remove_sprint_from_index, sender=Sprint)
-            disconnected.append(
-                ("post_delete", ai_signals.remove_sprint_from_index, Sprint)
-            )
+            from apps.projects import signals as project_signals
+
+            for signal_type, signal, handler, sender in (
+                ("post_save", post_save, project_signals.record_issue_event, Issue),
+                (
+                    "post_delete",
+                    post_delete,
+                    project_signals.record_issue_delete_event,
+                    Issue,
+                ),
+                ("post_save", post_save, project_signals.record_sprint_event, Sprint),
+                (
+                    "post_delete",
+                    post_delete,
+                    project_signals.record_sprint_delete_event,
+                    Sprint,
+                ),
+            ):
+                signal.disconnect(handler, sender=sender)
+                disconnected.append((signal_type, handler, sender))
 
             if self.verbose_logging:
-                self.stdout.write(
-                    "[DEBUG] Disconnected 6 Pinecone auto-indexing signals"
-                )
+                self.stdout.write("[DEBUG] Disconnected 4 outbox event signals")
 
         except Exception as e:
             self.stdout.write(
@@ -3,6 +3,7 @@ Django admin for Notifications app.
 """
 
 from django.contrib import admin
+from django.db import transaction
 from django.utils import timezone
 
 from apps.notifications.models import (
@@ -10,6 +11,7 @@ from apps.notifications.models import (
     NotificationPreference,
     ProjectNotificationSettings,
 )
+from apps.notifications.services.notification_stream import invalidate_counts
 
 
 @admin.register(Notification)
@@ -40,18 +42,26 @@ class NotificationAdmin(admin.ModelAdmin):
 
     def mark_as_read(self, request, queryset):
         """Mark selected notifications as read."""
+        recipient_ids = self._recipient_ids(queryset)
         count = queryset.update(is_read=True, read_at=timezone.now())
+        transaction.on_commit(lambda: invalidate_counts(recipient_ids))
         self.message_user(request, f"{count} notifications marked as read.")
 
     mark_as_read.short_description = "Mark selected as read"
 
     def mark_as_unread(self, request, queryset):
         """Mark selected notifications as unread."""
+        recipient_ids = self._recipient_ids(queryset)
         count = queryset.update(is_read=False, read_at=None)
+        transaction.on_commit(lambda: invalidate_counts(recipient_ids))
         self.message_user(request, f"{count} notifications marked as unread.")
 
     mark_as_unread.short_description = "Mark selected as unread"
 
+    @staticmethod
+    def _recipient_ids(queryset):
+        return list(queryset.values_list("recipient_id", flat=True).distinct())
+
 
 @admin.register(NotificationPreference)
 class NotificationPreferenceAdmin(admin.ModelAdmin):
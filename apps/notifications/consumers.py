@@ -0,0 +1,53 @@
+"""
+WebSocket consumer for per-user notification push.
+"""
+
+import json
+import logging
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncWebsocketConsumer
+
+from apps.notifications.services.notification_stream import NotificationStream
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationConsumer(AsyncWebsocketConsumer):
+    """
+    Push the authenticated user's notifications and unread count.
+
+    Clients connect to ws/notifications/?token=<JWT> (see JWTAuthMiddleware)
+    and receive:
+    - "notifications.sync" with the unread count on connect
+    - "notification.created" with each new notification
+    - "notifications.unread_count" when notifications are read
+    """
+
+    async def connect(self):
+        self.user = self.scope["user"]
+        if not self.user.is_authenticated:
+            logger.warning("[WS NOTIFICATIONS] Rejecting unauthenticated connection")
+            await self.close()
+            return
+
+        self.stream = NotificationStream(self.user.pk)
+        await self.channel_layer.group_add(self.stream.group_name, self.channel_name)
+        await self.accept()
+
+        unread_count = await database_sync_to_async(self.stream.unread_count)()
+        await self.send(
+            text_data=json.dumps(
+                {"type": "notifications.sync", "unread_count": unread_count}
+            )
+        )
+
+    async def disconnect(self, close_code):
+        if hasattr(self, "stream"):
+            await self.channel_layer.group_discard(
+                self.stream.group_name, self.channel_name
+            )
+
+    async def notification_event(self, event):
+        """Forward a message encoded by NotificationStream."""
+        await self.send(text_data=event["text"])
@@ -107,14 +107,33 @@ class Notification(models.Model):
     def __str__(self):
         return f"{self.title} - {self.recipient.email}"
 
-    def mark_as_read(self):
-        """Mark notification as read."""
-        if not self.is_read:
-            from django.utils import timezone
-
-            self.is_read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=["is_read", "read_at"])
+    def mark_as_read(self) -> bool:
+        """
+        Mark notification as read; False if it already was.
+
+        The update is conditional on is_read, so of two concurrent calls only
+        the one that changed the row counts it as read.
+        """
+        if self.is_read:
+            return False
+
+        from django.db import transaction
+        from django.utils import timezone
+
+        from apps.notifications.services.notification_stream import publish_read
+
+        read_at = timezone.now()
+        updated = Notification.objects.filter(pk=self.pk, is_read=False).update(
+            is_read=True, read_at=read_at
+        )
+        self.is_read = True
+        if not updated:
+            return False
+
+        self.read_at = read_at
+        recipient_id = self.recipient_id
+        transaction.on_commit(lambda: publish_read(recipient_id))
+        return True
 
 
 class ProjectNotificationSettings(models.Model):
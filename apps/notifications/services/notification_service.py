@@ -2,16 +2,34 @@
 Notification service for creating and delivering notifications.
 
 Handles in-app, email, and Slack notifications based on user preferences.
+
+Notifications are created in bulk: the preferences of all recipients are
+loaded with one query and the rows written with bulk_create. Email and Slack
+delivery is handed to Celery after commit, in batches of
+NOTIFICATION_DELIVERY_BATCH_SIZE, by rate-limited tasks. Events raised on the
+request path are enqueued with NotificationService.enqueue and their
+recipients resolved by the worker.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Count
 
 from apps.notifications.models import Notification, NotificationPreference
 from base.services import EmailService
 
+from .notification_stream import (
+    NotificationStream,
+    invalidate_counts,
+    publish_all_read,
+    publish_created,
+)
 from .slack_service import SlackService
 
 User = get_user_model()
@@ -53,49 +71,142 @@ class NotificationService:
         Returns:
             Created Notification instance
         """
-        try:
-            # Get user preferences
-            preferences = self._get_or_create_preferences(recipient)
+        created = self.deliver(
+            [
+                {
+                    "recipient": recipient,
+                    "notification_type": notification_type,
+                    "title": title,
+                    "message": message,
+                    "link": link,
+                    "data": data or {},
+                    "send_email": send_email,
+                    "send_slack": send_slack,
+                }
+            ]
+        )
+        return created[0] if created else None
 
-            # Check if in-app notifications are enabled
-            if not preferences.in_app_enabled:
-                logger.debug(f"In-app notifications disabled for {recipient.email}")
-                return None
+    def deliver(self, notifications_data: List[Dict[str, Any]]) -> List[Notification]:
+        """
+        Create notifications for many recipients and schedule their delivery.
+
+        Preferences of all recipients are read with one query (users without a
+        preference row get the defaults), notifications disabled by preference
+        are skipped, and the rest are written with one bulk_create. Email and
+        Slack are sent after commit by Celery tasks.
 
-            # Check if user wants this type of notification
-            if not preferences.is_type_enabled(notification_type):
+        Args:
+            notifications_data: Dictionaries with recipient (or recipient_id),
+                notification_type, title, message and optionally link, data,
+                send_email (default True) and send_slack (default False)
+
+        Returns:
+            Created Notification instances
+        """
+        preferences = self.get_preferences_map(
+            data.get("recipient_id") or data["recipient"].pk
+            for data in notifications_data
+            if data.get("recipient_id") or data.get("recipient")
+        )
+
+        notifications = []
+        email_ids = []
+        slack_ids = []
+        for data in notifications_data:
+            recipient_id = data.get("recipient_id") or getattr(
+                data.get("recipient"), "pk", None
+            )
+            if not recipient_id:
+                continue
+
+            notification_type = data.get("notification_type", "")
+            prefs = preferences[recipient_id]
+            if not prefs.in_app_enabled or not prefs.is_type_enabled(notification_type):
                 logger.debug(
-                    f"Notification type {notification_type} disabled for {recipient.email}"  # noqa: E501
+                    f"Notification type {notification_type} disabled for user {recipient_id}"  # noqa: E501
                 )
-                return None
+                continue
 
-            # Create in-app notification
-            notification = Notification.objects.create(
-                recipient=recipient,
+            notification = Notification(
+                recipient_id=recipient_id,
                 notification_type=notification_type,
-                title=title,
-                message=message,
-                link=link,
-                data=data or {},
+                title=data["title"],
+                message=data["message"],
+                link=data.get("link", ""),
+                data=data.get("data") or {},
             )
+            if data.get("recipient") is not None:
+                notification.recipient = data["recipient"]
+            notifications.append(notification)
 
-            # Send via channels based on preferences
             if (
-                send_email
-                and preferences.email_enabled
-                and not preferences.digest_enabled
+                data.get("send_email", True)
+                and prefs.email_enabled
+                and not prefs.digest_enabled
             ):
-                self._send_email_notification(notification)
+                email_ids.append(notification.id)
+            if data.get("send_slack", False) and prefs.slack_enabled:
+                slack_ids.append(notification.id)
 
-            if send_slack and preferences.slack_enabled:
-                self._send_slack_notification(notification)
+        if not notifications:
+            return []
 
-            logger.info(f"Created notification {notification.id} for {recipient.email}")
-            return notification
+        created = Notification.objects.bulk_create(notifications)
+        transaction.on_commit(lambda: publish_created(created))
+        self._schedule_delivery(email_ids, slack_ids)
+        logger.info(f"Created {len(created)} notifications")
+        return created
+
+    def get_preferences_map(
+        self, user_ids: Iterable
+    ) -> Dict[Any, NotificationPreference]:
+        """
+        Notification preferences of many users in one query.
 
-        except Exception as e:
-            logger.exception(f"Error creating notification: {str(e)}")
-            raise
+        Users without a preference row get unsaved defaults, so reading
+        preferences never writes.
+        """
+        user_ids = set(user_ids)
+        preferences = {
+            prefs.user_id: prefs
+            for prefs in NotificationPreference.objects.filter(user_id__in=user_ids)
+        }
+        for user_id in user_ids - preferences.keys():
+            preferences[user_id] = NotificationPreference(user_id=user_id)
+        return preferences
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    # Event name -> method that resolves recipients and delivers
+    EVENT_HANDLERS = {
+        "issue_assigned": "notify_issue_assigned",
+        "status_changed": "notify_status_change",
+        "issue_commented": "notify_issue_commented",
+        "deadline_approaching": "notify_deadline_approaching",
+        "anomaly_detected": "notify_anomaly_detected",
+    }
+
+    @classmethod
+    def enqueue(cls, event: str, **kwargs):
+        """
+        Queue a notification event for the Celery worker, after commit.
+
+        The worker runs the matching notify_* method, so recipient lookups and
+        inserts stay off the request path. kwargs must be JSON-serializable.
+        """
+        if event not in cls.EVENT_HANDLERS:
+            raise ValueError(f"Unknown notification event: {event}")
+
+        from apps.notifications.tasks import dispatch_notification_event
+
+        transaction.on_commit(lambda: dispatch_notification_event.delay(event, kwargs))
+
+    def handle_event(self, event: str, **kwargs):
+        """Run the notify_* method of a queued event."""
+        getattr(self, self.EVENT_HANDLERS[event])(**kwargs)
 
     def notify_issue_assigned(self, issue_id: str, assignee_id: str, assigner_id: str):
         """Notify user when issue is assigned to them."""
@@ -135,32 +246,78 @@ class NotificationService:
             changed_by = User.objects.get(id=changed_by_id)
 
             # Notify assignee and reporter
-            recipients = [
-                user
+            recipients = {
+                user.pk: user
                 for user in [issue.assignee, issue.reporter]
-                if user and user.id != changed_by_id
-            ]
+                if user and str(user.pk) != str(changed_by_id)
+            }
 
             title = f"Status changed: {issue.title}"
             message = f"{changed_by.get_full_name()} changed status from {old_status} to {new_status}"  # noqa: E501
             link = f"/projects/{issue.project.key}/issues/{issue.id}"
 
-            for recipient in recipients:
-                self.create_notification(
-                    recipient=recipient,
-                    notification_type="status_changed",
-                    title=title,
-                    message=message,
-                    link=link,
-                    data={
-                        "issue_id": str(issue_id),
-                        "old_status": old_status,
-                        "new_status": new_status,
-                    },
-                )
+            self.deliver(
+                [
+                    {
+                        "recipient": recipient,
+                        "notification_type": "status_changed",
+                        "title": title,
+                        "message": message,
+                        "link": link,
+                        "data": {
+                            "issue_id": str(issue_id),
+                            "old_status": old_status,
+                            "new_status": new_status,
+                        },
+                    }
+                    for recipient in recipients.values()
+                ]
+            )
         except Exception as e:
             logger.exception(f"Error in notify_status_change: {str(e)}")
 
+    def notify_issue_commented(self, comment_id: str, commenter_id: str):
+        """Notify issue assignee and reporter about a new comment."""
+        try:
+            from apps.projects.models import IssueComment
+
+            comment = IssueComment.objects.select_related(
+                "author", "issue__project", "issue__assignee", "issue__reporter"
+            ).get(id=comment_id)
+            issue = comment.issue
+            commenter = comment.author
+
+            recipients = {
+                user.pk: user
+                for user in [issue.assignee, issue.reporter]
+                if user and str(user.pk) != str(commenter_id)
+            }
+
+            title = f"New comment on {issue.full_key}: {issue.title}"
+            message = f"{commenter.get_full_name()} commented: {comment.content[:100]}{'...' if len(comment.content) > 100 else ''}"  # noqa: E501
+            link = f"/projects/{issue.project.key}/issues/{issue.id}"
+
+            self.deliver(
+                [
+                    {
+                        "recipient": recipient,
+                        "notification_type": "issue_commented",
+                        "title": title,
+                        "message": message,
+                        "link": link,
+                        "data": {
+                            "issue_id": str(issue.id),
+                            "comment_id": str(comment.id),
+                            "project_id": str(issue.project_id),
+                        },
+                        "send_email": True,
+                    }
+                    for recipient in recipients.values()
+                ]
+            )
+        except Exception as e:
+            logger.exception(f"Error in notify_issue_commented: {str(e)}")
+
     def notify_deadline_approaching(self, issue_id: str, days_until_deadline: int):
         """Notify assignee about approaching deadline."""
         try:
@@ -207,20 +364,24 @@ class NotificationService:
             message = f"{severity.upper()}: {description}"
             link = f"/projects/{project.key}/analytics"
 
-            for lead in leads:
-                self.create_notification(
-                    recipient=lead.user,
-                    notification_type="anomaly_detected",
-                    title=title,
-                    message=message,
-                    link=link,
-                    data={
-                        "project_id": str(project_id),
-                        "anomaly_type": anomaly_type,
-                        "severity": severity,
-                    },
-                    send_email=True,
-                )
+            self.deliver(
+                [
+                    {
+                        "recipient": lead.user,
+                        "notification_type": "anomaly_detected",
+                        "title": title,
+                        "message": message,
+                        "link": link,
+                        "data": {
+                            "project_id": str(project_id),
+                            "anomaly_type": anomaly_type,
+                            "severity": severity,
+                        },
+                        "send_email": True,
+                    }
+                    for lead in leads
+                ]
+            )
         except Exception as e:
             logger.exception(f"Error in notify_anomaly_detected: {str(e)}")
 
@@ -236,30 +397,7 @@ class NotificationService:
         Returns:
             Number of notifications created
         """
-        notifications = []
-        for data in notifications_data:
-            recipient = data.get("recipient")
-            if not recipient:
-                continue
-
-            preferences = self._get_or_create_preferences(recipient)
-            if not preferences.is_type_enabled(data.get("notification_type", "")):
-                continue
-
-            notifications.append(
-                Notification(
-                    recipient=recipient,
-                    notification_type=data["notification_type"],
-                    title=data["title"],
-                    message=data["message"],
-                    link=data.get("link", ""),
-                    data=data.get("data", {}),
-                )
-            )
-
-        created = Notification.objects.bulk_create(notifications)
-        logger.info(f"Bulk created {len(created)} notifications")
-        return len(created)
+        return len(self.deliver(notifications_data))
 
     def mark_all_read(self, user: User) -> int:
         """Mark all notifications as read for user."""
@@ -268,6 +406,7 @@ class NotificationService:
         count = Notification.objects.filter(recipient=user, is_read=False).update(
             is_read=True, read_at=timezone.now()
         )
+        transaction.on_commit(lambda: publish_all_read(user.pk))
 
         logger.info(f"Marked {count} notifications as read for {user.email}")
         return count
@@ -277,21 +416,17 @@ class NotificationService:
         return self.mark_all_read(user)
 
     def get_unread_count(self, user: User) -> int:
-        """Get count of unread notifications for user."""
-        return Notification.objects.filter(recipient=user, is_read=False).count()
+        """Get count of unread notifications for user (cached)."""
+        return NotificationStream(user.pk).unread_count()
 
     def mark_as_read(self, notification_id, user: User) -> bool:
         """Mark a specific notification as read."""
-        from django.utils import timezone
-
         try:
             notification = Notification.objects.get(id=notification_id, recipient=user)
-            notification.is_read = True
-            notification.read_at = timezone.now()
-            notification.save(update_fields=["is_read", "read_at"])
-            return True
         except Notification.DoesNotExist:
             return False
+        notification.mark_as_read()
+        return True
 
     def get_notifications_for_user(self, user: User, limit=50):
         """Get notifications for a user."""
@@ -306,7 +441,14 @@ class NotificationService:
         from django.utils import timezone
 
         cutoff_date = timezone.now() - timedelta(days=days)
-        count, _ = Notification.objects.filter(created_at__lt=cutoff_date).delete()
+        old_notifications = Notification.objects.filter(created_at__lt=cutoff_date)
+        recipient_ids = list(
+            old_notifications.filter(is_read=False)
+            .values_list("recipient_id", flat=True)
+            .distinct()
+        )
+        count, _ = old_notifications.delete()
+        transaction.on_commit(lambda: invalidate_counts(recipient_ids))
         logger.info(f"Deleted {count} notifications older than {days} days")
         return count
 
@@ -371,44 +513,175 @@ class NotificationService:
         )
         return preferences
 
-    def _send_email_notification(self, notification: Notification):
-        """Send email notification."""
-        try:
-            # Use existing EmailService
-            notification.title
-            message = notification.message
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _schedule_delivery(email_ids: List, slack_ids: List):
+        """Queue email and Slack sends in batches once the rows are committed."""
+        from apps.notifications.tasks import (
+            send_notification_emails,
+            send_notification_slack,
+        )
 
+        size = getattr(settings, "NOTIFICATION_DELIVERY_BATCH_SIZE", 100)
+        for task, ids in (
+            (send_notification_emails, email_ids),
+            (send_notification_slack, slack_ids),
+        ):
+            for start in range(0, len(ids), size):
+                batch = [
+                    str(notification_id)
+                    for notification_id in ids[start : start + size]
+                ]
+                transaction.on_commit(lambda task=task, batch=batch: task.delay(batch))
+
+    def send_email_batch(self, notification_ids: List[str]) -> int:
+        """
+        Email a batch of notifications over a single backend connection.
+
+        Returns:
+            Number of notifications emailed
+        """
+        notifications = list(
+            Notification.objects.filter(
+                id__in=notification_ids, email_sent=False
+            ).select_related("recipient")
+        )
+        messages = []
+        for notification in notifications:
+            message = notification.message
             if notification.link:
                 message += f"\n\nView: {notification.link}"
+            messages.append(
+                EmailMessage(
+                    subject=notification.title,
+                    body=message,
+                    to=[notification.recipient.email],
+                )
+            )
+        if not messages:
+            return 0
 
-            # This is a placeholder - actual implementation would use EmailService
-            # self.email_service.send_notification_email(
-            #     to_email=notification.recipient.email,
-            #     subject=subject,
-            #     message=message,
-            # )
+        with get_connection() as connection:
+            connection.send_messages(messages)
 
-            notification.email_sent = True
-            notification.save(update_fields=["email_sent"])
-            logger.debug(f"Email sent for notification {notification.id}")
+        Notification.objects.filter(
+            id__in=[notification.id for notification in notifications]
+        ).update(email_sent=True)
+        logger.debug(f"Emailed {len(notifications)} notifications")
+        return len(notifications)
 
-        except Exception as e:
-            logger.exception(f"Error sending email notification: {str(e)}")
+    def send_slack_batch(self, notification_ids: List[str]) -> int:
+        """
+        Post a batch of notifications to Slack, spaced to stay under
+        NOTIFICATION_SLACK_MAX_PER_SECOND.
 
-    def _send_slack_notification(self, notification: Notification):
-        """Send Slack notification."""
-        try:
-            # This would use SlackService
-            self.slack_service.send_notification(
+        Returns:
+            Number of notifications posted
+        """
+        interval = 1.0 / getattr(settings, "NOTIFICATION_SLACK_MAX_PER_SECOND", 1.0)
+        sent = []
+        last_post = 0.0
+        for notification in Notification.objects.filter(
+            id__in=notification_ids, slack_sent=False
+        ):
+            wait = last_post + interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            last_post = time.monotonic()
+            if self.slack_service.send_notification(
                 channel=None,  # User's DM
                 title=notification.title,
                 message=notification.message,
                 link=notification.link,
+            ):
+                sent.append(notification.id)
+
+        Notification.objects.filter(id__in=sent).update(slack_sent=True)
+        logger.debug(f"Posted {len(sent)} notifications to Slack")
+        return len(sent)
+
+    # ------------------------------------------------------------------
+    # Digests
+    # ------------------------------------------------------------------
+
+    def build_digests(self, since) -> List[Dict[str, Any]]:
+        """
+        Unread notification counts per type for every digest recipient.
+
+        One GROUP BY (recipient, notification_type) over the window, limited
+        to users with digest and email enabled.
+
+        Args:
+            since: Start of the digest window
+
+        Returns:
+            [{"email": ..., "counts": {notification_type: count}}], only for
+            users with unread notifications in the window
+        """
+        rows = (
+            Notification.objects.filter(
+                is_read=False,
+                created_at__gte=since,
+                recipient__notification_preferences__digest_enabled=True,
+                recipient__notification_preferences__email_enabled=True,
+            )
+            .values("recipient_id", "recipient__email", "notification_type")
+            .annotate(count=Count("id"))
+            .order_by("recipient_id")
+        )
+
+        digests: Dict[Any, Dict[str, Any]] = {}
+        for row in rows:
+            digest = digests.setdefault(
+                row["recipient_id"], {"email": row["recipient__email"], "counts": {}}
             )
+            digest["counts"][row["notification_type"]] = row["count"]
+        return list(digests.values())
+
+    @staticmethod
+    def render_digest(counts: Dict[str, int]) -> str:
+        """Plain-text digest body for per-type unread counts."""
+        total = sum(counts.values())
+        lines = [f"You have {total} unread notifications:", ""]
+        for notification_type, count in sorted(counts.items()):
+            lines.append(
+                f"- {count} {notification_type.replace('_', ' ')} notifications"
+            )
+        return "\n".join(lines) + "\n"
 
-            notification.slack_sent = True
-            notification.save(update_fields=["slack_sent"])
-            logger.debug(f"Slack sent for notification {notification.id}")
+    def send_digest_batch(
+        self, digests: List[Dict[str, Any]]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Render and email a batch of digests over one backend connection.
 
-        except Exception as e:
-            logger.exception(f"Error sending Slack notification: {str(e)}")
+        Each digest is sent on its own, so an error part-way only affects the
+        digests it hits and the caller can retry exactly those.
+
+        Returns:
+            Number of digests sent, and the digests that failed
+        """
+        digests = [digest for digest in digests if digest.get("email")]
+        if not digests:
+            return 0, []
+
+        failed = []
+        with get_connection() as connection:
+            for digest in digests:
+                try:
+                    EmailMessage(
+                        subject="Your notification digest",
+                        body=self.render_digest(digest["counts"]),
+                        to=[digest["email"]],
+                        connection=connection,
+                    ).send()
+                except Exception as e:
+                    logger.warning(f"Could not send digest to {digest['email']}: {e}")
+                    failed.append(digest)
+
+        sent = len(digests) - len(failed)
+        logger.debug(f"Sent {sent} notification digests")
+        return sent, failed
@@ -0,0 +1,170 @@
+"""
+Per-user notification push and cached unread counts.
+
+Each user's unread count is kept in the cache (Redis in production) and
+adjusted when notifications are created or read, so badge updates and the
+unread-count endpoint do not query the database. A missing count is computed
+once with a COUNT and cached for NOTIFICATION_UNREAD_COUNT_TTL_SECONDS, which
+bounds any drift from writes that bypass the service.
+
+Counts are stored under a per-user generation number. A change that finds no
+cached count to adjust, and every invalidation, moves to the next generation,
+so a COUNT that raced the change is cached under the old generation and never
+read again. A lost generation restarts from the current time in milliseconds,
+so old counts are not picked up again either.
+
+New notifications and count changes are sent to the user's channel group,
+which NotificationConsumer (ws/notifications/) forwards to connected clients.
+"""
+
+import json
+import time
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+
+def group_name(user_id) -> str:
+    return f"notifications_{user_id}"
+
+
+def notification_payload(notification) -> Dict:
+    """Client representation of a notification, without extra queries."""
+    return {
+        "id": str(notification.id),
+        "notification_type": notification.notification_type,
+        "title": notification.title,
+        "message": notification.message,
+        "link": notification.link,
+        "data": notification.data,
+        "is_read": notification.is_read,
+        "created_at": notification.created_at,
+    }
+
+
+class NotificationStream:
+    """Unread counter and WebSocket group of one user."""
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.group_name = group_name(user_id)
+
+    @property
+    def _generation_key(self) -> str:
+        return f"notifications:{self.user_id}:unread_generation"
+
+    @property
+    def _count_key(self) -> str:
+        generation = cache.get(self._generation_key)
+        if generation is None:
+            cache.add(self._generation_key, int(time.time() * 1000), timeout=None)
+            generation = cache.get(self._generation_key)
+        return f"notifications:{self.user_id}:unread:{generation}"
+
+    # ------------------------------------------------------------------
+    # Unread count
+    # ------------------------------------------------------------------
+
+    def unread_count(self) -> int:
+        count_key = self._count_key
+        count = cache.get(count_key)
+        if count is None:
+            from apps.notifications.models import Notification
+
+            count = Notification.objects.filter(
+                recipient_id=self.user_id, is_read=False
+            ).count()
+            cache.add(
+                count_key,
+                count,
+                getattr(settings, "NOTIFICATION_UNREAD_COUNT_TTL_SECONDS", 300),
+            )
+        return max(count, 0)
+
+    def adjust(self, delta: int) -> Optional[int]:
+        """
+        Add delta to a cached count; None if it was not cached.
+
+        Uncached counts are invalidated, since a recount may be running that
+        does not include this change, and computed on the next read.
+        """
+        try:
+            if delta >= 0:
+                return cache.incr(self._count_key, delta)
+            return max(cache.decr(self._count_key, -delta), 0)
+        except ValueError:
+            self.invalidate()
+            return None
+
+    def invalidate(self):
+        """Move to a new generation; the next read recounts."""
+        try:
+            cache.incr(self._generation_key)
+        except ValueError:
+            cache.add(self._generation_key, int(time.time() * 1000), timeout=None)
+
+    # ------------------------------------------------------------------
+    # Push
+    # ------------------------------------------------------------------
+
+    def send(self, message_type: str, **data):
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        text = json.dumps(
+            {"type": message_type, **data},
+            cls=DjangoJSONEncoder,
+            separators=(",", ":"),
+        )
+        async_to_sync(channel_layer.group_send)(
+            self.group_name, {"type": "notification_event", "text": text}
+        )
+
+    def send_count(self, count: Optional[int] = None):
+        if count is None:
+            count = self.unread_count()
+        self.send("notifications.unread_count", unread_count=count)
+
+
+def publish_created(notifications: Iterable):
+    """Update counts and push new notifications to their recipients."""
+    by_recipient = {}
+    for notification in notifications:
+        by_recipient.setdefault(notification.recipient_id, []).append(notification)
+
+    for recipient_id, created in by_recipient.items():
+        stream = NotificationStream(recipient_id)
+        unread = sum(1 for notification in created if not notification.is_read)
+        # Not cached: clients add the new notifications to their own count
+        count = stream.adjust(unread)
+        for notification in created:
+            stream.send(
+                "notification.created",
+                notification=notification_payload(notification),
+                unread_count=count,
+            )
+
+
+def publish_read(user_id, count: int = 1):
+    """Count notifications of a user as read and push the new count."""
+    stream = NotificationStream(user_id)
+    stream.send_count(stream.adjust(-count))
+
+
+def publish_all_read(user_id):
+    """Push a zero count after mark-all-read."""
+    stream = NotificationStream(user_id)
+    # Dropped rather than set to 0, so a racing create is not lost
+    stream.invalidate()
+    stream.send_count(0)
+
+
+def invalidate_counts(user_ids: Iterable):
+    """Drop cached counts of users after bulk changes outside the service."""
+    for user_id in set(user_ids):
+        NotificationStream(user_id).invalidate()
@@ -2,51 +2,36 @@
 Signals for automatic notification creation.
 
 Automatically creates notifications when issues are assigned, status changes, etc.
-Implements field tracking to detect changes in assignee, status, and priority.
+Issue notifications run after commit as outbox handlers and read the field diff
+recorded with the event to detect changes in assignee, status, and priority.
 """
 
 import logging
+from uuid import UUID
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from apps.projects.models import Issue, IssueComment
+from apps.projects.services.outbox_service import outbox_handler
 from apps.reporting.middleware import get_current_user
 
 logger = logging.getLogger(__name__)
 
 
-# =============================================================================
-# FIELD TRACKING: Store old values before save
-# =============================================================================
-
-
-@receiver(pre_save, sender=Issue)
-def track_issue_changes(sender, instance, **kwargs):
-    """
-    Track field changes before save to detect what changed.
-    Stores old values in instance._old_values for comparison in post_save.
-    """
-    if instance.pk:  # Only for existing instances
-        try:
-            old_instance = Issue.objects.get(pk=instance.pk)
-            instance._old_assignee_id = old_instance.assignee_id
-            instance._old_status_id = old_instance.status_id
-            instance._old_priority = old_instance.priority
-        except Issue.DoesNotExist:
-            pass
-
-
 # =============================================================================
 # ISSUE NOTIFICATIONS
 # =============================================================================
 
 
-@receiver(post_save, sender=Issue)
-def notify_on_issue_change(sender, instance, created, **kwargs):
+@outbox_handler("issue")
+def notify_on_issue_change(event):
     """
     Create notifications when issues are created or updated.
 
+    Runs after commit as an outbox handler; the acting user and the field diff
+    are taken from the event payload.
+
     Handles:
     - New issue creation with assignee
     - Assignment changes
@@ -54,111 +39,102 @@ def notify_on_issue_change(sender, instance, created, **kwargs):
     - Priority changes
 
     Args:
-        sender: Issue model
-        instance: Issue instance
-        created: True if newly created
-        **kwargs: Additional arguments
+        event: OutboxEvent for the issue
     """
-    try:
-        from apps.notifications.services import NotificationService
+    if event.event_type == "deleted":
+        return
 
-        notification_service = NotificationService()
-        current_user = get_current_user()
+    payload = event.payload
+    actor_id = payload.get("actor_id")
 
-        # Skip if no authenticated user (e.g., management commands, migrations)
-        if not current_user or not current_user.is_authenticated:
-            logger.debug(
-                f"Skipping notification for issue {instance.id} - no authenticated user"
+    # Skip if no authenticated user (e.g., management commands, migrations)
+    if not actor_id:
+        logger.debug(
+            f"Skipping notification for issue {event.aggregate_id} - no authenticated user"  # noqa: E501
+        )
+        return
+
+    issue = (
+        Issue.objects.select_related("project").filter(id=event.aggregate_id).first()
+    )
+    if issue is None:
+        return
+
+    from apps.notifications.services import NotificationService
+
+    notification_service = NotificationService()
+    changes = payload.get("changes", {})
+    created = event.event_type == "created"
+
+    # =====================================================================
+    # 1. ASSIGNMENT NOTIFICATIONS
+    # =====================================================================
+
+    if created:
+        # New issue created with assignee
+        if issue.assignee_id and str(issue.assignee_id) != actor_id:
+            notification_service.notify_issue_assigned(
+                issue_id=str(issue.id),
+                assignee_id=str(issue.assignee_id),
+                assigner_id=actor_id,
+            )
+            logger.info(
+                f"[NOTIFICATION] Sent assignment notification for new issue {issue.full_key}"  # noqa: E501
+            )
+    elif "assignee_id" in changes:
+        # Assignee changed on existing issue
+        old_id_str, new_id_str = changes["assignee_id"]
+
+        if new_id_str and new_id_str != actor_id:
+            # Notify new assignee
+            notification_service.notify_issue_assigned(
+                issue_id=str(issue.id),
+                assignee_id=new_id_str,
+                assigner_id=actor_id,
+            )
+            logger.info(
+                f"[NOTIFICATION] Sent assignment change notification for issue {issue.full_key} "  # noqa: E501
+                f"(old: {old_id_str}, new: {new_id_str})"
             )
-            return
 
-        # =====================================================================
-        # 1. ASSIGNMENT NOTIFICATIONS
-        # =====================================================================
-
-        if created:
-            # New issue created with assignee
-            if instance.assignee and instance.assignee != current_user:
-                notification_service.notify_issue_assigned(
-                    issue_id=str(instance.id),
-                    assignee_id=str(instance.assignee_id),
-                    assigner_id=str(current_user.id),
-                )
-                logger.info(
-                    f"[NOTIFICATION] Sent assignment notification for new issue {instance.full_key}"  # noqa: E501
-                )
-        else:
-            # Check if assignee changed on existing issue
-            old_assignee_id = getattr(instance, "_old_assignee_id", None)
-            new_assignee_id = instance.assignee_id
-
-            # Convert to strings for comparison (UUIDs)
-            old_id_str = str(old_assignee_id) if old_assignee_id else None
-            new_id_str = str(new_assignee_id) if new_assignee_id else None
-            current_user_id_str = str(current_user.id)
-
-            if old_id_str != new_id_str:
-                # Assignee changed
-                if new_assignee_id and new_id_str != current_user_id_str:
-                    # Notify new assignee
-                    notification_service.notify_issue_assigned(
-                        issue_id=str(instance.id),
-                        assignee_id=new_id_str,
-                        assigner_id=current_user_id_str,
-                    )
-                    logger.info(
-                        f"[NOTIFICATION] Sent assignment change notification for issue {instance.full_key} "  # noqa: E501
-                        f"(old: {old_id_str}, new: {new_id_str})"
-                    )
-
-        # =====================================================================
-        # 2. STATUS CHANGE NOTIFICATIONS
-        # =====================================================================
-
-        if not created:
-            old_status_id = getattr(instance, "_old_status_id", None)
-            new_status_id = instance.status_id
-
-            # Convert to strings for comparison (UUIDs)
-            old_status_str = str(old_status_id) if old_status_id else None
-            new_status_str = str(new_status_id) if new_status_id else None
-
-            if old_status_str and old_status_str != new_status_str:
-                # Status changed - get status names
-                try:
-                    from apps.projects.models import WorkflowStatus
-
-                    old_status = WorkflowStatus.objects.get(id=old_status_id)
-                    new_status = WorkflowStatus.objects.get(id=new_status_id)
-
-                    notification_service.notify_status_change(
-                        issue_id=str(instance.id),
-                        old_status=old_status.name,
-                        new_status=new_status.name,
-                        changed_by_id=str(current_user.id),
-                    )
-                    logger.info(
-                        f"[NOTIFICATION] Sent status change notification for issue {instance.full_key} "  # noqa: E501
-                        f"({old_status.name} -> {new_status.name})"
-                    )
-                except Exception as e:
-                    logger.error(f"Error notifying status change: {str(e)}")
-
-        # =====================================================================
-        # 3. PRIORITY CHANGE NOTIFICATIONS (Optional - can be enabled)
-        # =====================================================================
-
-        # Uncomment if you want priority change notifications:
-        # if not created:
-        #     old_priority = getattr(instance, '_old_priority', None)
-        #     if old_priority and old_priority != instance.priority:
-        #         # Notify assignee and reporter about priority change
-        #         pass
+    # =====================================================================
+    # 2. STATUS CHANGE NOTIFICATIONS
+    # =====================================================================
 
-    except Exception as e:
-        logger.exception(
-            f"[NOTIFICATION ERROR] Failed to create notification for issue {instance.id}: {str(e)}"  # noqa: E501
-        )
+    if not created and "status_id" in changes:
+        old_status_id, new_status_id = changes["status_id"]
+
+        if old_status_id:
+            # Status changed - get status names
+            from apps.projects.models import WorkflowStatus
+
+            names = dict(
+                WorkflowStatus.objects.filter(
+                    id__in=[old_status_id, new_status_id]
+                ).values_list("id", "name")
+            )
+            old_status = names.get(UUID(old_status_id), "")
+            new_status = names.get(UUID(new_status_id), "")
+
+            notification_service.notify_status_change(
+                issue_id=str(issue.id),
+                old_status=old_status,
+                new_status=new_status,
+                changed_by_id=actor_id,
+            )
+            logger.info(
+                f"[NOTIFICATION] Sent status change notification for issue {issue.full_key} "  # noqa: E501
+                f"({old_status} -> {new_status})"
+            )
+
+    # =====================================================================
+    # 3. PRIORITY CHANGE NOTIFICATIONS (Optional - can be enabled)
+    # =====================================================================
+
+    # Uncomment if you want priority change notifications:
+    # if not created and "priority" in changes:
+    #     # Notify assignee and reporter about priority change
+    #     pass
 
 
 # =============================================================================
@@ -171,10 +147,9 @@ def notify_on_comment(sender, instance, created, **kwargs):
     """
     Create notifications when comments are added to issues.
 
-    Notifies:
+    Queues an issue_commented event after commit; the worker notifies:
     - Issue assignee (if not the commenter)
     - Issue reporter (if not the commenter)
-    - Previous commenters (optional, can be enabled)
 
     Args:
         sender: IssueComment model
@@ -188,7 +163,6 @@ def notify_on_comment(sender, instance, created, **kwargs):
     try:
         from apps.notifications.services import NotificationService
 
-        notification_service = NotificationService()
         current_user = get_current_user()
 
         # Skip if no authenticated user
@@ -196,44 +170,15 @@ def notify_on_comment(sender, instance, created, **kwargs):
             logger.debug("Skipping comment notification - no authenticated user")
             return
 
-        issue = instance.issue
-        commenter = instance.author
-
-        # Determine recipients (assignee and reporter, excluding commenter)
-        recipients = []
-
-        if issue.assignee and issue.assignee != commenter:
-            recipients.append(issue.assignee)
-
-        if (
-            issue.reporter
-            and issue.reporter != commenter
-            and issue.reporter not in recipients
-        ):
-            recipients.append(issue.reporter)
-
-        # Create notification for each recipient
-        for recipient in recipients:
-            title = f"New comment on {issue.full_key}: {issue.title}"
-            message = f"{commenter.get_full_name()} commented: {instance.content[:100]}{'...' if len(instance.content) > 100 else ''}"  # noqa: E501
-            link = f"/projects/{issue.project.key}/issues/{issue.id}"
-
-            notification_service.create_notification(
-                recipient=recipient,
-                notification_type="issue_commented",
-                title=title,
-                message=message,
-                link=link,
-                data={
-                    "issue_id": str(issue.id),
-                    "comment_id": str(instance.id),
-                    "project_id": str(issue.project_id),
-                },
-                send_email=True,
-            )
-            logger.info(
-                f"[NOTIFICATION] Sent comment notification to {recipient.email} for issue {issue.full_key}"  # noqa: E501
-            )
+        # Recipients are resolved and notified by the Celery worker
+        NotificationService.enqueue(
+            "issue_commented",
+            comment_id=str(instance.id),
+            commenter_id=str(instance.author_id),
+        )
+        logger.info(
+            f"[NOTIFICATION] Queued comment notification for comment {instance.id}"
+        )
 
     except Exception as e:
         logger.exception(
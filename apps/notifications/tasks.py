@@ -7,6 +7,10 @@ Scheduled tasks for deadline monitoring and notification delivery.
 import logging
 from datetime import timedelta
 
+from django.conf import settings
+from django.db.models import CharField, Exists, OuterRef, Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Replace
 from django.utils import timezone
 
 from celery import shared_task
@@ -20,7 +24,7 @@ def check_upcoming_deadlines(self):
     Check for upcoming issue and sprint deadlines and send alerts.
 
     This task runs daily at 9 AM and sends notifications for:
-    - Issues due in 3 days, 1 day, or today
+    - Open issues whose sprint ends in 3 days, 1 day, or today
     - Sprints ending in 3 days, 1 day, or today
 
     Returns:
@@ -48,48 +52,59 @@ def check_upcoming_deadlines(self):
         for days_until in [3, 1, 0]:  # 3 days, 1 day, today
             deadline_date = today + timedelta(days=days_until)
 
-            # Query issues due on this date
-            issues_due = Issue.objects.filter(
-                due_date__date=deadline_date,
-                status__is_final=False,  # Not completed
-                assignee__isnull=False,  # Has assignee
-            ).select_related("assignee", "project")
+            # Issues due on this date without a notification for this deadline
+            # in the last 12 hours, as one anti-join
+            already_notified = Notification.objects.annotate(
+                issue_ref=Replace(
+                    KeyTextTransform("issue_id", "data"),
+                    Value("-"),
+                    output_field=CharField(),
+                )
+            ).filter(
+                recipient_id=OuterRef("assignee_id"),
+                notification_type="deadline_approaching",
+                issue_ref=Replace(
+                    Cast(OuterRef("id"), output_field=CharField()), Value("-")
+                ),
+                data__days_until=days_until,
+                created_at__gte=now - timedelta(hours=12),
+            )
+            issues_due = (
+                Issue.objects.filter(
+                    sprint__end_date=deadline_date,
+                    is_active=True,
+                    status__is_final=False,  # Not completed
+                    assignee__isnull=False,  # Has assignee
+                )
+                .exclude(Exists(already_notified))
+                .select_related("project")
+            )
 
+            pending = []
             for issue in issues_due:
-                try:
-                    results["issue_deadlines_checked"] += 1
-
-                    # Check if we already notified about this deadline
-                    already_notified = Notification.objects.filter(
-                        recipient=issue.assignee,
-                        notification_type="deadline_approaching",
-                        data__issue_id=str(issue.id),
-                        data__days_until=days_until,
-                        created_at__gte=now
-                        - timedelta(hours=12),  # Within last 12 hours
-                    ).exists()
-
-                    if already_notified:
-                        logger.debug(
-                            f"Already notified about issue {issue.key} deadline"
-                        )
-                        continue
-
-                    # Send notification
-                    notification_service.notify_deadline_approaching(
-                        issue_id=str(issue.id),
-                        days_until_deadline=days_until,
-                    )
-
-                    results["notifications_created"] += 1
-                    logger.info(
-                        f"Sent deadline notification for issue {issue.key} (due in {days_until} day(s))"  # noqa: E501
-                    )
+                results["issue_deadlines_checked"] += 1
+                pending.append(
+                    {
+                        "recipient_id": issue.assignee_id,
+                        "notification_type": "deadline_approaching",
+                        "title": f"Deadline approaching: {issue.title}",
+                        "message": f"Issue {issue.project.key}-{issue.key} is due in {days_until} day(s)",  # noqa: E501
+                        "link": f"/projects/{issue.project.key}/issues/{issue.id}",
+                        "data": {"issue_id": str(issue.id), "days_until": days_until},
+                        "send_email": True,
+                    }
+                )
 
-                except Exception as e:
-                    error_msg = f"Error notifying issue {issue.id} deadline: {str(e)}"
-                    logger.exception(error_msg)
-                    results["errors"].append(error_msg)
+            try:
+                created = notification_service.deliver(pending)
+                results["notifications_created"] += len(created)
+                logger.info(
+                    f"Sent {len(created)} deadline notifications for issues due in {days_until} day(s)"  # noqa: E501
+                )
+            except Exception as e:
+                error_msg = f"Error notifying issues due in {days_until} day(s): {str(e)}"  # noqa: E501
+                logger.exception(error_msg)
+                results["errors"].append(error_msg)
 
         # ===== Check Sprint Deadlines =====
         for days_until in [3, 1, 0]:  # 3 days, 1 day, today
@@ -97,7 +112,7 @@ def check_upcoming_deadlines(self):
 
             # Query sprints ending on this date
             sprints_ending = Sprint.objects.filter(
-                end_date__date=deadline_date,
+                end_date=deadline_date,
                 status__in=["planning", "active"],  # Not completed
             ).select_related("project")
 
@@ -114,48 +129,50 @@ def check_upcoming_deadlines(self):
                         is_active=True,
                     ).select_related("user")
 
-                    for team_member in team_leads:
-                        # Check if already notified
-                        already_notified = Notification.objects.filter(
-                            recipient=team_member.user,
+                    notified = set(
+                        Notification.objects.filter(
+                            recipient__in=[member.user_id for member in team_leads],
                             notification_type="sprint_deadline_approaching",
                             data__sprint_id=str(sprint.id),
                             data__days_until=days_until,
                             created_at__gte=now - timedelta(hours=12),
-                        ).exists()
-
-                        if already_notified:
-                            continue
-
-                        # Create notification
-                        urgency = (
-                            "critical"
-                            if days_until == 0
-                            else "high"
-                            if days_until == 1
-                            else "medium"
-                        )
-                        title = f"Sprint deadline {'today' if days_until == 0 else f'in {days_until} day(s)'}"  # noqa: E501
-                        message = f"Sprint '{sprint.name}' ends on {sprint.end_date.strftime('%Y-%m-%d')}"  # noqa: E501
-
-                        notification_service.create_notification(
-                            recipient=team_member.user,
-                            notification_type="sprint_deadline_approaching",
-                            title=title,
-                            message=message,
-                            link=f"/projects/{sprint.project.key}/sprints/{sprint.id}",
-                            data={
-                                "sprint_id": str(sprint.id),
-                                "days_until": days_until,
-                                "urgency": urgency,
-                            },
-                            send_email=True if days_until <= 1 else False,
-                        )
-
-                        results["notifications_created"] += 1
-                        logger.info(
-                            f"Sent sprint deadline notification for {sprint.name} to {team_member.user.email}"  # noqa: E501
-                        )
+                        ).values_list("recipient_id", flat=True)
+                    )
+
+                    urgency = (
+                        "critical"
+                        if days_until == 0
+                        else "high"
+                        if days_until == 1
+                        else "medium"
+                    )
+                    title = f"Sprint deadline {'today' if days_until == 0 else f'in {days_until} day(s)'}"  # noqa: E501
+                    message = f"Sprint '{sprint.name}' ends on {sprint.end_date.strftime('%Y-%m-%d')}"  # noqa: E501
+
+                    created = notification_service.deliver(
+                        [
+                            {
+                                "recipient": team_member.user,
+                                "notification_type": "sprint_deadline_approaching",
+                                "title": title,
+                                "message": message,
+                                "link": f"/projects/{sprint.project.key}/sprints/{sprint.id}",  # noqa: E501
+                                "data": {
+                                    "sprint_id": str(sprint.id),
+                                    "days_until": days_until,
+                                    "urgency": urgency,
+                                },
+                                "send_email": days_until <= 1,
+                            }
+                            for team_member in team_leads
+                            if team_member.user_id not in notified
+                        ]
+                    )
+
+                    results["notifications_created"] += len(created)
+                    logger.info(
+                        f"Sent {len(created)} sprint deadline notifications for {sprint.name}"  # noqa: E501
+                    )
 
                 except Exception as e:
                     error_msg = f"Error notifying sprint {sprint.id} deadline: {str(e)}"
@@ -175,72 +192,27 @@ def send_notification_digests(self):
     """
     Send daily digest emails to users who have digest mode enabled.
 
-    This task aggregates unread notifications and sends a summary email.
+    Unread notifications of the last 24 hours are counted per user and type
+    in one grouped query; rendering and sending is split into chunks of
+    NOTIFICATION_DIGEST_CHUNK_SIZE recipients handled by the email workers.
 
     Returns:
-        dict: Digest sending results
+        dict: Digest scheduling results
     """
     try:
-        from apps.notifications.models import Notification, NotificationPreference
+        from apps.notifications.services import NotificationService
 
         logger.info("Starting notification digest task")
 
-        results = {
-            "users_processed": 0,
-            "digests_sent": 0,
-            "errors": [],
-        }
-
-        # Get users with digest mode enabled
-        digest_preferences = NotificationPreference.objects.filter(
-            digest_enabled=True,
-            email_enabled=True,
-        ).select_related("user")
+        yesterday = timezone.now() - timedelta(days=1)
+        digests = NotificationService().build_digests(since=yesterday)
 
-        for preference in digest_preferences:
-            try:
-                user = preference.user
-                results["users_processed"] += 1
-
-                # Get unread notifications from last 24 hours
-                yesterday = timezone.now() - timedelta(days=1)
-                unread_notifications = Notification.objects.filter(
-                    recipient=user,
-                    is_read=False,
-                    created_at__gte=yesterday,
-                ).order_by("-created_at")
-
-                if not unread_notifications.exists():
-                    continue
-
-                # Group notifications by type
-                notification_groups = {}
-                for notif in unread_notifications:
-                    if notif.notification_type not in notification_groups:
-                        notification_groups[notif.notification_type] = []
-                    notification_groups[notif.notification_type].append(notif)
-
-                # Build digest email (simplified - would use email template in
-                # production)
-                digest_summary = (
-                    f"You have {unread_notifications.count()} unread notifications:\n\n"
-                )
-                for notif_type, notifs in notification_groups.items():
-                    digest_summary += f"- {len(notifs)} {notif_type.replace('_', ' ')} notifications\n"  # noqa: E501
-
-                # Send digest email (placeholder - would use EmailService in production)
-                # notification_service.email_service.send_digest_email(user.email, digest_summary)  # noqa: E501
-
-                results["digests_sent"] += 1
-                logger.info(
-                    f"Sent digest to {user.email} with {unread_notifications.count()} notifications"  # noqa: E501
-                )
-
-            except Exception as e:
-                error_msg = f"Error sending digest to {preference.user_id}: {str(e)}"
-                logger.exception(error_msg)
-                results["errors"].append(error_msg)
+        size = getattr(settings, "NOTIFICATION_DIGEST_CHUNK_SIZE", 200)
+        chunks = [digests[i : i + size] for i in range(0, len(digests), size)]
+        for chunk in chunks:
+            send_digest_emails.delay(chunk)
 
+        results = {"users_processed": len(digests), "batches_queued": len(chunks)}
         logger.info(f"Notification digest task completed: {results}")
         return results
 
@@ -249,6 +221,40 @@ def send_notification_digests(self):
         raise
 
 
+@shared_task(
+    bind=True,
+    name="apps.notifications.tasks.send_digest_emails",
+    rate_limit=getattr(settings, "NOTIFICATION_EMAIL_RATE_LIMIT", "30/m"),
+    max_retries=3,
+)
+def send_digest_emails(self, digests):
+    """
+    Render and email a chunk of notification digests.
+
+    Only the digests that could not be sent are retried, so recipients who
+    already got theirs are not mailed again.
+
+    Args:
+        digests: [{"email": ..., "counts": {notification_type: count}}]
+
+    Returns:
+        dict: Number of digests sent
+    """
+    from apps.notifications.services import NotificationService
+
+    try:
+        sent, failed = NotificationService().send_digest_batch(digests)
+    except Exception as e:
+        # The backend connection failed, so nothing was sent
+        logger.exception(f"Error sending notification digests: {str(e)}")
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+    if failed:
+        logger.warning(f"Retrying {len(failed)} of {len(digests)} notification digests")
+        raise self.retry(args=[failed], countdown=60 * 2**self.request.retries)
+    return {"sent": sent}
+
+
 @shared_task(bind=True, name="apps.notifications.tasks.cleanup_old_notifications")
 def cleanup_old_notifications(self):
     """
@@ -276,3 +282,68 @@ def cleanup_old_notifications(self):
     except Exception as e:
         logger.exception(f"Error in cleanup_old_notifications task: {str(e)}")
         raise
+
+
+@shared_task(bind=True, name="apps.notifications.tasks.dispatch_notification_event")
+def dispatch_notification_event(self, event, kwargs):
+    """
+    Resolve the recipients of a queued notification event and notify them.
+
+    Queued by NotificationService.enqueue after the triggering transaction
+    commits.
+
+    Args:
+        event: Event name (see NotificationService.EVENT_HANDLERS)
+        kwargs: Arguments of the matching notify_* method
+    """
+    from apps.notifications.services import NotificationService
+
+    NotificationService().handle_event(event, **kwargs)
+
+
+@shared_task(
+    bind=True,
+    name="apps.notifications.tasks.send_notification_emails",
+    rate_limit=getattr(settings, "NOTIFICATION_EMAIL_RATE_LIMIT", "30/m"),
+    max_retries=3,
+)
+def send_notification_emails(self, notification_ids):
+    """
+    Email a batch of notifications.
+
+    Rate-limited per worker by NOTIFICATION_EMAIL_RATE_LIMIT (batches); the
+    batch is retried with backoff if the mail backend fails.
+
+    Args:
+        notification_ids: Notification UUIDs
+
+    Returns:
+        dict: Number of notifications emailed
+    """
+    from apps.notifications.services import NotificationService
+
+    try:
+        return {"sent": NotificationService().send_email_batch(notification_ids)}
+    except Exception as e:
+        logger.exception(f"Error emailing notifications: {str(e)}")
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
+
+
+@shared_task(
+    bind=True,
+    name="apps.notifications.tasks.send_notification_slack",
+    rate_limit=getattr(settings, "NOTIFICATION_SLACK_RATE_LIMIT", "30/m"),
+)
+def send_notification_slack(self, notification_ids):
+    """
+    Post a batch of notifications to Slack.
+
+    Args:
+        notification_ids: Notification UUIDs
+
+    Returns:
+        dict: Number of notifications posted
+    """
+    from apps.notifications.services import NotificationService
+
+    return {"sent": NotificationService().send_slack_batch(notification_ids)}
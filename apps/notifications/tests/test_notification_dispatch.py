@@ -0,0 +1,222 @@
+"""
+Tests for bulk notification creation, queued events and batched delivery.
+
+Slack calls are mocked; emails go to the locmem backend.
+"""
+
+from datetime import timedelta
+from smtplib import SMTPRecipientsRefused
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.utils import timezone
+
+import pytest
+from celery.exceptions import Retry
+
+from apps.authentication.tests.factories import UserFactory
+from apps.notifications.models import Notification
+from apps.notifications.services import NotificationService
+from apps.notifications.tasks import (
+    check_upcoming_deadlines,
+    send_digest_emails,
+    send_notification_digests,
+)
+from apps.notifications.tests.factories import (
+    NotificationFactory,
+    NotificationPreferenceFactory,
+)
+from apps.projects.tests.factories import (
+    IssueCommentFactory,
+    IssueFactory,
+    SprintFactory,
+)
+
+
+def notification_data(recipient, **extra):
+    return {
+        "recipient": recipient,
+        "notification_type": "issue_assigned",
+        "title": "Assigned",
+        "message": "You were assigned",
+        **extra,
+    }
+
+
+@pytest.mark.django_db
+class TestDeliver:
+    def test_constant_queries_for_many_recipients(self, django_assert_num_queries):
+        users = UserFactory.create_batch(10)
+        NotificationPreferenceFactory(user=users[0])
+
+        # Preferences of every recipient, then one INSERT
+        with django_assert_num_queries(2):
+            created = NotificationService().deliver(
+                [notification_data(user) for user in users]
+            )
+
+        assert len(created) == 10
+        assert Notification.objects.filter(recipient__in=users).count() == 10
+
+    def test_respects_preferences(self):
+        muted = NotificationPreferenceFactory(
+            notification_types={"issue_assigned": False}
+        ).user
+        disabled = NotificationPreferenceFactory(in_app_enabled=False).user
+        default = UserFactory()
+
+        created = NotificationService().deliver(
+            [notification_data(user) for user in (muted, disabled, default)]
+        )
+
+        assert [notification.recipient_id for notification in created] == [default.pk]
+
+    def test_email_and_slack_sent_in_batches_after_commit(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        settings.NOTIFICATION_DELIVERY_BATCH_SIZE = 2
+        settings.NOTIFICATION_SLACK_MAX_PER_SECOND = 1000
+        users = [
+            NotificationPreferenceFactory(slack_enabled=True).user for _ in range(3)
+        ]
+        digest = NotificationPreferenceFactory(digest_enabled=True).user
+
+        with patch(
+            "apps.notifications.services.notification_service.SlackService"
+        ) as slack_service:
+            slack_service.return_value.send_notification.return_value = True
+            service = NotificationService()
+            with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                service.deliver(
+                    [notification_data(user, send_slack=True) for user in users]
+                    + [notification_data(digest)]
+                )
+
+        # WebSocket push, two email batches and two Slack batches
+        assert len(callbacks) == 5
+        assert sorted(message.to[0] for message in mail.outbox) == sorted(
+            user.email for user in users
+        )
+        assert slack_service.return_value.send_notification.call_count == 3
+        assert Notification.objects.filter(email_sent=True).count() == 3
+        assert Notification.objects.filter(slack_sent=True).count() == 3
+
+
+@pytest.mark.django_db
+class TestQueuedEvents:
+    def test_comment_event_notifies_assignee_and_reporter(
+        self, django_capture_on_commit_callbacks
+    ):
+        issue = IssueFactory()
+        comment = IssueCommentFactory(issue=issue, author=issue.reporter)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.enqueue(
+                "issue_commented",
+                comment_id=str(comment.id),
+                commenter_id=str(comment.author_id),
+            )
+
+        notifications = Notification.objects.filter(notification_type="issue_commented")
+        assert [notification.recipient_id for notification in notifications] == [
+            issue.assignee_id
+        ]
+
+    def test_unknown_event_is_rejected(self):
+        with pytest.raises(ValueError):
+            NotificationService.enqueue("unknown")
+
+
+@pytest.mark.django_db
+class TestDeadlineTask:
+    def test_notifies_each_issue_once(self):
+        sprint = SprintFactory(end_date=timezone.now().date() + timedelta(days=1))
+        issues = IssueFactory.create_batch(
+            3, project=sprint.project, sprint=sprint, status__project=sprint.project
+        )
+        IssueFactory(project=sprint.project, sprint=sprint, assignee=None)
+
+        first = check_upcoming_deadlines()
+        second = check_upcoming_deadlines()
+
+        assert first["issue_deadlines_checked"] == 3
+        assert second["issue_deadlines_checked"] == 0
+        notified = Notification.objects.filter(notification_type="deadline_approaching")
+        assert sorted(notification.data["issue_id"] for notification in notified) == (
+            sorted(str(issue.id) for issue in issues)
+        )
+
+
+@pytest.mark.django_db
+class TestDigests:
+    def test_grouped_counts_in_one_query(self, django_assert_num_queries):
+        users = [
+            NotificationPreferenceFactory(digest_enabled=True).user for _ in range(3)
+        ]
+        realtime = NotificationPreferenceFactory(digest_enabled=False).user
+        for user in users + [realtime]:
+            NotificationFactory.create_batch(2, recipient=user)
+            NotificationFactory(recipient=user, notification_type="mention")
+            NotificationFactory(recipient=user, is_read=True)
+
+        with django_assert_num_queries(1):
+            digests = NotificationService().build_digests(
+                since=timezone.now() - timedelta(days=1)
+            )
+
+        assert sorted(digest["email"] for digest in digests) == sorted(
+            user.email for user in users
+        )
+        assert all(
+            digest["counts"] == {"issue_assigned": 2, "mention": 1}
+            for digest in digests
+        )
+
+    def test_task_sends_digests_in_chunks(self, settings):
+        settings.NOTIFICATION_DIGEST_CHUNK_SIZE = 2
+        users = [
+            NotificationPreferenceFactory(digest_enabled=True).user for _ in range(3)
+        ]
+        for user in users:
+            NotificationFactory(recipient=user)
+
+        result = send_notification_digests()
+
+        assert result == {"users_processed": 3, "batches_queued": 2}
+        assert sorted(message.to[0] for message in mail.outbox) == sorted(
+            user.email for user in users
+        )
+        assert "You have 1 unread notifications" in mail.outbox[0].body
+
+    def test_failed_digests_are_retried_alone(self):
+        digests = [
+            {"email": "first@example.com", "counts": {"mention": 1}},
+            {"email": "second@example.com", "counts": {"mention": 2}},
+        ]
+        refused = []
+        send_messages = EmailBackend.send_messages
+
+        def refuse_second_once(backend, messages):
+            if messages[0].to == ["second@example.com"] and not refused:
+                refused.append(messages[0])
+                raise SMTPRecipientsRefused({"second@example.com": (450, b"busy")})
+            return send_messages(backend, messages)
+
+        def run_retry(args, countdown):
+            send_digest_emails(*args)
+            return Retry()
+
+        with patch.object(EmailBackend, "send_messages", refuse_second_once):
+            with patch(
+                "apps.notifications.tasks.send_digest_emails.retry",
+                side_effect=run_retry,
+            ) as retry:
+                with pytest.raises(Retry):
+                    send_digest_emails(digests)
+
+        retry.assert_called_once()
+        assert [message.to for message in mail.outbox] == [
+            ["first@example.com"],
+            ["second@example.com"],
+        ]
@@ -0,0 +1,184 @@
+"""
+Tests for cached unread counts and the notification WebSocket.
+"""
+
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.utils import timezone
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.testing import WebsocketCommunicator
+from rest_framework.test import APIClient
+
+from apps.authentication.tests.factories import UserFactory
+from apps.notifications.admin import NotificationAdmin
+from apps.notifications.consumers import NotificationConsumer
+from apps.notifications.models import Notification
+from apps.notifications.services import NotificationService
+from apps.notifications.services.notification_stream import NotificationStream
+from apps.notifications.tests.factories import NotificationFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def deliver(user, count=1):
+    return NotificationService().deliver(
+        [
+            {
+                "recipient": user,
+                "notification_type": "issue_assigned",
+                "title": f"Assigned {index}",
+                "message": "You were assigned",
+                "send_email": False,
+            }
+            for index in range(count)
+        ]
+    )
+
+
+@pytest.mark.django_db
+class TestUnreadCounter:
+    def test_counted_once_then_cached(self, django_assert_num_queries):
+        user = UserFactory()
+        NotificationFactory.create_batch(3, recipient=user)
+        stream = NotificationStream(user.pk)
+
+        with django_assert_num_queries(1):
+            assert stream.unread_count() == 3
+        with django_assert_num_queries(0):
+            assert stream.unread_count() == 3
+
+    def test_follows_create_and_read(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+        stream = NotificationStream(user.pk)
+        assert stream.unread_count() == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first, second = deliver(user, count=2)
+        assert cache.get(stream._count_key) == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first.mark_as_read()
+            NotificationService().mark_as_read(second.id, user)
+        assert cache.get(stream._count_key) == 0
+
+    def test_stale_copy_is_only_counted_as_read_once(
+        self, django_capture_on_commit_callbacks
+    ):
+        user = UserFactory()
+        NotificationFactory.create_batch(2, recipient=user)
+        notification = NotificationFactory(recipient=user)
+        stale_copy = Notification.objects.get(pk=notification.pk)
+        stream = NotificationStream(user.pk)
+        assert stream.unread_count() == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert notification.mark_as_read()
+            assert not stale_copy.mark_as_read()
+
+        assert stream.unread_count() == 2
+
+    def test_recount_racing_a_create_is_not_cached(self):
+        user = UserFactory()
+        stream = NotificationStream(user.pk)
+        count_key = stream._count_key
+
+        # A create commits and finds nothing to adjust while a recount that
+        # missed it is still running
+        stream.adjust(1)
+        cache.add(count_key, 0)
+
+        NotificationFactory(recipient=user)
+        assert stream.unread_count() == 1
+
+    def test_admin_and_cleanup_invalidate_counts(
+        self, django_capture_on_commit_callbacks
+    ):
+        user = UserFactory()
+        stale = NotificationFactory(recipient=user)
+        NotificationFactory(recipient=user)
+        Notification.objects.filter(pk=stale.pk).update(
+            created_at=timezone.now() - timedelta(days=100)
+        )
+        stream = NotificationStream(user.pk)
+        assert stream.unread_count() == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService().delete_old_notifications(days=90)
+        assert stream.unread_count() == 1
+
+        admin = NotificationAdmin(Notification, AdminSite())
+        with patch.object(admin, "message_user"), django_capture_on_commit_callbacks(
+            execute=True
+        ):
+            admin.mark_as_read(RequestFactory().get("/"), Notification.objects.all())
+        assert stream.unread_count() == 0
+
+    def test_endpoint_uses_no_sql_when_cached(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        user = UserFactory()
+        client = APIClient()
+        client.force_authenticate(user)
+        NotificationStream(user.pk).unread_count()
+        with django_capture_on_commit_callbacks(execute=True):
+            deliver(user, count=2)
+
+        with django_assert_num_queries(0):
+            response = client.get("/api/v1/notifications/notifications/unread-count/")
+        assert response.data == {"unread_count": 2}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.post("/api/v1/notifications/notifications/mark-all-read/")
+        response = client.get("/api/v1/notifications/notifications/unread-count/")
+        assert response.data == {"unread_count": 0}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestNotificationConsumer:
+    @async_to_sync
+    async def _session(self, user, action=None):
+        communicator = WebsocketCommunicator(
+            NotificationConsumer.as_asgi(), "/ws/notifications/"
+        )
+        communicator.scope["user"] = user
+        connected, _ = await communicator.connect()
+        received = []
+        if connected:
+            received.append(json.loads(await communicator.receive_from()))
+            if action is not None:
+                await action()
+            while not await communicator.receive_nothing(timeout=0.2):
+                received.append(json.loads(await communicator.receive_from()))
+        await communicator.disconnect()
+        return connected, received
+
+    def test_rejects_anonymous(self):
+        connected, _ = self._session(AnonymousUser())
+        assert not connected
+
+    def test_pushes_new_notifications(self):
+        user = UserFactory()
+        NotificationFactory(recipient=user)
+
+        connected, received = self._session(
+            user, action=sync_to_async(lambda: deliver(user))
+        )
+
+        assert connected
+        assert received[0] == {"type": "notifications.sync", "unread_count": 1}
+        assert received[1]["type"] == "notification.created"
+        assert received[1]["notification"]["title"] == "Assigned 0"
+        assert received[1]["unread_count"] == 2
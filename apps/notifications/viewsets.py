@@ -6,6 +6,7 @@ Provides REST API endpoints for notifications management.
 
 import logging
 
+from django.db import transaction
 from django.utils import timezone
 
 from django_filters import rest_framework as filters
@@ -13,7 +14,6 @@ from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
@@ -24,12 +24,17 @@ from apps.notifications.serializers import (
     NotificationUpdateSerializer,
 )
 from apps.notifications.services import SlackService
+from apps.notifications.services.notification_stream import (
+    NotificationStream,
+    publish_all_read,
+)
+from base.pagination import CursorOptInPagination
 
 logger = logging.getLogger(__name__)
 
 
-class NotificationPagination(PageNumberPagination):
-    """Custom pagination for notifications."""
+class NotificationPagination(CursorOptInPagination):
+    """Custom pagination for notifications (?pagination=cursor for keyset)."""
 
     page_size = 20
     page_size_query_param = "page_size"
@@ -141,6 +146,28 @@ class NotificationViewSet(viewsets.ModelViewSet):
             return NotificationUpdateSerializer
         return NotificationSerializer
 
+    def perform_update(self, serializer):
+        was_read = serializer.instance.is_read
+        notification = serializer.save()
+        if notification.is_read != was_read:
+            self._refresh_unread_count()
+
+    def perform_destroy(self, instance):
+        was_unread = not instance.is_read
+        instance.delete()
+        if was_unread:
+            self._refresh_unread_count()
+
+    def _refresh_unread_count(self):
+        """Recount after changes the counter does not track and push it."""
+        stream = NotificationStream(self.request.user.pk)
+
+        def refresh():
+            stream.invalidate()
+            stream.send_count()
+
+        transaction.on_commit(refresh)
+
     @extend_schema(
         tags=["Notifications"],
         summary="Mark notification as read",
@@ -180,6 +207,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
         count = Notification.objects.filter(
             recipient=request.user, is_read=False
         ).update(is_read=True, read_at=timezone.now())
+        user_id = request.user.pk
+        transaction.on_commit(lambda: publish_all_read(user_id))
 
         return Response(
             {
@@ -192,20 +221,12 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @extend_schema(
         tags=["Notifications"],
         summary="Get unread count",
-        description="Get count of unread notifications for current user",
+        description="Get count of unread notifications for current user. Clients connected to ws/notifications/ receive count changes as they happen.",  # noqa: E501
     )
     @action(detail=False, methods=["get"], url_path="unread-count")
     def unread_count(self, request):
-        """Get unread notification count - optimized with direct query."""
-        # Use values().count() for maximum performance with index
-        count = (
-            Notification.objects.filter(
-                recipient_id=self.request.user.id,  # Use recipient_id to avoid JOIN
-                is_read=False,
-            )
-            .values("id")  # Force index-only scan
-            .count()
-        )
+        """Get unread notification count from the cached counter."""
+        count = NotificationStream(request.user.pk).unread_count()
         return Response({"unread_count": count}, status=status.HTTP_200_OK)
 
     @extend_schema(
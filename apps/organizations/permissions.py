@@ -5,7 +5,7 @@ Implements role-based access control for organizations and memberships.
 
 from rest_framework import permissions
 
-from apps.organizations.models import OrganizationMembership
+from base.utils.access_scope import AccessScope
 
 
 class IsOrganizationMember(permissions.BasePermission):
@@ -24,9 +24,9 @@ class IsOrganizationMember(permissions.BasePermission):
             # obj is Organization
             organization = obj
 
-        return OrganizationMembership.objects.filter(
-            organization=organization, user=request.user, is_active=True
-        ).exists()
+        return AccessScope.for_user(request.user).is_organization_member(
+            organization.id
+        )
 
 
 class IsOrganizationOwnerOrAdmin(permissions.BasePermission):
@@ -47,14 +47,8 @@ class IsOrganizationOwnerOrAdmin(permissions.BasePermission):
         else:
             organization = obj
 
-        membership = OrganizationMembership.objects.filter(
-            organization=organization,
-            user=request.user,
-            role__in=["owner", "admin"],
-            is_active=True,
-        ).first()
-
-        return membership is not None
+        role = AccessScope.for_user(request.user).organization_role(organization.id)
+        return role in ("owner", "admin")
 
 
 class CanManageMembers(permissions.BasePermission):
@@ -78,26 +72,18 @@ class CanManageMembers(permissions.BasePermission):
         organization = obj.organization
 
         # Check if requesting user has management permissions
-        membership = OrganizationMembership.objects.filter(
-            organization=organization,
-            user=request.user,
-            role__in=["owner", "admin", "manager"],
-            is_active=True,
-        ).first()
-
-        if not membership:
-            return False
+        role = AccessScope.for_user(request.user).organization_role(organization.id)
 
         # Owners can manage anyone
-        if membership.role == "owner":
+        if role == "owner":
             return True
 
         # Admins can't change owner roles or other admins
-        if membership.role == "admin":
+        if role == "admin":
             return obj.role not in ["owner", "admin"]
 
         # Managers can only change regular members
-        if membership.role == "manager":
+        if role == "manager":
             return obj.role in ["member", "guest"]
 
         return False
@@ -121,8 +107,5 @@ class IsOrganizationOwner(permissions.BasePermission):
             return organization.owner == request.user
 
         # Fallback: check membership role
-        membership = OrganizationMembership.objects.filter(
-            organization=organization, user=request.user, role="owner", is_active=True
-        ).first()
-
-        return membership is not None
+        role = AccessScope.for_user(request.user).organization_role(organization.id)
+        return role == "owner"
@@ -4,11 +4,13 @@ from rest_framework import serializers
 
 from apps.organizations.models import Organization
 from base.serializers import UserBasicSerializer
+from base.utils.access_scope import AccessScope
 
 
 class OrganizationSerializer(serializers.ModelSerializer):
-    member_count = serializers.ReadOnlyField()
-    workspace_count = serializers.ReadOnlyField()
+    member_count = serializers.SerializerMethodField()
+    workspace_count = serializers.SerializerMethodField()
+    user_role = serializers.SerializerMethodField()
     logo_url = serializers.SerializerMethodField()
     owner = UserBasicSerializer(read_only=True)
 
@@ -38,6 +40,7 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "is_active",
             "member_count",
             "workspace_count",
+            "user_role",
             "active_projects_count",
             "active_projects_change_pct",
             "team_members_count",
@@ -56,6 +59,25 @@ class OrganizationSerializer(serializers.ModelSerializer):
             return obj.logo.url
         return None
 
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_member_count(self, obj):
+        # Annotated on list; counted per object otherwise
+        count = getattr(obj, "team_members_count", None)
+        return obj.member_count if count is None else count
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_workspace_count(self, obj):
+        count = getattr(obj, "total_workspaces_count", None)
+        return obj.workspace_count if count is None else count
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_user_role(self, obj):
+        """Role of the requesting user, from their cached access scope."""
+        request = self.context.get("request")
+        if request and request.user.is_authenticated:
+            return AccessScope.for_user(request.user).organization_role(obj.id)
+        return None
+
     def validate_logo(self, value):
         if value and value.size > 5 * 1024 * 1024:  # 5MB limit
             raise serializers.ValidationError("Logo file size cannot exceed 5MB")
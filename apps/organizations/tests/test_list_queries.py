@@ -0,0 +1,111 @@
+"""
+Query counts of the organization list and dashboard statistics.
+"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.organizations.tests.factories import (
+    OrganizationFactory,
+    OrganizationMembershipFactory,
+)
+from apps.projects.tests.factories import ProjectFactory
+from apps.workspaces.tests.factories import WorkspaceFactory
+from base.utils.access_scope import AccessScope
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestOrganizationListQueries:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.organizations = OrganizationFactory.create_batch(100)
+        for index, organization in enumerate(self.organizations):
+            OrganizationMembershipFactory(
+                organization=organization,
+                user=self.user,
+                role="admin" if index % 2 else "member",
+            )
+        OrganizationFactory()
+
+    def test_list_of_100_organizations_runs_a_fixed_number_of_queries(
+        self, api_client, django_assert_max_num_queries
+    ):
+        api_client.force_authenticate(user=self.user)
+        url = reverse("organizations-list")
+
+        with django_assert_max_num_queries(6):
+            response = api_client.get(url, {"page_size": 100})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 100
+        roles = {row["id"]: row["user_role"] for row in response.data["results"]}
+        assert roles[str(self.organizations[0].id)] == "member"
+        assert roles[str(self.organizations[1].id)] == "admin"
+
+    def test_counts_include_every_member_not_just_the_requester(self, api_client):
+        organization = self.organizations[0]
+        OrganizationMembershipFactory.create_batch(2, organization=organization)
+        OrganizationMembershipFactory(organization=organization, is_active=False)
+        WorkspaceFactory(organization=organization, slug="one")
+        WorkspaceFactory(organization=organization, slug="two")
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(reverse("organizations-list"), {"page_size": 100})
+
+        row = next(
+            row for row in response.data["results"] if row["id"] == str(organization.id)
+        )
+        assert row["member_count"] == row["team_members_count"] == 3
+        assert row["workspace_count"] == row["total_workspaces_count"] == 2
+
+
+@pytest.mark.django_db
+class TestOrganizationDashboardStats:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.organization = OrganizationFactory()
+        OrganizationMembershipFactory(organization=self.organization, user=self.user)
+        OrganizationMembershipFactory.create_batch(2, organization=self.organization)
+        workspace = WorkspaceFactory(organization=self.organization)
+        ProjectFactory.create_batch(3, workspace=workspace, status="active")
+        self.url = reverse("organizations-dashboard-stats")
+
+    def test_stats_are_one_query_and_cached(
+        self, api_client, django_assert_num_queries
+    ):
+        api_client.force_authenticate(user=self.user)
+        # The access scope is loaded and cached separately
+        AccessScope.for_user(self.user)
+
+        with django_assert_num_queries(1):
+            first = api_client.get(self.url)
+        with django_assert_num_queries(0):
+            second = api_client.get(self.url)
+
+        assert first.data == second.data
+        # The user's personal organization counts too
+        assert first.data["organizations"] == 2
+        assert first.data["team_members"] == 4
+        assert first.data["active_projects"] >= 3
+
+    def test_joining_an_organization_refreshes_the_stats(self, api_client):
+        api_client.force_authenticate(user=self.user)
+        before = api_client.get(self.url).data
+
+        OrganizationMembershipFactory(
+            organization=OrganizationFactory(), user=self.user
+        )
+
+        after = api_client.get(self.url).data
+        assert after["organizations"] == before["organizations"] + 1
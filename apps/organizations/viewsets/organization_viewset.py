@@ -1,8 +1,9 @@
 from datetime import timedelta
 
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, OuterRef, Q, Sum
 from django.utils import timezone
+
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -20,6 +21,8 @@ from apps.organizations.serializers import (
     OrganizationMemberSerializer,
     OrganizationSerializer,
 )
+from base.utils.access_scope import AccessScope
+from base.utils.dashboard_stats import SubqueryCount, cached_dashboard_stats
 from base.utils.file_handlers import upload_organization_logo_to_s3
 
 
@@ -75,55 +78,11 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         return [IsAuthenticated()]
 
     def get_queryset(self):
-        queryset = (
-            Organization.objects.filter(
-                memberships__user=self.request.user, memberships__is_active=True
-            )
-            .select_related("owner")
-            .distinct()
-        )
+        queryset = self._member_organizations().select_related("owner")
 
         if self.action == "list":
             week_ago = timezone.now() - timedelta(days=7)
-            queryset = queryset.annotate(
-                active_projects_count=Count(
-                    "workspaces__projects",
-                    filter=Q(workspaces__projects__status="active"),
-                    distinct=True,
-                ),
-                team_members_count=Count(
-                    "memberships",
-                    filter=Q(memberships__is_active=True),
-                    distinct=True,
-                ),
-                total_workspaces_count=Count(
-                    "workspaces", filter=Q(workspaces__is_active=True), distinct=True
-                ),
-                prev_active_projects=Count(
-                    "workspaces__projects",
-                    filter=Q(
-                        workspaces__projects__status="active",
-                        workspaces__projects__created_at__lte=week_ago,
-                    ),
-                    distinct=True,
-                ),
-                prev_team_members=Count(
-                    "memberships",
-                    filter=Q(
-                        memberships__is_active=True,
-                        memberships__created_at__lte=week_ago,
-                    ),
-                    distinct=True,
-                ),
-                prev_workspaces=Count(
-                    "workspaces",
-                    filter=Q(
-                        workspaces__is_active=True,
-                        workspaces__created_at__lte=week_ago,
-                    ),
-                    distinct=True,
-                ),
-            )
+            queryset = self._annotate_counts(queryset, week_ago)
         else:
             queryset = queryset.prefetch_related(
                 "memberships", "memberships__user", "workspaces"
@@ -131,6 +90,43 @@ class OrganizationViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def _member_organizations(self):
+        """
+        Organizations the user is an active member of.
+
+        Filtered by ID rather than through the membership join, which would
+        also restrict the membership counts to the user's own membership.
+        """
+        scope = AccessScope.for_user(self.request.user)
+        return Organization.objects.filter(id__in=scope.organization_ids)
+
+    @staticmethod
+    def _annotate_counts(queryset, week_ago):
+        """Per-organization counts, now and a week ago, as subqueries."""
+        from apps.organizations.models import OrganizationMembership
+        from apps.projects.models import Project
+        from apps.workspaces.models import Workspace
+
+        projects = Project.objects.filter(
+            workspace__organization=OuterRef("pk"), status="active"
+        )
+        members = OrganizationMembership.objects.filter(
+            organization=OuterRef("pk"), is_active=True
+        )
+        workspaces = Workspace.objects.filter(
+            organization=OuterRef("pk"), is_active=True
+        )
+        return queryset.annotate(
+            active_projects_count=SubqueryCount(projects),
+            team_members_count=SubqueryCount(members),
+            total_workspaces_count=SubqueryCount(workspaces),
+            prev_active_projects=SubqueryCount(
+                projects.filter(created_at__lte=week_ago)
+            ),
+            prev_team_members=SubqueryCount(members.filter(created_at__lte=week_ago)),
+            prev_workspaces=SubqueryCount(workspaces.filter(created_at__lte=week_ago)),
+        )
+
     def get_object(self):
         """Return organization if the requesting user is an active member.
         This avoids false negatives that can occur when queryset joins remove
@@ -161,21 +157,18 @@ class OrganizationViewSet(viewsets.ModelViewSet):
 
     def _get_global_stats(self):
         """Calculate global statistics once for all items in list."""
-        user = self.request.user
         week_ago = timezone.now() - timedelta(days=7)
 
-        orgs = Organization.objects.filter(
-            memberships__user=user, memberships__is_active=True
-        ).distinct()
-
-        current_org_count = orgs.count()
-        previous_org_count = orgs.filter(created_at__lte=week_ago).count()
+        counts = self._member_organizations().aggregate(
+            current=Count("pk"),
+            previous=Count("pk", filter=Q(created_at__lte=week_ago)),
+        )
 
         return {
-            "current_org_count": current_org_count,
-            "previous_org_count": previous_org_count,
+            "current_org_count": counts["current"],
+            "previous_org_count": counts["previous"],
             "organizations_change_pct": self._calc_pct(
-                current_org_count, previous_org_count
+                counts["current"], counts["previous"]
             ),
         }
 
@@ -241,88 +234,52 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         description=(
             "Aggregated statistics across all organizations user has access to. "
             "Includes percentage changes compared to 7 days ago. "
-            "Optimized with single query using annotations."
+            "Computed in one query and cached briefly per user."
         ),
     )
     @action(detail=False, methods=["get"], url_path="dashboard-stats")
     def dashboard_stats(self, request):
-        """Return dashboard statistics optimized with annotations."""
-        user = request.user
-        week_ago = timezone.now() - timedelta(days=7)
+        """Return dashboard statistics, cached briefly per user."""
+        return Response(
+            cached_dashboard_stats(
+                "organizations", request.user, self._compute_dashboard_stats
+            ),
+            status=status.HTTP_200_OK,
+        )
 
-        organizations = Organization.objects.filter(
-            memberships__user=user, memberships__is_active=True
-        ).distinct()
+    def _compute_dashboard_stats(self):
+        """Totals over the per-organization counts, in one query."""
+        week_ago = timezone.now() - timedelta(days=7)
 
-        current_stats = organizations.aggregate(
-            total_active_projects=Count(
-                "workspaces__projects",
-                filter=Q(workspaces__projects__status="active"),
-                distinct=True,
-            ),
-            total_team_members=Count(
-                "memberships", filter=Q(memberships__is_active=True), distinct=True
-            ),
-            total_workspaces=Count(
-                "workspaces", filter=Q(workspaces__is_active=True), distinct=True
-            ),
-            total_organizations=Count("id", distinct=True),
+        stats = self._annotate_counts(self._member_organizations(), week_ago).aggregate(
+            total_active_projects=Sum("active_projects_count"),
+            total_team_members=Sum("team_members_count"),
+            total_workspaces=Sum("total_workspaces_count"),
+            total_organizations=Count("pk"),
+            prev_projects=Sum("prev_active_projects"),
+            prev_members=Sum("prev_team_members"),
+            prev_workspaces=Sum("prev_workspaces"),
+            prev_organizations=Count("pk", filter=Q(created_at__lte=week_ago)),
         )
 
-        previous_stats = organizations.aggregate(
-            prev_projects=Count(
-                "workspaces__projects",
-                filter=Q(
-                    workspaces__projects__status="active",
-                    workspaces__projects__created_at__lte=week_ago,
-                ),
-                distinct=True,
+        return {
+            "active_projects": stats["total_active_projects"] or 0,
+            "active_projects_change_pct": self._calc_pct(
+                stats["total_active_projects"], stats["prev_projects"]
             ),
-            prev_members=Count(
-                "memberships",
-                filter=Q(
-                    memberships__is_active=True,
-                    memberships__created_at__lte=week_ago,
-                ),
-                distinct=True,
+            "team_members": stats["total_team_members"] or 0,
+            "team_members_change_pct": self._calc_pct(
+                stats["total_team_members"], stats["prev_members"]
             ),
-            prev_workspaces=Count(
-                "workspaces",
-                filter=Q(
-                    workspaces__is_active=True, workspaces__created_at__lte=week_ago
-                ),
-                distinct=True,
+            "total_workspaces": stats["total_workspaces"] or 0,
+            "total_workspaces_change_pct": self._calc_pct(
+                stats["total_workspaces"], stats["prev_workspaces"]
             ),
-            prev_organizations=Count(
-                "id", filter=Q(created_at__lte=week_ago), distinct=True
+            "organizations": stats["total_organizations"] or 0,
+            "organizations_change_pct": self._calc_pct(
+                stats["total_organizations"], stats["prev_organizations"]
             ),
-        )
-
-        return Response(
-            {
-                "active_projects": current_stats["total_active_projects"] or 0,
-                "active_projects_change_pct": self._calc_pct(
-                    current_stats["total_active_projects"],
-                    previous_stats["prev_projects"],
-                ),
-                "team_members": current_stats["total_team_members"] or 0,
-                "team_members_change_pct": self._calc_pct(
-                    current_stats["total_team_members"],
-                    previous_stats["prev_members"],
-                ),
-                "total_workspaces": current_stats["total_workspaces"] or 0,
-                "total_workspaces_change_pct": self._calc_pct(
-                    current_stats["total_workspaces"],
-                    previous_stats["prev_workspaces"],
-                ),
-                "organizations": current_stats["total_organizations"] or 0,
-                "organizations_change_pct": self._calc_pct(
-                    current_stats["total_organizations"],
-                    previous_stats["prev_organizations"],
-                ),
-            },
-            status=status.HTTP_200_OK,
-        )
+        }
 
     def _calc_pct(self, current, previous):
         """Calculate percentage change between two values."""
@@ -2,9 +2,13 @@ import json
 
 from django.contrib.auth import get_user_model
 
+from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from apps.projects.services.board_event_stream import BoardEventStream
+from base.utils.access_scope import AccessScope
+
 User = get_user_model()
 
 
@@ -14,9 +18,8 @@ class BoardConsumer(AsyncWebsocketConsumer):
 
     Handles:
     - User connection/disconnection to board
-    - Broadcasting issue movements
-    - Broadcasting issue creation/updates/deletion
-    - Broadcasting column changes
+    - Forwarding sequenced issue and column messages (BoardEventStream)
+    - Replaying missed messages when a client reports a sequence gap
     """
 
     async def connect(self):
@@ -58,6 +61,12 @@ class BoardConsumer(AsyncWebsocketConsumer):
         logger.info("[WS CONSUMER] Accepting WebSocket connection")
         await self.accept()
 
+        # Clients track the sequence from here and resync on gaps
+        current_seq = await sync_to_async(BoardEventStream(self.board_id).current_seq)()
+        await self.send(
+            text_data=json.dumps({"type": "board.sync", "seq": current_seq})
+        )
+
         logger.info("[WS CONSUMER] Broadcasting user_joined event")
         await self.channel_layer.group_send(
             self.room_group_name,
@@ -89,7 +98,39 @@ class BoardConsumer(AsyncWebsocketConsumer):
             )
 
     async def receive(self, text_data):
-        """Handle incoming WebSocket messages from client"""
+        """
+        Handle incoming WebSocket messages from client.
+
+        {"type": "resync", "since": <seq>} replays the board messages missed
+        after <seq>; if they are no longer buffered the client gets
+        "board.resync_required" and should reload the board snapshot.
+        """
+        try:
+            message = json.loads(text_data)
+        except (TypeError, ValueError):
+            return
+
+        if not isinstance(message, dict) or message.get("type") != "resync":
+            return
+
+        try:
+            since = int(message.get("since", 0))
+        except (TypeError, ValueError):
+            return
+
+        stream = BoardEventStream(self.board_id)
+        events = await sync_to_async(stream.events_since)(since)
+        if events is None:
+            current_seq = await sync_to_async(stream.current_seq)()
+            await self.send(
+                text_data=json.dumps(
+                    {"type": "board.resync_required", "seq": current_seq}
+                )
+            )
+            return
+
+        for text in events:
+            await self.send(text_data=text)
 
     async def user_joined(self, event):
         """Broadcast when user joins the board"""
@@ -119,67 +160,17 @@ class BoardConsumer(AsyncWebsocketConsumer):
             )
         )
 
-    async def issue_moved(self, event):
-        """Broadcast when issue is moved between columns"""
-        await self.send(
-            text_data=json.dumps({"type": "issue.moved", "data": event["data"]})
-        )
-
-    async def issue_created(self, event):
-        """Broadcast when new issue is created"""
-        await self.send(
-            text_data=json.dumps({"type": "issue.created", "data": event["data"]})
-        )
-
-    async def issue_updated(self, event):
-        """Broadcast when issue is updated"""
-        await self.send(
-            text_data=json.dumps({"type": "issue.updated", "data": event["data"]})
-        )
-
-    async def issue_deleted(self, event):
-        """Broadcast when issue is deleted"""
-        await self.send(
-            text_data=json.dumps({"type": "issue.deleted", "data": event["data"]})
-        )
-
-    async def column_created(self, event):
-        """Broadcast when new column is created"""
-        await self.send(
-            text_data=json.dumps({"type": "column.created", "data": event["data"]})
-        )
-
-    async def column_updated(self, event):
-        """Broadcast when column is updated"""
-        await self.send(
-            text_data=json.dumps({"type": "column.updated", "data": event["data"]})
-        )
-
-    async def column_deleted(self, event):
-        """Broadcast when column is deleted"""
-        await self.send(
-            text_data=json.dumps({"type": "column.deleted", "data": event["data"]})
-        )
+    async def board_event(self, event):
+        """Forward a sequenced board message, already JSON-encoded once"""
+        await self.send(text_data=event["text"])
 
     @database_sync_to_async
     def check_board_access(self):
         """Check if user has access to the board"""
-        from apps.projects.models import Board, ProjectTeamMember
-        from apps.workspaces.models import WorkspaceMember
+        from apps.projects.models import Board
 
         try:
-            board = Board.objects.select_related("project__workspace").get(
-                id=self.board_id
-            )
-
-            is_project_member = ProjectTeamMember.objects.filter(
-                project=board.project, user=self.user, is_active=True
-            ).exists()
-
-            is_workspace_member = WorkspaceMember.objects.filter(
-                workspace=board.project.workspace, user=self.user, is_active=True
-            ).exists()
-
-            return is_project_member or is_workspace_member
+            board = Board.objects.select_related("project").get(id=self.board_id)
+            return AccessScope.for_user(self.user).can_access_project(board.project)
         except Board.DoesNotExist:
             return False
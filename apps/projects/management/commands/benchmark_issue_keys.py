@@ -0,0 +1,139 @@
+"""
+Management command to benchmark parallel issue creation.
+
+Starts several threads, each with its own database connection, that create
+issues in an existing project as fast as they can, once with the previous
+key allocation (SELECT ... FOR UPDATE over the project's issues + Max("key"))
+and once with the per-project counter. Reports issues per second and how many
+creations failed, e.g. on duplicate keys. Created issues are deleted and the
+project's counter is restored at the end.
+
+Meant for Postgres; SQLite serializes all writers regardless of strategy.
+
+Usage:
+    python manage.py benchmark_issue_keys --project <uuid>
+    python manage.py benchmark_issue_keys --project <uuid> --threads 16 --issues-per-thread 200
+"""  # noqa: E501
+
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+
+from apps.projects.models import (
+    Issue,
+    IssueKeySequence,
+    IssueType,
+    Project,
+    WorkflowStatus,
+)
+from apps.projects.services import IssueKeyGenerator
+
+
+def legacy_generate_key(project):
+    """Key allocation before per-project counters."""
+    max_key = (
+        Issue.objects.filter(project=project)
+        .select_for_update()
+        .aggregate(max_key=Max("key"))
+        .get("max_key")
+    )
+    try:
+        return str(int(max_key) + 1) if max_key else "1"
+    except (ValueError, TypeError):
+        return "1"
+
+
+class Command(BaseCommand):
+    help = "Benchmark issue creation throughput with parallel writers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", required=True, help="Project UUID")
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--issues-per-thread", type=int, default=100)
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.select_related("lead").get(id=options["project"])
+        except Project.DoesNotExist:
+            raise CommandError(f"Project {options['project']} not found")
+
+        issue_type = IssueType.objects.filter(project=project).first()
+        status = WorkflowStatus.objects.filter(project=project).first()
+        if issue_type is None or status is None:
+            raise CommandError("Project needs at least one issue type and status")
+
+        sequence = IssueKeySequence.objects.filter(project=project).first()
+        last_number = sequence.last_number if sequence else None
+
+        self.stdout.write(
+            f"{'strategy':>9} {'created':>8} {'failed':>7} {'seconds':>8} {'issues/s':>9}"  # noqa: E501
+        )
+        for name, generate in (
+            ("legacy", legacy_generate_key),
+            ("counter", IssueKeyGenerator.generate_key),
+        ):
+            created, failed, elapsed = self._run(
+                project,
+                issue_type,
+                status,
+                generate,
+                options["threads"],
+                options["issues_per_thread"],
+            )
+            self.stdout.write(
+                f"{name:>9} {len(created):>8} {failed:>7} {elapsed:>8.2f} "
+                f"{len(created) / elapsed if elapsed else 0:>9.1f}"
+            )
+            Issue.objects.filter(id__in=created).delete()
+
+        # Leave the project as it was
+        if last_number is None:
+            IssueKeySequence.objects.filter(project=project).delete()
+        else:
+            IssueKeySequence.objects.filter(project=project).update(
+                last_number=last_number
+            )
+
+        self.stdout.write(self.style.SUCCESS("Benchmark complete"))
+
+    def _run(self, project, issue_type, status, generate, threads, per_thread):
+        created, failures = [], []
+        lock = threading.Lock()
+        start_gate = threading.Barrier(threads)
+
+        def worker(number):
+            ids, failed = [], 0
+            start_gate.wait()
+            try:
+                for index in range(per_thread):
+                    try:
+                        with transaction.atomic():
+                            issue = Issue.objects.create(
+                                project=project,
+                                issue_type=issue_type,
+                                status=status,
+                                reporter=project.lead,
+                                key=generate(project),
+                                title=f"Benchmark issue {number}-{index}",
+                            )
+                        ids.append(issue.id)
+                    except Exception:
+                        failed += 1
+            finally:
+                connection.close()
+            with lock:
+                created.extend(ids)
+                failures.append(failed)
+
+        workers = [
+            threading.Thread(target=worker, args=(number,)) for number in range(threads)
+        ]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return created, sum(failures), time.perf_counter() - start
@@ -0,0 +1,198 @@
+"""
+Management command to benchmark the issue list query.
+
+Seeds synthetic issues (with comments on a fraction of them) into an existing
+project inside a transaction that is rolled back at the end, then times the
+list query as the API runs it: COUNT(*) for pagination plus one serialized
+page. The previous queryset (membership join + DISTINCT + COUNT aggregates
+over comments, attachments and links) is timed alongside for comparison.
+
+Usage:
+    python manage.py benchmark_issue_list --project <uuid>
+    python manage.py benchmark_issue_list --project <uuid> --issues 100000 --pages 1 50 500
+"""  # noqa: E501
+
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
+
+from apps.projects.models import Issue, IssueComment, IssueType, Project, WorkflowStatus
+from apps.projects.serializers import IssueListSerializer
+from apps.projects.viewsets.issue_viewset import IssueViewSet
+
+BATCH_SIZE = 5000
+
+
+def legacy_queryset(user):
+    """Issue list queryset before counters and the EXISTS access filter."""
+    return (
+        Issue.objects.filter(
+            Q(
+                project__workspace__members__user=user,
+                project__workspace__members__is_active=True,
+            )
+            | Q(
+                project__team_members__user=user,
+                project__team_members__is_active=True,
+            )
+        )
+        .select_related(
+            "project",
+            "project__workspace",
+            "issue_type",
+            "status",
+            "assignee",
+            "reporter",
+            "sprint",
+            "parent_issue",
+        )
+        .annotate(
+            _comment_count=Count("comments", distinct=True),
+            _attachment_count=Count("attachments", distinct=True),
+            _source_link_count=Count("source_links", distinct=True),
+            _target_link_count=Count("target_links", distinct=True),
+        )
+        .distinct()
+    )
+
+
+def current_queryset(user):
+    view = IssueViewSet()
+    view.request = SimpleNamespace(user=user)
+    view.action = "list"
+    return view.get_queryset()
+
+
+class Command(BaseCommand):
+    help = "Benchmark issue list latency on a project with many synthetic issues"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", required=True, help="Project UUID")
+        parser.add_argument(
+            "--user",
+            help="Email of the user listing issues (default: project lead)",
+        )
+        parser.add_argument(
+            "--issues",
+            type=int,
+            default=100000,
+            help="Synthetic issues to add to the project",
+        )
+        parser.add_argument(
+            "--comment-ratio",
+            type=float,
+            default=0.1,
+            help="Fraction of synthetic issues that get a comment",
+        )
+        parser.add_argument(
+            "--pages",
+            type=int,
+            nargs="+",
+            default=[1, 50, 500],
+            help="Page numbers to time",
+        )
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per page (best time is reported)",
+        )
+
+    def handle(self, *args, **options):
+        from django.contrib.auth import get_user_model
+
+        try:
+            project = Project.objects.select_related("lead").get(id=options["project"])
+        except Project.DoesNotExist:
+            raise CommandError(f"Project {options['project']} not found")
+
+        user = project.lead
+        if options["user"]:
+            user = get_user_model().objects.filter(email=options["user"]).first()
+        if user is None:
+            raise CommandError("No user to list issues as")
+
+        with transaction.atomic():
+            self._seed(project, user, options["issues"], options["comment_ratio"])
+
+            self.stdout.write(
+                f"{'query':>8} {'page':>6} {'count ms':>9} {'page ms':>8} {'total ms':>9}"  # noqa: E501
+            )
+            for name, build in (
+                ("legacy", legacy_queryset),
+                ("current", current_queryset),
+            ):
+                for page in options["pages"]:
+                    best = self._time_page(
+                        build(user).filter(project=project),
+                        page,
+                        options["page_size"],
+                        options["repeat"],
+                    )
+                    self.stdout.write(
+                        f"{name:>8} {page:>6} {best[0]:>9.1f} {best[1]:>8.1f} "
+                        f"{best[0] + best[1]:>9.1f}"
+                    )
+
+            # Leave the project as it was
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS("Benchmark complete"))
+
+    def _seed(self, project, user, count, comment_ratio):
+        issue_type = IssueType.objects.filter(project=project).first()
+        status = WorkflowStatus.objects.filter(project=project).first()
+        if issue_type is None or status is None:
+            raise CommandError("Project needs at least one issue type and status")
+
+        comment_every = int(1 / comment_ratio) if comment_ratio > 0 else 0
+        start = time.perf_counter()
+        for offset in range(0, count, BATCH_SIZE):
+            issues = [
+                Issue(
+                    project=project,
+                    issue_type=issue_type,
+                    status=status,
+                    reporter=user,
+                    key=f"BENCH-{number}",
+                    title=f"Benchmark issue {number}",
+                    comment_count=int(
+                        bool(comment_every) and number % comment_every == 0
+                    ),
+                )
+                for number in range(offset, min(offset + BATCH_SIZE, count))
+            ]
+            Issue.objects.bulk_create(issues)
+            IssueComment.objects.bulk_create(
+                IssueComment(issue=issue, author=user, content="Benchmark comment")
+                for issue in issues
+                if issue.comment_count
+            )
+
+        self.stdout.write(
+            f"Seeded {count} issues in {time.perf_counter() - start:.1f}s"
+        )
+
+    def _time_page(self, queryset, page, page_size, repeat):
+        queryset = queryset.order_by("-created_at")
+        offset = (page - 1) * page_size
+
+        best_count = best_page = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            queryset.count()
+            counted = time.perf_counter()
+            IssueListSerializer(queryset[offset : offset + page_size], many=True).data
+            listed = time.perf_counter()
+
+            count_ms = (counted - start) * 1000
+            page_ms = (listed - counted) * 1000
+            if best_count is None or count_ms < best_count:
+                best_count = count_ms
+            if best_page is None or page_ms < best_page:
+                best_page = page_ms
+        return best_count, best_page
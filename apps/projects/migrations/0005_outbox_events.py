@@ -0,0 +1,94 @@
+# Generated by Django 5.0.7 on 2026-10-18 21:26
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0004_make_slack_webhook_optional"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxEvent",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "aggregate_type",
+                    models.CharField(
+                        choices=[("issue", "Issue"), ("sprint", "Sprint")],
+                        max_length=20,
+                    ),
+                ),
+                ("aggregate_id", models.UUIDField()),
+                ("version", models.BigIntegerField()),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("payload", models.JSONField(default=dict)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("completed_handlers", models.JSONField(default=list)),
+                ("last_error", models.TextField(blank=True)),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Outbox Event",
+                "verbose_name_plural": "Outbox Events",
+                "db_table": "outbox_events",
+                "ordering": ["created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"],
+                        name="outbox_even_status_62eaed_idx",
+                    ),
+                    models.Index(
+                        fields=["aggregate_type", "aggregate_id"],
+                        name="outbox_even_aggrega_d56a15_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="outboxevent",
+            constraint=models.UniqueConstraint(
+                fields=("aggregate_type", "aggregate_id", "version", "event_type"),
+                name="unique_outbox_entity_version",
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.7 on 2026-10-18 21:49
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_issue_counters(apps, schema_editor):
+    """Set the counters of existing issues from their related rows."""
+    Issue = apps.get_model("projects", "Issue")
+    IssueComment = apps.get_model("projects", "IssueComment")
+    IssueAttachment = apps.get_model("projects", "IssueAttachment")
+    IssueLink = apps.get_model("projects", "IssueLink")
+
+    def count_of(queryset, field):
+        return Coalesce(
+            Subquery(
+                queryset.filter(**{field: OuterRef("pk")})
+                .order_by()
+                .values(field)
+                .annotate(total=Count("pk"))
+                .values("total"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    Issue.objects.update(
+        comment_count=count_of(IssueComment.objects, "issue"),
+        attachment_count=count_of(IssueAttachment.objects, "issue"),
+        link_count=count_of(IssueLink.objects, "source_issue")
+        + count_of(IssueLink.objects, "target_issue"),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0005_outbox_events"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issue",
+            name="attachment_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="issue",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="issue",
+            name="link_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            backfill_issue_counters, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "-created_at"], name="issues_project_created_idx"
+            ),
+        ),
+    ]
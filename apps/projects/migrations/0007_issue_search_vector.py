@@ -0,0 +1,72 @@
+# Generated by Django 5.0.7 on 2026-10-18 21:54
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Same weights the on-the-fly SearchVector used: title and key A, description B
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector(coalesce({row}.title, '')), 'A') ||
+    setweight(to_tsvector(coalesce({row}.key, '')), 'A') ||
+    setweight(to_tsvector(coalesce({row}.description, '')), 'B')
+"""
+
+CREATE_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION issues_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER issues_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, key, description, search_vector ON issues
+    FOR EACH ROW EXECUTE FUNCTION issues_search_vector_update();
+    """,
+    f"UPDATE issues SET search_vector = {SEARCH_VECTOR_SQL.format(row='issues')};",
+    "CREATE INDEX issues_search_vector_gin ON issues USING gin (search_vector);",
+    "CREATE INDEX issues_title_trgm ON issues USING gin (title gin_trgm_ops);",
+    "CREATE INDEX issues_key_trgm ON issues USING gin (key gin_trgm_ops);",
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS issues_key_trgm;",
+    "DROP INDEX IF EXISTS issues_title_trgm;",
+    "DROP INDEX IF EXISTS issues_search_vector_gin;",
+    "DROP TRIGGER IF EXISTS issues_search_vector_trigger ON issues;",
+    "DROP FUNCTION IF EXISTS issues_search_vector_update();",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        # Other backends (SQLite in development and tests) fall back to
+        # unindexed LIKE matching in SearchService
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0006_issue_counters"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="issue",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(
+            _run_on_postgres(CREATE_SQL), reverse_code=_run_on_postgres(DROP_SQL)
+        ),
+    ]
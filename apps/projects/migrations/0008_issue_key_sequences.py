@@ -0,0 +1,59 @@
+# Generated by Django 5.0.7 on 2026-10-18 22:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_issue_key_sequences(apps, schema_editor):
+    """Start each project's sequence at its highest numeric issue key."""
+    Issue = apps.get_model("projects", "Issue")
+    IssueKeySequence = apps.get_model("projects", "IssueKeySequence")
+
+    # Compared as numbers: Max() over the CharField would rank "9" above "10"
+    last_numbers = {}
+    for project_id, key in Issue.objects.values_list("project_id", "key").iterator(
+        chunk_size=5000
+    ):
+        if key.isdigit():
+            last_numbers[project_id] = max(last_numbers.get(project_id, 0), int(key))
+
+    IssueKeySequence.objects.bulk_create(
+        [
+            IssueKeySequence(project_id=project_id, last_number=number)
+            for project_id, number in last_numbers.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0007_issue_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueKeySequence",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="issue_key_sequence",
+                        serialize=False,
+                        to="projects.project",
+                    ),
+                ),
+                ("last_number", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Issue Key Sequence",
+                "verbose_name_plural": "Issue Key Sequences",
+                "db_table": "issue_key_sequences",
+            },
+        ),
+        migrations.RunPython(
+            backfill_issue_key_sequences, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.7 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0008_issue_key_sequences"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="outboxevent",
+            name="aggregate_type",
+            field=models.CharField(
+                choices=[
+                    ("issue", "Issue"),
+                    ("issue_batch", "Issue batch"),
+                    ("sprint", "Sprint"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.7 on 2026-10-18 23:15
+
+import apps.projects.models.issue_attachment_model
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0009_outbox_issue_batch"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issueattachment",
+            name="thumbnail",
+            field=models.FileField(
+                blank=True,
+                default="",
+                max_length=255,
+                storage=apps.projects.models.issue_attachment_model.thumbnail_storage,
+                upload_to="",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="issueattachment",
+            name="file",
+            field=models.FileField(
+                max_length=500,
+                upload_to=apps.projects.models.issue_attachment_model.issue_attachment_path,
+            ),
+        ),
+    ]
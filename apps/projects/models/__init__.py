@@ -1,9 +1,11 @@
 from .board_model import Board, BoardColumn
 from .issue_attachment_model import IssueAttachment
 from .issue_comment_model import IssueComment
+from .issue_key_sequence_model import IssueKeySequence
 from .issue_link_model import IssueLink
 from .issue_model import Issue
 from .issue_type_model import IssueType
+from .outbox_event_model import OutboxEvent
 from .project_archive_model import ProjectArchive
 from .project_config_model import ProjectConfiguration
 from .project_model import Project
@@ -26,4 +28,6 @@ __all__ = [
     "IssueComment",
     "IssueAttachment",
     "IssueLink",
+    "IssueKeySequence",
+    "OutboxEvent",
 ]
@@ -1,6 +1,7 @@
 import uuid
 
 from django.conf import settings
+from django.core.files.storage import storages
 from django.db import models
 
 
@@ -8,12 +9,16 @@ def issue_attachment_path(instance, filename):
     return f"issues/issue_{instance.issue.id}/attachments/{filename}"
 
 
+def thumbnail_storage():
+    return storages["thumbnails"]
+
+
 class IssueAttachment(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     issue = models.ForeignKey(
         "projects.Issue", on_delete=models.CASCADE, related_name="attachments"
     )
-    file = models.FileField(upload_to=issue_attachment_path)
+    file = models.FileField(upload_to=issue_attachment_path, max_length=500)
     filename = models.CharField(max_length=255)
     file_size = models.PositiveIntegerField()
     content_type = models.CharField(max_length=100)
@@ -23,6 +28,10 @@ class IssueAttachment(models.Model):
         related_name="uploaded_issue_attachments",
     )
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # WebP preview of image attachments, generated asynchronously
+    thumbnail = models.FileField(
+        storage=thumbnail_storage, max_length=255, blank=True, default=""
+    )
 
     class Meta:
         db_table = "issue_attachments"
@@ -43,6 +52,12 @@ class IssueAttachment(models.Model):
             return self.file.url
         return None
 
+    @property
+    def thumbnail_url(self):
+        if self.thumbnail:
+            return self.thumbnail.url
+        return None
+
     @property
     def file_size_mb(self):
         return round(self.file_size / (1024 * 1024), 2)
@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class IssueKeySequence(models.Model):
+    """
+    Last issue number allocated in a project.
+
+    Kept in its own row rather than on Project so that key allocation only
+    locks this counter (briefly, for one UPDATE) and full Project saves cannot
+    overwrite it with a stale value.
+    """
+
+    project = models.OneToOneField(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_key_sequence",
+    )
+    last_number = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "issue_key_sequences"
+        verbose_name = "Issue Key Sequence"
+        verbose_name_plural = "Issue Key Sequences"
+
+    def __str__(self):
+        return f"{self.project_id}: {self.last_number}"
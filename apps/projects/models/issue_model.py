@@ -1,10 +1,13 @@
 import uuid
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
+from apps.projects.utils.change_tracking import TrackedFieldsMixin
 
-class Issue(models.Model):
+
+class Issue(TrackedFieldsMixin, models.Model):
     PRIORITY_CHOICES = [
         ("P1", "Critical"),
         ("P2", "High"),
@@ -12,6 +15,30 @@ class Issue(models.Model):
         ("P4", "Low"),
     ]
 
+    # Diffed on every save and exposed as instance.changes to post_save receivers
+    TRACKED_FIELDS = (
+        "title",
+        "description",
+        "status_id",
+        "priority",
+        "assignee_id",
+        "sprint_id",
+        "issue_type_id",
+        "parent_issue_id",
+        "story_points",
+        "is_active",
+    )
+
+    # Written by the database, never by save(): the counters are maintained
+    # with UPDATE ... SET n = n + 1 by the comment, attachment and link
+    # signals, and search_vector by a Postgres trigger
+    DATABASE_MAINTAINED_FIELDS = (
+        "comment_count",
+        "attachment_count",
+        "link_count",
+        "search_vector",
+    )
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(
         "projects.Project", on_delete=models.CASCADE, related_name="issues"
@@ -61,6 +88,12 @@ class Issue(models.Model):
     story_points = models.PositiveIntegerField(null=True, blank=True)
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+    attachment_count = models.PositiveIntegerField(default=0, editable=False)
+    # Links where the issue is source or target
+    link_count = models.PositiveIntegerField(default=0, editable=False)
+    # Weighted title/key (A) and description (B) lexemes, GIN-indexed
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     resolved_at = models.DateTimeField(null=True, blank=True)
@@ -77,11 +110,32 @@ class Issue(models.Model):
             models.Index(fields=["sprint"]),
             models.Index(fields=["status"]),
             models.Index(fields=["priority"]),
+            models.Index(
+                fields=["project", "-created_at"], name="issues_project_created_idx"
+            ),
         ]
 
     def __str__(self):
         return f"{self.key} - {self.title}"
 
+    def save(self, *args, **kwargs):
+        # A stale instance must not overwrite counters incremented since it
+        # was loaded, and search_vector is always computed by the trigger
+        if (
+            not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.DATABASE_MAINTAINED_FIELDS
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def full_key(self):
         return f"{self.project.key}-{self.key}"
@@ -101,24 +155,3 @@ class Issue(models.Model):
     @property
     def is_bug(self):
         return self.issue_type.category == "bug"
-
-    @property
-    def comment_count(self):
-        # Use annotated value if available (from queryset optimization)
-        if hasattr(self, "_comment_count"):
-            return self._comment_count
-        return self.comments.count()
-
-    @property
-    def attachment_count(self):
-        # Use annotated value if available (from queryset optimization)
-        if hasattr(self, "_attachment_count"):
-            return self._attachment_count
-        return self.attachments.count()
-
-    @property
-    def link_count(self):
-        # Use annotated values if available (from queryset optimization)
-        if hasattr(self, "_source_link_count") and hasattr(self, "_target_link_count"):
-            return self._source_link_count + self._target_link_count
-        return self.source_links.count() + self.target_links.count()
@@ -0,0 +1,68 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEvent(models.Model):
+    """
+    Side effect of an issue/sprint write, stored in the same transaction.
+
+    Rows are fanned out to the registered handlers (search indexing,
+    notifications, board broadcasts) by OutboxService after commit.
+    """
+
+    AGGREGATE_TYPE_CHOICES = [
+        ("issue", "Issue"),
+        # One event for a bulk update of many issues (board broadcasts)
+        ("issue_batch", "Issue batch"),
+        ("sprint", "Sprint"),
+    ]
+
+    EVENT_TYPE_CHOICES = [
+        ("created", "Created"),
+        ("updated", "Updated"),
+        ("deleted", "Deleted"),
+    ]
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("processing", "Processing"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    aggregate_type = models.CharField(max_length=20, choices=AGGREGATE_TYPE_CHOICES)
+    aggregate_id = models.UUIDField()
+    # Entity version (updated_at in microseconds); duplicates are dropped
+    version = models.BigIntegerField()
+    event_type = models.CharField(max_length=20, choices=EVENT_TYPE_CHOICES)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Handlers that already succeeded are skipped on retry
+    completed_handlers = models.JSONField(default=list)
+    last_error = models.TextField(blank=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "outbox_events"
+        verbose_name = "Outbox Event"
+        verbose_name_plural = "Outbox Events"
+        ordering = ["created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["aggregate_type", "aggregate_id", "version", "event_type"],
+                name="unique_outbox_entity_version",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "available_at"]),
+            models.Index(fields=["aggregate_type", "aggregate_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.aggregate_type}:{self.aggregate_id} {self.event_type} v{self.version}"  # noqa: E501
@@ -14,6 +14,7 @@ class ProjectTeamMember(models.Model):
         ("business_analyst", "Business Analyst"),
         ("stakeholder", "Stakeholder"),
     ]
+    MANAGER_ROLES = ["project_manager", "tech_lead"]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(
@@ -45,7 +46,7 @@ class ProjectTeamMember(models.Model):
 
     @property
     def can_manage_project(self):
-        return self.role in ["project_manager", "tech_lead"]
+        return self.role in self.MANAGER_ROLES
 
     @property
     def can_create_issues(self):
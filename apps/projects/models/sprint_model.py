@@ -4,8 +4,10 @@ from datetime import date
 from django.conf import settings
 from django.db import models
 
+from apps.projects.utils.change_tracking import TrackedFieldsMixin
 
-class Sprint(models.Model):
+
+class Sprint(TrackedFieldsMixin, models.Model):
     STATUS_CHOICES = [
         ("planning", "Planning"),
         ("active", "Active"),
@@ -13,6 +15,9 @@ class Sprint(models.Model):
         ("cancelled", "Cancelled"),
     ]
 
+    # Diffed on every save and exposed as instance.changes to post_save receivers
+    TRACKED_FIELDS = ("name", "goal", "status", "start_date", "end_date")
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(
         "projects.Project", on_delete=models.CASCADE, related_name="sprints"
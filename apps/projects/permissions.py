@@ -5,9 +5,22 @@ Implements role-based access control for projects and project team members.
 
 from rest_framework import permissions
 
-from apps.organizations.models import OrganizationMembership
 from apps.projects.models import ProjectTeamMember
-from apps.workspaces.models import WorkspaceMember
+from base.utils.access_scope import AccessScope
+
+PROJECT_ADMIN_ROLES = ("lead", "admin")
+ORGANIZATION_ADMIN_ROLES = ("owner", "admin")
+
+
+def _is_project_admin(user, project):
+    """Project lead/admin, workspace admin or organization owner/admin."""
+    scope = AccessScope.for_user(user)
+    return (
+        scope.project_role(project.id) in PROJECT_ADMIN_ROLES
+        or scope.workspace_role(project.workspace_id) == "admin"
+        or scope.organization_role(project.workspace.organization_id)
+        in ORGANIZATION_ADMIN_ROLES
+    )
 
 
 class IsProjectMember(permissions.BasePermission):
@@ -30,20 +43,8 @@ class IsProjectMember(permissions.BasePermission):
         else:
             project = obj
 
-        # Check direct project membership
-        is_project_member = ProjectTeamMember.objects.filter(
-            project=project, user=request.user, is_active=True
-        ).exists()
-
-        if is_project_member:
-            return True
-
-        # Check if user is workspace member (can view projects)
-        is_workspace_member = WorkspaceMember.objects.filter(
-            workspace=project.workspace, user=request.user, is_active=True
-        ).exists()
-
-        return is_workspace_member
+        # Direct project membership, or workspace membership (can view projects)
+        return AccessScope.for_user(request.user).can_access_project(project)
 
 
 class IsProjectLeadOrAdmin(permissions.BasePermission):
@@ -71,37 +72,11 @@ class IsProjectLeadOrAdmin(permissions.BasePermission):
             project = obj
 
         # Check if user is the project lead
-        if project.lead == request.user:
-            return True
-
-        # Check if user is project admin
-        project_member = ProjectTeamMember.objects.filter(
-            project=project,
-            user=request.user,
-            role__in=["lead", "admin"],
-            is_active=True,
-        ).first()
-
-        if project_member:
-            return True
-
-        # Check if user is workspace admin
-        workspace_member = WorkspaceMember.objects.filter(
-            workspace=project.workspace, user=request.user, role="admin", is_active=True
-        ).first()
-
-        if workspace_member:
+        if project.lead_id == request.user.id:
             return True
 
-        # Check if user is organization owner/admin
-        org_membership = OrganizationMembership.objects.filter(
-            organization=project.workspace.organization,
-            user=request.user,
-            role__in=["owner", "admin"],
-            is_active=True,
-        ).first()
-
-        return org_membership is not None
+        # Project admin, workspace admin or organization owner/admin
+        return _is_project_admin(request.user, project)
 
 
 class CanAccessProject(permissions.BasePermission):
@@ -129,33 +104,19 @@ class CanAccessProject(permissions.BasePermission):
         else:
             project = obj
 
-        # Check project membership (full access)
-        is_project_member = ProjectTeamMember.objects.filter(
-            project=project, user=request.user, is_active=True
-        ).exists()
-
-        if is_project_member:
-            return True
-
-        # Check workspace membership (full access)
-        # Workspace members can access ALL projects in their workspace
-        is_workspace_member = WorkspaceMember.objects.filter(
-            workspace=project.workspace, user=request.user, is_active=True
-        ).exists()
+        scope = AccessScope.for_user(request.user)
 
-        if is_workspace_member:
+        # Project membership (full access), or workspace membership (full
+        # access): workspace members can access ALL projects in their workspace
+        if scope.can_access_project(project):
             return True
 
         # Check organization membership (read-only for public workspaces)
-        if project.workspace.visibility == "public":
-            is_org_member = OrganizationMembership.objects.filter(
-                organization=project.workspace.organization,
-                user=request.user,
-                is_active=True,
-            ).exists()
-
-            if is_org_member and request.method in permissions.SAFE_METHODS:
-                return True
+        if (
+            request.method in permissions.SAFE_METHODS
+            and project.workspace.visibility == "public"
+        ):
+            return scope.is_organization_member(project.workspace.organization_id)
 
         return False
 
@@ -180,37 +141,11 @@ class CanManageProjectTeam(permissions.BasePermission):
         project = obj.project
 
         # Check if user is project lead
-        if project.lead == request.user:
+        if project.lead_id == request.user.id:
             return True
 
-        # Check if user is project admin
-        is_project_admin = ProjectTeamMember.objects.filter(
-            project=project,
-            user=request.user,
-            role__in=["lead", "admin"],
-            is_active=True,
-        ).exists()
-
-        if is_project_admin:
-            return True
-
-        # Check if user is workspace admin
-        is_workspace_admin = WorkspaceMember.objects.filter(
-            workspace=project.workspace, user=request.user, role="admin", is_active=True
-        ).exists()
-
-        if is_workspace_admin:
-            return True
-
-        # Check if user is organization owner/admin
-        is_org_admin = OrganizationMembership.objects.filter(
-            organization=project.workspace.organization,
-            user=request.user,
-            role__in=["owner", "admin"],
-            is_active=True,
-        ).exists()
-
-        return is_org_admin
+        # Project admin, workspace admin or organization owner/admin
+        return _is_project_admin(request.user, project)
 
 
 class CanModifyProjectConfiguration(permissions.BasePermission):
@@ -243,14 +178,11 @@ class CanModifyIssue(permissions.BasePermission):
 
         issue = obj if hasattr(obj, "assignee") else obj
 
-        if issue.assignee == request.user or issue.reporter == request.user:
+        if request.user.id in (issue.assignee_id, issue.reporter_id):
             return True
 
-        project_member = ProjectTeamMember.objects.filter(
-            project=issue.project, user=request.user, is_active=True
-        ).first()
-
-        if project_member and project_member.can_manage_project:
+        role = AccessScope.for_user(request.user).project_role(issue.project_id)
+        if role in ProjectTeamMember.MANAGER_ROLES:
             return True
 
         return IsProjectLeadOrAdmin().has_object_permission(
@@ -327,6 +259,4 @@ class IsProjectTeamMember(permissions.BasePermission):
         else:
             project = obj
 
-        return ProjectTeamMember.objects.filter(
-            project=project, user=request.user, is_active=True
-        ).exists()
+        return AccessScope.for_user(request.user).is_project_member(project.id)
@@ -5,10 +5,18 @@ from .board_serializer import (
     BoardListSerializer,
     BoardUpdateSerializer,
 )
-from .issue_attachment_serializer import IssueAttachmentSerializer
+from .issue_attachment_serializer import (
+    AttachmentUploadCompleteSerializer,
+    AttachmentUploadStartSerializer,
+    IssueAttachmentSerializer,
+)
 from .issue_comment_serializer import IssueCommentSerializer
 from .issue_link_serializer import IssueLinkSerializer
 from .issue_serializer import (
+    IssueBulkAssignSerializer,
+    IssueBulkMoveSerializer,
+    IssueBulkSprintSerializer,
+    IssueBulkTransitionSerializer,
     IssueCreateSerializer,
     IssueDetailSerializer,
     IssueListSerializer,
@@ -43,6 +51,10 @@ __all__ = [
     "IssueCreateSerializer",
     "IssueTransitionSerializer",
     "IssueUpdateSerializer",
+    "IssueBulkTransitionSerializer",
+    "IssueBulkAssignSerializer",
+    "IssueBulkSprintSerializer",
+    "IssueBulkMoveSerializer",
     "IssueTypeListSerializer",
     "IssueTypeSerializer",
     "WorkflowStatusListSerializer",
@@ -58,5 +70,7 @@ __all__ = [
     "BoardColumnSerializer",
     "IssueCommentSerializer",
     "IssueAttachmentSerializer",
+    "AttachmentUploadStartSerializer",
+    "AttachmentUploadCompleteSerializer",
     "IssueLinkSerializer",
 ]
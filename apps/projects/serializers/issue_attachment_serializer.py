@@ -1,12 +1,24 @@
+from django.conf import settings
+
 from rest_framework import serializers
 
 from apps.projects.models import IssueAttachment
 from base.serializers import UserBasicSerializer
 
 
+def _validate_size(size):
+    max_size = getattr(settings, "ATTACHMENT_MAX_SIZE", 50 * 1024 * 1024)
+    if size > max_size:
+        raise serializers.ValidationError(
+            f"File size cannot exceed {max_size // (1024 * 1024)}MB"
+        )
+    return size
+
+
 class IssueAttachmentSerializer(serializers.ModelSerializer):
     uploaded_by = UserBasicSerializer(read_only=True)
     file_url = serializers.ReadOnlyField()
+    thumbnail_url = serializers.ReadOnlyField()
     file_size_mb = serializers.ReadOnlyField()
 
     class Meta:
@@ -19,6 +31,7 @@ class IssueAttachmentSerializer(serializers.ModelSerializer):
             "file_size_mb",
             "content_type",
             "file_url",
+            "thumbnail_url",
             "uploaded_by",
             "uploaded_at",
         ]
@@ -29,14 +42,13 @@ class IssueAttachmentSerializer(serializers.ModelSerializer):
             "file_size_mb",
             "content_type",
             "file_url",
+            "thumbnail_url",
             "uploaded_by",
             "uploaded_at",
         ]
 
     def validate_file(self, value):
-        max_size = 50 * 1024 * 1024
-        if value.size > max_size:
-            raise serializers.ValidationError("File size cannot exceed 50MB")
+        _validate_size(value.size)
         return value
 
     def create(self, validated_data):
@@ -46,3 +58,27 @@ class IssueAttachmentSerializer(serializers.ModelSerializer):
         validated_data["content_type"] = file.content_type
         validated_data["uploaded_by"] = self.context["request"].user
         return super().create(validated_data)
+
+
+class AttachmentUploadStartSerializer(serializers.Serializer):
+    """File to be uploaded directly to storage."""
+
+    filename = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(
+        max_length=100, default="application/octet-stream"
+    )
+    file_size = serializers.IntegerField(min_value=1, help_text="Size in bytes")
+
+    def validate_file_size(self, value):
+        return _validate_size(value)
+
+
+class AttachmentUploadPartSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1, max_value=10000)
+    etag = serializers.CharField(help_text="ETag header returned for the part")
+
+
+class AttachmentUploadCompleteSerializer(serializers.Serializer):
+    """Uploaded parts; required for multipart uploads only."""
+
+    parts = AttachmentUploadPartSerializer(many=True, required=False)
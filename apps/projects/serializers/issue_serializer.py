@@ -1,6 +1,9 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
 from rest_framework import serializers
 
-from apps.projects.models import Issue, IssueType, Project, WorkflowStatus
+from apps.projects.models import Issue, IssueType, Project, Sprint, WorkflowStatus
 from apps.projects.services import IssueKeyGenerator, WorkflowValidator
 from base.serializers import ProjectBasicSerializer, UserBasicSerializer
 
@@ -310,7 +313,8 @@ class IssueCreateSerializer(serializers.ModelSerializer):
                 project=project, is_active=True
             ).first()
 
-        key = IssueKeyGenerator.generate_key(project)
+        # Normally allocated by the caller before its create transaction
+        key = validated_data.pop("key", None) or IssueKeyGenerator.generate_key(project)
 
         validated_data["project"] = project
         validated_data["issue_type"] = issue_type
@@ -394,16 +398,14 @@ class IssueTransitionSerializer(serializers.Serializer):
 
         # Validate status exists
         try:
-            new_status = WorkflowStatus.objects.select_related("project").get(
-                id=status_id
-            )
+            new_status = WorkflowStatus.objects.get(id=status_id)
         except WorkflowStatus.DoesNotExist:
             raise serializers.ValidationError(
                 {"status": f"Workflow status with ID '{status_id}' does not exist"}
             )
 
         # Validate status belongs to same project
-        if new_status.project != issue.project:
+        if new_status.project_id != issue.project_id:
             raise serializers.ValidationError(
                 {
                     "status": (
@@ -425,6 +427,50 @@ class IssueTransitionSerializer(serializers.Serializer):
         return attrs
 
 
+class IssueBulkSerializer(serializers.Serializer):
+    """Issue IDs of a bulk update; duplicates are ignored."""
+
+    issue_ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, help_text="Issue UUIDs"
+    )
+
+    def validate_issue_ids(self, value):
+        issue_ids = list(dict.fromkeys(value))
+        max_size = getattr(settings, "BULK_ISSUE_MAX_SIZE", 200)
+        if len(issue_ids) > max_size:
+            raise serializers.ValidationError(
+                f"At most {max_size} issues can be updated at once"
+            )
+        return issue_ids
+
+
+class IssueBulkTransitionSerializer(IssueBulkSerializer):
+    status = serializers.PrimaryKeyRelatedField(
+        queryset=WorkflowStatus.objects.filter(is_active=True),
+        help_text="UUID of the target workflow status",
+    )
+
+
+class IssueBulkAssignSerializer(IssueBulkSerializer):
+    assignee = serializers.PrimaryKeyRelatedField(
+        queryset=get_user_model().objects.all(),
+        allow_null=True,
+        help_text="User ID of the new assignee, or null to unassign",
+    )
+
+
+class IssueBulkSprintSerializer(IssueBulkSerializer):
+    sprint = serializers.PrimaryKeyRelatedField(
+        queryset=Sprint.objects.all(),
+        allow_null=True,
+        help_text="UUID of the sprint, or null to move the issues to the backlog",
+    )
+
+
+class IssueBulkMoveSerializer(IssueBulkSerializer):
+    column_id = serializers.UUIDField(help_text="UUID of the target board column")
+
+
 class IssueUpdateSerializer(serializers.ModelSerializer):
     # assignee expects user_uuid (not integer id)
     assignee = serializers.UUIDField(write_only=True, required=False, allow_null=True)
@@ -449,11 +495,11 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
         if not value:
             return None
 
+        # Resolved once here and reused by validate() and update()
         try:
-            WorkflowStatus.objects.get(id=value)
+            return WorkflowStatus.objects.get(id=value)
         except WorkflowStatus.DoesNotExist:
             raise serializers.ValidationError("Status does not exist")
-        return value
 
     def validate_assignee(self, value):
         """Validate assignee exists by user_uuid."""
@@ -482,10 +528,9 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         instance = self.instance
-        status_id = attrs.get("status")
+        new_status = attrs.get("status")
 
-        if status_id:
-            new_status = WorkflowStatus.objects.get(id=status_id)
+        if new_status:
             can_transition, message = WorkflowValidator.can_transition(
                 instance, new_status
             )
@@ -524,7 +569,7 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
         from apps.projects.models import Sprint
 
         assignee_uuid = validated_data.pop("assignee", None)
-        status_id = validated_data.pop("status", None)
+        new_status = validated_data.pop("status", None)
         sprint_id = validated_data.pop("sprint", None)
 
         if assignee_uuid is not None:
@@ -533,8 +578,7 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
             else:
                 instance.assignee = None
 
-        if status_id:
-            new_status = WorkflowStatus.objects.get(id=status_id)
+        if new_status:
             instance.status = new_status
             if new_status.is_final and not instance.resolved_at:
                 instance.resolved_at = datetime.now()
@@ -1,4 +1,20 @@
+from .attachment_upload_service import AttachmentUploadError, AttachmentUploadService
+from .board_event_stream import BoardEventStream
+from .bulk_issue_service import BulkIssueError, BulkIssueService
 from .issue_key_generator import IssueKeyGenerator
+from .outbox_service import OutboxService, outbox_handler
+from .workflow_graph import WorkflowGraph
 from .workflow_validator import WorkflowValidator
 
-__all__ = ["IssueKeyGenerator", "WorkflowValidator"]
+__all__ = [
+    "AttachmentUploadError",
+    "AttachmentUploadService",
+    "BoardEventStream",
+    "BulkIssueError",
+    "BulkIssueService",
+    "IssueKeyGenerator",
+    "OutboxService",
+    "WorkflowGraph",
+    "WorkflowValidator",
+    "outbox_handler",
+]
@@ -0,0 +1,303 @@
+"""
+Direct-to-S3 issue attachment uploads and thumbnail generation.
+
+Clients start an upload, send the file straight to S3 with the presigned
+requests they get back, then complete it. The IssueAttachment is only created
+on completion, after checking the object S3 actually stored. Small files use
+a presigned POST whose policy limits the body to the declared size. Files
+over ATTACHMENT_MULTIPART_THRESHOLD use a multipart upload with one presigned
+URL per part, so parts can be sent in parallel and retried individually.
+
+Pending uploads are kept in the cache until their URLs expire. Multipart
+uploads that are never completed or aborted are left to the bucket's
+AbortIncompleteMultipartUpload lifecycle rule.
+
+Image attachments get a WebP thumbnail from generate_attachment_thumbnail,
+stored as attachments/<attachment id>/<size>.webp in the thumbnails storage.
+Attachments never change, so neither do thumbnail keys, and browsers can keep
+a thumbnail for as long as its signed URL is valid.
+"""
+
+import logging
+import math
+import os
+import uuid
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils.text import get_valid_filename
+
+from PIL import Image, UnidentifiedImageError
+
+from apps.projects.models import IssueAttachment
+from apps.projects.models.issue_attachment_model import issue_attachment_path
+from base.utils.file_handlers import resize_image
+
+logger = logging.getLogger(__name__)
+
+# S3 limits on multipart uploads
+MAX_PART_COUNT = 10000
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+THUMBNAIL_CONTENT_TYPES = {
+    "image/bmp",
+    "image/gif",
+    "image/jpeg",
+    "image/png",
+    "image/tiff",
+    "image/webp",
+}
+
+
+class AttachmentUploadError(Exception):
+    """An upload could not be started or completed."""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class AttachmentUploadService:
+    """Presigned S3 uploads of issue attachments."""
+
+    def __init__(self, storage=None):
+        self.storage = storage or default_storage
+        self.max_size = getattr(settings, "ATTACHMENT_MAX_SIZE", 50 * 1024 * 1024)
+        self.multipart_threshold = getattr(
+            settings, "ATTACHMENT_MULTIPART_THRESHOLD", 16 * 1024 * 1024
+        )
+        self.part_size = max(
+            getattr(settings, "ATTACHMENT_UPLOAD_PART_SIZE", 8 * 1024 * 1024),
+            MIN_PART_SIZE,
+        )
+        self.expiry = getattr(settings, "ATTACHMENT_UPLOAD_URL_EXPIRY_SECONDS", 3600)
+
+    @property
+    def is_available(self) -> bool:
+        """Direct uploads need S3; other storages use the regular upload."""
+        return bool(getattr(self.storage, "bucket_name", None))
+
+    @property
+    def client(self):
+        return self.storage.connection.meta.client
+
+    @staticmethod
+    def _cache_key(upload_id: str) -> str:
+        return f"attachment_upload:{upload_id}"
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    def start(self, issue, user, filename: str, content_type: str, size: int) -> Dict:
+        """Reserve a key for the file and presign the requests to upload it."""
+        if not self.is_available:
+            raise AttachmentUploadError(
+                "Direct uploads are not available; upload the file to the "
+                "attachments endpoint instead",
+                status_code=501,
+            )
+        if size > self.max_size:
+            raise AttachmentUploadError(
+                f"File size cannot exceed {self.max_size // (1024 * 1024)}MB"
+            )
+
+        upload_id = uuid.uuid4().hex
+        filename = os.path.basename(filename)
+        name = issue_attachment_path(
+            SimpleNamespace(issue=issue),
+            f"{upload_id}/{get_valid_filename(filename) or 'file'}",
+        )
+        pending = {
+            "issue_id": str(issue.id),
+            "user_id": user.id,
+            "name": name,
+            "key": self.storage._normalize_name(name),
+            "filename": filename,
+            "content_type": content_type,
+            "s3_upload_id": None,
+        }
+        response = {"upload_id": upload_id, "expires_in": self.expiry}
+
+        if size > self.multipart_threshold:
+            part_size = max(self.part_size, math.ceil(size / MAX_PART_COUNT))
+            multipart = self.client.create_multipart_upload(
+                Bucket=self.storage.bucket_name,
+                Key=pending["key"],
+                ContentType=content_type,
+            )
+            pending["s3_upload_id"] = multipart["UploadId"]
+            response.update(
+                method="multipart",
+                part_size=part_size,
+                parts=[
+                    {
+                        "part_number": number,
+                        "url": self._presign(
+                            "upload_part",
+                            pending,
+                            UploadId=multipart["UploadId"],
+                            PartNumber=number,
+                        ),
+                    }
+                    for number in range(1, math.ceil(size / part_size) + 1)
+                ],
+            )
+        else:
+            post = self.client.generate_presigned_post(
+                Bucket=self.storage.bucket_name,
+                Key=pending["key"],
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 0, size],
+                ],
+                ExpiresIn=self.expiry,
+            )
+            response.update(method="single", url=post["url"], fields=post["fields"])
+
+        # Completion may come shortly after the last URL has expired
+        cache.set(self._cache_key(upload_id), pending, self.expiry * 2)
+        return response
+
+    def complete(
+        self, upload_id: str, issue, user, parts: Optional[List[Dict]] = None
+    ) -> IssueAttachment:
+        """Finish an upload and register the stored object as an attachment."""
+        from botocore.exceptions import ClientError
+
+        pending = self._pending(upload_id, issue, user)
+        bucket, key = self.storage.bucket_name, pending["key"]
+
+        try:
+            if pending["s3_upload_id"]:
+                if not parts:
+                    raise AttachmentUploadError("The uploaded parts are required")
+                self.client.complete_multipart_upload(
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=pending["s3_upload_id"],
+                    MultipartUpload={
+                        "Parts": [
+                            {"PartNumber": part["part_number"], "ETag": part["etag"]}
+                            for part in sorted(parts, key=lambda p: p["part_number"])
+                        ]
+                    },
+                )
+            head = self.client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            logger.warning(f"[ATTACHMENTS] Could not complete upload {upload_id}: {e}")
+            raise AttachmentUploadError("The file was not uploaded completely")
+
+        if head["ContentLength"] > self.max_size:
+            self.client.delete_object(Bucket=bucket, Key=key)
+            cache.delete(self._cache_key(upload_id))
+            raise AttachmentUploadError(
+                f"File size cannot exceed {self.max_size // (1024 * 1024)}MB"
+            )
+
+        # Claim the upload, so a repeated completion cannot register it twice
+        if not cache.delete(self._cache_key(upload_id)):
+            raise AttachmentUploadError("Upload not found or expired", 404)
+
+        attachment = IssueAttachment.objects.create(
+            issue=issue,
+            file=pending["name"],
+            filename=pending["filename"],
+            file_size=head["ContentLength"],
+            content_type=head.get("ContentType") or pending["content_type"],
+            uploaded_by=user,
+        )
+        schedule_thumbnail(attachment)
+        return attachment
+
+    def abort(self, upload_id: str, issue, user):
+        """Cancel an upload and delete whatever was stored for it."""
+        from botocore.exceptions import ClientError
+
+        pending = self._pending(upload_id, issue, user)
+        cache.delete(self._cache_key(upload_id))
+        bucket, key = self.storage.bucket_name, pending["key"]
+        try:
+            if pending["s3_upload_id"]:
+                self.client.abort_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=pending["s3_upload_id"]
+                )
+            else:
+                self.client.delete_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            logger.warning(f"[ATTACHMENTS] Could not abort upload {upload_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _pending(self, upload_id: str, issue, user) -> Dict:
+        pending = cache.get(self._cache_key(upload_id))
+        if (
+            pending is None
+            or pending["issue_id"] != str(issue.id)
+            or pending["user_id"] != user.id
+        ):
+            raise AttachmentUploadError("Upload not found or expired", 404)
+        return pending
+
+    def _presign(self, operation: str, pending: Dict, **params) -> str:
+        return self.client.generate_presigned_url(
+            operation,
+            Params={
+                "Bucket": self.storage.bucket_name,
+                "Key": pending["key"],
+                **params,
+            },
+            ExpiresIn=self.expiry,
+        )
+
+
+# ----------------------------------------------------------------------
+# Thumbnails
+# ----------------------------------------------------------------------
+
+
+def thumbnail_name(attachment, size: int) -> str:
+    return f"attachments/{attachment.id}/{size}.webp"
+
+
+def schedule_thumbnail(attachment):
+    """Queue thumbnail generation for image attachments once committed."""
+    if attachment.content_type not in THUMBNAIL_CONTENT_TYPES:
+        return
+
+    from apps.projects.tasks import generate_attachment_thumbnail
+
+    attachment_id = str(attachment.id)
+    transaction.on_commit(lambda: generate_attachment_thumbnail.delay(attachment_id))
+
+
+def generate_thumbnail(attachment) -> Optional[str]:
+    """Store the WebP thumbnail of an attachment; None if it is not an image."""
+    size = getattr(settings, "ATTACHMENT_THUMBNAIL_SIZE", 400)
+    try:
+        with attachment.file.open("rb") as source:
+            content = resize_image(source, max_width=size, max_height=size)
+    except (UnidentifiedImageError, Image.DecompressionBombError) as e:
+        logger.warning(
+            f"[ATTACHMENTS] No thumbnail for attachment {attachment.id}: {e}"
+        )
+        return None
+
+    name = thumbnail_name(attachment, size)
+    storage = attachment.thumbnail.storage
+    # Retries write the same key; local storages would pick a new name
+    if storage.exists(name):
+        storage.delete(name)
+    name = storage.save(name, content)
+
+    IssueAttachment.objects.filter(pk=attachment.pk).update(thumbnail=name)
+    attachment.thumbnail.name = name
+    return name
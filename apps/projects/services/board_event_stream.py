@@ -0,0 +1,180 @@
+"""
+Sequenced event stream for board WebSocket clients.
+
+Every board message gets the next value of a per-board sequence number and is
+JSON-encoded once before the group send; consumers forward the encoded text
+as is. The last BOARD_EVENT_BUFFER_SIZE messages are kept in a ring buffer, so
+a client that notices a gap in the sequence can ask for the messages it missed
+instead of reloading the whole board. When the gap is older than the buffer
+the client is told to fetch a fresh board snapshot.
+
+The sequence also versions the board for snapshot ETags. A sequence whose key
+was lost (eviction, flush) restarts from the current time in milliseconds
+instead of 0, so numbers handed out before the reset are not reused.
+
+With the Redis cache backend the sequence is an INCR and the buffer a sorted
+set scored by sequence number; other cache backends (tests, local development)
+fall back to plain cache keys.
+"""
+
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+
+def encode_message(message: Dict) -> str:
+    """Compact JSON encoding shared by every board message."""
+    return json.dumps(message, cls=DjangoJSONEncoder, separators=(",", ":"))
+
+
+def _seq_base() -> int:
+    return int(time.time() * 1000)
+
+
+def _redis_client():
+    """Raw redis-py client of the default cache, if it is Redis-backed."""
+    try:
+        from django.core.cache.backends.redis import RedisCache
+    except ImportError:  # pragma: no cover
+        return None
+
+    if not isinstance(cache, RedisCache):
+        return None
+    return cache._cache.get_client(write=True)
+
+
+class BoardEventStream:
+    """Publish sequenced board messages and replay them for resync."""
+
+    def __init__(self, board_id):
+        self.board_id = str(board_id)
+        self.group_name = f"board_{self.board_id}"
+        self.buffer_size = getattr(settings, "BOARD_EVENT_BUFFER_SIZE", 200)
+        self.buffer_ttl = getattr(settings, "BOARD_EVENT_BUFFER_TTL_SECONDS", 3600)
+
+    @property
+    def _seq_key(self) -> str:
+        return f"board_events:{self.board_id}:seq"
+
+    @property
+    def _buffer_key(self) -> str:
+        return f"board_events:{self.board_id}:buffer"
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(self, event_type: str, data: Dict, user=None) -> int:
+        """
+        Send a message to every client of the board.
+
+        Args:
+            event_type: Client message type, e.g. "issue.moved"
+            data: Delta payload of the event
+            user: User who made the change, if any
+
+        Returns:
+            Sequence number of the message
+        """
+        seq = self._next_seq()
+        data = {**data, "timestamp": timezone.now()}
+        if user is not None:
+            data["user"] = {
+                "id": str(user.id),
+                "name": user.get_full_name() or user.username,
+            }
+
+        text = encode_message({"type": event_type, "seq": seq, "data": data})
+        self._append(seq, text)
+
+        channel_layer = get_channel_layer()
+        if channel_layer is not None:
+            async_to_sync(channel_layer.group_send)(
+                self.group_name, {"type": "board_event", "text": text}
+            )
+        return seq
+
+    def current_seq(self) -> int:
+        """
+        Sequence number of the last published message.
+
+        A board without a sequence yet gets one at the restart base, so the
+        value stays the same until the next publish. Callers check access to
+        the board first, since this creates the key.
+        """
+        client = _redis_client()
+        if client is not None:
+            key = cache.make_key(self._seq_key)
+            pipe = client.pipeline()
+            pipe.set(key, _seq_base(), nx=True)
+            pipe.get(key)
+            return int(pipe.execute()[1])
+
+        cache.add(self._seq_key, _seq_base(), timeout=None)
+        return cache.get(self._seq_key)
+
+    def events_since(self, seq: int) -> Optional[List[str]]:
+        """
+        Encoded messages published after the given sequence number.
+
+        Returns:
+            Messages in sequence order, or None if some of them are no longer
+            buffered and the client has to reload the board
+        """
+        current = self.current_seq()
+        if seq >= current:
+            return []
+
+        entries = self._buffered()
+        if not entries or entries[0][0] > seq + 1:
+            return None
+        return [text for entry_seq, text in entries if entry_seq > seq]
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _next_seq(self) -> int:
+        client = _redis_client()
+        if client is not None:
+            key = cache.make_key(self._seq_key)
+            pipe = client.pipeline()
+            pipe.set(key, _seq_base(), nx=True)
+            pipe.incr(key)
+            return int(pipe.execute()[1])
+
+        # The sequence must survive the buffer, so it never expires
+        cache.add(self._seq_key, _seq_base(), timeout=None)
+        return cache.incr(self._seq_key)
+
+    def _append(self, seq: int, text: str):
+        client = _redis_client()
+        if client is not None:
+            key = cache.make_key(self._buffer_key)
+            pipe = client.pipeline()
+            pipe.zadd(key, {text: seq})
+            pipe.zremrangebyrank(key, 0, -self.buffer_size - 1)
+            pipe.expire(key, self.buffer_ttl)
+            pipe.execute()
+            return
+
+        entries = cache.get(self._buffer_key, [])
+        entries.append((seq, text))
+        cache.set(self._buffer_key, entries[-self.buffer_size :], self.buffer_ttl)
+
+    def _buffered(self) -> List[Tuple[int, str]]:
+        client = _redis_client()
+        if client is not None:
+            rows = client.zrange(
+                cache.make_key(self._buffer_key), 0, -1, withscores=True
+            )
+            return [(int(score), text.decode()) for text, score in rows]
+        return sorted(cache.get(self._buffer_key, []))
@@ -0,0 +1,280 @@
+"""
+Bulk issue updates: transition, assign, sprint and board moves.
+
+The whole batch is validated before anything is written. Workflow rules and
+column WIP limits come from the project's cached WorkflowGraph. The changes
+are then saved with a single bulk_update.
+
+bulk_update bypasses Issue.save() and its signals, so the side effects those
+signals would have produced are written here in batches, in the same
+transaction:
+- one outbox event per issue, inserted together, for notifications and search
+  reindexing
+- one "issue_batch" outbox event, which boards receive as a single
+  issues.bulk_updated message
+- the activity log rows, inserted together
+
+Once the transaction commits, the project's cached dependency graph is
+invalidated and its diagrams are scheduled for re-rendering, as the Issue
+post_save receivers would have done.
+"""
+
+import logging
+import uuid
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.projects.models import Issue, ProjectTeamMember
+from apps.projects.services.outbox_service import OutboxService, to_json_value
+from apps.projects.services.workflow_graph import WorkflowGraph
+
+logger = logging.getLogger(__name__)
+
+
+class BulkIssueError(Exception):
+    """A bulk update was rejected; errors maps issue IDs to reasons."""
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.message = message
+        self.errors = errors or {}
+
+
+class BulkIssueService:
+    """Apply one change to many issues of a project."""
+
+    def __init__(self, issues, user, request=None):
+        self.issues = list(issues)
+        self.user = user
+        self.request = request
+
+        if not self.issues:
+            raise BulkIssueError("No issues to update")
+        if len({issue.project_id for issue in self.issues}) > 1:
+            raise BulkIssueError("All issues must belong to the same project")
+        self.project = self.issues[0].project
+
+    @staticmethod
+    def max_issues():
+        return getattr(settings, "BULK_ISSUE_MAX_SIZE", 200)
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    def transition(self, to_status):
+        """Move issues to a workflow status allowed from their current one."""
+        if to_status.project_id != self.project.id:
+            raise BulkIssueError("Target status does not belong to this project")
+
+        graph = WorkflowGraph.for_project(self.project.id)
+        errors = {}
+        for issue in self.issues:
+            if issue.status_id != to_status.id and not graph.can_transition(
+                issue.status_id, to_status.id
+            ):
+                errors[str(issue.id)] = (
+                    f"Cannot transition from '{issue.status.name}' "
+                    f"to '{to_status.name}'"
+                )
+        if errors:
+            raise BulkIssueError("Some issues cannot be transitioned", errors)
+
+        return self._set_status(to_status)
+
+    def move_to_column(self, column):
+        """Move issues to a board column, within its WIP limit."""
+        to_status = column.workflow_status
+        max_wip = WorkflowGraph.for_project(self.project.id).wip_limit(
+            column.board_id, to_status.id
+        )
+        if max_wip:
+            incoming = sum(1 for i in self.issues if i.status_id != to_status.id)
+            current = Issue.objects.filter(
+                project=self.project, status=to_status, is_active=True
+            ).count()
+            if incoming and current + incoming > max_wip:
+                raise BulkIssueError(
+                    f"Column has reached maximum WIP limit of {max_wip}"
+                )
+
+        return self._set_status(to_status)
+
+    def assign(self, assignee):
+        """Assign issues to a project team member, or unassign with None."""
+        if (
+            assignee is not None
+            and not ProjectTeamMember.objects.filter(
+                project=self.project, user=assignee, is_active=True
+            ).exists()
+        ):
+            raise BulkIssueError("Assignee is not a member of this project")
+
+        def change(issue):
+            old_name = issue.assignee.get_full_name() if issue.assignee else None
+            issue.assignee = assignee
+            return "assigned", {
+                "field": "assignee",
+                "old_value": old_name or "Unassigned",
+                "new_value": assignee.get_full_name() if assignee else "Unassigned",
+            }
+
+        return self._apply(["assignee"], change)
+
+    def set_sprint(self, sprint):
+        """Add issues to a sprint of the project, or remove them with None."""
+        if sprint is not None:
+            if sprint.project_id != self.project.id:
+                raise BulkIssueError("Sprint does not belong to this project")
+            if sprint.status == "completed":
+                raise BulkIssueError("Cannot add issues to a completed sprint")
+
+        errors = {
+            str(issue.id): "Issue is in a completed sprint"
+            for issue in self.issues
+            if issue.sprint_id
+            and issue.sprint_id != getattr(sprint, "id", None)
+            and issue.sprint.status == "completed"
+        }
+        if errors:
+            raise BulkIssueError("Some issues cannot leave their sprint", errors)
+
+        def change(issue):
+            issue.sprint = sprint
+            if sprint is None:
+                return "sprint_removed", {"field": "sprint"}
+            return "sprint_added", {"field": "sprint", "sprint_name": sprint.name}
+
+        return self._apply(["sprint"], change)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _set_status(self, to_status):
+        now = timezone.now()
+
+        def change(issue):
+            old_name = issue.status.name
+            issue.status = to_status
+            if to_status.is_final and not issue.resolved_at:
+                issue.resolved_at = now
+            elif not to_status.is_final and issue.resolved_at:
+                issue.resolved_at = None
+            return "transitioned", {
+                "field": "status",
+                "old_value": old_name,
+                "new_value": to_status.name,
+            }
+
+        return self._apply(["status", "resolved_at"], change)
+
+    def _apply(self, fields, change):
+        """
+        Run change(issue) on every issue and save the ones that changed.
+
+        change returns the (action_type, changes) activity log entry for the
+        issue. Returns the updated issues.
+        """
+        now = timezone.now()
+        updated, activity = [], []
+        for issue in self.issues:
+            action_type, log_changes = change(issue)
+            issue.changes = issue._collect_changes()
+            if not issue.changes:
+                continue
+            issue.updated_at = now
+            updated.append(issue)
+            activity.append((action_type, issue, log_changes))
+
+        if not updated:
+            return []
+
+        with transaction.atomic():
+            Issue.objects.bulk_update(updated, [*fields, "updated_at"])
+            self._record_events(updated)
+
+            from apps.reporting.signals import create_activity_logs
+
+            create_activity_logs(self.user, activity, self.request)
+            transaction.on_commit(self._refresh_project_caches)
+
+        for issue in updated:
+            issue._remember_tracked_values()
+
+        logger.info(
+            f"[BULK] {self.user} updated {', '.join(fields)} of {len(updated)} issues in project {self.project.key}"  # noqa: E501
+        )
+        return updated
+
+    def _refresh_project_caches(self):
+        """Invalidate what the skipped Issue post_save receivers would have."""
+        from apps.reporting.services.dependency_analysis_service import (
+            DependencyAnalysisService,
+        )
+        from apps.reporting.services.diagram_prerender_service import (
+            DiagramPrerenderService,
+        )
+        from apps.reporting.signals import PRERENDER_TRIGGERS
+
+        DependencyAnalysisService.invalidate(self.project.id)
+        DiagramPrerenderService.schedule(self.project.id, PRERENDER_TRIGGERS[Issue])
+
+    def _record_events(self, issues):
+        batch_id = uuid.uuid4()
+        actor_id = str(self.user.id) if self.user else None
+        project_id = str(self.project.id)
+
+        deltas = []
+        entries = []
+        for issue in issues:
+            changes = {
+                field: [
+                    to_json_value(issue.changes.old(field)),
+                    to_json_value(issue.changes.new(field)),
+                ]
+                for field in issue.changes.fields
+            }
+            entries.append(
+                (
+                    issue,
+                    {
+                        "project_id": project_id,
+                        "actor_id": actor_id,
+                        "changes": changes,
+                        "key": issue.key,
+                        "batch_id": str(batch_id),
+                    },
+                )
+            )
+            deltas.append(
+                {
+                    "id": str(issue.id),
+                    "key": issue.key,
+                    **{field: values[1] for field, values in changes.items()},
+                }
+            )
+
+        OutboxService.record_many("issue", entries, "updated")
+
+        fields_changed = sorted(
+            {field for delta in deltas for field in delta} - {"id", "key"}
+        )
+        OutboxService.record_many(
+            "issue_batch",
+            [
+                (
+                    SimpleNamespace(pk=batch_id),
+                    {
+                        "project_id": project_id,
+                        "actor_id": actor_id,
+                        "issues": deltas,
+                        "fields_changed": fields_changed,
+                    },
+                )
+            ],
+            "updated",
+        )
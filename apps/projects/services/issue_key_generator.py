@@ -1,31 +1,89 @@
-from django.db import transaction
-from django.db.models import Max
+from django.db import IntegrityError, connection, transaction
+from django.db.models import BigIntegerField, F, Max
+from django.db.models.functions import Cast
 
-from apps.projects.models import Issue
+from apps.projects.models import Issue, IssueKeySequence
 
 
 class IssueKeyGenerator:
-    @staticmethod
-    @transaction.atomic
-    def generate_key(project):
-        last_issue = (
-            Issue.objects.filter(project=project)
-            .select_for_update()
-            .aggregate(max_key=Max("key"))
-        )
+    """
+    Allocate issue keys from a per-project counter row.
+
+    Each allocation is a single UPDATE ... RETURNING on the project's
+    IssueKeySequence instead of a scan over the project's issues. The UPDATE
+    locks the counter row until the transaction it runs in ends, so callers
+    allocate before opening the transaction that saves the issue: the
+    allocation then commits on its own and concurrent creations only wait for
+    that one statement. A number that is allocated but never saved (failed
+    insert, rolled back request) is skipped, as with database sequences.
+    """
+
+    @classmethod
+    def generate_key(cls, project):
+        return cls.generate_keys(project, 1)[0]
+
+    @classmethod
+    def generate_keys(cls, project, count):
+        """Allocate count consecutive keys in one round trip."""
+        if count < 1:
+            return []
 
-        max_key = last_issue.get("max_key")
-        if max_key:
-            try:
-                next_number = int(max_key) + 1
-            except (ValueError, TypeError):
-                next_number = 1
-        else:
-            next_number = 1
+        project_id = getattr(project, "pk", project)
+        with transaction.atomic():
+            last_number = cls._increment(project_id, count)
+            if last_number is None:
+                cls._create_sequence(project_id)
+                last_number = cls._increment(project_id, count)
 
-        return str(next_number)
+        return [
+            str(number) for number in range(last_number - count + 1, last_number + 1)
+        ]
 
     @classmethod
     def generate_full_key(cls, project):
         key = cls.generate_key(project)
         return f"{project.key}-{key}"
+
+    @staticmethod
+    def _increment(project_id, count):
+        """Add count to the counter and return the new value (None if no row)."""
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {IssueKeySequence._meta.db_table} "
+                    "SET last_number = last_number + %s "
+                    "WHERE project_id = %s RETURNING last_number",
+                    [count, str(project_id)],
+                )
+                row = cursor.fetchone()
+            return row[0] if row else None
+
+        # Backends without RETURNING: the UPDATE holds the row lock until the
+        # surrounding transaction ends, so the read below sees our own value
+        updated = IssueKeySequence.objects.filter(project_id=project_id).update(
+            last_number=F("last_number") + count
+        )
+        if not updated:
+            return None
+        return (
+            IssueKeySequence.objects.filter(project_id=project_id)
+            .values_list("last_number", flat=True)
+            .get()
+        )
+
+    @staticmethod
+    def _create_sequence(project_id):
+        """Create the counter, starting after the highest numeric key in use."""
+        last_number = (
+            Issue.objects.filter(project_id=project_id, key__regex=r"^[0-9]+$")
+            .annotate(number=Cast("key", BigIntegerField()))
+            .aggregate(last=Max("number"))["last"]
+        )
+        try:
+            with transaction.atomic():
+                IssueKeySequence.objects.create(
+                    project_id=project_id, last_number=last_number or 0
+                )
+        except IntegrityError:
+            # Created concurrently by another allocation
+            pass
@@ -0,0 +1,246 @@
+"""
+Transactional outbox for issue and sprint side effects.
+
+post_save/post_delete receivers only write a compact OutboxEvent row in the
+same transaction as the change. Once the transaction commits, a Celery task
+claims pending events in batches and runs every handler registered for the
+aggregate type (search indexing, notifications, board broadcasts). Rolled back
+writes therefore leave no side effects, and no external I/O happens on the
+request path.
+
+Handlers are registered with the outbox_handler decorator and receive the
+OutboxEvent. They must be idempotent: an event is retried until every handler
+has succeeded once, and handlers that already succeeded are skipped.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.projects.models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+_HANDLERS: Dict[str, List[Callable]] = defaultdict(list)
+
+
+def outbox_handler(aggregate_type: str):
+    """Register a function as handler for events of an aggregate type."""
+
+    def decorator(func):
+        if func not in _HANDLERS[aggregate_type]:
+            _HANDLERS[aggregate_type].append(func)
+        return func
+
+    return decorator
+
+
+def get_handlers(aggregate_type: str) -> List[Callable]:
+    return list(_HANDLERS.get(aggregate_type, ()))
+
+
+def _handler_name(func) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def to_json_value(value):
+    """Convert model field values to JSON-serializable payload values."""
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class OutboxService:
+    """Record outbox events and dispatch them to registered handlers."""
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def record(
+        cls,
+        aggregate_type: str,
+        instance,
+        event_type: str,
+        payload: Optional[Dict] = None,
+    ):
+        """
+        Store an event for a saved or deleted instance.
+
+        The entity version comes from updated_at, so the same write recorded
+        twice (e.g. a repeated signal) is stored once.
+        """
+        cls.record_many(aggregate_type, [(instance, payload)], event_type)
+
+    @classmethod
+    def record_many(
+        cls,
+        aggregate_type: str,
+        entries: Iterable[Tuple[object, Optional[Dict]]],
+        event_type: str,
+    ):
+        """Store events for several (instance, payload) pairs in one insert."""
+        events = []
+        for instance, payload in entries:
+            if event_type == "deleted" or not getattr(instance, "updated_at", None):
+                version_time = timezone.now()
+            else:
+                version_time = instance.updated_at
+
+            events.append(
+                OutboxEvent(
+                    aggregate_type=aggregate_type,
+                    aggregate_id=instance.pk,
+                    version=int(version_time.timestamp() * 1_000_000),
+                    event_type=event_type,
+                    payload=payload or {},
+                )
+            )
+        if not events:
+            return
+
+        OutboxEvent.objects.bulk_create(events, ignore_conflicts=True)
+        cls.schedule_dispatch()
+
+    @classmethod
+    def schedule_dispatch(cls):
+        """Enqueue one dispatch task when the current transaction commits."""
+        if not getattr(settings, "OUTBOX_DISPATCH_ON_COMMIT", True):
+            return
+
+        # One task per transaction, however many events it recorded
+        if connection.in_atomic_block and any(
+            callback is _enqueue_dispatch for _, callback, _ in connection.run_on_commit
+        ):
+            return
+
+        transaction.on_commit(_enqueue_dispatch)
+
+    # ------------------------------------------------------------------
+    # Dispatching
+    # ------------------------------------------------------------------
+
+    def __init__(self):
+        self.batch_size = getattr(settings, "OUTBOX_BATCH_SIZE", 100)
+        self.max_attempts = getattr(settings, "OUTBOX_MAX_ATTEMPTS", 5)
+        self.lease_seconds = getattr(settings, "OUTBOX_LEASE_SECONDS", 300)
+
+    def dispatch_pending(self, max_batches: int = 10) -> Dict[str, int]:
+        """
+        Process pending events in batches until none are left.
+
+        Returns:
+            Counts of events done, retried and failed
+        """
+        totals = {"done": 0, "retried": 0, "failed": 0}
+        for _ in range(max_batches):
+            events = self._claim_batch()
+            if not events:
+                break
+            for key, count in self._process(events).items():
+                totals[key] += count
+        return totals
+
+    def _claim_batch(self) -> List[OutboxEvent]:
+        """
+        Lease a batch of due events.
+
+        Claimed rows get a lease instead of a lock held during processing, so
+        events of a crashed worker become due again once the lease expires.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            events = list(
+                OutboxEvent.objects.select_for_update(skip_locked=True)
+                .filter(status__in=["pending", "processing"], available_at__lte=now)
+                .order_by("created_at")[: self.batch_size]
+            )
+            if events:
+                OutboxEvent.objects.filter(id__in=[e.id for e in events]).update(
+                    status="processing",
+                    available_at=now + timedelta(seconds=self.lease_seconds),
+                )
+        return events
+
+    def _process(self, events: List[OutboxEvent]) -> Dict[str, int]:
+        counts = {"done": 0, "retried": 0, "failed": 0}
+        now = timezone.now()
+
+        for event in events:
+            errors = []
+            for handler in get_handlers(event.aggregate_type):
+                name = _handler_name(handler)
+                if name in event.completed_handlers:
+                    continue
+                try:
+                    handler(event)
+                    event.completed_handlers.append(name)
+                except Exception as e:
+                    logger.exception(
+                        f"[OUTBOX] Handler {name} failed for event {event.id}: {e}"
+                    )
+                    errors.append(f"{name}: {e}")
+
+            event.attempts += 1
+            if not errors:
+                event.status = "done"
+                event.processed_at = now
+                event.last_error = ""
+                counts["done"] += 1
+            elif event.attempts >= self.max_attempts:
+                event.status = "failed"
+                event.last_error = "\n".join(errors)
+                counts["failed"] += 1
+            else:
+                event.status = "pending"
+                event.available_at = now + timedelta(
+                    seconds=min(30 * 2 ** (event.attempts - 1), 3600)
+                )
+                event.last_error = "\n".join(errors)
+                counts["retried"] += 1
+
+        OutboxEvent.objects.bulk_update(
+            events,
+            [
+                "status",
+                "attempts",
+                "completed_handlers",
+                "last_error",
+                "available_at",
+                "processed_at",
+            ],
+        )
+
+        if counts["retried"] or counts["failed"]:
+            logger.warning(
+                f"[OUTBOX] Batch of {len(events)}: {counts['retried']} retried, {counts['failed']} failed"  # noqa: E501
+            )
+        return counts
+
+    def purge(self, older_than_days: Optional[int] = None) -> int:
+        """Delete dispatched events older than the retention period."""
+        days = older_than_days or getattr(settings, "OUTBOX_RETENTION_DAYS", 7)
+        deleted, _ = OutboxEvent.objects.filter(
+            status="done", processed_at__lt=timezone.now() - timedelta(days=days)
+        ).delete()
+        return deleted
+
+
+def _enqueue_dispatch():
+    from apps.projects.tasks import dispatch_outbox_events
+
+    try:
+        dispatch_outbox_events.delay()
+    except Exception as e:
+        # The periodic dispatch picks the events up later
+        logger.warning(f"[OUTBOX] Could not enqueue dispatch: {e}")
@@ -1,5 +1,50 @@
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db.models import Q
+"""
+Issue search backed by the stored, GIN-indexed Issue.search_vector column and
+trigram indexes on title and key (see migration 0007_issue_search_vector).
+
+The trigram indexes are on the raw columns, so partial matches are written as
+"column ILIKE pattern": Django's istartswith/icontains compile to
+UPPER(column::text) LIKE UPPER(pattern), which those indexes cannot serve.
+
+On databases other than Postgres the same calls fall back to LIKE matching.
+"""
+
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connections
+from django.db.models import Case, F, IntegerField, Lookup, Q, Value, When
+
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+
+
+def _uses_postgres(queryset) -> bool:
+    return connections[queryset.db].vendor == "postgresql"
+
+
+class _ILike(Lookup):
+    """lhs ILIKE rhs, with rhs a ready-made pattern."""
+
+    lookup_name = "ilike"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", [*lhs_params, *rhs_params]
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_query(search_term: str):
+    """tsquery matching every word of the term as a prefix ("log in" -> log:* & in:*)."""  # noqa: E501
+    words = re.findall(r"\w+", search_term)
+    if not words:
+        return None
+    return SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw")
 
 
 class SearchService:
@@ -8,19 +53,71 @@ class SearchService:
         if not search_term:
             return queryset
 
-        search_vector = SearchVector("title", weight="A") + SearchVector(
-            "description", weight="B"
-        )
-        search_query = SearchQuery(search_term)
+        if not _uses_postgres(queryset):
+            return queryset.filter(
+                Q(title__icontains=search_term)
+                | Q(description__icontains=search_term)
+                | Q(key__icontains=search_term)
+            )
 
+        search_query = SearchQuery(search_term)
         return (
-            queryset.annotate(
-                search=search_vector, rank=SearchRank(search_vector, search_query)
-            )
-            .filter(search=search_query)
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
             .order_by("-rank")
         )
 
+    @staticmethod
+    def suggest_issues(queryset, search_term, limit=SUGGEST_DEFAULT_LIMIT):
+        """
+        Search-as-you-type matches for a partial term.
+
+        Key prefixes rank first, then titles by trigram similarity. On
+        Postgres every condition can use a GIN index: the tsvector prefix
+        query the search_vector index, and the key prefix and title substring
+        ILIKEs the trigram indexes (for terms of at least three characters;
+        shorter ones match too few trigrams to narrow the scan).
+
+        Returns:
+            Up to limit dicts with id, key, title, project_id and status_id
+        """
+        search_term = (search_term or "").strip()
+        if not search_term:
+            return []
+        limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+
+        if _uses_postgres(queryset):
+            pattern = _like_escape(search_term)
+            key_match = Q(_ILike(F("key"), f"{pattern}%"))
+            matches = key_match | Q(_ILike(F("title"), f"%{pattern}%"))
+        else:
+            key_match = Q(key__istartswith=search_term)
+            matches = key_match | Q(title__icontains=search_term)
+        key_first = Case(
+            When(key_match, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+
+        if _uses_postgres(queryset):
+            prefix_query = _prefix_query(search_term)
+            if prefix_query is not None:
+                matches |= Q(search_vector=prefix_query)
+            queryset = queryset.filter(matches).annotate(
+                key_first=key_first,
+                similarity=TrigramSimilarity("title", search_term),
+            )
+            ordering = ["key_first", "-similarity", "-updated_at"]
+        else:
+            queryset = queryset.filter(matches).annotate(key_first=key_first)
+            ordering = ["key_first", "-updated_at"]
+
+        return list(
+            queryset.order_by(*ordering).values(
+                "id", "key", "title", "project_id", "status_id"
+            )[:limit]
+        )
+
     @staticmethod
     def filter_issues_advanced(queryset, filters):
         if filters.get("has_attachments"):
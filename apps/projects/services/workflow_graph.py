@@ -0,0 +1,191 @@
+"""
+Compiled workflow graph per project.
+
+Transition checks and board moves used to query WorkflowTransition each time.
+WorkflowGraph loads a project's statuses, active transitions and column WIP
+limits once and stores the transitions as an adjacency bitmap over status
+indexes. Checking a transition is then a dict lookup and a bit test.
+
+Graphs are cached in process memory and in the shared cache under a version
+stamp. Saving or deleting a WorkflowStatus, WorkflowTransition or BoardColumn
+replaces the project's stamp, and every process then rebuilds or reloads its
+graph. A process rechecks the stamp at most every
+WORKFLOW_GRAPH_LOCAL_TTL_SECONDS.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# project_id -> (graph, monotonic time its version was last checked)
+_local_graphs: Dict[str, Tuple["WorkflowGraph", float]] = {}
+
+
+class WorkflowGraph:
+    """Statuses, allowed transitions and WIP limits of one project."""
+
+    def __init__(
+        self,
+        project_id,
+        version: int,
+        status_ids: List[str],
+        adjacency: List[int],
+        wip_limits: Dict[str, Dict[str, int]],
+    ):
+        self.project_id = str(project_id)
+        self.version = version
+        self.status_ids = status_ids
+        # Bit j of adjacency[i] is set when status i may move to status j
+        self.adjacency = adjacency
+        self.wip_limits = wip_limits
+        self._index = {status_id: index for index, status_id in enumerate(status_ids)}
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def can_transition(self, from_status_id, to_status_id) -> bool:
+        """True if an active transition leads from one status to the other."""
+        source = self._index.get(str(from_status_id))
+        target = self._index.get(str(to_status_id))
+        if source is None or target is None:
+            return False
+        return bool(self.adjacency[source] >> target & 1)
+
+    def targets(self, from_status_id) -> List[str]:
+        """IDs of the statuses reachable from a status in one transition."""
+        source = self._index.get(str(from_status_id))
+        if source is None:
+            return []
+        row = self.adjacency[source]
+        return [
+            status_id
+            for index, status_id in enumerate(self.status_ids)
+            if row >> index & 1
+        ]
+
+    def wip_limit(self, board_id, status_id) -> Optional[int]:
+        """max_wip of the board column showing a status, if it has one."""
+        return self.wip_limits.get(str(board_id), {}).get(str(status_id))
+
+    # ------------------------------------------------------------------
+    # Caching
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def for_project(cls, project) -> "WorkflowGraph":
+        """Graph of a project (instance or ID), from memory when current."""
+        project_id = str(getattr(project, "pk", project))
+        now = time.monotonic()
+        local_ttl = getattr(settings, "WORKFLOW_GRAPH_LOCAL_TTL_SECONDS", 5)
+
+        entry = _local_graphs.get(project_id)
+        if entry is not None and now - entry[1] < local_ttl:
+            return entry[0]
+
+        version = cls._current_version(project_id)
+        if entry is not None and entry[0].version == version:
+            _local_graphs[project_id] = (entry[0], now)
+            return entry[0]
+
+        graph_key = cls._graph_key(project_id, version)
+        data = cache.get(graph_key)
+        if data is None:
+            graph = cls.build(project_id, version)
+            cache.set(
+                graph_key,
+                graph.to_dict(),
+                getattr(settings, "WORKFLOW_GRAPH_CACHE_TTL_SECONDS", 86400),
+            )
+        else:
+            graph = cls.from_dict(project_id, version, data)
+
+        _local_graphs[project_id] = (graph, now)
+        return graph
+
+    @classmethod
+    def invalidate(cls, project_id):
+        """Drop cached graphs of a project in every process."""
+        project_id = str(project_id)
+        _local_graphs.pop(project_id, None)
+        # A new stamp rather than an increment: a stamp lost with the cache
+        # must not come back as a number that old graphs were stored under
+        cache.set(cls._version_key(project_id), time.time_ns(), timeout=None)
+
+    @classmethod
+    def _current_version(cls, project_id) -> int:
+        key = cls._version_key(project_id)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    @staticmethod
+    def _version_key(project_id) -> str:
+        return f"workflow_graph:{project_id}:version"
+
+    @staticmethod
+    def _graph_key(project_id, version) -> str:
+        return f"workflow_graph:{project_id}:{version}"
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, project_id, version: int = 0) -> "WorkflowGraph":
+        """Load a project's workflow from the database (three queries)."""
+        from apps.projects.models import BoardColumn, WorkflowStatus, WorkflowTransition
+
+        status_ids = [
+            str(status_id)
+            for status_id in WorkflowStatus.objects.filter(project_id=project_id)
+            .order_by("order", "id")
+            .values_list("id", flat=True)
+        ]
+        index = {status_id: i for i, status_id in enumerate(status_ids)}
+
+        adjacency = [0] * len(status_ids)
+        transitions = WorkflowTransition.objects.filter(
+            project_id=project_id, is_active=True
+        ).values_list("from_status_id", "to_status_id")
+        for from_status_id, to_status_id in transitions:
+            source = index.get(str(from_status_id))
+            target = index.get(str(to_status_id))
+            if source is not None and target is not None:
+                adjacency[source] |= 1 << target
+
+        wip_limits: Dict[str, Dict[str, int]] = {}
+        columns = BoardColumn.objects.filter(
+            board__project_id=project_id, max_wip__isnull=False
+        ).values_list("board_id", "workflow_status_id", "max_wip")
+        for board_id, status_id, max_wip in columns:
+            wip_limits.setdefault(str(board_id), {})[str(status_id)] = max_wip
+
+        logger.debug(
+            f"[WORKFLOW] Built graph for project {project_id}: {len(status_ids)} statuses"  # noqa: E501
+        )
+        return cls(project_id, version, status_ids, adjacency, wip_limits)
+
+    def to_dict(self) -> Dict:
+        return {
+            "status_ids": self.status_ids,
+            "adjacency": self.adjacency,
+            "wip_limits": self.wip_limits,
+        }
+
+    @classmethod
+    def from_dict(cls, project_id, version: int, data: Dict) -> "WorkflowGraph":
+        return cls(
+            project_id,
+            version,
+            data["status_ids"],
+            data["adjacency"],
+            data["wip_limits"],
+        )
@@ -1,25 +1,21 @@
 from apps.projects.models import WorkflowTransition
+from apps.projects.services.workflow_graph import WorkflowGraph
 
 
 class WorkflowValidator:
     @staticmethod
     def can_transition(issue, to_status):
-        if issue.status == to_status:
+        if issue.status_id == to_status.id:
             return True, "Already in this status"
 
-        transition_exists = WorkflowTransition.objects.filter(
-            project=issue.project,
-            from_status=issue.status,
-            to_status=to_status,
-            is_active=True,
-        ).exists()
+        if to_status.project_id != issue.project_id:
+            return False, "Target status does not belong to this project"
 
-        if transition_exists:
+        # Cached adjacency bitmap; no WorkflowTransition query per check
+        graph = WorkflowGraph.for_project(issue.project_id)
+        if graph.can_transition(issue.status_id, to_status.id):
             return True, "Transition allowed"
 
-        if to_status.project != issue.project:
-            return False, "Target status does not belong to this project"
-
         return (
             False,
             f"Cannot transition from '{issue.status.name}' to '{to_status.name}'",
@@ -6,18 +6,45 @@ This ensures that every new project automatically gets:
 - Default WorkflowStatuses (To Do, In Progress, Done)
 - Default WorkflowTransitions (automatic transitions between states)
 - Default ProjectConfiguration (with sensible defaults)
+
+Issue and sprint writes are recorded as outbox events in the same transaction;
+their side effects run after commit through OutboxService handlers.
+
+Comment, attachment and link writes keep the issue counter columns in sync.
+Workflow status, transition and board column writes invalidate the cached
+WorkflowGraph of their project.
 """
 
-from django.db.models.signals import post_save
+import logging
+
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from apps.projects.models import (
+    Board,
+    BoardColumn,
+    Issue,
+    IssueAttachment,
+    IssueComment,
+    IssueLink,
     IssueType,
     Project,
     ProjectConfiguration,
+    Sprint,
     WorkflowStatus,
     WorkflowTransition,
 )
+from apps.projects.services.outbox_service import (
+    OutboxService,
+    outbox_handler,
+    to_json_value,
+)
+from apps.projects.services.workflow_graph import WorkflowGraph
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=Project)
@@ -285,6 +312,7 @@ def _create_default_workflow_transitions(project, statuses):
     # Bulk create all transitions
     if default_transitions:
         WorkflowTransition.objects.bulk_create(default_transitions)
+        _invalidate_workflow_graph(project.id)
         print(
             f"✅ Auto-created {len(default_transitions)} default WorkflowTransitions for project: {project.name}"  # noqa: E501
         )
@@ -350,6 +378,7 @@ def create_transitions_for_new_status(sender, instance, created, **kwargs):
             transitions_to_create,
             ignore_conflicts=True,  # Ignore if transition already exists
         )
+        _invalidate_workflow_graph(instance.project_id)
         print(
             f"✅ Auto-created {len(transitions_to_create)} transitions for new status: "
             f"{instance.name} in project {instance.project.name}"
@@ -397,3 +426,269 @@ def create_default_project_configuration(sender, instance, created, **kwargs):
 
     # Log for debugging (optional)
     print(f"✅ Auto-created default ProjectConfiguration for project: {instance.name}")
+
+
+# ============================================================================
+# WORKFLOW GRAPH
+# ============================================================================
+
+
+def _invalidate_workflow_graph(project_id):
+    """Drop the cached WorkflowGraph now and again once the change commits."""
+    WorkflowGraph.invalidate(project_id)
+    # Another process may rebuild from the old rows before the commit
+    transaction.on_commit(lambda: WorkflowGraph.invalidate(project_id))
+
+
+@receiver(post_save, sender=WorkflowStatus)
+@receiver(post_delete, sender=WorkflowStatus)
+@receiver(post_save, sender=WorkflowTransition)
+@receiver(post_delete, sender=WorkflowTransition)
+def invalidate_workflow_graph(sender, instance, **kwargs):
+    """Rebuild the project's transition graph after workflow changes."""
+    _invalidate_workflow_graph(instance.project_id)
+
+
+@receiver(post_save, sender=BoardColumn)
+@receiver(post_delete, sender=BoardColumn)
+def invalidate_workflow_graph_wip(sender, instance, **kwargs):
+    """Rebuild the project's graph after column WIP limit changes."""
+    project_id = (
+        Board.objects.filter(id=instance.board_id)
+        .values_list("project_id", flat=True)
+        .first()
+    )
+    if project_id:
+        _invalidate_workflow_graph(project_id)
+
+
+# ============================================================================
+# ISSUE COUNTERS
+# ============================================================================
+
+
+def _adjust_issue_counter(issue_ids, field, delta):
+    """Increment/decrement a counter column in the caller's transaction."""
+    Issue.objects.filter(id__in=issue_ids).update(
+        **{field: Greatest(F(field) + delta, Value(0))}
+    )
+
+
+@receiver(post_save, sender=IssueComment)
+def increment_comment_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        _adjust_issue_counter([instance.issue_id], "comment_count", 1)
+
+
+@receiver(post_delete, sender=IssueComment)
+def decrement_comment_count(sender, instance, **kwargs):
+    _adjust_issue_counter([instance.issue_id], "comment_count", -1)
+
+
+@receiver(post_save, sender=IssueAttachment)
+def increment_attachment_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        _adjust_issue_counter([instance.issue_id], "attachment_count", 1)
+
+
+@receiver(post_delete, sender=IssueAttachment)
+def decrement_attachment_count(sender, instance, **kwargs):
+    _adjust_issue_counter([instance.issue_id], "attachment_count", -1)
+
+
+@receiver(post_save, sender=IssueLink)
+def increment_link_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        _adjust_issue_counter(
+            [instance.source_issue_id, instance.target_issue_id], "link_count", 1
+        )
+
+
+@receiver(post_delete, sender=IssueLink)
+def decrement_link_count(sender, instance, **kwargs):
+    _adjust_issue_counter(
+        [instance.source_issue_id, instance.target_issue_id], "link_count", -1
+    )
+
+
+# ============================================================================
+# OUTBOX EVENTS
+# ============================================================================
+
+
+def _current_actor_id():
+    """ID of the authenticated user behind the current request, if any."""
+    from apps.reporting.middleware import get_current_request, get_current_user
+
+    request = get_current_request()
+    user = getattr(request, "user", None) or get_current_user()
+    if user is not None and user.is_authenticated:
+        return str(user.id)
+    return None
+
+
+def _changes_payload(instance):
+    changes = getattr(instance, "changes", None)
+    if not changes:
+        return {}
+    return {
+        field: [to_json_value(changes.old(field)), to_json_value(changes.new(field))]
+        for field in changes.fields
+    }
+
+
+def _record_save(aggregate_type, instance, created, **extra):
+    changes = _changes_payload(instance)
+    if not created and not changes:
+        return
+
+    OutboxService.record(
+        aggregate_type,
+        instance,
+        "created" if created else "updated",
+        {
+            "project_id": str(instance.project_id),
+            "actor_id": _current_actor_id(),
+            "changes": changes,
+            **extra,
+        },
+    )
+
+
+@receiver(post_save, sender=Issue)
+def record_issue_event(sender, instance, created, raw=False, **kwargs):
+    """Record issue creation and tracked field changes in the outbox."""
+    if not raw:
+        _record_save("issue", instance, created, key=instance.key)
+
+
+@receiver(post_delete, sender=Issue)
+def record_issue_delete_event(sender, instance, **kwargs):
+    """Record issue deletion in the outbox."""
+    OutboxService.record(
+        "issue",
+        instance,
+        "deleted",
+        {
+            "project_id": str(instance.project_id),
+            "actor_id": _current_actor_id(),
+            "key": instance.key,
+        },
+    )
+
+
+@receiver(post_save, sender=Sprint)
+def record_sprint_event(sender, instance, created, raw=False, **kwargs):
+    """Record sprint creation and tracked field changes in the outbox."""
+    if not raw:
+        _record_save("sprint", instance, created)
+
+
+@receiver(post_delete, sender=Sprint)
+def record_sprint_delete_event(sender, instance, **kwargs):
+    """Record sprint deletion in the outbox."""
+    OutboxService.record(
+        "sprint",
+        instance,
+        "deleted",
+        {"project_id": str(instance.project_id), "actor_id": _current_actor_id()},
+    )
+
+
+# ============================================================================
+# OUTBOX HANDLERS
+# ============================================================================
+
+
+@outbox_handler("issue")
+def broadcast_issue_event(event):
+    """Push issue deltas to every board of the issue's project."""
+    from django.contrib.auth import get_user_model
+
+    from apps.projects.models import Board
+    from apps.projects.utils.websocket_utils import (
+        BOARD_ISSUE_FIELDS,
+        BoardWebSocketNotifier,
+    )
+
+    payload = event.payload
+    if payload.get("batch_id"):
+        # Part of a bulk update; boards get the one "issue_batch" event instead
+        return
+
+    board_ids = list(
+        Board.objects.filter(project_id=payload["project_id"]).values_list(
+            "id", flat=True
+        )
+    )
+    if not board_ids:
+        return
+
+    actor = None
+    if payload.get("actor_id"):
+        actor = get_user_model().objects.filter(id=payload["actor_id"]).first()
+
+    if event.event_type == "deleted":
+        for board_id in board_ids:
+            BoardWebSocketNotifier.send_issue_deleted(
+                board_id, event.aggregate_id, payload.get("key"), actor
+            )
+        return
+
+    if event.event_type == "created":
+        issue_data = (
+            Issue.objects.filter(id=event.aggregate_id)
+            .values(*BOARD_ISSUE_FIELDS)
+            .first()
+        )
+        if issue_data is None:
+            return
+        for board_id in board_ids:
+            BoardWebSocketNotifier.send_issue_created(board_id, issue_data, actor)
+        return
+
+    # Updates only carry the new values of the fields that changed
+    changes = payload.get("changes", {})
+    issue_data = {"id": str(event.aggregate_id), "key": payload.get("key")}
+    issue_data.update({field: values[1] for field, values in changes.items()})
+
+    for board_id in board_ids:
+        if "status_id" in changes:
+            old_status_id, new_status_id = changes["status_id"]
+            BoardWebSocketNotifier.send_issue_moved(
+                board_id, issue_data, old_status_id, new_status_id, actor
+            )
+        else:
+            BoardWebSocketNotifier.send_issue_updated(
+                board_id, issue_data, actor, fields_changed=sorted(changes)
+            )
+
+
+@outbox_handler("issue_batch")
+def broadcast_issue_batch_event(event):
+    """Push a bulk issue update to every board of the project as one message."""
+    from django.contrib.auth import get_user_model
+
+    from apps.projects.models import Board
+    from apps.projects.utils.websocket_utils import BoardWebSocketNotifier
+
+    payload = event.payload
+    board_ids = list(
+        Board.objects.filter(project_id=payload["project_id"]).values_list(
+            "id", flat=True
+        )
+    )
+    if not board_ids:
+        return
+
+    actor = None
+    if payload.get("actor_id"):
+        actor = get_user_model().objects.filter(id=payload["actor_id"]).first()
+
+    for board_id in board_ids:
+        BoardWebSocketNotifier.send_issues_bulk_updated(
+            board_id,
+            payload["issues"],
+            actor,
+            fields_changed=payload.get("fields_changed", []),
+        )
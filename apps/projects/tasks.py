@@ -0,0 +1,75 @@
+"""
+Celery tasks for projects app.
+
+Dispatching of outbox events recorded for issue and sprint writes, and
+attachment thumbnails.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="apps.projects.tasks.dispatch_outbox_events")
+def dispatch_outbox_events(self):
+    """
+    Fan pending outbox events out to their registered handlers.
+
+    Enqueued after each committing transaction that recorded events, and run
+    every minute by beat to pick up retries and events whose enqueue failed.
+
+    Returns:
+        dict: Number of events done, retried and failed
+    """
+    from apps.projects.services.outbox_service import OutboxService
+
+    result = OutboxService().dispatch_pending()
+    if any(result.values()):
+        logger.info(f"Dispatched outbox events: {result}")
+    return result
+
+
+@shared_task(bind=True, name="apps.projects.tasks.purge_outbox_events")
+def purge_outbox_events(self):
+    """
+    Delete dispatched outbox events past the retention period.
+
+    Returns:
+        dict: Number of deleted events
+    """
+    from apps.projects.services.outbox_service import OutboxService
+
+    deleted = OutboxService().purge()
+    logger.info(f"Purged {deleted} dispatched outbox events")
+    return {"deleted": deleted}
+
+
+@shared_task(
+    bind=True, name="apps.projects.tasks.generate_attachment_thumbnail", max_retries=3
+)
+def generate_attachment_thumbnail(self, attachment_id):
+    """
+    Generate the WebP thumbnail of an image attachment.
+
+    Args:
+        attachment_id: UUID of the IssueAttachment
+
+    Returns:
+        dict: Stored thumbnail name, None if the file is not a readable image
+    """
+    from apps.projects.models import IssueAttachment
+    from apps.projects.services.attachment_upload_service import generate_thumbnail
+
+    attachment = IssueAttachment.objects.filter(pk=attachment_id).first()
+    if attachment is None:
+        return {"thumbnail": None}
+
+    try:
+        return {"thumbnail": generate_thumbnail(attachment)}
+    except Exception as e:
+        logger.exception(
+            f"Error generating thumbnail for attachment {attachment_id}: {str(e)}"
+        )
+        raise self.retry(exc=e, countdown=60 * 2**self.request.retries)
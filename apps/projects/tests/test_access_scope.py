@@ -0,0 +1,104 @@
+"""
+Tests for the cached per-user access scope.
+"""
+
+from django.contrib.auth import get_user_model
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.models import Issue
+from apps.projects.permissions import CanAccessProject, IsProjectLeadOrAdmin
+from apps.projects.tests.factories import (
+    IssueFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+)
+from apps.projects.utils.access import project_access_filter
+from apps.workspaces.tests.factories import WorkspaceFactory, WorkspaceMemberFactory
+from base.utils.access_scope import AccessScope
+
+
+def fresh(user):
+    """The same user as a new object, as in the next request."""
+    return get_user_model().objects.get(pk=user.pk)
+
+
+@pytest.mark.django_db
+class TestAccessScope:
+    def test_built_in_one_query(self, django_assert_num_queries):
+        user = UserFactory()
+        project = ProjectFactory()
+        workspace = WorkspaceFactory()
+        ProjectTeamMemberFactory(project=project, user=user, role="tech_lead")
+        WorkspaceMemberFactory(workspace=workspace, user=user, role="admin")
+
+        with django_assert_num_queries(1):
+            scope = AccessScope.build(user.pk)
+
+        assert scope.project_role(project.id) == "tech_lead"
+        assert scope.workspace_role(workspace.id) == "admin"
+        assert scope.is_organization_member(workspace.organization_id) is False
+
+    def test_reused_across_requests_and_checks(self, django_assert_num_queries):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        AccessScope.for_user(fresh(user))
+
+        request = APIRequestFactory().get("/")
+        request.user = fresh(user)
+        with django_assert_num_queries(0):
+            for _ in range(10):
+                assert CanAccessProject().has_object_permission(request, None, project)
+
+    def test_membership_changes_invalidate(self):
+        user = UserFactory()
+        project = ProjectFactory()
+        assert not AccessScope.for_user(fresh(user)).is_project_member(project.id)
+
+        member = ProjectTeamMemberFactory(project=project, user=user)
+        assert AccessScope.for_user(fresh(user)).is_project_member(project.id)
+
+        member.is_active = False
+        member.save()
+        assert not AccessScope.for_user(fresh(user)).is_project_member(project.id)
+
+    def test_change_in_same_request_is_seen(self):
+        user = UserFactory()
+        workspace = WorkspaceFactory()
+        project = ProjectFactory(workspace=workspace)
+        request = APIRequestFactory().patch("/")
+        request.user = user
+        assert not IsProjectLeadOrAdmin().has_object_permission(request, None, project)
+
+        WorkspaceMemberFactory(workspace=workspace, user=user, role="admin")
+
+        assert IsProjectLeadOrAdmin().has_object_permission(request, None, project)
+
+    def test_queryset_filter_has_no_membership_join(self, django_assert_num_queries):
+        user = UserFactory()
+        member_project = ProjectFactory()
+        workspace_project = ProjectFactory()
+        hidden = IssueFactory()
+        ProjectTeamMemberFactory(project=member_project, user=user)
+        WorkspaceMemberFactory(workspace=workspace_project.workspace, user=user)
+        visible = {
+            IssueFactory(project=member_project).id,
+            IssueFactory(project=workspace_project).id,
+        }
+        AccessScope.for_user(user)
+
+        with django_assert_num_queries(1) as captured:
+            ids = set(
+                Issue.objects.filter(project_access_filter(user)).values_list(
+                    "id", flat=True
+                )
+            )
+
+        assert visible <= ids
+        assert hidden.id not in ids
+        sql = captured.captured_queries[0]["sql"]
+        assert "project_team_members" not in sql
+        assert "workspace_members" not in sql
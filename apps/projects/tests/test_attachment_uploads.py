@@ -0,0 +1,391 @@
+"""
+Tests for direct-to-S3 attachment uploads and attachment thumbnails.
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+import factory
+import pytest
+from botocore.exceptions import ClientError
+from PIL import Image
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.models import IssueAttachment
+from apps.projects.services import attachment_upload_service
+from apps.projects.tasks import generate_attachment_thumbnail
+from apps.projects.tests.factories import (
+    IssueAttachmentFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+)
+from base.storage import ThumbnailStorage
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def s3_storage():
+    """Stand-in for the S3 media storage; the boto3 client is a mock."""
+    storage = MagicMock()
+    storage.bucket_name = "bucket"
+    storage._normalize_name.side_effect = lambda name: f"media/{name}"
+    client = storage.connection.meta.client
+    client.generate_presigned_url.side_effect = lambda operation, Params, ExpiresIn: (
+        f"https://s3.test/{operation}/{Params.get('PartNumber', '')}"
+    )
+    client.generate_presigned_post.side_effect = lambda **kwargs: {
+        "url": "https://s3.test/bucket",
+        "fields": {**kwargs["Fields"], "key": kwargs["Key"], "policy": "p"},
+    }
+    client.create_multipart_upload.return_value = {"UploadId": "mp-1"}
+    client.head_object.return_value = {
+        "ContentLength": 1234,
+        "ContentType": "application/pdf",
+    }
+    with patch.object(attachment_upload_service, "default_storage", storage):
+        yield storage
+
+
+@pytest.fixture
+def thumbnail_storage(tmp_path):
+    field = IssueAttachment._meta.get_field("thumbnail")
+    storage = FileSystemStorage(location=tmp_path / "thumbnails")
+    with patch.object(field, "storage", storage):
+        yield storage
+
+
+def _image(width, height, fmt="JPEG"):
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(output, format=fmt)
+    return output.getvalue()
+
+
+@pytest.mark.django_db
+class TestDirectUploadAPI:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+        self.issue = IssueFactory(project=self.project)
+        self.start_url = reverse(
+            "issue-attachment-upload-list", kwargs={"issue_pk": self.issue.id}
+        )
+
+    def _complete_url(self, upload_id):
+        return reverse(
+            "issue-attachment-upload-complete",
+            kwargs={"issue_pk": self.issue.id, "upload_id": upload_id},
+        )
+
+    def _start(self, api_client, size=1234):
+        return api_client.post(
+            self.start_url,
+            {
+                "filename": "../spec sheet.pdf",
+                "content_type": "application/pdf",
+                "file_size": size,
+            },
+            format="json",
+        )
+
+    def test_small_file_is_uploaded_with_one_size_limited_presigned_post(
+        self, api_client, s3_storage
+    ):
+        api_client.force_authenticate(user=self.user)
+
+        response = self._start(api_client)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["method"] == "single"
+        assert response.data["url"] == "https://s3.test/bucket"
+        assert response.data["fields"]["Content-Type"] == "application/pdf"
+        client = s3_storage.connection.meta.client
+        conditions = client.generate_presigned_post.call_args.kwargs["Conditions"]
+        assert ["content-length-range", 0, 1234] in conditions
+        s3_storage.connection.meta.client.create_multipart_upload.assert_not_called()
+        assert not IssueAttachment.objects.exists()
+
+    def test_completion_registers_the_stored_object(self, api_client, s3_storage):
+        api_client.force_authenticate(user=self.user)
+        upload_id = self._start(api_client).data["upload_id"]
+
+        response = api_client.post(self._complete_url(upload_id), {}, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        attachment = IssueAttachment.objects.get(id=response.data["id"])
+        assert attachment.file.name == (
+            f"issues/issue_{self.issue.id}/attachments/{upload_id}/spec_sheet.pdf"
+        )
+        assert attachment.filename == "spec sheet.pdf"
+        assert attachment.file_size == 1234
+        assert attachment.uploaded_by == self.user
+        s3_storage.connection.meta.client.head_object.assert_called_once_with(
+            Bucket="bucket", Key=f"media/{attachment.file.name}"
+        )
+
+    def test_upload_can_only_be_completed_once(self, api_client, s3_storage):
+        api_client.force_authenticate(user=self.user)
+        upload_id = self._start(api_client).data["upload_id"]
+        api_client.post(self._complete_url(upload_id), {}, format="json")
+
+        response = api_client.post(self._complete_url(upload_id), {}, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert IssueAttachment.objects.count() == 1
+
+    def test_large_file_uses_multipart_upload(self, api_client, s3_storage, settings):
+        settings.ATTACHMENT_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+        settings.ATTACHMENT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+        client = s3_storage.connection.meta.client
+        client.head_object.return_value = {"ContentLength": 20 * 1024 * 1024}
+        api_client.force_authenticate(user=self.user)
+
+        started = self._start(api_client, size=20 * 1024 * 1024)
+
+        assert started.data["method"] == "multipart"
+        assert started.data["part_size"] == 8 * 1024 * 1024
+        assert [part["part_number"] for part in started.data["parts"]] == [1, 2, 3]
+        assert started.data["parts"][1]["url"] == "https://s3.test/upload_part/2"
+
+        response = api_client.post(
+            self._complete_url(started.data["upload_id"]),
+            {
+                "parts": [
+                    {"part_number": 2, "etag": '"b"'},
+                    {"part_number": 1, "etag": '"a"'},
+                    {"part_number": 3, "etag": '"c"'},
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        kwargs = client.complete_multipart_upload.call_args.kwargs
+        assert kwargs["UploadId"] == "mp-1"
+        assert [part["ETag"] for part in kwargs["MultipartUpload"]["Parts"]] == [
+            '"a"',
+            '"b"',
+            '"c"',
+        ]
+        # Content type falls back to the one declared when starting
+        attachment = IssueAttachment.objects.get(id=response.data["id"])
+        assert attachment.content_type == "application/pdf"
+
+    def test_missing_object_is_not_registered(self, api_client, s3_storage):
+        s3_storage.connection.meta.client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        api_client.force_authenticate(user=self.user)
+        upload_id = self._start(api_client).data["upload_id"]
+
+        response = api_client.post(self._complete_url(upload_id), {}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not IssueAttachment.objects.exists()
+
+    def test_oversized_object_is_deleted(self, api_client, s3_storage, settings):
+        settings.ATTACHMENT_MAX_SIZE = 2000
+        client = s3_storage.connection.meta.client
+        client.head_object.return_value = {"ContentLength": 5000}
+        api_client.force_authenticate(user=self.user)
+        upload_id = self._start(api_client).data["upload_id"]
+
+        response = api_client.post(self._complete_url(upload_id), {}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        client.delete_object.assert_called_once()
+        assert not IssueAttachment.objects.exists()
+
+    def test_declared_size_over_the_limit_is_rejected(
+        self, api_client, s3_storage, settings
+    ):
+        settings.ATTACHMENT_MAX_SIZE = 1000
+        api_client.force_authenticate(user=self.user)
+
+        response = self._start(api_client, size=1001)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file_size" in response.data
+
+    def test_other_users_cannot_complete_an_upload(self, api_client, s3_storage):
+        api_client.force_authenticate(user=self.user)
+        upload_id = self._start(api_client).data["upload_id"]
+        other = UserFactory()
+        ProjectTeamMemberFactory(project=self.project, user=other)
+        api_client.force_authenticate(user=other)
+
+        response = api_client.post(self._complete_url(upload_id), {}, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_non_members_cannot_start_uploads(self, api_client, s3_storage):
+        api_client.force_authenticate(user=UserFactory())
+
+        response = self._start(api_client)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_abort_cancels_the_multipart_upload(self, api_client, s3_storage):
+        client = s3_storage.connection.meta.client
+        api_client.force_authenticate(user=self.user)
+        upload_id = self._start(api_client, size=20 * 1024 * 1024).data["upload_id"]
+
+        response = api_client.delete(
+            reverse(
+                "issue-attachment-upload-detail",
+                kwargs={"issue_pk": self.issue.id, "upload_id": upload_id},
+            )
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        client.abort_multipart_upload.assert_called_once()
+        assert client.abort_multipart_upload.call_args.kwargs["UploadId"] == "mp-1"
+        response = api_client.post(self._complete_url(upload_id), {}, format="json")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_direct_uploads_need_s3_storage(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        response = self._start(api_client)
+
+        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+
+
+@pytest.mark.django_db
+class TestAttachmentThumbnails:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path / "media"
+
+    def test_thumbnail_is_a_bounded_webp_under_a_stable_key(
+        self, thumbnail_storage, settings
+    ):
+        settings.ATTACHMENT_THUMBNAIL_SIZE = 400
+        attachment = IssueAttachmentFactory(
+            file=factory.django.FileField(
+                filename="photo.jpg", data=_image(1600, 1200)
+            ),
+            content_type="image/jpeg",
+        )
+
+        result = generate_attachment_thumbnail.delay(str(attachment.id)).get()
+
+        assert result == {"thumbnail": f"attachments/{attachment.id}/400.webp"}
+        attachment.refresh_from_db()
+        assert attachment.thumbnail.name == result["thumbnail"]
+        with Image.open(thumbnail_storage.open(attachment.thumbnail.name)) as image:
+            assert image.format == "WEBP"
+            assert image.size == (400, 300)
+
+    def test_regenerating_keeps_the_key(self, thumbnail_storage):
+        attachment = IssueAttachmentFactory(
+            file=factory.django.FileField(filename="a.png", data=_image(50, 50, "PNG")),
+            content_type="image/png",
+        )
+
+        first = generate_attachment_thumbnail.delay(str(attachment.id)).get()
+        second = generate_attachment_thumbnail.delay(str(attachment.id)).get()
+
+        assert first == second
+
+    def test_unreadable_images_get_no_thumbnail(self, thumbnail_storage):
+        attachment = IssueAttachmentFactory(
+            file=factory.django.FileField(filename="x.png", data=b"not an image"),
+            content_type="image/png",
+        )
+
+        result = generate_attachment_thumbnail.delay(str(attachment.id)).get()
+
+        assert result == {"thumbnail": None}
+        attachment.refresh_from_db()
+        assert not attachment.thumbnail
+
+    def test_uploaded_images_are_queued_after_commit(
+        self, api_client, thumbnail_storage, django_capture_on_commit_callbacks
+    ):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        issue = IssueFactory(project=project)
+        api_client.force_authenticate(user=user)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            response = api_client.post(
+                reverse("issue-attachment-list", kwargs={"issue_pk": issue.id}),
+                {
+                    "file": SimpleUploadedFile(
+                        "shot.png", _image(800, 100, "PNG"), content_type="image/png"
+                    )
+                },
+                format="multipart",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(callbacks) == 1
+        attachment = IssueAttachment.objects.get(id=response.data["id"])
+        assert attachment.thumbnail.name == f"attachments/{attachment.id}/400.webp"
+
+    def test_other_files_are_not_queued(
+        self, api_client, django_capture_on_commit_callbacks
+    ):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        issue = IssueFactory(project=project)
+        api_client.force_authenticate(user=user)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            api_client.post(
+                reverse("issue-attachment-list", kwargs={"issue_pk": issue.id}),
+                {
+                    "file": SimpleUploadedFile(
+                        "notes.txt", b"text", content_type="text/plain"
+                    )
+                },
+                format="multipart",
+            )
+
+        assert callbacks == []
+
+
+class TestThumbnailStorage:
+    def _storage(self, **overrides):
+        return ThumbnailStorage(
+            bucket_name="bucket",
+            access_key="key",
+            secret_key="secret",
+            region_name="us-east-1",
+            **overrides,
+        )
+
+    def test_urls_are_signed_and_privately_cached(self, settings):
+        settings.ATTACHMENT_THUMBNAIL_URL_EXPIRY_SECONDS = 86400
+        storage = self._storage()
+
+        url = storage.url("attachments/1/400.webp")
+
+        assert "/thumbnails/attachments/1/400.webp?" in url
+        assert "Signature=" in url
+        assert storage.object_parameters == {
+            "CacheControl": "private, max-age=86400, immutable"
+        }
+
+    def test_custom_domain_requires_cloudfront_signing(self, settings):
+        settings.ATTACHMENT_THUMBNAIL_DOMAIN = "cdn.test"
+
+        with pytest.raises(ImproperlyConfigured):
+            self._storage()
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.urls import reverse
 
 import pytest
@@ -9,6 +10,8 @@ from apps.organizations.tests.factories import (
     OrganizationMembershipFactory,
 )
 from apps.projects.models import Board, BoardColumn
+from apps.projects.services import WorkflowGraph
+from apps.projects.services.board_event_stream import BoardEventStream
 from apps.projects.tests.factories import (
     BoardColumnFactory,
     BoardFactory,
@@ -240,3 +243,127 @@ class TestBoardAPI:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "WIP limit" in response.data["error"]
+
+    def test_move_issue_query_count(self, api_client, django_assert_max_num_queries):
+        user = UserFactory()
+        org = OrganizationFactory()
+        workspace = WorkspaceFactory(organization=org)
+        project = ProjectFactory(workspace=workspace)
+
+        OrganizationMembershipFactory(organization=org, user=user)
+        WorkspaceMemberFactory(workspace=workspace, user=user)
+        ProjectTeamMemberFactory(project=project, user=user)
+
+        board = BoardFactory(project=project)
+        status1 = WorkflowStatusFactory(project=project)
+        status2 = WorkflowStatusFactory(project=project)
+        BoardColumnFactory(board=board, workflow_status=status1, order=0)
+        column2 = BoardColumnFactory(board=board, workflow_status=status2, order=1)
+        issue = IssueFactory(project=project, status=status1)
+
+        api_client.force_authenticate(user=user)
+
+        url = reverse("board-move-issue", kwargs={"pk": board.id, "issue_id": issue.id})
+        WorkflowGraph.for_project(project)
+        with django_assert_max_num_queries(19) as captured:
+            response = api_client.patch(
+                url, {"column_id": str(column2.id)}, format="json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        # The issue row is loaded once; change tracking must not re-fetch it
+        issue_selects = [
+            query
+            for query in captured.captured_queries
+            if query["sql"].startswith("SELECT") and 'FROM "issues"' in query["sql"]
+        ]
+        assert len(issue_selects) == 1
+
+
+@pytest.mark.django_db
+class TestBoardSnapshot:
+    def setup_method(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+        self.board = BoardFactory(project=self.project, created_by=self.user)
+        self.todo = WorkflowStatusFactory(project=self.project)
+        self.done = WorkflowStatusFactory(project=self.project)
+        BoardColumnFactory(board=self.board, workflow_status=self.todo, order=0)
+        BoardColumnFactory(board=self.board, workflow_status=self.done, order=1)
+        self.url = reverse("board-snapshot", kwargs={"pk": self.board.id})
+
+    def test_snapshot_groups_issues_by_column(
+        self, api_client, django_assert_max_num_queries
+    ):
+        second = IssueFactory(project=self.project, status=self.todo, order=2)
+        first = IssueFactory(project=self.project, status=self.todo, order=1)
+        IssueFactory(project=self.project, status=self.done)
+        IssueFactory(project=self.project, status=self.done, is_active=False)
+        api_client.force_authenticate(user=self.user)
+
+        with django_assert_max_num_queries(5):
+            response = api_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        todo, done = response.data["columns"]
+        assert [issue["id"] for issue in todo["issues"]] == [first.id, second.id]
+        assert done["issue_count"] == 1
+        assert response["ETag"] == f'W/"{response.data["seq"]}"'
+
+    def test_unchanged_board_returns_304_without_loading_it(
+        self, api_client, django_assert_max_num_queries
+    ):
+        BoardEventStream(self.board.id).publish("board.updated", {})
+        api_client.force_authenticate(user=self.user)
+        etag = api_client.get(self.url)["ETag"]
+
+        with django_assert_max_num_queries(2) as captured:
+            response = api_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not any(
+            table in query["sql"]
+            for query in captured
+            for table in ('"issues"', '"board_columns"')
+        )
+
+    def test_idle_board_returns_304_on_the_second_request(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        first = api_client.get(self.url)
+        second = api_client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_inaccessible_board_is_not_found_whatever_the_etag(self, api_client):
+        stream = BoardEventStream(self.board.id)
+        etag = f'W/"{stream.publish("board.updated", {})}"'
+        api_client.force_authenticate(user=UserFactory())
+
+        response = api_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_board_change_invalidates_etag(self, api_client):
+        api_client.force_authenticate(user=self.user)
+        etag = api_client.get(self.url)["ETag"]
+
+        added = api_client.post(
+            reverse("board-add-column", kwargs={"pk": self.board.id}),
+            {
+                "name": "Review",
+                "workflow_status_id": str(
+                    WorkflowStatusFactory(project=self.project).id
+                ),
+                "order": 2,
+            },
+            format="json",
+        )
+        assert added.status_code == status.HTTP_201_CREATED
+        response = api_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["columns"]) == 3
@@ -0,0 +1,199 @@
+"""
+Tests for sequenced board WebSocket messages and resync.
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from asgiref.sync import async_to_sync
+from channels.testing import WebsocketCommunicator
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.consumers.board_consumer import BoardConsumer
+from apps.projects.services import board_event_stream
+from apps.projects.services.board_event_stream import BoardEventStream
+from apps.projects.services.outbox_service import OutboxService
+from apps.projects.tests.factories import (
+    BoardColumnFactory,
+    BoardFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+    WorkflowStatusFactory,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestBoardEventStream:
+    def test_sequence_increases_per_board(self):
+        stream, other = BoardEventStream("a"), BoardEventStream("b")
+
+        seqs = [stream.publish("issue.updated", {"n": n}) for n in range(3)]
+        other_seq = other.publish("issue.updated", {})
+
+        assert seqs == [seqs[0], seqs[0] + 1, seqs[0] + 2]
+        assert stream.current_seq() == seqs[-1]
+        assert other.current_seq() == other_seq
+
+    def test_current_sequence_is_stable_before_the_first_publish(self):
+        stream = BoardEventStream("a")
+
+        with patch.object(board_event_stream, "_seq_base", return_value=1000):
+            assert stream.current_seq() == 1000
+        with patch.object(board_event_stream, "_seq_base", return_value=2000):
+            assert stream.current_seq() == 1000
+            assert stream.publish("issue.updated", {}) == 1001
+
+        assert stream.events_since(1000) is not None
+
+    def test_lost_sequence_restarts_past_previous_numbers(self):
+        stream = BoardEventStream("a")
+        with patch.object(board_event_stream, "_seq_base", return_value=1000):
+            before = stream.publish("issue.updated", {})
+
+        cache.clear()
+
+        # The restart base is the clock in milliseconds, which has moved on
+        with patch.object(board_event_stream, "_seq_base", return_value=1002):
+            assert stream.publish("issue.updated", {}) > before
+
+    def test_message_is_encoded_once_per_publish(self):
+        stream = BoardEventStream("a")
+
+        with patch.object(
+            board_event_stream,
+            "encode_message",
+            wraps=board_event_stream.encode_message,
+        ) as encode:
+            stream.publish("issue.updated", {"issue": {"id": "1"}})
+
+        assert encode.call_count == 1
+
+    def test_events_since_replays_missed_messages(self):
+        stream = BoardEventStream("a")
+        seqs = [stream.publish("issue.updated", {"n": n}) for n in range(5)]
+
+        missed = [json.loads(text) for text in stream.events_since(seqs[2])]
+
+        assert [m["seq"] for m in missed] == seqs[3:]
+        assert stream.events_since(seqs[-1]) == []
+
+    def test_gap_older_than_buffer_requires_reload(self, settings):
+        settings.BOARD_EVENT_BUFFER_SIZE = 2
+        stream = BoardEventStream("a")
+        seqs = [stream.publish("issue.updated", {"n": n}) for n in range(5)]
+
+        assert stream.events_since(seqs[0]) is None
+        replayed = [json.loads(t)["seq"] for t in stream.events_since(seqs[2])]
+        assert replayed == seqs[3:]
+
+
+@pytest.mark.django_db
+class TestIssueBroadcasts:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+        self.board = BoardFactory(project=self.project)
+        self.todo = WorkflowStatusFactory(project=self.project)
+        self.done = WorkflowStatusFactory(project=self.project)
+        BoardColumnFactory(board=self.board, workflow_status=self.todo, order=0)
+        self.column = BoardColumnFactory(
+            board=self.board, workflow_status=self.done, order=1
+        )
+
+    def test_move_sends_only_the_changed_fields(self, api_client):
+        issue = IssueFactory(project=self.project, status=self.todo)
+        stream = BoardEventStream(self.board.id)
+        OutboxService().dispatch_pending()
+        start = stream.current_seq()
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.patch(
+            reverse(
+                "board-move-issue",
+                kwargs={"pk": self.board.id, "issue_id": issue.id},
+            ),
+            {"column_id": str(self.column.id)},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        OutboxService().dispatch_pending()
+
+        (message,) = [json.loads(text) for text in stream.events_since(start)]
+        assert message["type"] == "issue.moved"
+        assert message["seq"] == start + 1
+        assert message["data"]["issue"] == {
+            "id": str(issue.id),
+            "key": issue.key,
+            "status_id": str(self.done.id),
+        }
+        assert message["data"]["user"]["id"] == str(self.user.id)
+
+
+@pytest.mark.django_db
+class TestBoardConsumerResync:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.board_id = "00000000-0000-0000-0000-000000000001"
+
+    def _communicator(self):
+        communicator = WebsocketCommunicator(
+            BoardConsumer.as_asgi(), f"/ws/boards/{self.board_id}/"
+        )
+        communicator.scope["user"] = self.user
+        communicator.scope["url_route"] = {"kwargs": {"board_id": self.board_id}}
+        return communicator
+
+    @async_to_sync
+    async def _session(self, *client_messages):
+        communicator = self._communicator()
+        received = []
+        with patch.object(
+            BoardConsumer, "check_board_access", AsyncMock(return_value=True)
+        ):
+            connected, _ = await communicator.connect()
+            assert connected
+            received.append(json.loads(await communicator.receive_from()))
+            for message in client_messages:
+                await communicator.send_json_to(message)
+            while not await communicator.receive_nothing(timeout=0.2):
+                received.append(json.loads(await communicator.receive_from()))
+            await communicator.disconnect()
+        return received
+
+    def test_connect_reports_current_sequence(self):
+        seq = BoardEventStream(self.board_id).publish("issue.updated", {})
+
+        received = self._session()
+
+        assert received[0] == {"type": "board.sync", "seq": seq}
+
+    def test_resync_replays_buffered_messages(self):
+        stream = BoardEventStream(self.board_id)
+        seqs = [stream.publish("issue.updated", {"n": n}) for n in range(3)]
+
+        received = self._session({"type": "resync", "since": seqs[0]})
+
+        replayed = [m["seq"] for m in received if m["type"] == "issue.updated"]
+        assert replayed == seqs[1:]
+
+    def test_resync_beyond_buffer_requires_reload(self, settings):
+        settings.BOARD_EVENT_BUFFER_SIZE = 1
+        stream = BoardEventStream(self.board_id)
+        seqs = [stream.publish("issue.updated", {"n": n}) for n in range(3)]
+
+        received = self._session({"type": "resync", "since": seqs[0] - 1})
+
+        assert {"type": "board.resync_required", "seq": seqs[-1]} in received
@@ -1,4 +1,5 @@
 from django.urls import reverse
+from django.utils import timezone
 
 import pytest
 from rest_framework import status
@@ -10,6 +11,7 @@ from apps.organizations.tests.factories import (
 )
 from apps.projects.models import Issue
 from apps.projects.tests.factories import (
+    IssueCommentFactory,
     IssueFactory,
     IssueTypeFactory,
     ProjectFactory,
@@ -17,6 +19,7 @@ from apps.projects.tests.factories import (
     WorkflowStatusFactory,
 )
 from apps.workspaces.tests.factories import WorkspaceFactory, WorkspaceMemberFactory
+from base.utils.access_scope import AccessScope
 
 
 @pytest.mark.django_db
@@ -174,3 +177,171 @@ class TestIssueAPI:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_partial_update_query_count(
+        self, api_client, django_assert_max_num_queries
+    ):
+        user = UserFactory()
+        org = OrganizationFactory()
+        workspace = WorkspaceFactory(organization=org)
+        project = ProjectFactory(workspace=workspace)
+
+        OrganizationMembershipFactory(organization=org, user=user)
+        WorkspaceMemberFactory(workspace=workspace, user=user)
+        ProjectTeamMemberFactory(project=project, user=user)
+
+        issue = IssueFactory(project=project, reporter=user)
+
+        api_client.force_authenticate(user=user)
+
+        url = reverse("issue-detail", kwargs={"pk": issue.id})
+        AccessScope.for_user(user)
+        with django_assert_max_num_queries(10) as captured:
+            response = api_client.patch(url, {"priority": "P1"}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        # The issue row is loaded once; change tracking must not re-fetch it
+        issue_selects = [
+            query
+            for query in captured.captured_queries
+            if query["sql"].startswith("SELECT") and 'FROM "issues"' in query["sql"]
+        ]
+        assert len(issue_selects) == 1
+
+    def test_list_query_has_no_distinct_or_join_per_membership(
+        self, api_client, django_assert_max_num_queries
+    ):
+        user = UserFactory()
+        workspace = WorkspaceFactory()
+        project = ProjectFactory(workspace=workspace)
+
+        # Both memberships match; the issue must still be listed once
+        WorkspaceMemberFactory(workspace=workspace, user=user)
+        ProjectTeamMemberFactory(project=project, user=user)
+
+        issue = IssueFactory(project=project)
+        IssueCommentFactory(issue=issue)
+        IssueFactory.create_batch(3, project=project)
+        IssueFactory()
+
+        api_client.force_authenticate(user=user)
+
+        with django_assert_max_num_queries(6) as captured:
+            response = api_client.get(reverse("issue-list"), {"has_comments": True})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["id"] for row in response.data["results"]] == [str(issue.id)]
+        issue_queries = [
+            query["sql"]
+            for query in captured.captured_queries
+            if 'FROM "issues"' in query["sql"]
+        ]
+        assert issue_queries
+        assert not any("DISTINCT" in sql for sql in issue_queries)
+
+    def test_suggest_returns_key_prefix_matches_first(self, api_client):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+
+        by_title = IssueFactory(project=project, key="OTHER-1", title="Fix login page")
+        by_key = IssueFactory(project=project, key="LOG-7", title="Unrelated")
+        IssueFactory(project=project, key="LOG-8", title="Archived", is_active=False)
+        IssueFactory(key="LOG-9", title="Login elsewhere")
+
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse("issue-suggest"), {"q": "log"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["id"] for row in response.data["results"]] == [
+            by_key.id,
+            by_title.id,
+        ]
+
+    def test_suggest_limit_is_capped(self, api_client):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        for number in range(25):
+            IssueFactory(project=project, key=f"CAP-{number}")
+
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse("issue-suggest"), {"q": "CAP", "limit": 100})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 20
+
+    def test_search_filter(self, api_client):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        match = IssueFactory(project=project, title="Password reset email")
+        IssueFactory(project=project, title="Dark mode")
+
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse("issue-list"), {"search": "password"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["id"] for row in response.data["results"]] == [str(match.id)]
+
+    def test_cursor_pagination_walks_ties_without_count(
+        self, api_client, django_assert_max_num_queries
+    ):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        issues = IssueFactory.create_batch(7, project=project)
+
+        # Same timestamp for most rows: the id tiebreaker must keep pages stable
+        tied = timezone.now()
+        Issue.objects.filter(id__in=[i.id for i in issues[1:]]).update(created_at=tied)
+        expected = [
+            str(issue.id)
+            for issue in Issue.objects.filter(project=project).order_by(
+                "-created_at", "-id"
+            )
+        ]
+
+        api_client.force_authenticate(user=user)
+        url = reverse("issue-list") + "?pagination=cursor&page_size=3"
+        seen, pages = [], []
+        while url:
+            with django_assert_max_num_queries(6) as captured:
+                response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert "count" not in response.data
+            assert not any(
+                "COUNT(" in query["sql"] for query in captured.captured_queries
+            )
+            pages.append(response.data)
+            seen += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+
+        assert seen == expected
+        assert [len(page["results"]) for page in pages] == [3, 3, 1]
+        assert pages[0]["previous"] is None
+
+        # Going back from the last page returns the middle page
+        response = api_client.get(pages[-1]["previous"])
+        assert [row["id"] for row in response.data["results"]] == expected[3:6]
+        assert response.data["next"] and response.data["previous"]
+
+    def test_page_number_pagination_is_default(self, api_client):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        IssueFactory.create_batch(3, project=project)
+
+        api_client.force_authenticate(user=user)
+        response = api_client.get(reverse("issue-list"), {"page_size": 2})
+
+        assert response.data["count"] == 3
+        assert len(response.data["results"]) == 2
+
+    def test_invalid_cursor_returns_not_found(self, api_client):
+        user = UserFactory()
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(reverse("issue-list"), {"cursor": "garbage"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
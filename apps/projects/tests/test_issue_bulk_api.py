@@ -0,0 +1,250 @@
+"""
+Tests for bulk issue transition, assignment, sprint and board move endpoints.
+"""
+
+import json
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.models import Issue, OutboxEvent, WorkflowTransition
+from apps.projects.services.board_event_stream import BoardEventStream
+from apps.projects.services.outbox_service import OutboxService
+from apps.projects.services.workflow_graph import WorkflowGraph
+from apps.projects.tests.factories import (
+    BoardColumnFactory,
+    BoardFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+    SprintFactory,
+    WorkflowStatusFactory,
+)
+from apps.reporting.models import ActivityLog
+from apps.reporting.services.dependency_analysis_service import (
+    DependencyAnalysisService,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestIssueBulkAPI:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+        self.todo = WorkflowStatusFactory(project=self.project)
+        self.done = WorkflowStatusFactory(project=self.project, is_final=True)
+        self.issues = IssueFactory.create_batch(
+            4, project=self.project, status=self.todo
+        )
+        self.ids = [str(issue.id) for issue in self.issues]
+
+    def test_bulk_transition_updates_all_issues_in_batched_writes(
+        self, api_client, django_assert_max_num_queries
+    ):
+        api_client.force_authenticate(user=self.user)
+        OutboxEvent.objects.all().delete()
+        WorkflowGraph.for_project(self.project)
+
+        # Independent of the number of issues: one bulk UPDATE, one insert each
+        # for outbox events and activity logs
+        with django_assert_max_num_queries(14):
+            response = api_client.post(
+                reverse("issue-bulk-transition"),
+                {"issue_ids": self.ids, "status": str(self.done.id)},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 4
+        issues = Issue.objects.filter(id__in=self.ids)
+        assert {issue.status_id for issue in issues} == {self.done.id}
+        assert all(issue.resolved_at for issue in issues)
+
+        events = OutboxEvent.objects.all()
+        assert events.filter(aggregate_type="issue").count() == 4
+        (batch,) = events.filter(aggregate_type="issue_batch")
+        assert sorted(row["id"] for row in batch.payload["issues"]) == sorted(self.ids)
+        assert batch.payload["fields_changed"] == ["status_id"]
+
+        logs = ActivityLog.objects.filter(action_type="transitioned")
+        assert logs.count() == 4
+        assert logs.first().changes["new_value"] == self.done.name
+
+    def test_bulk_transition_refreshes_cached_dependency_graph(
+        self, api_client, django_capture_on_commit_callbacks
+    ):
+        self.todo.category, self.done.category = "to_do", "done"
+        self.todo.save()
+        self.done.save()
+        service = DependencyAnalysisService()
+        graph = service.get_graph(self.project)
+        assert not any(graph.is_done(node) for node in range(len(graph.issues)))
+
+        api_client.force_authenticate(user=self.user)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("issue-bulk-transition"),
+                {"issue_ids": self.ids, "status": str(self.done.id)},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        graph = service.get_graph(self.project)
+        assert all(graph.is_done(node) for node in range(len(graph.issues)))
+
+    def test_bulk_transition_is_all_or_nothing(self, api_client):
+        blocked = WorkflowStatusFactory(project=self.project)
+        WorkflowTransition.objects.filter(
+            from_status=blocked, to_status=self.done
+        ).update(is_active=False)
+        stuck = IssueFactory(project=self.project, status=blocked)
+
+        api_client.force_authenticate(user=self.user)
+        response = api_client.post(
+            reverse("issue-bulk-transition"),
+            {"issue_ids": self.ids + [str(stuck.id)], "status": str(self.done.id)},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data["issues"]) == [str(stuck.id)]
+        assert not Issue.objects.filter(status=self.done).exists()
+
+    def test_inaccessible_issues_are_reported_as_not_found(self, api_client):
+        other = IssueFactory()
+
+        api_client.force_authenticate(user=self.user)
+        response = api_client.post(
+            reverse("issue-bulk-assign"),
+            {"issue_ids": self.ids + [str(other.id)], "assignee": None},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["issues"] == {str(other.id): "Issue not found"}
+
+    def test_bulk_assign_requires_project_member(self, api_client):
+        outsider = UserFactory()
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.post(
+            reverse("issue-bulk-assign"),
+            {"issue_ids": self.ids, "assignee": outsider.id},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = api_client.post(
+            reverse("issue-bulk-assign"),
+            {"issue_ids": self.ids, "assignee": self.user.id},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert Issue.objects.filter(assignee=self.user).count() == 4
+
+    def test_bulk_sprint_rejects_completed_sprint(self, api_client):
+        sprint = SprintFactory(project=self.project)
+        completed = SprintFactory(project=self.project, status="completed")
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.post(
+            reverse("issue-bulk-sprint"),
+            {"issue_ids": self.ids, "sprint": str(completed.id)},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = api_client.post(
+            reverse("issue-bulk-sprint"),
+            {"issue_ids": self.ids[:2], "sprint": str(sprint.id)},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 2
+        assert ActivityLog.objects.filter(action_type="sprint_added").count() == 2
+
+    def test_batch_size_is_limited(self, api_client, settings):
+        settings.BULK_ISSUE_MAX_SIZE = 2
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.post(
+            reverse("issue-bulk-assign"),
+            {"issue_ids": self.ids, "assignee": None},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "issue_ids" in response.data
+
+
+@pytest.mark.django_db
+class TestBoardBulkMove:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+        self.board = BoardFactory(project=self.project)
+        self.todo = WorkflowStatusFactory(project=self.project)
+        self.done = WorkflowStatusFactory(project=self.project)
+        BoardColumnFactory(board=self.board, workflow_status=self.todo, order=0)
+        self.column = BoardColumnFactory(
+            board=self.board, workflow_status=self.done, order=1
+        )
+        self.issues = IssueFactory.create_batch(
+            3, project=self.project, status=self.todo
+        )
+        self.url = reverse("board-bulk-move-issues", kwargs={"pk": self.board.id})
+
+    def test_bulk_move_sends_one_board_message(self, api_client):
+        stream = BoardEventStream(self.board.id)
+        OutboxService().dispatch_pending()
+        start = stream.current_seq()
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.post(
+            self.url,
+            {
+                "issue_ids": [str(issue.id) for issue in self.issues],
+                "column_id": str(self.column.id),
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        OutboxService().dispatch_pending()
+
+        (message,) = [json.loads(text) for text in stream.events_since(start)]
+        assert message["type"] == "issues.bulk_updated"
+        assert message["data"]["fields_changed"] == ["status_id"]
+        assert {row["status_id"] for row in message["data"]["issues"]} == {
+            str(self.done.id)
+        }
+        assert len(message["data"]["issues"]) == 3
+
+    def test_bulk_move_respects_wip_limit(self, api_client):
+        self.column.max_wip = 2
+        self.column.save()
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.post(
+            self.url,
+            {
+                "issue_ids": [str(issue.id) for issue in self.issues],
+                "column_id": str(self.column.id),
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Issue.objects.filter(status=self.done).exists()
@@ -0,0 +1,145 @@
+"""
+Tests for per-project issue key allocation.
+"""
+
+import threading
+import time
+from unittest import mock
+
+from django.db import OperationalError, connection
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.models import Issue, IssueKeySequence
+from apps.projects.services import IssueKeyGenerator
+from apps.projects.tests.factories import (
+    IssueFactory,
+    IssueTypeFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+    WorkflowStatusFactory,
+)
+
+
+@pytest.mark.django_db
+class TestIssueKeyGenerator:
+    def test_keys_are_numeric_past_nine(self):
+        project = ProjectFactory()
+
+        keys = [IssueKeyGenerator.generate_key(project) for _ in range(11)]
+
+        assert keys == [str(number) for number in range(1, 12)]
+
+    def test_sequence_starts_after_highest_existing_key(self):
+        project = ProjectFactory()
+        for key in ("9", "10", "LEGACY-99"):
+            IssueFactory(project=project, key=key)
+
+        assert IssueKeyGenerator.generate_key(project) == "11"
+        assert IssueKeySequence.objects.get(project=project).last_number == 11
+
+    def test_batch_allocation_is_contiguous(self):
+        project = ProjectFactory()
+        IssueKeyGenerator.generate_key(project)
+
+        batch = IssueKeyGenerator.generate_keys(project, 5)
+
+        assert batch == ["2", "3", "4", "5", "6"]
+        assert IssueKeyGenerator.generate_key(project) == "7"
+        assert IssueKeyGenerator.generate_keys(project, 0) == []
+
+    def test_allocation_does_not_read_issue_rows(self, django_assert_max_num_queries):
+        project = ProjectFactory()
+        IssueFactory.create_batch(3, project=project)
+        IssueKeyGenerator.generate_key(project)
+
+        with django_assert_max_num_queries(4) as captured:
+            IssueKeyGenerator.generate_keys(project, 10)
+
+        assert not any('"issues"' in query["sql"] for query in captured)
+
+    def test_projects_have_independent_sequences(self):
+        first, second = ProjectFactory(), ProjectFactory()
+
+        IssueKeyGenerator.generate_keys(first, 3)
+
+        assert IssueKeyGenerator.generate_key(second) == "1"
+
+    def test_create_allocates_key_outside_the_insert_transaction(self, api_client):
+        user = UserFactory()
+        project = ProjectFactory()
+        ProjectTeamMemberFactory(project=project, user=user)
+        issue_type = IssueTypeFactory(project=project, category="task")
+        WorkflowStatusFactory(project=project, is_initial=True)
+        api_client.force_authenticate(user=user)
+
+        # The test itself runs in a transaction; allocation adds only its own
+        depths = []
+        outer_depth = len(connection.atomic_blocks)
+        increment = IssueKeyGenerator._increment
+
+        def record_depth(*args):
+            depths.append(len(connection.atomic_blocks) - outer_depth)
+            return increment(*args)
+
+        with mock.patch.object(
+            IssueKeyGenerator, "_increment", side_effect=record_depth
+        ):
+            response = api_client.post(
+                reverse("issue-list"),
+                {
+                    "project": str(project.id),
+                    "issue_type": str(issue_type.id),
+                    "title": "Keyed",
+                    "priority": "P2",
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert depths and set(depths) == {1}
+        assert Issue.objects.get(title="Keyed").key == "1"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_allocations_never_repeat_a_key():
+    project = ProjectFactory()
+    IssueKeyGenerator.generate_key(project)
+    keys, errors = [], []
+    lock = threading.Lock()
+
+    def allocate_with_retry():
+        # The shared in-memory SQLite test database fails lock conflicts
+        # immediately instead of waiting like Postgres; retry as a busy
+        # timeout would. A failed attempt is rolled back entirely.
+        for _ in range(200):
+            try:
+                return IssueKeyGenerator.generate_keys(project, 2)
+            except OperationalError as exc:
+                if "locked" not in str(exc):
+                    raise
+                time.sleep(0.001)
+        raise AssertionError("allocation kept conflicting")
+
+    def allocate():
+        try:
+            for _ in range(10):
+                allocated = allocate_with_retry()
+                with lock:
+                    keys.extend(allocated)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=allocate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert sorted(keys, key=int) == [str(number) for number in range(2, 162)]
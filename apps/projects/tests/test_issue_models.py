@@ -2,7 +2,7 @@ from django.core.exceptions import ValidationError
 
 import pytest
 
-from apps.projects.models import IssueLink
+from apps.projects.models import Issue, IssueLink
 from apps.projects.tests.factories import (
     IssueFactory,
     IssueLinkFactory,
@@ -64,15 +64,22 @@ class TestIssueModel:
 
         issue = IssueFactory()
         IssueCommentFactory(issue=issue)
-        IssueCommentFactory(issue=issue)
+        comment = IssueCommentFactory(issue=issue)
+        issue.refresh_from_db()
 
         assert issue.comment_count == 2
 
+        comment.delete()
+        issue.refresh_from_db()
+
+        assert issue.comment_count == 1
+
     def test_issue_attachment_count(self):
         from apps.projects.tests.factories import IssueAttachmentFactory
 
         issue = IssueFactory()
         IssueAttachmentFactory(issue=issue)
+        issue.refresh_from_db()
 
         assert issue.attachment_count == 1
 
@@ -81,8 +88,73 @@ class TestIssueModel:
         issue2 = IssueFactory(project=issue1.project)
 
         IssueLinkFactory(source_issue=issue1, target_issue=issue2)
+        issue1.refresh_from_db()
+        issue2.refresh_from_db()
 
         assert issue1.link_count >= 1
+        assert issue2.link_count >= 1
+
+    def test_stale_instance_save_keeps_counters(self):
+        from apps.projects.tests.factories import IssueCommentFactory
+
+        issue = IssueFactory()
+        stale = Issue.objects.get(pk=issue.pk)
+        IssueCommentFactory(issue=issue)
+
+        stale.title = "Renamed"
+        stale.save()
+        issue.refresh_from_db()
+
+        assert issue.title == "Renamed"
+        assert issue.comment_count == 1
+
+
+@pytest.mark.django_db
+class TestIssueChangeTracking:
+    def test_loaded_issue_diffs_without_refetch(self, django_assert_num_queries):
+        issue = Issue.objects.get(pk=IssueFactory(priority="P3").pk)
+        issue.priority = "P1"
+        issue.title = issue.title
+
+        with django_assert_num_queries(0):
+            changes = issue._collect_changes()
+
+        assert changes.fields == {"priority"}
+        assert changes.old("priority") == "P3"
+        assert changes.new("priority") == "P1"
+
+    def test_changes_reset_after_save(self):
+        issue = Issue.objects.get(pk=IssueFactory(priority="P3").pk)
+        issue.priority = "P1"
+        issue.save()
+
+        assert issue.changes.has_changed("priority")
+
+        issue.save()
+
+        assert not issue.changes
+
+    def test_unloaded_instance_fetches_once(self, django_assert_num_queries):
+        issue = IssueFactory(priority="P3")
+        stale = Issue(
+            **{
+                field.attname: getattr(issue, field.attname)
+                for field in Issue._meta.concrete_fields
+            }
+        )
+        stale._state.adding = False
+        stale.__dict__.pop("_loaded_values", None)
+        stale.priority = "P2"
+
+        with django_assert_num_queries(1):
+            changes = stale._collect_changes()
+
+        assert changes.fields == {"priority"}
+
+    def test_new_issue_has_no_changes(self):
+        issue = IssueFactory()
+
+        assert not issue.changes
 
 
 @pytest.mark.django_db
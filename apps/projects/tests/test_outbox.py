@@ -0,0 +1,219 @@
+"""
+Tests for the issue/sprint transactional outbox.
+"""
+
+from unittest.mock import patch
+
+from django.db import transaction
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.notifications.models import Notification
+from apps.projects.models import Issue, OutboxEvent
+from apps.projects.services import outbox_service
+from apps.projects.services.outbox_service import OutboxService
+from apps.projects.tests.factories import (
+    BoardColumnFactory,
+    BoardFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+    SprintFactory,
+    WorkflowStatusFactory,
+)
+from apps.projects.utils.websocket_utils import BoardWebSocketNotifier
+
+
+@pytest.fixture
+def isolated_handlers():
+    """Replace the registered handlers for the duration of a test."""
+    with patch.dict(outbox_service._HANDLERS, clear=True):
+        yield outbox_service._HANDLERS
+
+
+@pytest.mark.django_db
+class TestOutboxRecording:
+    def test_issue_changes_are_recorded_in_the_same_transaction(self):
+        issue = IssueFactory(priority="P3")
+        issue = Issue.objects.get(pk=issue.pk)
+
+        issue.priority = "P1"
+        issue.save()
+
+        event = OutboxEvent.objects.filter(
+            aggregate_id=issue.id, event_type="updated"
+        ).get()
+        assert event.payload["changes"] == {"priority": ["P3", "P1"]}
+        assert event.status == "pending"
+
+    def test_rolled_back_writes_leave_no_events(self):
+        issue = IssueFactory()
+        issue = Issue.objects.get(pk=issue.pk)
+
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                issue.title = "Renamed"
+                issue.save()
+                raise RuntimeError("rollback")
+
+        assert not OutboxEvent.objects.filter(event_type="updated").exists()
+
+    def test_saves_without_tracked_changes_are_not_recorded(self):
+        issue = Issue.objects.get(pk=IssueFactory().pk)
+        count = OutboxEvent.objects.count()
+
+        issue.order = 5
+        issue.save()
+
+        assert OutboxEvent.objects.count() == count
+
+    def test_same_entity_version_is_stored_once(self):
+        sprint = SprintFactory()
+
+        OutboxService.record("sprint", sprint, "updated", {"changes": {}})
+        OutboxService.record("sprint", sprint, "updated", {"changes": {}})
+
+        assert (
+            OutboxEvent.objects.filter(
+                aggregate_id=sprint.id, event_type="updated"
+            ).count()
+            == 1
+        )
+
+    def test_one_dispatch_is_enqueued_per_transaction(
+        self, django_capture_on_commit_callbacks
+    ):
+        project = ProjectFactory()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            with transaction.atomic():
+                IssueFactory.create_batch(3, project=project)
+
+        assert callbacks.count(outbox_service._enqueue_dispatch) == 1
+
+
+@pytest.mark.django_db
+class TestOutboxDispatch:
+    def setup_method(self):
+        self.sprint = SprintFactory()
+        OutboxEvent.objects.all().delete()
+
+    def _event(self):
+        OutboxService.record("sprint", self.sprint, "updated", {"changes": {}})
+        return OutboxEvent.objects.get()
+
+    def test_handlers_run_and_event_is_marked_done(self, isolated_handlers):
+        seen = []
+        outbox_service.outbox_handler("sprint")(lambda event: seen.append(event.id))
+        event = self._event()
+
+        result = OutboxService().dispatch_pending()
+
+        event.refresh_from_db()
+        assert seen == [event.id]
+        assert result["done"] == 1
+        assert event.status == "done"
+
+    def test_failed_handler_is_retried_without_rerunning_others(
+        self, isolated_handlers
+    ):
+        calls = {"ok": 0, "flaky": 0}
+
+        def ok(event):
+            calls["ok"] += 1
+
+        def flaky(event):
+            calls["flaky"] += 1
+            if calls["flaky"] == 1:
+                raise ConnectionError("index unavailable")
+
+        outbox_service.outbox_handler("sprint")(ok)
+        outbox_service.outbox_handler("sprint")(flaky)
+        event = self._event()
+
+        OutboxService().dispatch_pending()
+        event.refresh_from_db()
+        assert event.status == "pending"
+        assert "index unavailable" in event.last_error
+
+        OutboxEvent.objects.update(available_at=event.created_at)
+        OutboxService().dispatch_pending()
+
+        event.refresh_from_db()
+        assert event.status == "done"
+        assert calls == {"ok": 1, "flaky": 2}
+
+    def test_event_fails_after_max_attempts(self, isolated_handlers, settings):
+        settings.OUTBOX_MAX_ATTEMPTS = 1
+
+        def broken(event):
+            raise ValueError("boom")
+
+        outbox_service.outbox_handler("sprint")(broken)
+        event = self._event()
+
+        result = OutboxService().dispatch_pending()
+
+        event.refresh_from_db()
+        assert result["failed"] == 1
+        assert event.status == "failed"
+
+
+@pytest.mark.django_db
+class TestOutboxHandlers:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+
+    def test_move_issue_broadcasts_on_dispatch(self, api_client):
+        board = BoardFactory(project=self.project)
+        todo = WorkflowStatusFactory(project=self.project)
+        done = WorkflowStatusFactory(project=self.project)
+        BoardColumnFactory(board=board, workflow_status=todo, order=0)
+        column = BoardColumnFactory(board=board, workflow_status=done, order=1)
+        issue = IssueFactory(project=self.project, status=todo)
+        api_client.force_authenticate(user=self.user)
+
+        url = reverse("board-move-issue", kwargs={"pk": board.id, "issue_id": issue.id})
+        with patch.object(
+            BoardWebSocketNotifier, "send_issue_moved"
+        ) as send_issue_moved:
+            response = api_client.patch(
+                url, {"column_id": str(column.id)}, format="json"
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            send_issue_moved.assert_not_called()
+
+            OutboxService().dispatch_pending()
+
+        args = send_issue_moved.call_args.args
+        assert args[0] == board.id
+        assert (args[2], args[3]) == (str(todo.id), str(done.id))
+
+    def test_assignment_notification_is_created_by_dispatch(self, api_client):
+        assignee = UserFactory()
+        ProjectTeamMemberFactory(project=self.project, user=assignee)
+        issue = IssueFactory(project=self.project, reporter=self.user)
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.patch(
+            reverse("issue-detail", kwargs={"pk": issue.id}),
+            {"assignee": str(assignee.user_uuid)},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert not Notification.objects.filter(recipient=assignee).exists()
+
+        OutboxService().dispatch_pending()
+
+        assert Notification.objects.filter(
+            recipient=assignee, notification_type="issue_assigned"
+        ).exists()
+        assert OutboxEvent.objects.filter(
+            aggregate_id=issue.id, event_type="updated", status="done"
+        ).exists()
@@ -0,0 +1,108 @@
+"""
+Tests for the cached per-project workflow graph.
+"""
+
+import pytest
+
+from apps.projects.models import WorkflowStatus, WorkflowTransition
+from apps.projects.services import WorkflowGraph, WorkflowValidator, workflow_graph
+from apps.projects.tests.factories import (
+    BoardColumnFactory,
+    BoardFactory,
+    IssueFactory,
+    ProjectFactory,
+    WorkflowStatusFactory,
+)
+
+
+@pytest.fixture
+def project():
+    return ProjectFactory()
+
+
+def statuses(project):
+    return list(WorkflowStatus.objects.filter(project=project).order_by("order"))
+
+
+@pytest.mark.django_db
+class TestWorkflowGraph:
+    def test_matches_active_transitions(self, project):
+        first, second, *_ = statuses(project)
+        WorkflowTransition.objects.filter(from_status=first, to_status=second).update(
+            is_active=False
+        )
+        WorkflowGraph.invalidate(project.id)
+
+        graph = WorkflowGraph.for_project(project)
+
+        for transition in WorkflowTransition.objects.filter(project=project):
+            assert (
+                graph.can_transition(transition.from_status_id, transition.to_status_id)
+                is transition.is_active
+            )
+        assert str(second.id) not in graph.targets(first.id)
+
+    def test_checks_do_not_query_once_warm(self, project, django_assert_num_queries):
+        issue = IssueFactory(project=project)
+        target = next(s for s in statuses(project) if s.id != issue.status_id)
+        WorkflowGraph.for_project(project)
+
+        with django_assert_num_queries(0):
+            for _ in range(50):
+                assert WorkflowValidator.can_transition(issue, target)
+
+    def test_deactivating_transition_invalidates(self, project):
+        first, second, *_ = statuses(project)
+        assert WorkflowGraph.for_project(project).can_transition(first.id, second.id)
+
+        transition = WorkflowTransition.objects.get(from_status=first, to_status=second)
+        transition.is_active = False
+        transition.save()
+
+        assert not WorkflowGraph.for_project(project).can_transition(
+            first.id, second.id
+        )
+
+    def test_new_status_is_reachable(self, project):
+        first = statuses(project)[0]
+        WorkflowGraph.for_project(project)
+
+        added = WorkflowStatusFactory(project=project)
+
+        graph = WorkflowGraph.for_project(project)
+        assert graph.can_transition(first.id, added.id)
+        assert graph.can_transition(added.id, first.id)
+
+    def test_column_wip_limit(self, project):
+        board = BoardFactory(project=project)
+        column = BoardColumnFactory(board=board, workflow_status=statuses(project)[0])
+        assert (
+            WorkflowGraph.for_project(project).wip_limit(
+                board.id, column.workflow_status_id
+            )
+            is None
+        )
+
+        column.max_wip = 3
+        column.save()
+
+        assert (
+            WorkflowGraph.for_project(project).wip_limit(
+                board.id, column.workflow_status_id
+            )
+            == 3
+        )
+
+    def test_other_processes_reuse_shared_copy(
+        self, project, django_assert_num_queries
+    ):
+        graph = WorkflowGraph.for_project(project)
+        # A fresh process has no local copy but finds the cached one
+        workflow_graph._local_graphs.clear()
+
+        with django_assert_num_queries(0):
+            reloaded = WorkflowGraph.for_project(project)
+
+        assert reloaded is not graph
+        assert reloaded.adjacency == graph.adjacency
+        assert reloaded.status_ids == graph.status_ids
@@ -64,6 +64,21 @@ urlpatterns = [
         IssueAttachmentViewSet.as_view({"get": "list", "post": "create"}),
         name="issue-attachment-list",
     ),
+    path(
+        "issues/<uuid:issue_pk>/attachments/uploads/",
+        IssueAttachmentViewSet.as_view({"post": "start_upload"}),
+        name="issue-attachment-upload-list",
+    ),
+    path(
+        "issues/<uuid:issue_pk>/attachments/uploads/<str:upload_id>/",
+        IssueAttachmentViewSet.as_view({"delete": "abort_upload"}),
+        name="issue-attachment-upload-detail",
+    ),
+    path(
+        "issues/<uuid:issue_pk>/attachments/uploads/<str:upload_id>/complete/",
+        IssueAttachmentViewSet.as_view({"post": "complete_upload"}),
+        name="issue-attachment-upload-complete",
+    ),
     path(
         "issues/<uuid:issue_pk>/attachments/<uuid:pk>/",
         IssueAttachmentViewSet.as_view({"get": "retrieve", "delete": "destroy"}),
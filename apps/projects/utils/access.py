@@ -0,0 +1,44 @@
+"""
+Project access filters for querysets.
+
+Filtering on a join through workspace members OR project team members returns
+one row per matching membership and needs DISTINCT, which Postgres has to apply
+(and count) over the whole join product. The filters here use the user's
+cached AccessScope instead: IN lists on the object's own project and workspace
+columns, so list queries stay plain indexed scans without joins or DISTINCT.
+"""
+
+from django.db.models import Q
+
+from base.utils.access_scope import AccessScope
+
+
+def project_access_filter(user, project_field: str = "project"):
+    """
+    Filter expression for objects whose project the user can access.
+
+    Args:
+        user: Authenticated user
+        project_field: Path from the filtered model to its project, or "" when
+            filtering projects themselves
+
+    Returns:
+        Q for queryset.filter(): project in the user's active project team
+        memberships, or in a workspace the user is an active member of
+    """
+    return AccessScope.for_user(user).project_filter(project_field)
+
+
+def workspace_access_filter(user, workspace_field: str = "workspace"):
+    """
+    Filter expression for objects in workspaces the user is an active member of.
+
+    Args:
+        user: Authenticated user
+        workspace_field: Path from the filtered model to its workspace
+
+    Returns:
+        Q for queryset.filter()
+    """
+    workspace_ids = AccessScope.for_user(user).workspace_ids
+    return Q(**{f"{workspace_field}_id__in": workspace_ids})
@@ -0,0 +1,106 @@
+"""
+Field change tracking for model instances.
+
+Models opt in by listing the attribute names to watch in TRACKED_FIELDS and
+mixing in TrackedFieldsMixin. The values loaded from the database are kept on
+the instance, and every save() exposes a single FieldChanges diff on
+instance.changes for post_save receivers (search indexing, notifications,
+activity logging) instead of each receiver re-fetching the row in pre_save.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class FieldChanges:
+    """Old and new values of the tracked fields changed by one save()."""
+
+    def __init__(self, changes: Optional[Dict[str, Tuple[Any, Any]]] = None):
+        self._changes = changes or {}
+
+    def __bool__(self):
+        return bool(self._changes)
+
+    def __contains__(self, field):
+        return field in self._changes
+
+    def __repr__(self):
+        return f"FieldChanges({self._changes!r})"
+
+    @property
+    def fields(self):
+        return set(self._changes)
+
+    def has_changed(self, *fields: str) -> bool:
+        """True if any of the given fields changed."""
+        return any(field in self._changes for field in fields)
+
+    def old(self, field: str, default=None):
+        """Value of a changed field before the save."""
+        if field in self._changes:
+            return self._changes[field][0]
+        return default
+
+    def new(self, field: str, default=None):
+        """Value of a changed field after the save."""
+        if field in self._changes:
+            return self._changes[field][1]
+        return default
+
+
+class TrackedFieldsMixin:
+    """
+    Keep the loaded values of TRACKED_FIELDS and diff them on save().
+
+    Instances loaded through a queryset need no extra query. Instances built in
+    memory with a primary key, or loaded with tracked fields deferred, fetch
+    the missing values once per save.
+    """
+
+    TRACKED_FIELDS: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_tracked_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._remember_tracked_values(fields)
+
+    def save(self, *args, **kwargs):
+        self.changes = self._collect_changes()
+        super().save(*args, **kwargs)
+        # Later saves of this instance diff against what was just written
+        self._remember_tracked_values()
+
+    def _remember_tracked_values(self, fields: Optional[Iterable[str]] = None):
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        for field in self.TRACKED_FIELDS:
+            if field in self.__dict__ and (fields is None or field in fields):
+                loaded[field] = self.__dict__[field]
+
+    def _collect_changes(self) -> FieldChanges:
+        if self._state.adding or self.pk is None:
+            return FieldChanges()
+
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        missing = [field for field in self.TRACKED_FIELDS if field not in loaded]
+        if missing:
+            row = (
+                type(self)
+                ._base_manager.using(self._state.db or "default")
+                .filter(pk=self.pk)
+                .values(*missing)
+                .first()
+            )
+            if row is None:
+                return FieldChanges()
+            loaded.update(row)
+
+        changes = {}
+        for field in self.TRACKED_FIELDS:
+            new_value = getattr(self, field)
+            if loaded[field] != new_value:
+                changes[field] = (loaded[field], new_value)
+        return FieldChanges(changes)
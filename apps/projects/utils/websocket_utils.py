@@ -1,32 +1,29 @@
-from datetime import datetime
-from uuid import UUID
+from apps.projects.services.board_event_stream import BoardEventStream
+
+# Issue fields sent to board clients; the board only renders cards, so the
+# full issue serializer (comments, attachments, links) is never needed here
+BOARD_ISSUE_FIELDS = (
+    "id",
+    "key",
+    "title",
+    "status_id",
+    "issue_type_id",
+    "priority",
+    "assignee_id",
+    "sprint_id",
+    "parent_issue_id",
+    "story_points",
+    "order",
+)
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
 
-
-def convert_uuids_to_strings(obj):
+class BoardWebSocketNotifier:
     """
-    Recursively convert UUID objects to strings for msgpack serialization.
-
-    Args:
-        obj: Object to convert (dict, list, or primitive)
+    Utility class to send WebSocket notifications for board events.
 
-    Returns:
-        Object with all UUIDs converted to strings
+    Messages carry only what changed and a per-board sequence number; see
+    BoardEventStream for encoding, buffering and resync.
     """
-    if isinstance(obj, UUID):
-        return str(obj)
-    elif isinstance(obj, dict):
-        return {key: convert_uuids_to_strings(value) for key, value in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [convert_uuids_to_strings(item) for item in obj]
-    else:
-        return obj
-
-
-class BoardWebSocketNotifier:
-    """Utility class to send WebSocket notifications for board events"""
 
     @staticmethod
     def send_issue_moved(board_id, issue_data, old_status_id, new_status_id, user):
@@ -35,66 +32,32 @@ class BoardWebSocketNotifier:
 
         Args:
             board_id: UUID of the board
-            issue_data: Serialized issue data
+            issue_data: Issue id and key plus the fields changed by the move
             old_status_id: Previous workflow status ID
             new_status_id: New workflow status ID
             user: User who performed the action
         """
-        channel_layer = get_channel_layer()
-
-        message = {
-            "type": "issue_moved",
-            "data": {
+        BoardEventStream(board_id).publish(
+            "issue.moved",
+            {
                 "issue": issue_data,
                 "from_status": str(old_status_id),
                 "to_status": str(new_status_id),
-                "timestamp": datetime.now().isoformat(),
-                "user": {
-                    "id": str(user.id),
-                    "name": user.get_full_name() or user.username,
-                },
             },
-        }
-
-        # Convert all UUIDs to strings for msgpack
-        message = convert_uuids_to_strings(message)
-
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            message,
+            user,
         )
 
     @staticmethod
     def send_issue_created(board_id, issue_data, user):
         """
-        Send notification when issue is created from board
+        Send notification when issue is created
 
         Args:
             board_id: UUID of the board
-            issue_data: Serialized issue data
+            issue_data: Issue card fields (see BOARD_ISSUE_FIELDS)
             user: User who created the issue
         """
-        channel_layer = get_channel_layer()
-
-        message = {
-            "type": "issue_created",
-            "data": {
-                "issue": issue_data,
-                "timestamp": datetime.now().isoformat(),
-                "user": {
-                    "id": str(user.id),
-                    "name": user.get_full_name() or user.username,
-                },
-            },
-        }
-
-        # Convert all UUIDs to strings for msgpack
-        message = convert_uuids_to_strings(message)
-
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            message,
-        )
+        BoardEventStream(board_id).publish("issue.created", {"issue": issue_data}, user)
 
     @staticmethod
     def send_issue_updated(board_id, issue_data, user, fields_changed=None):
@@ -103,31 +66,31 @@ class BoardWebSocketNotifier:
 
         Args:
             board_id: UUID of the board
-            issue_data: Serialized issue data
+            issue_data: Issue id and key plus the new values of changed fields
             user: User who updated the issue
             fields_changed: List of field names that changed (optional)
         """
-        channel_layer = get_channel_layer()
-
-        message = {
-            "type": "issue_updated",
-            "data": {
-                "issue": issue_data,
-                "fields_changed": fields_changed or [],
-                "timestamp": datetime.now().isoformat(),
-                "user": {
-                    "id": str(user.id),
-                    "name": user.get_full_name() or user.username,
-                },
-            },
-        }
+        BoardEventStream(board_id).publish(
+            "issue.updated",
+            {"issue": issue_data, "fields_changed": fields_changed or []},
+            user,
+        )
 
-        # Convert all UUIDs to strings for msgpack
-        message = convert_uuids_to_strings(message)
+    @staticmethod
+    def send_issues_bulk_updated(board_id, issues_data, user, fields_changed=None):
+        """
+        Send one notification for a bulk update of several issues
 
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            message,
+        Args:
+            board_id: UUID of the board
+            issues_data: Per issue, id and key plus the new values of changed fields
+            user: User who performed the bulk update
+            fields_changed: List of field names that changed (optional)
+        """
+        BoardEventStream(board_id).publish(
+            "issues.bulk_updated",
+            {"issues": issues_data, "fields_changed": fields_changed or []},
+            user,
         )
 
     @staticmethod
@@ -141,22 +104,10 @@ class BoardWebSocketNotifier:
             issue_key: Key of deleted issue
             user: User who deleted the issue
         """
-        channel_layer = get_channel_layer()
-
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            {
-                "type": "issue_deleted",
-                "data": {
-                    "issue_id": str(issue_id),
-                    "issue_key": issue_key,
-                    "timestamp": datetime.now().isoformat(),
-                    "user": {
-                        "id": str(user.id),
-                        "name": user.get_full_name() or user.username,
-                    },
-                },
-            },
+        BoardEventStream(board_id).publish(
+            "issue.deleted",
+            {"issue_id": str(issue_id), "issue_key": issue_key},
+            user,
         )
 
     @staticmethod
@@ -169,26 +120,8 @@ class BoardWebSocketNotifier:
             column_data: Serialized column data
             user: User who created the column
         """
-        channel_layer = get_channel_layer()
-
-        message = {
-            "type": "column_created",
-            "data": {
-                "column": column_data,
-                "timestamp": datetime.now().isoformat(),
-                "user": {
-                    "id": str(user.id),
-                    "name": user.get_full_name() or user.username,
-                },
-            },
-        }
-
-        # Convert all UUIDs to strings for msgpack
-        message = convert_uuids_to_strings(message)
-
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            message,
+        BoardEventStream(board_id).publish(
+            "column.created", {"column": column_data}, user
         )
 
     @staticmethod
@@ -201,26 +134,8 @@ class BoardWebSocketNotifier:
             column_data: Serialized column data
             user: User who updated the column
         """
-        channel_layer = get_channel_layer()
-
-        message = {
-            "type": "column_updated",
-            "data": {
-                "column": column_data,
-                "timestamp": datetime.now().isoformat(),
-                "user": {
-                    "id": str(user.id),
-                    "name": user.get_full_name() or user.username,
-                },
-            },
-        }
-
-        # Convert all UUIDs to strings for msgpack
-        message = convert_uuids_to_strings(message)
-
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            message,
+        BoardEventStream(board_id).publish(
+            "column.updated", {"column": column_data}, user
         )
 
     @staticmethod
@@ -234,20 +149,8 @@ class BoardWebSocketNotifier:
             column_name: Name of deleted column
             user: User who deleted the column
         """
-        channel_layer = get_channel_layer()
-
-        async_to_sync(channel_layer.group_send)(
-            f"board_{board_id}",
-            {
-                "type": "column_deleted",
-                "data": {
-                    "column_id": str(column_id),
-                    "column_name": column_name,
-                    "timestamp": datetime.now().isoformat(),
-                    "user": {
-                        "id": str(user.id),
-                        "name": user.get_full_name() or user.username,
-                    },
-                },
-            },
+        BoardEventStream(board_id).publish(
+            "column.deleted",
+            {"column_id": str(column_id), "column_name": column_name},
+            user,
         )
@@ -1,4 +1,5 @@
 from django.db import models, transaction
+from django.utils.http import parse_etags
 
 from django_filters import rest_framework as filters
 from drf_spectacular.utils import extend_schema, extend_schema_view
@@ -20,9 +21,17 @@ from apps.projects.serializers import (
     BoardDetailSerializer,
     BoardListSerializer,
     BoardUpdateSerializer,
+    IssueBulkMoveSerializer,
     IssueCreateSerializer,
 )
-from apps.projects.utils.websocket_utils import BoardWebSocketNotifier
+from apps.projects.services import BulkIssueError, BulkIssueService
+from apps.projects.services.board_event_stream import BoardEventStream
+from apps.projects.services.workflow_graph import WorkflowGraph
+from apps.projects.utils.access import project_access_filter
+from apps.projects.utils.websocket_utils import (
+    BOARD_ISSUE_FIELDS,
+    BoardWebSocketNotifier,
+)
 
 
 class BoardFilter(filters.FilterSet):
@@ -77,6 +86,12 @@ class BoardViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         from django.db.models import Count, Prefetch, Q
 
+        if self.action == "snapshot":
+            # The snapshot loads columns and issues itself with values()
+            return Board.objects.filter(
+                project_access_filter(self.request.user)
+            ).select_related("project", "project__workspace")
+
         # Optimize columns with pre-calculated issue counts
         optimized_columns = (
             BoardColumn.objects.select_related("workflow_status")
@@ -96,19 +111,9 @@ class BoardViewSet(viewsets.ModelViewSet):
         )
 
         return (
-            Board.objects.filter(
-                Q(
-                    project__workspace__members__user=self.request.user,
-                    project__workspace__members__is_active=True,
-                )
-                | Q(
-                    project__team_members__user=self.request.user,
-                    project__team_members__is_active=True,
-                )
-            )
+            Board.objects.filter(project_access_filter(self.request.user))
             .select_related("project", "created_by")
             .prefetch_related(Prefetch("columns", queryset=optimized_columns))
-            .distinct()
         )
 
     def get_serializer_class(self):
@@ -207,6 +212,68 @@ class BoardViewSet(viewsets.ModelViewSet):
             },
         )
 
+    def perform_update(self, serializer):
+        board = serializer.save()
+        BoardEventStream(board.id).publish(
+            "board.updated", {"board": serializer.data}, self.request.user
+        )
+
+    @extend_schema(
+        tags=["Boards"],
+        operation_id="boards_snapshot",
+        summary="Get Board Snapshot",
+        description=(
+            "Get all columns of the board with their issues in one response. "
+            "The weak ETag is the board's event sequence number: send it in "
+            "If-None-Match to get 304 while the board is unchanged, and apply "
+            "WebSocket messages with a higher seq on top of the snapshot."
+        ),
+    )
+    @action(detail=True, methods=["get"], url_path="snapshot")
+    def snapshot(self, request, pk=None):
+        # Access is checked first; unchanged boards then skip loading the
+        # columns and issues
+        board = self.get_object()
+        seq = BoardEventStream(board.id).current_seq()
+        etag = f'W/"{seq}"'
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and etag.removeprefix("W/") in {
+            tag.removeprefix("W/") for tag in parse_etags(if_none_match)
+        }:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        columns = list(
+            BoardColumn.objects.filter(board=board)
+            .order_by("order")
+            .values("id", "name", "order", "workflow_status_id", "min_wip", "max_wip")
+        )
+        issues_by_status = {column["workflow_status_id"]: [] for column in columns}
+        issues = (
+            Issue.objects.filter(
+                project_id=board.project_id,
+                is_active=True,
+                status_id__in=issues_by_status,
+            )
+            .order_by("order", "-created_at")
+            .values(*BOARD_ISSUE_FIELDS)
+        )
+        for issue in issues:
+            issues_by_status[issue["status_id"]].append(issue)
+
+        for column in columns:
+            column["issues"] = issues_by_status[column["workflow_status_id"]]
+            column["issue_count"] = len(column["issues"])
+
+        data = {
+            "id": board.id,
+            "name": board.name,
+            "board_type": board.board_type,
+            "project_id": board.project_id,
+            "seq": seq,
+            "columns": columns,
+        }
+        return Response(data, status=status.HTTP_200_OK, headers={"ETag": etag})
+
     @extend_schema(
         tags=["Boards"],
         operation_id="boards_add_column",
@@ -366,10 +433,7 @@ class BoardViewSet(viewsets.ModelViewSet):
 
         response_serializer = IssueDetailSerializer(issue)
 
-        BoardWebSocketNotifier.send_issue_created(
-            board_id=board.id, issue_data=response_serializer.data, user=request.user
-        )
-
+        # Board broadcast runs after commit from the issue's outbox event
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
     @extend_schema(
@@ -421,19 +485,17 @@ class BoardViewSet(viewsets.ModelViewSet):
                 {"error": "Column not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        if column.max_wip:
+        max_wip = WorkflowGraph.for_project(board.project_id).wip_limit(
+            board.id, column.workflow_status_id
+        )
+        if max_wip and issue.status_id != column.workflow_status_id:
             current_count = Issue.objects.filter(
                 project=board.project, status=column.workflow_status, is_active=True
             ).count()
 
-            if (
-                current_count >= column.max_wip
-                and issue.status != column.workflow_status
-            ):
+            if current_count >= max_wip:
                 return Response(
-                    {
-                        "error": f"Column has reached maximum WIP limit of {column.max_wip}"  # noqa: E501
-                    },
+                    {"error": f"Column has reached maximum WIP limit of {max_wip}"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
@@ -445,7 +507,7 @@ class BoardViewSet(viewsets.ModelViewSet):
 
             issue.resolved_at = datetime.now()
 
-        # Save only - signal will trigger reindexing
+        # Save only - the outbox event triggers reindexing and broadcasts
         issue.save(update_fields=["status", "resolved_at", "updated_at"])
 
         LoggerService.log_info(
@@ -467,12 +529,83 @@ class BoardViewSet(viewsets.ModelViewSet):
         # Issue already has all relations loaded via select_related/prefetch_related
         serializer = IssueDetailSerializer(issue)
 
-        BoardWebSocketNotifier.send_issue_moved(
-            board_id=board.id,
-            issue_data=serializer.data,
-            old_status_id=old_status.id,
-            new_status_id=column.workflow_status.id,
+        # Board broadcast runs after commit from the issue's outbox event
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["Boards"],
+        operation_id="boards_bulk_move_issues",
+        summary="Move Multiple Issues in Board",
+        description="Move several issues to one column in a single request. The column's WIP limit is checked for the whole batch, and clients receive one issues.bulk_updated message.",  # noqa: E501
+        request=IssueBulkMoveSerializer,
+    )
+    @action(detail=True, methods=["post"], url_path="issues/bulk-move")
+    def bulk_move_issues(self, request, pk=None):
+        board = self.get_object()
+        serializer = IssueBulkMoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        issue_ids = serializer.validated_data["issue_ids"]
+
+        try:
+            column = BoardColumn.objects.select_related("workflow_status").get(
+                id=serializer.validated_data["column_id"], board=board
+            )
+        except BoardColumn.DoesNotExist:
+            return Response(
+                {"error": "Column not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        issues = list(
+            Issue.objects.filter(
+                project=board.project, id__in=issue_ids
+            ).select_related("project__workspace", "status", "sprint")
+        )
+        found = {str(issue.id) for issue in issues}
+        missing = {
+            str(issue_id): "Issue not found"
+            for issue_id in issue_ids
+            if str(issue_id) not in found
+        }
+        if missing:
+            return Response(
+                {"error": "Some issues were not found", "issues": missing},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            updated = BulkIssueService(issues, request.user, request).move_to_column(
+                column
+            )
+        except BulkIssueError as e:
+            return Response(
+                {"error": e.message, "issues": e.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        LoggerService.log_info(
+            action="issues_bulk_moved_in_board",
             user=request.user,
+            ip_address=request.META.get("REMOTE_ADDR"),
+            details={
+                "board_id": str(board.id),
+                "column_id": str(column.id),
+                "new_status": column.workflow_status.name,
+                "issue_count": len(issues),
+                "updated_count": len(updated),
+            },
         )
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(
+            {
+                "updated": len(updated),
+                "issues": [
+                    {
+                        "id": str(issue.id),
+                        "key": issue.key,
+                        "status_id": str(issue.status_id),
+                    }
+                    for issue in issues
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
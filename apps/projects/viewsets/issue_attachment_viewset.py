@@ -1,3 +1,5 @@
+from django.shortcuts import get_object_or_404
+
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
@@ -6,7 +8,13 @@ from rest_framework.response import Response
 from apps.logging.services import LoggerService
 from apps.projects.models import Issue, IssueAttachment
 from apps.projects.permissions import CanAccessProject, IsProjectTeamMember
-from apps.projects.serializers import IssueAttachmentSerializer
+from apps.projects.serializers import (
+    AttachmentUploadCompleteSerializer,
+    AttachmentUploadStartSerializer,
+    IssueAttachmentSerializer,
+)
+from apps.projects.services import AttachmentUploadError, AttachmentUploadService
+from apps.projects.services.attachment_upload_service import schedule_thumbnail
 
 
 @extend_schema_view(
@@ -46,8 +54,20 @@ class IssueAttachmentViewSet(viewsets.ModelViewSet):
             "uploaded_by", "issue"
         )
 
+    def get_serializer_class(self):
+        if self.action == "start_upload":
+            return AttachmentUploadStartSerializer
+        elif self.action == "complete_upload":
+            return AttachmentUploadCompleteSerializer
+        return IssueAttachmentSerializer
+
     def get_permissions(self):
-        if self.action == "create":
+        if self.action in (
+            "create",
+            "start_upload",
+            "complete_upload",
+            "abort_upload",
+        ):
             return [IsAuthenticated(), IsProjectTeamMember()]
         elif self.action == "destroy":
             return [IsAuthenticated()]
@@ -63,20 +83,104 @@ class IssueAttachmentViewSet(viewsets.ModelViewSet):
             )
 
         attachment = serializer.save(issue=issue)
+        schedule_thumbnail(attachment)
+        self._log_uploaded(attachment)
 
+    def _log_uploaded(self, attachment):
         LoggerService.log_info(
             action="attachment_uploaded",
             user=self.request.user,
             ip_address=self.request.META.get("REMOTE_ADDR"),
             details={
                 "attachment_id": str(attachment.id),
-                "issue_id": str(issue.id),
-                "issue_key": issue.full_key,
+                "issue_id": str(attachment.issue.id),
+                "issue_key": attachment.issue.full_key,
                 "filename": attachment.filename,
                 "file_size": attachment.file_size,
             },
         )
 
+    def _get_issue(self):
+        issue = get_object_or_404(Issue, id=self.kwargs.get("issue_pk"))
+        self.check_object_permissions(self.request, issue)
+        return issue
+
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issue_attachments_upload_start",
+        summary="Start Direct Attachment Upload",
+        description=(
+            "Get presigned requests to upload a file straight to storage. Small "
+            "files get one POST URL and form fields, limited to the declared "
+            "size; larger ones a multipart upload with one PUT URL per part. "
+            "Finish with the complete endpoint."
+        ),
+    )
+    def start_upload(self, request, issue_pk=None):
+        issue = self._get_issue()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            upload = AttachmentUploadService().start(
+                issue,
+                request.user,
+                filename=serializer.validated_data["filename"],
+                content_type=serializer.validated_data["content_type"],
+                size=serializer.validated_data["file_size"],
+            )
+        except AttachmentUploadError as e:
+            return Response({"error": e.message}, status=e.status_code)
+        return Response(upload, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issue_attachments_upload_complete",
+        summary="Complete Direct Attachment Upload",
+        description=(
+            "Register an uploaded file as an attachment. Multipart uploads must "
+            "list the part numbers and ETags returned by storage."
+        ),
+        responses={201: IssueAttachmentSerializer},
+    )
+    def complete_upload(self, request, issue_pk=None, upload_id=None):
+        issue = self._get_issue()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            attachment = AttachmentUploadService().complete(
+                upload_id,
+                issue,
+                request.user,
+                parts=serializer.validated_data.get("parts"),
+            )
+        except AttachmentUploadError as e:
+            return Response({"error": e.message}, status=e.status_code)
+
+        self._log_uploaded(attachment)
+        return Response(
+            IssueAttachmentSerializer(
+                attachment, context=self.get_serializer_context()
+            ).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issue_attachments_upload_abort",
+        summary="Abort Direct Attachment Upload",
+        description="Cancel an upload and delete the data uploaded so far",
+        responses={204: None},
+    )
+    def abort_upload(self, request, issue_pk=None, upload_id=None):
+        issue = self._get_issue()
+        try:
+            AttachmentUploadService().abort(upload_id, issue, request.user)
+        except AttachmentUploadError as e:
+            return Response({"error": e.message}, status=e.status_code)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     def perform_destroy(self, instance):
         from apps.projects.models import ProjectTeamMember
 
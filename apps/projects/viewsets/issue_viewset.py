@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from django.db import transaction
 from django.utils import timezone
 
@@ -17,12 +19,23 @@ from apps.projects.permissions import (
     IsProjectTeamMember,
 )
 from apps.projects.serializers import (
+    IssueBulkAssignSerializer,
+    IssueBulkSprintSerializer,
+    IssueBulkTransitionSerializer,
     IssueCreateSerializer,
     IssueDetailSerializer,
     IssueListSerializer,
     IssueTransitionSerializer,
     IssueUpdateSerializer,
 )
+from apps.projects.services import BulkIssueError, BulkIssueService, IssueKeyGenerator
+from apps.projects.services.search_service import (
+    SUGGEST_DEFAULT_LIMIT,
+    SUGGEST_MAX_LIMIT,
+    SearchService,
+)
+from apps.projects.utils.access import project_access_filter
+from base.pagination import CursorOptInPagination
 
 
 class IssueFilter(filters.FilterSet):
@@ -137,50 +150,22 @@ class IssueFilter(filters.FilterSet):
         ]
 
     def filter_search(self, queryset, name, value):
-        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-        from django.db import models as django_models
-
-        try:
-            search_vector = (
-                SearchVector("title", weight="A")
-                + SearchVector("description", weight="B")
-                + SearchVector("key", weight="A")
-            )
-            search_query = SearchQuery(value)
-
-            return (
-                queryset.annotate(
-                    search=search_vector, rank=SearchRank(search_vector, search_query)
-                )
-                .filter(search=search_query)
-                .order_by("-rank")
-            )
-        except Exception:
-            return queryset.filter(
-                django_models.Q(title__icontains=value)
-                | django_models.Q(description__icontains=value)
-                | django_models.Q(key__icontains=value)
-            )
+        return SearchService.search_issues(queryset, value)
 
     def filter_has_attachments(self, queryset, name, value):
         if value:
-            return queryset.filter(attachments__isnull=False).distinct()
-        return queryset.filter(attachments__isnull=True)
+            return queryset.filter(attachment_count__gt=0)
+        return queryset.filter(attachment_count=0)
 
     def filter_has_comments(self, queryset, name, value):
         if value:
-            return queryset.filter(comments__isnull=False).distinct()
-        return queryset.filter(comments__isnull=True)
+            return queryset.filter(comment_count__gt=0)
+        return queryset.filter(comment_count=0)
 
     def filter_has_links(self, queryset, name, value):
-        from django.db import models as django_models
-
         if value:
-            return queryset.filter(
-                django_models.Q(source_links__isnull=False)
-                | django_models.Q(target_links__isnull=False)
-            ).distinct()
-        return queryset.filter(source_links__isnull=True, target_links__isnull=True)
+            return queryset.filter(link_count__gt=0)
+        return queryset.filter(link_count=0)
 
     def filter_board(self, queryset, name, value):
         from apps.projects.models import Board
@@ -274,39 +259,22 @@ class IssueViewSet(viewsets.ModelViewSet):
     filterset_class = IssueFilter
     ordering_fields = ["priority", "created_at", "updated_at", "order"]
     ordering = ["-created_at"]
+    pagination_class = CursorOptInPagination
 
     def get_queryset(self):
-        from django.db.models import Count, Q
-
-        return (
-            Issue.objects.filter(
-                Q(
-                    project__workspace__members__user=self.request.user,
-                    project__workspace__members__is_active=True,
-                )
-                | Q(
-                    project__team_members__user=self.request.user,
-                    project__team_members__is_active=True,
-                )
-            )
-            .select_related(
-                "project",
-                "project__workspace",
-                "issue_type",
-                "status",
-                "assignee",
-                "reporter",
-                "sprint",
-                "parent_issue",
-            )
-            .annotate(
-                # Pre-calculate counts to avoid N queries
-                _comment_count=Count("comments", distinct=True),
-                _attachment_count=Count("attachments", distinct=True),
-                _source_link_count=Count("source_links", distinct=True),
-                _target_link_count=Count("target_links", distinct=True),
-            )
-            .distinct()
+        # Access scope filter and stored counters: one row per issue, so no
+        # DISTINCT or aggregate over joined comments/attachments/links
+        return Issue.objects.filter(
+            project_access_filter(self.request.user)
+        ).select_related(
+            "project",
+            "project__workspace",
+            "issue_type",
+            "status",
+            "assignee",
+            "reporter",
+            "sprint",
+            "parent_issue",
         )
 
     def get_serializer_class(self):
@@ -318,6 +286,12 @@ class IssueViewSet(viewsets.ModelViewSet):
             return IssueDetailSerializer
         elif self.action == "transition":
             return IssueTransitionSerializer
+        elif self.action == "bulk_transition":
+            return IssueBulkTransitionSerializer
+        elif self.action == "bulk_assign":
+            return IssueBulkAssignSerializer
+        elif self.action == "bulk_sprint":
+            return IssueBulkSprintSerializer
         return IssueListSerializer
 
     def get_permissions(self):
@@ -331,7 +305,6 @@ class IssueViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), CanAccessProject()]
         return [IsAuthenticated()]
 
-    @transaction.atomic
     def create(self, request, *args, **kwargs):
         """
         Create a new issue and return full details including story_points.
@@ -339,7 +312,12 @@ class IssueViewSet(viewsets.ModelViewSet):
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        issue = serializer.save()
+        # The key is allocated (and committed) before the create transaction,
+        # so the project's key counter row is not locked while the issue, its
+        # signals and outbox events are written
+        key = IssueKeyGenerator.generate_key(serializer.validated_data["project"])
+        with transaction.atomic():
+            issue = serializer.save(key=key)
 
         LoggerService.log_info(
             action="issue_created",
@@ -401,6 +379,39 @@ class IssueViewSet(viewsets.ModelViewSet):
         kwargs["partial"] = True
         return self.update(request, *args, **kwargs)
 
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issues_suggest",
+        summary="Suggest Issues",
+        description=(
+            "Search-as-you-type: issues whose key starts with or whose title "
+            "contains `q`, key matches first. Optional `project` (UUID) and "
+            f"`limit` (max {SUGGEST_MAX_LIMIT})."
+        ),
+    )
+    @action(detail=False, methods=["get"], url_path="suggest")
+    def suggest(self, request):
+        search_term = request.query_params.get("q", "")
+        project_id = request.query_params.get("project")
+        try:
+            limit = int(request.query_params.get("limit", SUGGEST_DEFAULT_LIMIT))
+            if project_id:
+                project_id = UUID(project_id)
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer and project a UUID"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = Issue.objects.filter(
+            project_access_filter(request.user), is_active=True
+        )
+        if project_id:
+            queryset = queryset.filter(project_id=project_id)
+
+        results = SearchService.suggest_issues(queryset, search_term, limit)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
     @extend_schema(
         tags=["Issues"],
         operation_id="issues_assign",
@@ -593,3 +604,98 @@ class IssueViewSet(viewsets.ModelViewSet):
         # Return with detailed serializer (expanded relations)
         serializer = IssueDetailSerializer(issue, context=self.get_serializer_context())
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def _bulk_update(self, request, operation, action_name):
+        """
+        Validate a bulk request, load its issues and apply operation(service).
+
+        Nothing is saved unless every issue exists, is accessible and passes
+        validation; otherwise the response lists the rejected issues.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        issue_ids = serializer.validated_data["issue_ids"]
+
+        issues = list(self.get_queryset().filter(id__in=issue_ids))
+        found = {issue.id for issue in issues}
+        missing = {str(issue_id): "Issue not found" for issue_id in issue_ids}
+        for issue_id in found:
+            missing.pop(str(issue_id), None)
+        if missing:
+            return Response(
+                {"error": "Some issues were not found", "issues": missing},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            service = BulkIssueService(issues, request.user, request)
+            updated = operation(service, serializer.validated_data)
+        except BulkIssueError as e:
+            return Response(
+                {"error": e.message, "issues": e.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        LoggerService.log_info(
+            action=action_name,
+            user=request.user,
+            ip_address=request.META.get("REMOTE_ADDR"),
+            details={
+                "project_id": str(service.project.id),
+                "issue_count": len(issues),
+                "updated_count": len(updated),
+            },
+        )
+
+        results = IssueListSerializer(
+            issues, many=True, context=self.get_serializer_context()
+        )
+        return Response(
+            {"updated": len(updated), "results": results.data},
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issues_bulk_transition",
+        summary="Change Status of Multiple Issues",
+        description="Transition up to BULK_ISSUE_MAX_SIZE issues of one project to a workflow status. Every transition is validated against the project workflow first; if any is not allowed, no issue is changed.",  # noqa: E501
+        request=IssueBulkTransitionSerializer,
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-transition")
+    def bulk_transition(self, request):
+        return self._bulk_update(
+            request,
+            lambda service, data: service.transition(data["status"]),
+            "issues_bulk_status_changed",
+        )
+
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issues_bulk_assign",
+        summary="Assign Multiple Issues",
+        description="Assign issues of one project to a project team member, or unassign them with a null assignee.",  # noqa: E501
+        request=IssueBulkAssignSerializer,
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-assign")
+    def bulk_assign(self, request):
+        return self._bulk_update(
+            request,
+            lambda service, data: service.assign(data["assignee"]),
+            "issues_bulk_assigned",
+        )
+
+    @extend_schema(
+        tags=["Issues"],
+        operation_id="issues_bulk_sprint",
+        summary="Move Multiple Issues to a Sprint",
+        description="Add issues of one project to a sprint, or move them to the backlog with a null sprint. Completed sprints cannot gain or lose issues.",  # noqa: E501
+        request=IssueBulkSprintSerializer,
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-sprint")
+    def bulk_sprint(self, request):
+        return self._bulk_update(
+            request,
+            lambda service, data: service.set_sprint(data["sprint"]),
+            "issues_bulk_sprint_changed",
+        )
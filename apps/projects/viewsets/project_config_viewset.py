@@ -11,6 +11,7 @@ from rest_framework.response import Response
 from apps.projects.models import ProjectConfiguration
 from apps.projects.permissions import CanModifyProjectConfiguration
 from apps.projects.serializers import ProjectConfigSerializer
+from apps.projects.utils.access import workspace_access_filter
 
 logger = logging.getLogger(__name__)
 
@@ -62,9 +63,8 @@ class ProjectConfigViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter configurations by user's accessible projects."""
         return ProjectConfiguration.objects.filter(
-            project__workspace__members__user=self.request.user,
-            project__workspace__members__is_active=True,
-        ).distinct()
+            workspace_access_filter(self.request.user, "project__workspace")
+        )
 
     def create(self, request, *args, **kwargs):
         """
@@ -19,6 +19,7 @@ from apps.projects.permissions import (
     IsProjectLeadOrAdmin,
 )
 from apps.projects.serializers import ProjectSerializer
+from apps.projects.utils.access import workspace_access_filter
 from base.utils.file_handlers import upload_project_file_to_s3
 
 logger = logging.getLogger(__name__)
@@ -103,16 +104,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
         Returns only projects where user is a workspace member.
         """
         # Base queryset: user must be a member of the workspace
-        queryset = (
-            Project.objects.filter(
-                workspace__members__user=self.request.user,
-                workspace__members__is_active=True,
-            )
-            .select_related(
-                "workspace", "workspace__organization", "lead", "created_by"
-            )
-            .distinct()
-        )
+        queryset = Project.objects.filter(
+            workspace_access_filter(self.request.user)
+        ).select_related("workspace", "workspace__organization", "lead", "created_by")
 
         if self.action == "list":
             week_ago = timezone.now() - timedelta(days=7)
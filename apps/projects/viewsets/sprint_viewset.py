@@ -18,6 +18,7 @@ from apps.projects.serializers import (
     SprintListSerializer,
     SprintUpdateSerializer,
 )
+from apps.projects.utils.access import project_access_filter
 
 
 class SprintFilter(filters.FilterSet):
@@ -72,16 +73,7 @@ class SprintViewSet(viewsets.ModelViewSet):
         from django.db.models import Count, Q
 
         return (
-            Sprint.objects.filter(
-                Q(
-                    project__workspace__members__user=self.request.user,
-                    project__workspace__members__is_active=True,
-                )
-                | Q(
-                    project__team_members__user=self.request.user,
-                    project__team_members__is_active=True,
-                )
-            )
+            Sprint.objects.filter(project_access_filter(self.request.user))
             .select_related("project", "project__workspace", "created_by")
             .annotate(
                 # Pre-calculate counts to avoid N queries
@@ -94,7 +86,6 @@ class SprintViewSet(viewsets.ModelViewSet):
                     distinct=True,
                 ),
             )
-            .distinct()
         )
 
     def get_serializer_class(self):
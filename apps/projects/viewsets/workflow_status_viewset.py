@@ -1,5 +1,3 @@
-from django.db.models import Q
-
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
@@ -10,6 +8,7 @@ from apps.projects.serializers.workflow_status_serializer import (
     WorkflowStatusListSerializer,
     WorkflowStatusSerializer,
 )
+from apps.projects.utils.access import project_access_filter
 
 
 @extend_schema_view(
@@ -63,14 +62,6 @@ class WorkflowStatusViewSet(viewsets.ReadOnlyModelViewSet):
 
         # User can see workflow statuses from projects they have access to
         # Through project membership OR workspace membership
-
-        accessible_projects = Q(
-            project__team_members__user=user, project__team_members__is_active=True
-        ) | Q(
-            project__workspace__members__user=user,
-            project__workspace__members__is_active=True,
-        )
-
-        queryset = queryset.filter(accessible_projects).distinct()
+        queryset = queryset.filter(project_access_filter(user))
 
         return queryset.order_by("project", "order", "name")
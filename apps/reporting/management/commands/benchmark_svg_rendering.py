@@ -0,0 +1,106 @@
+"""
+Management command to micro-benchmark SVG diagram rendering.
+
+Times the workflow and roadmap generators against an existing project, and
+the text measurement helpers with a cold and a warm cache.
+
+Usage:
+    python manage.py benchmark_svg_rendering --project=UUID
+    python manage.py benchmark_svg_rendering --project=UUID --iterations 50
+    python manage.py benchmark_svg_rendering            # text metrics only
+"""
+
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.reporting.services.diagram_generators import (
+    generate_roadmap_timeline_svg,
+    generate_workflow_diagram_svg,
+)
+from apps.reporting.services.diagram_utils import estimate_text_width
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark workflow/roadmap SVG generation and text metrics"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=str,
+            help="Project UUID to render the workflow and roadmap diagrams for",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Renders per generator (default: 20)",
+        )
+        parser.add_argument(
+            "--labels",
+            type=int,
+            default=2000,
+            help="Distinct labels for the text metrics benchmark (default: 2000)",
+        )
+
+    def handle(self, *args, **options):
+        self._benchmark_text_metrics(options["labels"])
+
+        if options.get("project"):
+            from apps.projects.models import Project
+
+            try:
+                project = Project.objects.get(id=options["project"])
+            except (Project.DoesNotExist, ValueError):
+                raise CommandError(f"Project {options['project']} not found")
+
+            iterations = options["iterations"]
+            for name, generator in (
+                ("workflow", generate_workflow_diagram_svg),
+                ("roadmap", generate_roadmap_timeline_svg),
+            ):
+                self._benchmark_generator(name, generator, project, iterations)
+
+        self.stdout.write(self.style.SUCCESS("Benchmark complete"))
+
+    def _benchmark_text_metrics(self, label_count):
+        rng = random.Random(7)
+        alphabet = string.ascii_letters + string.digits + " -_"
+        labels = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 30)))
+            for _ in range(label_count)
+        ]
+
+        estimate_text_width.cache_clear()
+        start = time.perf_counter()
+        for label in labels:
+            estimate_text_width(label, 12)
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for label in labels:
+            estimate_text_width(label, 12)
+        warm_ms = (time.perf_counter() - start) * 1000
+
+        self.stdout.write(
+            f"estimate_text_width x{label_count}: "
+            f"cold {cold_ms:.2f}ms, warm {warm_ms:.2f}ms"
+        )
+
+    def _benchmark_generator(self, name, generator, project, iterations):
+        timings = []
+        size = 0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            svg = generator(project)
+            timings.append((time.perf_counter() - start) * 1000)
+            size = len(svg)
+
+        timings.sort()
+        self.stdout.write(
+            f"{name:>8}: min {timings[0]:.2f}ms, "
+            f"median {timings[len(timings) // 2]:.2f}ms, "
+            f"max {timings[-1]:.2f}ms, {size / 1024:.1f} KiB"
+        )
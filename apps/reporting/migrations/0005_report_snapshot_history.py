@@ -0,0 +1,44 @@
+# Generated by Django 5.0.7 on 2026-10-18 21:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0004_make_slack_webhook_optional"),
+        (
+            "reporting",
+            "0004_rename_activity_lo_organiz_idx_activity_lo_organiz_0b4cc8_idx_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reportsnapshot",
+            name="chain_position",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="reportsnapshot",
+            name="is_keyframe",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name="reportsnapshot",
+            name="source",
+            field=models.CharField(
+                choices=[("on_demand", "On Demand"), ("scheduled", "Scheduled")],
+                default="on_demand",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reportsnapshot",
+            index=models.Index(
+                fields=["project", "report_type", "source", "generated_at"],
+                name="report_snap_project_7d60fd_idx",
+            ),
+        ),
+    ]
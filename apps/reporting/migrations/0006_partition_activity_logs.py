@@ -0,0 +1,27 @@
+# Generated by Django 5.0.7 on 2026-10-18 23:10
+
+from django.db import migrations
+
+from apps.logging.partitions import convert_to_partitioned, convert_to_regular
+
+
+def partition_activity_logs(apps, schema_editor):
+    # No-op outside Postgres (see apps.logging.partitions)
+    convert_to_partitioned(schema_editor, "activity_logs")
+
+
+def unpartition_activity_logs(apps, schema_editor):
+    convert_to_regular(schema_editor, "activity_logs")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("logging", "0003_partition_log_tables"),
+        ("reporting", "0005_report_snapshot_history"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            partition_activity_logs, reverse_code=unpartition_activity_logs
+        ),
+    ]
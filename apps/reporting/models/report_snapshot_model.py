@@ -18,6 +18,11 @@ class ReportSnapshot(models.Model):
         ("custom", "Custom Report"),
     ]
 
+    SOURCE_CHOICES = [
+        ("on_demand", "On Demand"),
+        ("scheduled", "Scheduled"),
+    ]
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     project = models.ForeignKey(
         "projects.Project", on_delete=models.CASCADE, related_name="report_snapshots"
@@ -30,7 +35,14 @@ class ReportSnapshot(models.Model):
         related_name="report_snapshots",
     )
     report_type = models.CharField(max_length=20, choices=REPORT_TYPE_CHOICES)
+    # Full report for keyframes, delta against the previous snapshot otherwise
     report_data = models.JSONField()
+    source = models.CharField(
+        max_length=20, choices=SOURCE_CHOICES, default="on_demand"
+    )
+    is_keyframe = models.BooleanField(default=True)
+    # Number of deltas since the last keyframe of the same series
+    chain_position = models.PositiveIntegerField(default=0)
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
     generated_by = models.ForeignKey(
@@ -52,6 +64,7 @@ class ReportSnapshot(models.Model):
             models.Index(fields=["project", "report_type"]),
             models.Index(fields=["sprint"]),
             models.Index(fields=["generated_at"]),
+            models.Index(fields=["project", "report_type", "source", "generated_at"]),
         ]
 
     def __str__(self):
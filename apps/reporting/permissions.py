@@ -1,5 +1,17 @@
 from rest_framework import permissions
 
+from base.utils.access_scope import AccessScope
+
+
+def _project_workspace_id(project_id):
+    from apps.projects.models import Project
+
+    return (
+        Project.objects.filter(id=project_id)
+        .values_list("workspace_id", flat=True)
+        .first()
+    )
+
 
 class CanGenerateReports(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -16,34 +28,20 @@ class CanGenerateReports(permissions.BasePermission):
         if not project_id:
             return True
 
-        from apps.projects.models import ProjectTeamMember
-        from apps.workspaces.models import WorkspaceMember
+        scope = AccessScope.for_user(request.user)
 
         # Check if user is project member
-        is_project_member = ProjectTeamMember.objects.filter(
-            project_id=project_id, user=request.user, is_active=True
-        ).exists()
-
-        if is_project_member:
+        if scope.is_project_member(project_id):
             return True
 
         # Check if user is workspace member (has access to all projects in workspace)
-        from apps.projects.models import Project
-
-        try:
-            project = Project.objects.select_related("workspace").get(id=project_id)
-            return WorkspaceMember.objects.filter(
-                workspace=project.workspace, user=request.user, is_active=True
-            ).exists()
-        except Project.DoesNotExist:
-            return False
+        workspace_id = _project_workspace_id(project_id)
+        return workspace_id is not None and scope.is_workspace_member(workspace_id)
 
     def has_object_permission(self, request, view, obj):
         if not request.user or not request.user.is_authenticated:
             return False
 
-        from apps.projects.models import ProjectTeamMember
-
         if hasattr(obj, "project"):
             project = obj.project
         elif hasattr(obj, "user"):
@@ -51,9 +49,7 @@ class CanGenerateReports(permissions.BasePermission):
         else:
             return False
 
-        return ProjectTeamMember.objects.filter(
-            project=project, user=request.user, is_active=True
-        ).exists()
+        return AccessScope.for_user(request.user).is_project_member(project.id)
 
 
 class CanExportData(permissions.BasePermission):
@@ -71,30 +67,14 @@ class CanExportData(permissions.BasePermission):
         if not project_id:
             return False
 
-        from apps.projects.models import ProjectTeamMember
-        from apps.workspaces.models import WorkspaceMember
+        scope = AccessScope.for_user(request.user)
 
         # Check if user is project admin/owner
-        is_project_admin = ProjectTeamMember.objects.filter(
-            project_id=project_id,
-            user=request.user,
-            role__in=["owner", "admin"],
-            is_active=True,
-        ).exists()
-
-        if is_project_admin:
+        if scope.project_role(project_id) in ("owner", "admin"):
             return True
 
         # Check if user is workspace admin
-        from apps.projects.models import Project
-
-        try:
-            project = Project.objects.select_related("workspace").get(id=project_id)
-            return WorkspaceMember.objects.filter(
-                workspace=project.workspace,
-                user=request.user,
-                role="admin",
-                is_active=True,
-            ).exists()
-        except Project.DoesNotExist:
-            return False
+        workspace_id = _project_workspace_id(project_id)
+        return (
+            workspace_id is not None and scope.workspace_role(workspace_id) == "admin"
+        )
@@ -6,6 +6,8 @@ class DiagramRequestSerializer(serializers.Serializer):
         ("workflow", "Workflow"),
         ("dependency", "Dependency"),
         ("roadmap", "Roadmap"),
+        ("velocity", "Velocity"),
+        ("burndown", "Burndown"),
         ("uml", "UML"),
         ("architecture", "Architecture"),
         ("angular_component_hierarchy", "Angular Component Hierarchy"),
@@ -102,6 +102,7 @@ class ExportRequestSerializer(serializers.Serializer):
 class ReportSnapshotSerializer(serializers.ModelSerializer):
     formatted_period = serializers.CharField(read_only=True)
     download_url = serializers.CharField(read_only=True)
+    report_data = serializers.SerializerMethodField()
 
     class Meta:
         model = ReportSnapshot
@@ -118,6 +119,19 @@ class ReportSnapshotSerializer(serializers.ModelSerializer):
             "parameters",
             "csv_file",
             "download_url",
+            "source",
+            "is_keyframe",
             "generated_at",
         ]
         read_only_fields = fields
+
+    def get_report_data(self, obj):
+        # Scheduled snapshots between keyframes only store a delta
+        if obj.is_keyframe:
+            return obj.report_data
+
+        from apps.reporting.services.report_snapshot_service import (
+            ReportSnapshotService,
+        )
+
+        return ReportSnapshotService().get_data(obj)
@@ -0,0 +1,237 @@
+"""
+Dependency analysis over IssueLink.
+
+Answers critical path, topological order, cycle and blocking-chain questions
+for a project from a single bulk load of its issues and links. The loaded
+rows are cached per project behind a version stamp that is bumped whenever
+an issue or link of the project changes.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .dependency_graph import (
+    KIND_RELATES,
+    DependencyGraph,
+    longest_weighted_path,
+    strongly_connected_components,
+    topological_order,
+    transitive_predecessors,
+)
+
+logger = logging.getLogger(__name__)
+
+WEIGHT_FIELDS = ("story_points", "estimated_hours")
+
+# Positions of the fields in the cached issue rows
+ISSUE_FIELDS = (
+    "id",
+    "key",
+    "title",
+    "story_points",
+    "estimated_hours",
+    "status__category",
+)
+
+
+@dataclass
+class ProjectDependencyGraph:
+    """Dependency graph of a project plus the issue rows it indexes."""
+
+    graph: DependencyGraph
+    issues: List[tuple]
+
+    def describe(self, node: int) -> Dict:
+        issue_id, key, title, story_points, estimated_hours, category = self.issues[
+            node
+        ]
+        return {
+            "id": str(issue_id),
+            "key": key,
+            "title": title,
+            "status_category": category,
+            "story_points": story_points,
+            "estimated_hours": (
+                float(estimated_hours) if estimated_hours is not None else None
+            ),
+        }
+
+    def is_done(self, node: int) -> bool:
+        return self.issues[node][5] == "done"
+
+    def weights(self, weight_field: str, include_done: bool) -> List[float]:
+        column = ISSUE_FIELDS.index(weight_field)
+        return [
+            0.0 if not include_done and self.is_done(node) else float(row[column] or 0)
+            for node, row in enumerate(self.issues)
+        ]
+
+
+class DependencyAnalysisService:
+    """
+    Graph analytics for blocks / depends-on relationships between issues.
+
+    Edges point from the prerequisite issue to the issue waiting on it;
+    relates_to and duplicate links are ignored.
+    """
+
+    VERSION_KEY = "dependency_graph_version:{project_id}"
+    GRAPH_KEY = "dependency_graph:{project_id}:{version}"
+
+    def __init__(self):
+        self.cache_ttl = getattr(settings, "DEPENDENCY_GRAPH_CACHE_TTL_SECONDS", 3600)
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def invalidate(cls, project_id):
+        """
+        Bump the project's graph version once the transaction commits.
+
+        Bumping earlier would let a read between the bump and the commit cache
+        the old rows under the new version.
+        """
+        version_key = cls.VERSION_KEY.format(project_id=project_id)
+
+        def bump():
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                cache.set(version_key, 1, timeout=None)
+            except Exception as e:
+                logger.warning(f"[DEPENDENCY] Could not invalidate graph cache: {e}")
+
+        transaction.on_commit(bump)
+
+    def get_graph(self, project) -> ProjectDependencyGraph:
+        """Return the project's dependency graph, loading it on a cache miss."""
+        try:
+            version = cache.get_or_set(
+                self.VERSION_KEY.format(project_id=project.id), 1, timeout=None
+            )
+            graph_key = self.GRAPH_KEY.format(project_id=project.id, version=version)
+            rows = cache.get(graph_key)
+        except Exception as e:
+            logger.warning(f"[DEPENDENCY] Cache unavailable, loading graph: {e}")
+            graph_key, rows = None, None
+
+        if rows is None:
+            rows = self._load_rows(project)
+            if graph_key:
+                try:
+                    cache.set(graph_key, rows, timeout=self.cache_ttl)
+                except Exception as e:
+                    logger.warning(f"[DEPENDENCY] Could not cache graph: {e}")
+
+        issues, links = rows
+        graph = DependencyGraph.from_links([issue[0] for issue in issues], links)
+        return ProjectDependencyGraph(graph=graph, issues=issues)
+
+    # ------------------------------------------------------------------
+    # Analyses
+    # ------------------------------------------------------------------
+
+    def analyze(
+        self,
+        project,
+        weight_field: str = "story_points",
+        include_done: bool = False,
+    ) -> Dict:
+        """
+        Critical path, cycles and topological order of a project.
+
+        Args:
+            project: Project instance
+            weight_field: 'story_points' or 'estimated_hours'
+            include_done: Count the weight of finished issues on the path
+
+        Raises:
+            ValueError: If weight_field is not supported
+        """
+        if weight_field not in WEIGHT_FIELDS:
+            raise ValueError(f"weight must be one of: {', '.join(WEIGHT_FIELDS)}")
+
+        project_graph = self.get_graph(project)
+        graph = project_graph.graph
+        order, _ = topological_order(graph)
+        cycles = strongly_connected_components(graph)
+
+        weights = project_graph.weights(weight_field, include_done)
+        path, total = longest_weighted_path(graph, order, weights)
+        critical_path = []
+        for node in path:
+            issue = project_graph.describe(node)
+            issue["weight"] = weights[node]
+            critical_path.append(issue)
+
+        return {
+            "project_id": str(project.id),
+            "issue_count": graph.node_count,
+            "dependency_count": sum(1 for kind in graph.kinds if kind != KIND_RELATES),
+            "has_cycles": bool(cycles),
+            "cycles": [
+                [project_graph.describe(node)["key"] for node in cycle]
+                for cycle in cycles
+            ],
+            "critical_path": {
+                "weight_field": weight_field,
+                "include_done": include_done,
+                "total_weight": total,
+                "length": len(critical_path),
+                "issues": critical_path,
+            },
+            "topological_order": [
+                project_graph.describe(node)["key"] for node in order
+            ],
+        }
+
+    def get_blocking_chain(self, issue) -> Dict:
+        """
+        Every issue the given issue transitively waits on.
+
+        Returns:
+            Dict with the issue, its blockers ordered by distance, and the
+            number of blockers that are not done yet
+        """
+        project_graph = self.get_graph(issue.project)
+        node = project_graph.graph.index.get(issue.id)
+
+        blockers = []
+        if node is not None:
+            depths = transitive_predecessors(project_graph.graph, node)
+            for blocker, depth in sorted(depths.items(), key=lambda item: item[1]):
+                entry = project_graph.describe(blocker)
+                entry["depth"] = depth
+                entry["is_resolved"] = project_graph.is_done(blocker)
+                blockers.append(entry)
+
+        return {
+            "issue": {"id": str(issue.id), "key": issue.key, "title": issue.title},
+            "blockers": blockers,
+            "blocker_count": len(blockers),
+            "direct_blocker_count": sum(1 for b in blockers if b["depth"] == 1),
+            "unresolved_count": sum(1 for b in blockers if not b["is_resolved"]),
+        }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _load_rows(self, project):
+        from apps.projects.models import Issue
+
+        from .dependency_graph import load_project_links
+
+        issues = list(
+            Issue.objects.filter(project=project, is_active=True)
+            .order_by("created_at")
+            .values_list(*ISSUE_FIELDS)
+        )
+        return issues, load_project_links(project)
@@ -0,0 +1,568 @@
+"""
+Dependency Graph Engine.
+
+Loads a project's issue links once into integer-indexed adjacency arrays and
+computes a layered (Sugiyama-style) layout:
+
+1. Cycle breaking + topological order (Kahn's algorithm with a min in-degree
+   heap, so cycles are broken at the node with the fewest pending blockers)
+2. Longest-path layer assignment
+3. Barycenter sweeps to reduce edge crossings
+4. Coordinate assignment, wrapping very wide layers onto several rows
+
+Graphs above a configurable size are collapsed into clusters (level of
+detail) before layout, so rendering time stays bounded for large projects.
+
+The same arrays back the dependency analytics (cycle detection, longest
+weighted path, transitive blockers) used by DependencyAnalysisService.
+"""
+
+import heapq
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from django.db.models import Q
+
+# Edge kinds stored in DependencyGraph.kinds
+KIND_BLOCKS = 0
+KIND_DEPENDS = 1
+KIND_RELATES = 2
+
+# link_type -> (kind, reversed). Ordering edges always point from the
+# prerequisite issue to the issue waiting on it.
+LINK_TYPE_KINDS = {
+    "blocks": (KIND_BLOCKS, False),
+    "blocked_by": (KIND_BLOCKS, True),
+    "dependency_of": (KIND_DEPENDS, False),
+    "depends_on": (KIND_DEPENDS, True),
+    "relates_to": (KIND_RELATES, False),
+    "duplicates": (KIND_RELATES, False),
+    "duplicated_by": (KIND_RELATES, True),
+}
+
+CROSSING_REDUCTION_SWEEPS = 4
+
+
+def build_issue_filter(project, filters: Optional[Dict] = None) -> Q:
+    """
+    Build the Issue filter shared by the dependency SVG and JSON endpoints.
+
+    Args:
+        project: Project instance
+        filters: Optional dict with keys sprint_id, status_ids, priorities,
+                 assignee_id, issue_type_ids, search
+
+    Returns:
+        Q object selecting the active, filtered issues of the project
+    """
+    filters = filters or {}
+    query = Q(project=project, is_active=True)
+
+    if filters.get("sprint_id"):
+        if filters["sprint_id"] == "backlog":
+            query &= Q(sprint__isnull=True)
+        else:
+            query &= Q(sprint_id=filters["sprint_id"])
+
+    if filters.get("status_ids"):
+        query &= Q(status_id__in=filters["status_ids"])
+
+    if filters.get("priorities"):
+        query &= Q(priority__in=filters["priorities"])
+
+    if filters.get("assignee_id"):
+        if filters["assignee_id"] == "unassigned":
+            query &= Q(assignee__isnull=True)
+        else:
+            query &= Q(assignee_id=filters["assignee_id"])
+
+    if filters.get("issue_type_ids"):
+        query &= Q(issue_type_id__in=filters["issue_type_ids"])
+
+    if filters.get("search"):
+        search = filters["search"]
+        query &= Q(title__icontains=search) | Q(key__icontains=search)
+
+    return query
+
+
+def load_project_links(project) -> List[Tuple]:
+    """
+    Load every link between active issues of a project in a single query.
+
+    Returns:
+        List of (source_issue_id, target_issue_id, link_type) tuples
+    """
+    from apps.projects.models import IssueLink
+
+    return list(
+        IssueLink.objects.filter(
+            source_issue__project=project,
+            source_issue__is_active=True,
+            target_issue__is_active=True,
+        ).values_list("source_issue_id", "target_issue_id", "link_type")
+    )
+
+
+class DependencyGraph:
+    """
+    Compact directed graph over integer node indexes.
+
+    Edges are stored as parallel arrays (sources, targets, kinds) and the
+    ordering edges (blocks / depends on) are additionally indexed in CSR form
+    for O(1) access to each node's successors and predecessors.
+    """
+
+    def __init__(self, node_count: int, edges: Iterable[Tuple[int, int, int]]):
+        self.node_count = node_count
+        self.sources = array("i")
+        self.targets = array("i")
+        self.kinds = array("b")
+
+        seen = set()
+        for source, target, kind in edges:
+            if source == target:
+                continue
+            if kind == KIND_RELATES and source > target:
+                source, target = target, source
+            edge_key = (source, target, kind)
+            if edge_key in seen:
+                continue
+            seen.add(edge_key)
+            self.sources.append(source)
+            self.targets.append(target)
+            self.kinds.append(kind)
+
+        self.out_offsets, self.out_targets = self._build_csr(self.sources, self.targets)
+        self.in_offsets, self.in_sources = self._build_csr(self.targets, self.sources)
+
+    @classmethod
+    def from_links(
+        cls, node_ids: Sequence[Hashable], links: Iterable[Tuple]
+    ) -> "DependencyGraph":
+        """
+        Build a graph from raw (source_id, target_id, link_type) tuples.
+
+        Links touching ids outside node_ids are ignored; reciprocal link pairs
+        (e.g. blocks / blocked_by) collapse into a single edge.
+        """
+        index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+        edges = []
+        for source_id, target_id, link_type in links:
+            source = index.get(source_id)
+            target = index.get(target_id)
+            if source is None or target is None:
+                continue
+            kind, reverse = LINK_TYPE_KINDS.get(link_type, (KIND_RELATES, False))
+            if reverse:
+                source, target = target, source
+            edges.append((source, target, kind))
+
+        graph = cls(len(node_ids), edges)
+        graph.node_ids = list(node_ids)
+        graph.index = index
+        return graph
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.sources)
+
+    def successors(self, node: int):
+        return self.out_targets[self.out_offsets[node] : self.out_offsets[node + 1]]
+
+    def predecessors(self, node: int):
+        return self.in_sources[self.in_offsets[node] : self.in_offsets[node + 1]]
+
+    def degrees(self) -> array:
+        """Number of edges of any kind touching each node."""
+        degrees = array("i", bytes(4 * self.node_count))
+        for source, target in zip(self.sources, self.targets):
+            degrees[source] += 1
+            degrees[target] += 1
+        return degrees
+
+    def contract(
+        self, cluster_of: Sequence[int], cluster_count: int
+    ) -> Tuple["DependencyGraph", Dict[Tuple[int, int, int], int]]:
+        """
+        Collapse nodes into clusters.
+
+        Returns:
+            Tuple of (cluster graph, {(source, target, kind): edge count})
+        """
+        weights: Dict[Tuple[int, int, int], int] = {}
+        for source, target, kind in zip(self.sources, self.targets, self.kinds):
+            cluster_source = cluster_of[source]
+            cluster_target = cluster_of[target]
+            if cluster_source == cluster_target:
+                continue
+            if kind == KIND_RELATES and cluster_source > cluster_target:
+                cluster_source, cluster_target = cluster_target, cluster_source
+            edge_key = (cluster_source, cluster_target, kind)
+            weights[edge_key] = weights.get(edge_key, 0) + 1
+
+        return DependencyGraph(cluster_count, weights.keys()), weights
+
+    def _build_csr(self, heads: array, tails: array) -> Tuple[array, array]:
+        """Index ordering edges by head node (compressed sparse row)."""
+        offsets = array("i", bytes(4 * (self.node_count + 1)))
+        for head, kind in zip(heads, self.kinds):
+            if kind != KIND_RELATES:
+                offsets[head + 1] += 1
+        for node in range(self.node_count):
+            offsets[node + 1] += offsets[node]
+
+        adjacency = array("i", bytes(4 * offsets[self.node_count]))
+        cursor = array("i", offsets[: self.node_count])
+        for head, tail, kind in zip(heads, tails, self.kinds):
+            if kind != KIND_RELATES:
+                adjacency[cursor[head]] = tail
+                cursor[head] += 1
+        return offsets, adjacency
+
+
+@dataclass
+class LayeredLayout:
+    """Node positions computed by layered_layout(), indexed like the graph."""
+
+    x: array
+    y: array
+    layers: array
+    layer_count: int
+    width: int
+    height: int
+    reversed_edges: int = 0
+    clustered: bool = False
+    rows: List[List[int]] = field(default_factory=list)
+
+
+def topological_order(graph: DependencyGraph) -> Tuple[List[int], int]:
+    """
+    Order nodes so that ordering edges point forward where possible.
+
+    When only cycles remain, the node with the fewest unresolved predecessors
+    is emitted next, which breaks the cycle at its weakest point.
+
+    Returns:
+        Tuple of (node order, number of edges left pointing backwards)
+    """
+    remaining = array("i", bytes(4 * graph.node_count))
+    for node in range(graph.node_count):
+        remaining[node] = graph.in_offsets[node + 1] - graph.in_offsets[node]
+
+    heap = [(remaining[node], node) for node in range(graph.node_count)]
+    heapq.heapify(heap)
+    placed = bytearray(graph.node_count)
+    order = []
+    reversed_edges = 0
+
+    while heap:
+        pending, node = heapq.heappop(heap)
+        if placed[node] or pending != remaining[node]:
+            continue
+        placed[node] = 1
+        order.append(node)
+        reversed_edges += pending
+        for successor in graph.successors(node):
+            if not placed[successor]:
+                remaining[successor] -= 1
+                heapq.heappush(heap, (remaining[successor], successor))
+
+    return order, reversed_edges
+
+
+def assign_layers(graph: DependencyGraph, order: List[int]) -> array:
+    """Longest-path layering along the given topological order."""
+    position = array("i", bytes(4 * graph.node_count))
+    for rank, node in enumerate(order):
+        position[node] = rank
+
+    layers = array("i", bytes(4 * graph.node_count))
+    for node in order:
+        layer = 0
+        for predecessor in graph.predecessors(node):
+            if position[predecessor] < position[node]:
+                layer = max(layer, layers[predecessor] + 1)
+        layers[node] = layer
+    return layers
+
+
+def reduce_crossings(
+    graph: DependencyGraph, layer_nodes: List[List[int]], sweeps: int
+) -> None:
+    """Reorder nodes inside each layer by the barycenter of their neighbours."""
+    slot = array("d", bytes(8 * graph.node_count))
+    for nodes in layer_nodes:
+        for rank, node in enumerate(nodes):
+            slot[node] = rank
+
+    def barycenter(node, neighbours):
+        if not neighbours:
+            return slot[node]
+        return sum(slot[neighbour] for neighbour in neighbours) / len(neighbours)
+
+    for sweep in range(sweeps):
+        downward = sweep % 2 == 0
+        layer_range = (
+            range(1, len(layer_nodes))
+            if downward
+            else range(len(layer_nodes) - 2, -1, -1)
+        )
+        for layer in layer_range:
+            nodes = layer_nodes[layer]
+            if downward:
+                keys = {
+                    node: barycenter(node, graph.predecessors(node)) for node in nodes
+                }
+            else:
+                keys = {
+                    node: barycenter(node, graph.successors(node)) for node in nodes
+                }
+            nodes.sort(key=keys.__getitem__)
+            for rank, node in enumerate(nodes):
+                slot[node] = rank
+
+
+def layered_layout(
+    graph: DependencyGraph,
+    node_width: int,
+    node_height: int,
+    spacing_x: int,
+    spacing_y: int,
+    max_row_width: int = 10,
+    origin: Tuple[int, int] = (0, 0),
+    layers: Optional[Sequence[int]] = None,
+) -> LayeredLayout:
+    """
+    Compute a top-to-bottom layered layout.
+
+    Prerequisite issues are placed above the issues waiting on them. Layers
+    wider than max_row_width wrap onto extra rows, and each row is centred
+    on the widest row, so nodes never overlap and no collision checks are
+    needed.
+
+    Args:
+        graph: DependencyGraph to lay out
+        node_width, node_height: Node box size in pixels
+        spacing_x: Horizontal distance between node origins
+        spacing_y: Vertical gap between rows
+        max_row_width: Maximum nodes per row
+        origin: Top-left (x, y) offset for the drawing area
+        layers: Optional precomputed layer per node
+
+    Returns:
+        LayeredLayout with per-node x/y/layer arrays and total size
+    """
+    reversed_edges = 0
+    if layers is None:
+        order, reversed_edges = topological_order(graph)
+        layers = assign_layers(graph, order)
+    else:
+        order = list(range(graph.node_count))
+
+    layer_count = (max(layers) + 1) if graph.node_count else 0
+    layer_nodes: List[List[int]] = [[] for _ in range(layer_count)]
+    for node in order:
+        layer_nodes[layers[node]].append(node)
+
+    reduce_crossings(graph, layer_nodes, CROSSING_REDUCTION_SWEEPS)
+
+    rows = []
+    for nodes in layer_nodes:
+        for start in range(0, len(nodes), max_row_width):
+            rows.append(nodes[start : start + max_row_width])
+
+    widest = max((len(row) for row in rows), default=0)
+    origin_x, origin_y = origin
+    x = array("i", bytes(4 * graph.node_count))
+    y = array("i", bytes(4 * graph.node_count))
+    for row_index, row in enumerate(rows):
+        offset = (widest - len(row)) * spacing_x // 2
+        row_y = origin_y + row_index * (node_height + spacing_y)
+        for column, node in enumerate(row):
+            x[node] = origin_x + offset + column * spacing_x
+            y[node] = row_y
+
+    width = (widest - 1) * spacing_x + node_width if widest else 0
+    height = len(rows) * (node_height + spacing_y) - spacing_y if rows else 0
+
+    return LayeredLayout(
+        x=x,
+        y=y,
+        layers=array("i", layers),
+        layer_count=layer_count,
+        width=width,
+        height=height,
+        reversed_edges=reversed_edges,
+        rows=rows,
+    )
+
+
+def cluster_nodes(
+    graph: DependencyGraph,
+    layers: Sequence[int],
+    group_of: Sequence[Hashable],
+    max_clusters: int,
+) -> Tuple[array, List[Tuple[int, Hashable]]]:
+    """
+    Group nodes into at most ~max_clusters clusters for level-of-detail views.
+
+    Linked nodes are grouped by (layer band, group key); layer bands are
+    sized so the cluster count stays within budget. Issues with no links at
+    all are grouped by group key alone under band -1.
+
+    Args:
+        graph: DependencyGraph
+        layers: Layer per node (from assign_layers)
+        group_of: Group key per node (e.g. status category)
+        max_clusters: Target upper bound on cluster count
+
+    Returns:
+        Tuple of (cluster index per node, list of (band, group key) per cluster)
+    """
+    degrees = graph.degrees()
+    groups = sorted(set(group_of), key=str)
+    layer_count = (max(layers) + 1) if graph.node_count else 1
+    bands = max(1, max_clusters // max(1, len(groups) + 1) - 1)
+    band_size = max(1, math.ceil(layer_count / bands))
+
+    cluster_index: Dict[Tuple[int, Hashable], int] = {}
+    cluster_keys: List[Tuple[int, Hashable]] = []
+    cluster_of = array("i", bytes(4 * graph.node_count))
+    for node in range(graph.node_count):
+        band = layers[node] // band_size if degrees[node] else -1
+        key = (band, group_of[node])
+        cluster = cluster_index.get(key)
+        if cluster is None:
+            cluster = cluster_index[key] = len(cluster_keys)
+            cluster_keys.append(key)
+        cluster_of[node] = cluster
+    return cluster_of, cluster_keys
+
+
+def cluster_layers(cluster_keys: List[Tuple[int, Hashable]]) -> array:
+    """Layer per cluster: layer bands in order, unlinked clusters last."""
+    last_band = max((band for band, _group in cluster_keys), default=-1)
+    return array(
+        "i", (band if band >= 0 else last_band + 1 for band, _group in cluster_keys)
+    )
+
+
+def strongly_connected_components(graph: DependencyGraph) -> List[List[int]]:
+    """
+    Find dependency cycles with an iterative Tarjan's algorithm.
+
+    Returns:
+        List of components with more than one node (each one is a cycle)
+    """
+    unvisited = -1
+    index_of = array("i", [unvisited]) * graph.node_count
+    lowlink = array("i", bytes(4 * graph.node_count))
+    on_stack = bytearray(graph.node_count)
+    stack: List[int] = []
+    components = []
+    counter = 0
+
+    for root in range(graph.node_count):
+        if index_of[root] != unvisited:
+            continue
+
+        work = [(root, graph.out_offsets[root])]
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+
+        while work:
+            node, cursor = work[-1]
+            if cursor < graph.out_offsets[node + 1]:
+                work[-1] = (node, cursor + 1)
+                successor = graph.out_targets[cursor]
+                if index_of[successor] == unvisited:
+                    index_of[successor] = lowlink[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = 1
+                    work.append((successor, graph.out_offsets[successor]))
+                elif on_stack[successor]:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1:
+                    components.append(component)
+
+    return components
+
+
+def longest_weighted_path(
+    graph: DependencyGraph, order: List[int], weights: Sequence[float]
+) -> Tuple[List[int], float]:
+    """
+    Longest path by summed node weight, following the given topological order.
+
+    Edges pointing backwards in the order (cycle edges) are ignored.
+
+    Returns:
+        Tuple of (node path from first prerequisite to last dependent, total)
+    """
+    if not order:
+        return [], 0
+
+    position = array("i", bytes(4 * graph.node_count))
+    for rank, node in enumerate(order):
+        position[node] = rank
+
+    total = array("d", bytes(8 * graph.node_count))
+    previous = array("i", [-1]) * graph.node_count
+    for node in order:
+        best, best_predecessor = 0.0, -1
+        for predecessor in graph.predecessors(node):
+            if position[predecessor] < position[node] and total[predecessor] > best:
+                best, best_predecessor = total[predecessor], predecessor
+        total[node] = best + weights[node]
+        previous[node] = best_predecessor
+
+    end = max(order, key=total.__getitem__)
+    path = []
+    node = end
+    while node != -1:
+        path.append(node)
+        node = previous[node]
+    path.reverse()
+    return path, total[end]
+
+
+def transitive_predecessors(graph: DependencyGraph, node: int) -> Dict[int, int]:
+    """
+    Breadth-first walk over everything a node (transitively) waits on.
+
+    Returns:
+        Dict mapping each upstream node to its distance from the start node
+    """
+    depth = {node: 0}
+    frontier = [node]
+    while frontier:
+        next_frontier = []
+        for current in frontier:
+            for predecessor in graph.predecessors(current):
+                if predecessor not in depth:
+                    depth[predecessor] = depth[current] + 1
+                    next_frontier.append(predecessor)
+        frontier = next_frontier
+    del depth[node]
+    return depth
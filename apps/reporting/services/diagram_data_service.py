@@ -19,9 +19,9 @@ Diagram Types:
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from django.db.models import Count, Q
+from django.db.models import Count
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,17 @@ class DiagramDataService:
     No SVG generation - pure data computation.
     """
 
+    # link_type -> (label, color) for dependency graph edges
+    LINK_TYPE_STYLES = {
+        "blocks": ("Blocks", "#DE350B"),
+        "blocked_by": ("Blocked By", "#DE350B"),
+        "depends_on": ("Depends On", "#0052CC"),
+        "dependency_of": ("Dependency Of", "#0052CC"),
+        "relates_to": ("Relates To", "#6554C0"),
+        "duplicates": ("Duplicates", "#FF991F"),
+        "duplicated_by": ("Duplicated By", "#FF991F"),
+    }
+
     def get_workflow_data(self, project) -> Dict:
         """
         Generate workflow diagram data structure.
@@ -178,11 +189,15 @@ class DiagramDataService:
         Generate dependency graph data structure.
 
         Returns dict with:
-        - nodes: List of issue boxes with details
+        - nodes: List of issue boxes with details and layered x/y positions
         - edges: List of dependency connections
         - metadata: Project info and filter details
         - layout: Canvas dimensions and layout type
 
+        Projects with more issues than DEPENDENCY_GRAPH_MAX_DATA_NODES are
+        returned as cluster nodes (status category x layer band) with
+        aggregated edges instead of one node per issue.
+
         Args:
             project: Project instance
             filters: Optional dict with filter keys:
@@ -196,48 +211,38 @@ class DiagramDataService:
         Returns:
             Dict with dependency graph data structure
         """
-        from apps.projects.models import Issue, IssueLink
-
-        logger.info(f"Generating dependency data for project {project.name}")
+        from django.conf import settings
 
-        filters = filters or {}
+        from apps.projects.models import Issue
 
-        # Build queryset with filters
-        queryset = (
-            Issue.objects.filter(project=project, is_active=True)
-            .select_related("status", "assignee", "issue_type", "sprint")
-            .prefetch_related("source_links", "target_links")
+        from .dependency_graph import (
+            DependencyGraph,
+            build_issue_filter,
+            layered_layout,
+            load_project_links,
         )
 
-        # Apply filters
-        if filters.get("sprint_id"):
-            if filters["sprint_id"] == "backlog":
-                queryset = queryset.filter(sprint__isnull=True)
-            else:
-                queryset = queryset.filter(sprint_id=filters["sprint_id"])
-
-        if filters.get("status_ids"):
-            queryset = queryset.filter(status_id__in=filters["status_ids"])
-
-        if filters.get("priorities"):
-            queryset = queryset.filter(priority__in=filters["priorities"])
-
-        if filters.get("assignee_id"):
-            if filters["assignee_id"] == "unassigned":
-                queryset = queryset.filter(assignee__isnull=True)
-            else:
-                queryset = queryset.filter(assignee_id=filters["assignee_id"])
+        logger.info(f"Generating dependency data for project {project.name}")
 
-        if filters.get("issue_type_ids"):
-            queryset = queryset.filter(issue_type_id__in=filters["issue_type_ids"])
+        filters = filters or {}
 
-        if filters.get("search"):
-            search = filters["search"]
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(key__icontains=search)
+        issues = list(
+            Issue.objects.filter(build_issue_filter(project, filters))
+            .order_by("created_at")
+            .values(
+                "id",
+                "key",
+                "title",
+                "priority",
+                "story_points",
+                "status__name",
+                "status__category",
+                "issue_type__category",
+                "assignee_id",
+                "assignee__first_name",
+                "assignee__last_name",
             )
-
-        issues = list(queryset[:100])  # Limit to 100 for performance
+        )
 
         if not issues:
             return {
@@ -251,155 +256,85 @@ class DiagramDataService:
                 },
                 "nodes": [],
                 "edges": [],
-                "layout": {"type": "force-directed", "width": 1400, "height": 800},
-            }
-
-        # Build issue nodes
-        nodes = []
-        issue_ids = set()
-
-        for issue in issues:
-            issue_ids.add(str(issue.id))
-
-            # Get assignee info
-            assignee = None
-            if issue.assignee:
-                assignee = {
-                    "id": issue.assignee.id,
-                    "name": issue.assignee.get_full_name(),
-                    "avatar_url": getattr(issue.assignee, "avatar_url", None),
-                }
-
-            node = {
-                "id": f"issue-{issue.id}",
-                "key": issue.key,
-                "summary": issue.title,
-                "status": issue.status.name if issue.status else "Unknown",
-                "status_color": (
-                    self._get_status_color(issue.status.category)
-                    if issue.status
-                    else "#5E6C84"
-                ),
-                "priority": issue.priority or "none",
-                "priority_color": self._get_priority_color(issue.priority),
-                "assignee": assignee,
-                "type": issue.issue_type.category if issue.issue_type else "task",
-                "estimate": issue.story_points,
-                "issue_url": f"/projects/{project.id}/issues/{issue.id}",
+                "layout": {"type": "layered", "width": 1400, "height": 800},
             }
 
-            nodes.append(node)
-
-        # Build dependency edges
-        edges = []
-        edge_id = 1
+        project_links = load_project_links(project)
+        issue_ids = [issue["id"] for issue in issues]
+        graph = DependencyGraph.from_links(issue_ids, project_links)
+        categories = [issue["status__category"] or "todo" for issue in issues]
 
-        logger.debug(f"Building edges for {len(issues)} issues")
-        logger.debug(f"Issue IDs for filtering: {list(issue_ids)[:5]}...")
-
-        # Get all issue links for these issues
-        # Use ID list for better performance and explicit filtering
-        issue_uuid_list = [issue.id for issue in issues]
-
-        logger.debug(
-            f"Querying IssueLinks where source or target in {len(issue_uuid_list)} issues"  # noqa: E501
-        )
-
-        links = IssueLink.objects.filter(
-            Q(source_issue_id__in=issue_uuid_list)
-            | Q(target_issue_id__in=issue_uuid_list),
-            source_issue__is_active=True,
-            target_issue__is_active=True,
-        ).select_related("source_issue", "target_issue")
-
-        link_count = links.count()
-        logger.info(f"Found {link_count} IssueLinks in database")
-
-        if link_count == 0:
-            # Diagnostic: Check if ANY links exist in project
-            total_links = IssueLink.objects.filter(
-                Q(source_issue__project=project) | Q(target_issue__project=project)
-            ).count()
-            logger.warning(
-                f"No links found for filtered issues. Total links in project: {total_links}"  # noqa: E501
+        max_nodes = getattr(settings, "DEPENDENCY_GRAPH_MAX_DATA_NODES", 1000)
+        if len(issues) > max_nodes:
+            nodes, edges, layout = self._build_clustered_dependency_graph(
+                project, graph, categories, max_nodes
             )
-
-        for link in links:
-            source_id = str(link.source_issue.id)
-            target_id = str(link.target_issue.id)
-
-            logger.debug(
-                f"Processing link: {link.source_issue.key} {link.link_type} {link.target_issue.key}"  # noqa: E501
-            )
-
-            # Only include if both nodes are in the filtered set
-            if source_id in issue_ids and target_id in issue_ids:
-                # Determine edge color and type
-                if link.link_type == "blocks":
-                    color = "#DE350B"  # Red for blocking
-                    label = "Blocks"
-                elif link.link_type == "blocked_by":
-                    color = "#DE350B"  # Red for blocking (reverse)
-                    label = "Blocked By"
-                elif link.link_type == "depends_on":
-                    color = "#0052CC"  # Blue for dependency
-                    label = "Depends On"
-                elif link.link_type == "dependency_of":
-                    color = "#0052CC"  # Blue for dependency (reverse)
-                    label = "Dependency Of"
-                elif link.link_type == "relates_to":
-                    color = "#6554C0"  # Purple for relation
-                    label = "Relates To"
-                elif link.link_type == "duplicates":
-                    color = "#FF991F"  # Orange for duplicate
-                    label = "Duplicates"
-                elif link.link_type == "duplicated_by":
-                    color = "#FF991F"  # Orange for duplicate (reverse)
-                    label = "Duplicated By"
-                else:
-                    color = "#42526E"  # Gray for other
-                    label = link.link_type.replace("_", " ").title()
-
-                edge = {
-                    "id": f"dep-{edge_id}",
-                    "source": f"issue-{source_id}",
-                    "target": f"issue-{target_id}",
-                    "type": link.link_type,
-                    "label": label,
-                    "color": color,
-                }
-                edges.append(edge)
-                edge_id += 1
-                logger.debug(
-                    f"Added edge: {edge['source']} -> {edge['target']} ({edge['type']})"
-                )
-            else:
-                logger.debug(
-                    f"Skipped link (nodes not in filtered set): {source_id} -> {target_id}"  # noqa: E501
+        else:
+            layout = layered_layout(graph, 220, 100, 280, 140, origin=(60, 60))
+            nodes = []
+            for idx, issue in enumerate(issues):
+                assignee = None
+                if issue["assignee_id"]:
+                    first_name = issue["assignee__first_name"]
+                    last_name = issue["assignee__last_name"]
+                    full_name = f"{first_name} {last_name}".strip()
+                    assignee = {
+                        "id": issue["assignee_id"],
+                        "name": full_name,
+                        "avatar_url": None,
+                    }
+
+                nodes.append(
+                    {
+                        "id": f"issue-{issue['id']}",
+                        "key": issue["key"],
+                        "summary": issue["title"],
+                        "status": issue["status__name"] or "Unknown",
+                        "status_color": (
+                            self._get_status_color(issue["status__category"])
+                            if issue["status__category"]
+                            else "#5E6C84"
+                        ),
+                        "priority": issue["priority"] or "none",
+                        "priority_color": self._get_priority_color(issue["priority"]),
+                        "assignee": assignee,
+                        "type": issue["issue_type__category"] or "task",
+                        "estimate": issue["story_points"],
+                        "issue_url": f"/projects/{project.id}/issues/{issue['id']}",
+                        "layer": layout.layers[idx],
+                        "x": layout.x[idx],
+                        "y": layout.y[idx],
+                    }
                 )
+            edges = self._build_dependency_edges(graph.index, project_links)
 
-        logger.info(f"Built {len(edges)} edges from {link_count} links")
+        logger.info(
+            f"Built {len(edges)} edges from {len(project_links)} links "
+            f"({len(issues)} issues)"
+        )
 
-        # Build metadata with diagnostic info
         metadata = {
             "project_id": str(project.id),
             "project_name": project.name,
-            "issue_count": len(nodes),
-            "dependency_count": len(edges),
+            "issue_count": len(issues),
+            "node_count": len(nodes),
+            "dependency_count": (
+                sum(edge["weight"] for edge in edges)
+                if layout.clustered
+                else len(edges)
+            ),
             "filters_applied": list(filters.keys()) if filters else [],
             "has_dependencies": len(edges) > 0,
+            "clustered": layout.clustered,
         }
 
         # Add diagnostic info if no dependencies found
-        if len(edges) == 0 and len(nodes) > 0:
-            total_project_links = IssueLink.objects.filter(
-                Q(source_issue__project=project) | Q(target_issue__project=project)
-            ).count()
+        if len(edges) == 0:
             metadata["debug"] = {
-                "total_links_in_project": total_project_links,
+                "total_links_in_project": len(project_links),
                 "message": (
                     "No dependencies found between filtered issues"
-                    if total_project_links > 0
+                    if project_links
                     else "No issue links exist in this project yet"
                 ),
             }
@@ -409,8 +344,111 @@ class DiagramDataService:
             "metadata": metadata,
             "nodes": nodes,
             "edges": edges,
-            "layout": {"type": "force-directed", "width": 1400, "height": 800},
+            "layout": {
+                "type": "layered",
+                "width": max(1400, layout.width + 120),
+                "height": max(800, layout.height + 120),
+                "layer_count": layout.layer_count,
+            },
+        }
+
+    def _build_dependency_edges(self, index: Dict, project_links) -> List[Dict]:
+        """Build one edge per IssueLink whose endpoints are both in the graph."""
+        edges = []
+        for source_id, target_id, link_type in project_links:
+            if source_id not in index or target_id not in index:
+                continue
+            label, color = self.LINK_TYPE_STYLES.get(
+                link_type, (link_type.replace("_", " ").title(), "#42526E")
+            )
+            edges.append(
+                {
+                    "id": f"dep-{len(edges) + 1}",
+                    "source": f"issue-{source_id}",
+                    "target": f"issue-{target_id}",
+                    "type": link_type,
+                    "label": label,
+                    "color": color,
+                }
+            )
+        return edges
+
+    def _build_clustered_dependency_graph(self, project, graph, categories, max_nodes):
+        """
+        Collapse a large dependency graph into status/layer-band clusters.
+
+        Returns:
+            Tuple of (cluster nodes, aggregated edges, layout)
+        """
+        from .dependency_graph import (
+            KIND_BLOCKS,
+            KIND_DEPENDS,
+            assign_layers,
+            cluster_layers,
+            cluster_nodes,
+            layered_layout,
+            topological_order,
+        )
+
+        order, _ = topological_order(graph)
+        cluster_of, cluster_keys = cluster_nodes(
+            graph, assign_layers(graph, order), categories, max_nodes
+        )
+        cluster_graph, weights = graph.contract(cluster_of, len(cluster_keys))
+        layout = layered_layout(
+            cluster_graph,
+            220,
+            100,
+            280,
+            140,
+            origin=(60, 60),
+            layers=cluster_layers(cluster_keys),
+        )
+        layout.clustered = True
+
+        members = [0] * len(cluster_keys)
+        for cluster in cluster_of:
+            members[cluster] += 1
+
+        nodes = []
+        for idx, (band, category) in enumerate(cluster_keys):
+            nodes.append(
+                {
+                    "id": f"cluster-{idx}",
+                    "is_cluster": True,
+                    "key": f"{members[idx]} issues",
+                    "summary": category.replace("_", " ").title(),
+                    "status": category,
+                    "status_color": self._get_status_color(category),
+                    "member_count": members[idx],
+                    "layer_band": band,
+                    "layer": layout.layers[idx],
+                    "x": layout.x[idx],
+                    "y": layout.y[idx],
+                }
+            )
+
+        kind_types = {
+            KIND_BLOCKS: "blocks",
+            KIND_DEPENDS: "dependency_of",
         }
+        edges = []
+        for (source, target, kind), weight in weights.items():
+            link_type = kind_types.get(kind, "relates_to")
+            label, color = self.LINK_TYPE_STYLES[link_type]
+            edges.append(
+                {
+                    "id": f"dep-{len(edges) + 1}",
+                    "source": f"cluster-{source}",
+                    "target": f"cluster-{target}",
+                    "type": link_type,
+                    "label": label,
+                    "color": color,
+                    "weight": weight,
+                }
+            )
+
+        return nodes, edges, layout
 
     def get_roadmap_data(self, project) -> Dict:
         """
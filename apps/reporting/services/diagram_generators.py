@@ -18,6 +18,7 @@ from django.utils import timezone
 from .diagram_utils import (
     BoundingBox,
     DesignSystem,
+    SpatialGrid,
     calculate_grid_points,
     create_text_bounding_box,
     estimate_text_height,
@@ -25,6 +26,7 @@ from .diagram_utils import (
     find_non_overlapping_position,
 )
 from .svg_builder import (
+    SVGWriter,
     close_svg,
     create_arrow,
     create_axes,
@@ -38,7 +40,6 @@ from .svg_builder import (
     create_svg_canvas,
     create_svg_defs,
     create_text,
-    create_text_with_background,
     create_title,
 )
 
@@ -65,13 +66,17 @@ def generate_workflow_diagram_svg(project) -> str:
     Returns:
         SVG string
     """
+    from django.db.models import Count, Q
+
     from apps.projects.models import WorkflowStatus, WorkflowTransition
 
     ds = DesignSystem
 
     # Get data
     statuses = list(
-        WorkflowStatus.objects.filter(project=project).prefetch_related("issues")
+        WorkflowStatus.objects.filter(project=project).annotate(
+            active_issue_count=Count("issues", filter=Q(issues__is_active=True))
+        )
     )
     transitions = list(
         WorkflowTransition.objects.filter(from_status__project=project).select_related(
@@ -92,7 +97,7 @@ def generate_workflow_diagram_svg(project) -> str:
     status_map = {}  # id -> index for positioning
 
     for idx, status in enumerate(statuses):
-        issue_count = status.issues.filter(is_active=True).count()
+        issue_count = status.active_issue_count
         status_nodes.append(
             {
                 "id": str(status.id),
@@ -140,41 +145,29 @@ def generate_workflow_diagram_svg(project) -> str:
     canvas_width = max(calculated_width, ds.LAYOUT["canvas_min_width"])
     canvas_height = max(calculated_height, ds.LAYOUT["canvas_min_height"])
 
-    # Start SVG with improved rendering attributes
-    svg_opening = f"""<svg xmlns="http://www.w3.org/2000/svg"
-        width="{canvas_width}" height="{canvas_height}"
-        viewBox="0 0 {canvas_width} {canvas_height}"
-        style="shape-rendering: crispEdges; text-rendering: optimizeLegibility;">"""
-
-    parts = [
-        svg_opening,
-        create_svg_defs(),
-    ]
+    svg = SVGWriter(canvas_width, canvas_height)
+    svg.write(create_svg_defs())
 
     # Background
-    parts.append(
-        create_rect(
-            0,
-            0,
-            canvas_width,
-            canvas_height,
-            fill=ds.COLORS["bg_secondary"],
-            opacity=0.3,
-        )
+    svg.rect(
+        0,
+        0,
+        canvas_width,
+        canvas_height,
+        fill=ds.COLORS["bg_secondary"],
+        opacity=0.3,
     )
 
     # Title
-    parts.append(
-        create_title(
-            f"{project.name} - Workflow",
-            canvas_width / 2,
-            padding / 2 + 10,
-            subtitle=f"{num_nodes} statuses, {len(edges)} transitions",
-        )
+    svg.title(
+        f"{project.name} - Workflow",
+        canvas_width / 2,
+        padding / 2 + 10,
+        subtitle=f"{num_nodes} statuses, {len(edges)} transitions",
     )
 
     # Track bounding boxes for collision detection
-    bounding_boxes = []
+    bounding_boxes = SpatialGrid()
 
     # Calculate status node positions and create bounding boxes FIRST
     status_node_positions = []
@@ -215,11 +208,7 @@ def generate_workflow_diagram_svg(project) -> str:
         to_x = padding + (to_idx * spacing_x)
 
         # Draw arrow
-        parts.append(
-            create_arrow(
-                from_x, y_center, to_x, y_center, curve=True, arrow_type="default"
-            )
-        )
+        svg.arrow(from_x, y_center, to_x, y_center, curve=True, arrow_type="default")
 
         # Draw transition label with collision avoidance
         if edge["label"]:
@@ -237,19 +226,17 @@ def generate_workflow_diagram_svg(project) -> str:
             )
 
             # Create and add label WITH BACKGROUND for better visibility
-            parts.append(
-                create_text_with_background(
-                    final_x,
-                    final_y,
-                    edge["label"],
-                    size=label_font_size,
-                    fill=ds.COLORS["text_primary"],
-                    anchor="middle",
-                    bg_fill="#FFFFFF",
-                    bg_opacity=0.95,
-                    padding=4,
-                    truncate_at=15,
-                )
+            svg.text_with_background(
+                final_x,
+                final_y,
+                edge["label"],
+                size=label_font_size,
+                fill=ds.COLORS["text_primary"],
+                anchor="middle",
+                bg_fill="#FFFFFF",
+                bg_opacity=0.95,
+                padding=4,
+                truncate_at=15,
             )
 
             # Add label bounding box to prevent future overlaps
@@ -275,71 +262,61 @@ def generate_workflow_diagram_svg(project) -> str:
             border_color = ds.COLORS["chart_blue"]
             border_width = 3
 
-        parts.append(
-            create_rect(
-                x,
-                y,
-                node_width,
-                node_height,
-                fill=node["color"],
-                stroke=border_color,
-                stroke_width=border_width,
-                shadow=True,
-            )
+        svg.rect(
+            x,
+            y,
+            node_width,
+            node_height,
+            fill=node["color"],
+            stroke=border_color,
+            stroke_width=border_width,
+            shadow=True,
         )
 
         # Status name
-        parts.append(
-            create_text(
-                x + node_width / 2,
-                y + node_height / 2 - 8,
-                node["name"],
-                size=ds.FONTS["size_body"],
-                fill=ds.COLORS["text_inverse"],
-                anchor="middle",
-                weight="bold",
-                truncate_at=18,
-            )
+        svg.text(
+            x + node_width / 2,
+            y + node_height / 2 - 8,
+            node["name"],
+            size=ds.FONTS["size_body"],
+            fill=ds.COLORS["text_inverse"],
+            anchor="middle",
+            weight="bold",
+            truncate_at=18,
         )
 
         # Issue count
         count_text = f"{node['count']} issue{'s' if node['count'] != 1 else ''}"
-        parts.append(
-            create_text(
-                x + node_width / 2,
-                y + node_height / 2 + 8,
-                count_text,
-                size=ds.FONTS["size_small"],
-                fill=ds.COLORS["text_inverse"],
-                anchor="middle",
-                truncate_at=20,
-            )
+        svg.text(
+            x + node_width / 2,
+            y + node_height / 2 + 8,
+            count_text,
+            size=ds.FONTS["size_small"],
+            fill=ds.COLORS["text_inverse"],
+            anchor="middle",
+            truncate_at=20,
         )
 
         # Initial/Final badge
         if node["is_initial"]:
-            parts.append(
-                create_text(
-                    x + node_width / 2,
-                    y - 10,
-                    "START",
-                    size=ds.FONTS["size_tiny"],
-                    fill=ds.COLORS["chart_green"],
-                    anchor="middle",
-                    weight="bold",
-                )
+            svg.text(
+                x + node_width / 2,
+                y - 10,
+                "START",
+                size=ds.FONTS["size_tiny"],
+                fill=ds.COLORS["chart_green"],
+                anchor="middle",
+                weight="bold",
             )
         elif node["is_final"]:
-            parts.append(
-                create_text(
-                    x + node_width / 2,
-                    y - 10,
-                    "END",
-                    size=ds.FONTS["size_tiny"],
-                    fill=ds.COLORS["chart_blue"],
-                    anchor="middle",
-                    weight="bold",
-                )
+            svg.text(
+                x + node_width / 2,
+                y - 10,
+                "END",
+                size=ds.FONTS["size_tiny"],
+                fill=ds.COLORS["chart_blue"],
+                anchor="middle",
+                weight="bold",
             )
 
     # Legend
@@ -351,10 +328,9 @@ def generate_workflow_diagram_svg(project) -> str:
     ]
 
     legend_y = y + node_height + 40
-    parts.append(create_legend(padding, legend_y, legend_items, title="Status Colors"))
+    svg.legend(padding, legend_y, legend_items, title="Status Colors")
 
-    parts.append(close_svg())
-    return "\n".join(parts)
+    return svg.getvalue()
 
 
 # ============================================================================
@@ -369,9 +345,10 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
     Features:
     - Issue nodes with key, title, status
     - Connection arrows showing dependencies
-    - Hierarchical layout (dependencies at top)
+    - Layered layout (prerequisites above the issues waiting on them)
     - Color-coded by status
     - Critical path highlighting
+    - Large graphs collapsed into status/layer clusters
     - Filterable by sprint, status, priority, assignee, issue_type, search
 
     Args:
@@ -382,52 +359,39 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
     Returns:
         SVG string
     """
-    from django.db.models import Q
+    from django.conf import settings
+
+    from apps.projects.models import Issue
 
-    from apps.projects.models import Issue, IssueLink
+    from .dependency_graph import (
+        KIND_BLOCKS,
+        KIND_RELATES,
+        DependencyGraph,
+        assign_layers,
+        build_issue_filter,
+        cluster_layers,
+        cluster_nodes,
+        layered_layout,
+        load_project_links,
+        longest_weighted_path,
+        topological_order,
+    )
 
     ds = DesignSystem
     filters = filters or {}
 
-    # Build query with filters
-    query = Q(project=project, is_active=True)
-
-    # Sprint filter
-    if filters.get("sprint_id"):
-        if filters["sprint_id"] == "backlog":
-            query &= Q(sprint__isnull=True)
-        else:
-            query &= Q(sprint_id=filters["sprint_id"])
-
-    # Status filter (list of status IDs)
-    if filters.get("status_ids"):
-        query &= Q(status_id__in=filters["status_ids"])
-
-    # Priority filter (list like ['P1', 'P2'])
-    if filters.get("priorities"):
-        query &= Q(priority__in=filters["priorities"])
-
-    # Assignee filter
-    if filters.get("assignee_id"):
-        if filters["assignee_id"] == "unassigned":
-            query &= Q(assignee__isnull=True)
-        else:
-            query &= Q(assignee_id=filters["assignee_id"])
-
-    # Issue type filter
-    if filters.get("issue_type_ids"):
-        query &= Q(issue_type_id__in=filters["issue_type_ids"])
-
-    # Search filter (title or key)
-    if filters.get("search"):
-        search_term = filters["search"]
-        query &= Q(title__icontains=search_term) | Q(key__icontains=search_term)
-
-    # Get filtered issues (limit to 50 for readability)
     issues = list(
-        Issue.objects.filter(query).select_related(
-            "status", "issue_type", "assignee", "sprint"
-        )[:50]
+        Issue.objects.filter(build_issue_filter(project, filters))
+        .order_by("created_at")
+        .values(
+            "id",
+            "key",
+            "title",
+            "priority",
+            "story_points",
+            "status__name",
+            "status__category",
+        )
     )
 
     if not issues:
@@ -438,71 +402,99 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
             "Create issues to visualize dependencies between them",
         )
 
-    [issue.id for issue in issues]
-
-    links = list(
-        IssueLink.objects.filter(
-            source_issue__in=issues, link_type__in=["depends_on", "blocks"]
-        ).select_related("source_issue", "target_issue")
+    graph = DependencyGraph.from_links(
+        [issue["id"] for issue in issues], load_project_links(project)
     )
+    categories = [issue["status__category"] or "todo" for issue in issues]
 
-    # Build node data
-    nodes = []
-    node_map = {}  # id -> index
-
-    for idx, issue in enumerate(issues):
-        nodes.append(
-            {
-                "id": str(issue.id),
-                "key": issue.key,
-                "title": issue.title,
-                "status": issue.status.name if issue.status else "Unknown",
-                "status_category": issue.status.category if issue.status else "todo",
-                "color": ds.get_status_color(
-                    issue.status.category if issue.status else "todo"
-                ),
-                "priority": issue.priority or "P3",
-                "index": idx,
-            }
-        )
-        node_map[str(issue.id)] = idx
-
-    # Build edge data
-    edges = []
-    for link in links:
-        source_id = str(link.source_issue.id)
-        target_id = str(link.target_issue.id)
-        if source_id in node_map and target_id in node_map:
-            edges.append(
-                {
-                    "from_idx": node_map[source_id],
-                    "to_idx": node_map[target_id],
-                    "type": link.link_type,
-                    "critical": link.link_type == "blocks",
-                }
-            )
-
-    # Layout (simple grid layout)
     node_width = ds.LAYOUT["dependency_node_width"]
     node_height = ds.LAYOUT["dependency_node_height"]
     spacing_x = ds.LAYOUT["dependency_spacing_x"]
     spacing_y = ds.LAYOUT["dependency_spacing_y"]
     padding = ds.LAYOUT["canvas_padding"]
-    items_per_row = 4
+    header_height = 70
 
-    rows = (len(nodes) + items_per_row - 1) // items_per_row
-    calculated_width = (
-        (items_per_row * node_width)
-        + ((items_per_row - 1) * (spacing_x - node_width))
-        + (padding * 2)
+    max_nodes = getattr(settings, "DEPENDENCY_GRAPH_MAX_SVG_NODES", 300)
+    clustered = len(issues) > max_nodes
+
+    # Build node and edge data (clusters replace issues on large graphs)
+    critical_nodes = set()
+    if clustered:
+        order, _ = topological_order(graph)
+        cluster_of, cluster_keys = cluster_nodes(
+            graph, assign_layers(graph, order), categories, max_nodes
+        )
+        members = [0] * len(cluster_keys)
+        for cluster in cluster_of:
+            members[cluster] += 1
+
+        nodes = []
+        for (band, category), member_count in zip(cluster_keys, members):
+            nodes.append(
+                {
+                    "key": f"{member_count} issues",
+                    "title": category.replace("_", " ").title(),
+                    "status": f"Layer band {band + 1}" if band >= 0 else "No links",
+                    "color": ds.get_status_color(category),
+                    "priority": None,
+                }
+            )
+        layout_graph, weights = graph.contract(cluster_of, len(cluster_keys))
+        layers = cluster_layers(cluster_keys)
+        edges = [
+            (source, target, kind == KIND_BLOCKS, weight)
+            for (source, target, kind), weight in weights.items()
+            if kind != KIND_RELATES
+        ]
+    else:
+        nodes = [
+            {
+                "key": issue["key"],
+                "title": issue["title"],
+                "status": issue["status__name"] or "Unknown",
+                "color": ds.get_status_color(category),
+                "priority": issue["priority"] or "P3",
+            }
+            for issue, category in zip(issues, categories)
+        ]
+        layout_graph, layers = graph, None
+
+        # Critical path: longest chain of remaining story points
+        order, _ = topological_order(graph)
+        weights = [
+            0 if category == "done" else issue["story_points"] or 0
+            for issue, category in zip(issues, categories)
+        ]
+        path, total = longest_weighted_path(graph, order, weights)
+        if total > 0 and len(path) > 1:
+            critical_nodes = set(path)
+        critical_edges = set(zip(path, path[1:])) if critical_nodes else set()
+
+        edges = [
+            (
+                source,
+                target,
+                kind == KIND_BLOCKS or (source, target) in critical_edges,
+                1,
+            )
+            for source, target, kind in zip(graph.sources, graph.targets, graph.kinds)
+            if kind != KIND_RELATES
+        ]
+
+    layout = layered_layout(
+        layout_graph,
+        node_width,
+        node_height,
+        spacing_x,
+        spacing_y,
+        max_row_width=8,
+        origin=(padding, padding + header_height),
+        layers=layers,
     )
-    calculated_height = (rows * (node_height + spacing_y)) + (padding * 2) + 100
 
-    # Enforce minimum dimensions (dynamic minimum based on content)
-    min_width = max(1400, calculated_width)
-    min_height = max(600, calculated_height)
-    canvas_width = min_width
-    canvas_height = min_height
+    canvas_width = max(1400, layout.width + padding * 2)
+    canvas_height = max(600, layout.height + padding * 2 + header_height + 160)
+    x_shift = (canvas_width - layout.width - padding * 2) // 2
 
     # Start SVG with improved rendering
     svg_opening = f"""<svg xmlns="http://www.w3.org/2000/svg"
@@ -540,7 +532,10 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
     if filters.get("search"):
         filter_info.append(f"Search: '{filters['search']}'")
 
-    subtitle = f"{len(nodes)} issues, {len(edges)} dependencies"
+    dependency_count = sum(1 for kind in graph.kinds if kind != KIND_RELATES)
+    subtitle = f"{len(issues)} issues, {dependency_count} dependencies"
+    if clustered:
+        subtitle += f", grouped into {len(nodes)} clusters"
     if filter_info:
         subtitle += f" ({', '.join(filter_info)})"
 
@@ -553,39 +548,29 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
         )
     )
 
-    # Calculate node positions
-    node_positions = []
-    for idx, node in enumerate(nodes):
-        row = idx // items_per_row
-        col = idx % items_per_row
-        x = padding + (col * spacing_x)
-        y = padding + 70 + (row * (node_height + spacing_y))
-        node_positions.append((x, y))
-
-    # Draw edges first
-    for edge in edges:
-        from_idx = edge["from_idx"]
-        to_idx = edge["to_idx"]
-
-        from_x, from_y = node_positions[from_idx]
-        to_x, to_y = node_positions[to_idx]
+    # Draw edges first (bottom of prerequisite -> top of dependent issue)
+    for source, target, critical, weight in edges:
+        from_cx = layout.x[source] + x_shift + node_width / 2
+        from_cy = layout.y[source] + node_height
+        to_cx = layout.x[target] + x_shift + node_width / 2
+        to_cy = layout.y[target]
 
-        # Calculate connection points (center of nodes)
-        from_cx = from_x + node_width / 2
-        from_cy = from_y + node_height / 2
-        to_cx = to_x + node_width / 2
-        to_cy = to_y + node_height / 2
-
-        arrow_type = "critical" if edge["critical"] else "dependency"
         parts.append(
             create_arrow(
-                from_cx, from_cy, to_cx, to_cy, curve=True, arrow_type=arrow_type
+                from_cx,
+                from_cy,
+                to_cx,
+                to_cy,
+                curve=True,
+                arrow_type="critical" if critical else "dependency",
+                width=min(2 + weight // 5, 8),
             )
         )
 
     # Draw nodes
     for idx, node in enumerate(nodes):
-        x, y = node_positions[idx]
+        x = layout.x[idx] + x_shift
+        y = layout.y[idx]
 
         # Node box
         parts.append(
@@ -595,12 +580,17 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
                 node_width,
                 node_height,
                 fill=node["color"],
-                stroke=ds.COLORS["border_strong"],
+                stroke=(
+                    ds.COLORS["arrow_blocked"]
+                    if idx in critical_nodes
+                    else ds.COLORS["border_strong"]
+                ),
+                stroke_width=4 if idx in critical_nodes else 2,
                 shadow=True,
             )
         )
 
-        # Issue key
+        # Issue key (or member count for clusters)
         parts.append(
             create_text(
                 x + 10,
@@ -637,21 +627,22 @@ def generate_dependency_graph_svg(project, filters=None) -> str:
         )
 
         # Priority badge
-        priority_color = ds.get_priority_color(node["priority"])
-        parts.append(
-            create_circle(
-                x + node_width - 15,
-                y + 15,
-                8,
-                fill=priority_color,
-                stroke=ds.COLORS["bg_primary"],
+        if node["priority"]:
+            priority_color = ds.get_priority_color(node["priority"])
+            parts.append(
+                create_circle(
+                    x + node_width - 15,
+                    y + 15,
+                    8,
+                    fill=priority_color,
+                    stroke=ds.COLORS["bg_primary"],
+                )
             )
-        )
 
     # Legend
     legend_items = [
         ("Depends On", ds.COLORS["arrow_depends"]),
-        ("Blocks", ds.COLORS["arrow_blocked"]),
+        ("Blocks / Critical Path", ds.COLORS["arrow_blocked"]),
     ]
 
     parts.append(
@@ -1120,12 +1111,18 @@ def generate_roadmap_timeline_svg(project) -> str:
     Returns:
         SVG string
     """
+    from django.db.models import Count, Q
+
     from apps.projects.models import Sprint
 
     ds = DesignSystem
 
     # Get sprints and epics
-    sprints = list(Sprint.objects.filter(project=project).order_by("start_date")[:12])
+    sprints = list(
+        Sprint.objects.filter(project=project)
+        .annotate(active_issue_count=Count("issues", filter=Q(issues__is_active=True)))
+        .order_by("start_date")[:12]
+    )
 
     if not sprints:
         return create_empty_state(
@@ -1169,37 +1166,25 @@ def generate_roadmap_timeline_svg(project) -> str:
     chart_width = canvas_width - (margin * 2) - label_width
     chart_height = len(sprints) * row_height
 
-    # Start SVG with improved rendering
-    svg_opening = f"""<svg xmlns="http://www.w3.org/2000/svg"
-        width="{canvas_width}" height="{canvas_height}"
-        viewBox="0 0 {canvas_width} {canvas_height}"
-        style="shape-rendering: crispEdges; text-rendering: optimizeLegibility;">"""
-
-    parts = [
-        svg_opening,
-        create_svg_defs(),
-    ]
+    svg = SVGWriter(canvas_width, canvas_height)
+    svg.write(create_svg_defs())
 
     # Background
-    parts.append(
-        create_rect(
-            0,
-            0,
-            canvas_width,
-            canvas_height,
-            fill=ds.COLORS["bg_secondary"],
-            opacity=0.3,
-        )
+    svg.rect(
+        0,
+        0,
+        canvas_width,
+        canvas_height,
+        fill=ds.COLORS["bg_secondary"],
+        opacity=0.3,
     )
 
     # Title
-    parts.append(
-        create_title(
-            f"{project.name} - Roadmap",
-            canvas_width / 2,
-            25,
-            subtitle=f"{len(sprints)} sprints from {min_date.strftime('%b %d')} to {max_date.strftime('%b %d, %Y')}",  # noqa: E501
-        )
+    svg.title(
+        f"{project.name} - Roadmap",
+        canvas_width / 2,
+        25,
+        subtitle=f"{len(sprints)} sprints from {min_date.strftime('%b %d')} to {max_date.strftime('%b %d, %Y')}",  # noqa: E501
     )
 
     # Draw timeline axis
@@ -1213,28 +1198,24 @@ def generate_roadmap_timeline_svg(project) -> str:
         days_from_start = (today - min_date).days
         today_x = timeline_x_start + (days_from_start / total_days * chart_width)
 
-        parts.append(
-            create_line(
-                today_x,
-                timeline_y,
-                today_x,
-                timeline_y + chart_height + 20,
-                stroke=ds.COLORS["today_marker"],
-                width=2,
-                dashed=True,
-            )
+        svg.line(
+            today_x,
+            timeline_y,
+            today_x,
+            timeline_y + chart_height + 20,
+            stroke=ds.COLORS["today_marker"],
+            width=2,
+            dashed=True,
         )
 
-        parts.append(
-            create_text(
-                today_x,
-                timeline_y - 10,
-                "TODAY",
-                size=ds.FONTS["size_tiny"],
-                fill=ds.COLORS["today_marker"],
-                anchor="middle",
-                weight="bold",
-            )
+        svg.text(
+            today_x,
+            timeline_y - 10,
+            "TODAY",
+            size=ds.FONTS["size_tiny"],
+            fill=ds.COLORS["today_marker"],
+            anchor="middle",
+            weight="bold",
         )
 
     # Draw sprint bars
@@ -1260,62 +1241,50 @@ def generate_roadmap_timeline_svg(project) -> str:
         bar_color = status_colors.get(sprint.status, ds.COLORS["chart_blue"])
 
         # Draw bar
-        parts.append(
-            create_rect(
-                bar_x,
-                y,
-                bar_width,
-                bar_height,
-                fill=bar_color,
-                stroke=ds.COLORS["border"],
-                shadow=True,
-                radius=4,
-            )
+        svg.rect(
+            bar_x,
+            y,
+            bar_width,
+            bar_height,
+            fill=bar_color,
+            stroke=ds.COLORS["border"],
+            shadow=True,
+            radius=4,
         )
 
         # Sprint name label (left side, outside bar)
-        parts.append(
-            create_text(
-                margin + 10,
-                y + bar_height / 2 + 4,
-                sprint.name,
-                size=ds.FONTS["size_body"],
-                weight="bold",
-                truncate_at=22,
-            )
+        svg.text(
+            margin + 10,
+            y + bar_height / 2 + 4,
+            sprint.name,
+            size=ds.FONTS["size_body"],
+            weight="bold",
+            truncate_at=22,
         )
 
         # Date range inside bar (if bar is wide enough)
         if bar_width > 100:
             date_text = f"{sprint.start_date.strftime('%m/%d')} - {sprint.end_date.strftime('%m/%d')}"  # noqa: E501
-            parts.append(
-                create_text(
-                    bar_x + bar_width / 2,
-                    y + bar_height / 2 + 4,
-                    date_text,
-                    size=ds.FONTS["size_tiny"],
-                    fill=ds.COLORS["text_inverse"],
-                    anchor="middle",
-                    weight="bold",
-                )
+            svg.text(
+                bar_x + bar_width / 2,
+                y + bar_height / 2 + 4,
+                date_text,
+                size=ds.FONTS["size_tiny"],
+                fill=ds.COLORS["text_inverse"],
+                anchor="middle",
+                weight="bold",
             )
 
         # Issue count badge (if sprint has issues)
-        sprint_issues = (
-            sprint.issues.filter(is_active=True).count()
-            if hasattr(sprint, "issues")
-            else 0
-        )
+        sprint_issues = sprint.active_issue_count
         if sprint_issues > 0:
             badge_x = bar_x + bar_width + 10
-            parts.append(
-                create_text(
-                    badge_x,
-                    y + bar_height / 2 + 4,
-                    f"{sprint_issues} issues",
-                    size=ds.FONTS["size_tiny"],
-                    fill=ds.COLORS["text_tertiary"],
-                )
+            svg.text(
+                badge_x,
+                y + bar_height / 2 + 4,
+                f"{sprint_issues} issues",
+                size=ds.FONTS["size_tiny"],
+                fill=ds.COLORS["text_tertiary"],
             )
 
     # Legend
@@ -1325,9 +1294,6 @@ def generate_roadmap_timeline_svg(project) -> str:
         ("Completed", ds.COLORS["chart_green"]),
     ]
 
-    parts.append(
-        create_legend(margin, canvas_height - 100, legend_items, title="Sprint Status")
-    )
+    svg.legend(margin, canvas_height - 100, legend_items, title="Sprint Status")
 
-    parts.append(close_svg())
-    return "\n".join(parts)
+    return svg.getvalue()
@@ -0,0 +1,313 @@
+"""
+Background pre-rendering of exportable diagrams.
+
+Data changes schedule a debounced re-render per project. Rendered SVG (and PNG
+when cairosvg is available) artifacts are stored in the cache keyed by a
+per-project version stamp, so export requests can serve them without
+regenerating anything. The stamp is bumped on commit by the same changes that
+schedule the re-render; unlike a Max(updated_at) hash it never goes back to an
+earlier value, e.g. when the most recently updated issue is deleted.
+"""
+
+import logging
+import time
+from typing import Dict, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+PRERENDER_DIAGRAM_TYPES = ("workflow", "dependency", "roadmap", "velocity", "burndown")
+
+
+class DiagramPrerenderService:
+    """
+    Renders and stores SVG/PNG diagram artifacts outside the request cycle.
+
+    Artifacts only cover the unfiltered version of each diagram; filtered
+    dependency exports are still rendered on demand.
+    """
+
+    PENDING_KEY = "diagram_prerender:pending:{project_id}"
+    VERSION_KEY = "diagram_prerender:version:{project_id}"
+    ARTIFACT_KEY = "diagram_artifact:{project_id}:{diagram_type}:{scope}:{version}:{fmt}"  # noqa: E501
+    METRICS_KEY = "diagram_render_metrics:{diagram_type}:{fmt}"
+
+    def __init__(self):
+        self.artifact_ttl = getattr(
+            settings, "DIAGRAM_ARTIFACT_TTL_SECONDS", 60 * 60 * 24
+        )
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def schedule(cls, project_id, diagram_types: Iterable[str]):
+        """
+        Schedule a debounced re-render of the given diagram types.
+
+        Once the transaction commits, the project's artifact version is bumped
+        and the first change for a project enqueues a delayed task; further
+        changes arriving before it runs are merged into the same pending set.
+        Rolled back changes leave nothing behind.
+        """
+        cls.bump_version(project_id)
+
+        if not getattr(settings, "DIAGRAM_PRERENDER_ENABLED", True):
+            return
+
+        debounce = getattr(settings, "DIAGRAM_PRERENDER_DEBOUNCE_SECONDS", 10)
+        pending_key = cls.PENDING_KEY.format(project_id=project_id)
+        diagram_types = sorted(set(diagram_types))
+
+        def claim_and_enqueue():
+            from apps.reporting.tasks import prerender_project_diagrams
+
+            try:
+                if not cache.add(pending_key, diagram_types, timeout=debounce * 6):
+                    pending = cache.get(pending_key) or []
+                    merged = sorted(set(pending) | set(diagram_types))
+                    cache.set(pending_key, merged, timeout=debounce * 6)
+                    return
+            except Exception as e:
+                logger.warning(f"[PRERENDER] Cache unavailable, skipping schedule: {e}")
+                return
+
+            try:
+                prerender_project_diagrams.apply_async(
+                    args=[str(project_id)], countdown=debounce
+                )
+            except Exception as e:
+                cache.delete(pending_key)
+                logger.warning(
+                    f"[PRERENDER] Could not enqueue render for project {project_id}: {e}"  # noqa: E501
+                )
+
+        transaction.on_commit(claim_and_enqueue)
+
+    @classmethod
+    def bump_version(cls, project_id):
+        """
+        Bump the project's artifact version once the transaction commits.
+
+        Bumping earlier would let a render between the bump and the commit
+        store the old data under the new version.
+        """
+        version_key = cls.VERSION_KEY.format(project_id=project_id)
+
+        def bump():
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                cache.set(version_key, 1, timeout=None)
+            except Exception as e:
+                logger.warning(f"[PRERENDER] Could not bump artifact version: {e}")
+
+        transaction.on_commit(bump)
+
+    @classmethod
+    def pop_pending(cls, project_id) -> list:
+        """Return and clear the diagram types pending for a project."""
+        pending_key = cls.PENDING_KEY.format(project_id=project_id)
+        pending = cache.get(pending_key) or []
+        cache.delete(pending_key)
+        return pending
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def render_project(self, project, diagram_types: Iterable[str]) -> Dict:
+        """
+        Render every requested diagram type for a project.
+
+        Burndown charts are rendered for each active sprint.
+
+        Returns:
+            Dict mapping diagram type to number of artifacts rendered
+        """
+        from apps.projects.models import Sprint
+
+        rendered = {}
+        for diagram_type in diagram_types:
+            if diagram_type not in PRERENDER_DIAGRAM_TYPES:
+                continue
+            try:
+                if diagram_type == "burndown":
+                    sprints = Sprint.objects.filter(project=project, status="active")
+                    for sprint in sprints:
+                        self.render(project, "burndown", sprint=sprint)
+                    rendered[diagram_type] = len(sprints)
+                else:
+                    self.render(project, diagram_type)
+                    rendered[diagram_type] = 1
+            except Exception as e:
+                logger.error(
+                    f"[PRERENDER] Failed to render {diagram_type} for project {project.id}: {e}",  # noqa: E501
+                    exc_info=True,
+                )
+        return rendered
+
+    def render(
+        self, project, diagram_type: str, sprint=None, formats=("svg", "png")
+    ) -> Dict:
+        """
+        Render and store the SVG artifact, plus PNG when cairosvg is installed.
+
+        Returns:
+            Dict with the SVG content, data version and render timings
+        """
+        version = self._get_version(project, diagram_type, sprint)
+
+        start_time = time.perf_counter()
+        svg_content = self._render_svg(project, diagram_type, sprint)
+        svg_ms = int((time.perf_counter() - start_time) * 1000)
+        self.record_render_timing(diagram_type, "svg", svg_ms)
+        self._store(project, diagram_type, sprint, version, "svg", svg_content)
+
+        result = {"svg": svg_content, "version": version, "svg_ms": svg_ms}
+
+        if "png" in formats:
+            try:
+                result["png"] = self._render_png(
+                    project, diagram_type, sprint, version, svg_content
+                )
+            except ImportError:
+                logger.debug("[PRERENDER] cairosvg not installed, skipping PNG")
+            except Exception as e:
+                logger.warning(
+                    f"[PRERENDER] PNG conversion failed for {diagram_type}: {e}"
+                )
+
+        logger.info(
+            f"[PRERENDER] Rendered {diagram_type} for project {project.id} "
+            f"(version {version}, svg {svg_ms}ms)"
+        )
+        return result
+
+    def get_artifact(self, project, diagram_type: str, fmt: str, sprint=None):
+        """Return the stored artifact for the current data version, or None."""
+        version = self._get_version(project, diagram_type, sprint)
+        return cache.get(
+            self._artifact_key(project, diagram_type, sprint, version, fmt)
+        )
+
+    def get_or_render(self, project, diagram_type: str, fmt: str, sprint=None) -> Dict:
+        """
+        Serve a stored artifact, rendering and storing it on a miss.
+
+        Raises:
+            ImportError: If PNG is requested and cairosvg is not installed
+        """
+        content = self.get_artifact(project, diagram_type, fmt, sprint)
+        if content is not None:
+            return {"content": content, "cached": True}
+
+        result = self.render(project, diagram_type, sprint, formats=("svg",))
+        if fmt == "svg":
+            return {"content": result["svg"], "cached": False}
+
+        content = self._render_png(
+            project, diagram_type, sprint, result["version"], result["svg"]
+        )
+        return {"content": content, "cached": False}
+
+    @staticmethod
+    def svg_to_png(svg_content: str) -> bytes:
+        import cairosvg
+
+        return cairosvg.svg2png(bytestring=svg_content.encode("utf-8"))
+
+    def _render_png(self, project, diagram_type, sprint, version, svg_content):
+        start_time = time.perf_counter()
+        png_data = self.svg_to_png(svg_content)
+        png_ms = int((time.perf_counter() - start_time) * 1000)
+        self.record_render_timing(diagram_type, "png", png_ms)
+        self._store(project, diagram_type, sprint, version, "png", png_data)
+        return png_data
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def record_render_timing(cls, diagram_type: str, fmt: str, elapsed_ms: int):
+        """Accumulate render timing stats for a diagram type and format."""
+        key = cls.METRICS_KEY.format(diagram_type=diagram_type, fmt=fmt)
+        try:
+            stats = cache.get(key) or {"count": 0, "total_ms": 0, "max_ms": 0}
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["last_ms"] = elapsed_ms
+            cache.set(key, stats, timeout=None)
+        except Exception as e:
+            logger.debug(f"[PRERENDER] Could not record render timing: {e}")
+
+    @classmethod
+    def get_render_metrics(cls) -> Dict:
+        """Return render timing stats keyed by diagram type, then format."""
+        metrics = {}
+        for diagram_type in PRERENDER_DIAGRAM_TYPES:
+            for fmt in ("svg", "png"):
+                key = cls.METRICS_KEY.format(diagram_type=diagram_type, fmt=fmt)
+                stats = cache.get(key)
+                if not stats:
+                    continue
+                stats["avg_ms"] = round(stats["total_ms"] / stats["count"], 2)
+                metrics.setdefault(diagram_type, {})[fmt] = stats
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _render_svg(self, project, diagram_type: str, sprint=None) -> str:
+        from .diagram_generators import (
+            generate_burndown_chart_svg,
+            generate_dependency_graph_svg,
+            generate_roadmap_timeline_svg,
+            generate_velocity_chart_svg,
+            generate_workflow_diagram_svg,
+        )
+
+        if diagram_type == "workflow":
+            return generate_workflow_diagram_svg(project)
+        if diagram_type == "dependency":
+            return generate_dependency_graph_svg(project)
+        if diagram_type == "roadmap":
+            return generate_roadmap_timeline_svg(project)
+        if diagram_type == "velocity":
+            return generate_velocity_chart_svg(project)
+        if diagram_type == "burndown":
+            if sprint is None:
+                raise ValueError("Burndown chart requires a sprint")
+            return generate_burndown_chart_svg(sprint)
+        raise ValueError(f"Diagram type '{diagram_type}' cannot be pre-rendered")
+
+    def _get_version(self, project, diagram_type: str, sprint=None) -> str:
+        # Project edits (e.g. a rename shown in diagram titles) do not go
+        # through schedule(), so the project's own timestamp is part of it
+        stamp = cache.get_or_set(
+            self.VERSION_KEY.format(project_id=project.id), 1, timeout=None
+        )
+        return f"{stamp}-{project.updated_at.timestamp():.0f}"
+
+    def _artifact_key(self, project, diagram_type, sprint, version, fmt) -> str:
+        return self.ARTIFACT_KEY.format(
+            project_id=project.id,
+            diagram_type=diagram_type,
+            scope=sprint.id if sprint else "project",
+            version=version,
+            fmt=fmt,
+        )
+
+    def _store(self, project, diagram_type, sprint, version, fmt, content):
+        key = self._artifact_key(project, diagram_type, sprint, version, fmt)
+        try:
+            cache.set(key, content, timeout=self.artifact_ttl)
+        except Exception as e:
+            logger.warning(f"[PRERENDER] Could not store {fmt} artifact: {e}")
@@ -466,21 +466,23 @@ class DiagramService:
             f"Cached {diagram_type} diagram with key {cache_key[:8]}... (TTL: {ttl_minutes}min)"  # noqa: E501
         )
 
-    def _get_data_version_hash(self, project, diagram_type: str) -> str:
+    def _get_data_version_hash(self, project, diagram_type: str, sprint=None) -> str:
         """
         Generate version hash based on relevant data timestamps.
         When data changes, hash changes, invalidating cache automatically.
 
         Args:
             project: Project instance
-            diagram_type: Type of diagram (workflow, dependency, roadmap)
+            diagram_type: Type of diagram (workflow, dependency, roadmap,
+                velocity, burndown)
+            sprint: Sprint instance (burndown only)
 
         Returns:
             MD5 hash of timestamps
         """
-        from django.db.models import Max
+        from django.db.models import Count, Max
 
-        from apps.projects.models import Issue, Sprint, WorkflowStatus
+        from apps.projects.models import Issue, IssueLink, Sprint, WorkflowStatus
 
         timestamps = []
 
@@ -496,22 +498,34 @@ class DiagramService:
             if status_updated:
                 timestamps.append(str(status_updated))
 
-        # Dependency and Roadmap: Issue changes
-        if diagram_type in ["dependency", "roadmap"]:
+        # Issue-driven diagrams: Issue changes
+        if diagram_type in ["dependency", "roadmap", "velocity", "burndown"]:
             issue_updated = Issue.objects.filter(
                 project=project, is_active=True
             ).aggregate(Max("updated_at"))["updated_at__max"]
             if issue_updated:
                 timestamps.append(str(issue_updated))
 
-        # Roadmap: Sprint changes
-        if diagram_type == "roadmap":
+        # Dependency: Link changes (links do not touch issue timestamps)
+        if diagram_type == "dependency":
+            link_stats = IssueLink.objects.filter(
+                source_issue__project=project
+            ).aggregate(count=Count("id"), latest=Max("created_at"))
+            timestamps.append(f"{link_stats['count']}:{link_stats['latest']}")
+
+        # Sprint-driven diagrams: Sprint changes
+        if diagram_type in ["roadmap", "velocity"]:
             sprint_updated = Sprint.objects.filter(project=project).aggregate(
                 Max("updated_at")
             )["updated_at__max"]
             if sprint_updated:
                 timestamps.append(str(sprint_updated))
 
+        # Burndown: Sprint changes plus the day, since it draws a "today" marker
+        if diagram_type == "burndown" and sprint is not None:
+            timestamps.append(f"{sprint.id}:{sprint.updated_at}")
+            timestamps.append(str(timezone.now().date()))
+
         # Generate hash from timestamps
         version_data = (
             "|".join(timestamps) if timestamps else str(timezone.now().date())
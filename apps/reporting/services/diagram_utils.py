@@ -5,6 +5,7 @@ Provides consistent color palette, typography, spacing, and shape constants
 following WCAG AA accessibility standards and modern UX/UI principles.
 """
 
+from functools import lru_cache
 from typing import Dict
 
 
@@ -423,26 +424,9 @@ def calculate_grid_points(min_val: float, max_val: float, num_lines: int = 5) ->
 # ============================================================================
 
 
-def estimate_text_width(text: str, font_size: int, font_family: str = "Arial") -> float:
-    """
-    Estimate text width in pixels for SVG rendering.
-
-    Uses character-based approximation since server-side SVG generation
-    cannot access browser text measurement APIs.
-
-    Args:
-        text: Text string to measure
-        font_size: Font size in pixels
-        font_family: Font family (affects character width)
-
-    Returns:
-        Estimated width in pixels (includes 20% safety buffer)
-    """
-    if not text:
-        return 0
-
-    # Character width multipliers (proportion of font_size)
-    char_widths = {
+# Character width multipliers (proportion of font_size) per font family
+FONT_CHAR_WIDTHS = {
+    "Arial": {
         # Narrow characters
         "i": 0.3,
         "l": 0.3,
@@ -521,17 +505,48 @@ def estimate_text_width(text: str, font_size: int, font_family: str = "Arial") -
         "(": 0.35,
         ")": 0.35,
     }
+}
+
+# Width for characters not in the table
+DEFAULT_CHAR_WIDTH = 0.55
+
+
+@lru_cache(maxsize=None)
+def _char_width_table(font_family: str) -> tuple:
+    """ASCII lookup table (indexed by code point) for a font family."""
+    widths = FONT_CHAR_WIDTHS.get(font_family, FONT_CHAR_WIDTHS["Arial"])
+    return tuple(widths.get(chr(code), DEFAULT_CHAR_WIDTH) for code in range(128))
+
+
+@lru_cache(maxsize=4096)
+def estimate_text_width(text: str, font_size: int, font_family: str = "Arial") -> float:
+    """
+    Estimate text width in pixels for SVG rendering.
+
+    Uses character-based approximation since server-side SVG generation
+    cannot access browser text measurement APIs. Widths come from a
+    precomputed per-font table and results are memoized per
+    (text, font_size, font_family), since diagrams measure the same labels
+    many times.
 
-    # Default width for characters not in map
-    default_width = 0.55
+    Args:
+        text: Text string to measure
+        font_size: Font size in pixels
+        font_family: Font family (affects character width)
 
-    total_width = 0
-    for char in text:
-        char_width = char_widths.get(char, default_width)
-        total_width += char_width * font_size
+    Returns:
+        Estimated width in pixels (includes 20% safety buffer)
+    """
+    if not text:
+        return 0
+
+    table = _char_width_table(font_family)
+    total_width = sum(
+        table[code] if code < 128 else DEFAULT_CHAR_WIDTH for code in map(ord, text)
+    )
 
     # Add 20% safety buffer for approximation errors
-    return total_width * 1.2
+    return total_width * font_size * 1.2
 
 
 def estimate_text_height(font_size: int, line_height: float = 1.2) -> float:
@@ -620,6 +635,53 @@ class BoundingBox:
         return f"BoundingBox({self.label}: x={self.x:.1f}, y={self.y:.1f}, w={self.width:.1f}, h={self.height:.1f})"  # noqa: E501
 
 
+class SpatialGrid:
+    """
+    Uniform grid index over bounding boxes for collision detection.
+
+    Each box is registered in every cell it touches, so an overlap check only
+    compares against boxes in neighbouring cells instead of every placed box.
+    Supports list-style append() so it can replace a plain list of boxes.
+    """
+
+    def __init__(self, cell_size: float = 120):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.boxes = []
+
+    def _cell_range(self, box: BoundingBox, margin: float = 0):
+        size = self.cell_size
+        x0 = int((box.left - margin) // size)
+        x1 = int((box.right + margin) // size)
+        y0 = int((box.top - margin) // size)
+        y1 = int((box.bottom + margin) // size)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def add(self, box: BoundingBox):
+        """Register a placed box."""
+        self.boxes.append(box)
+        for cell in self._cell_range(box):
+            self.cells.setdefault(cell, []).append(box)
+
+    append = add
+
+    def overlaps_any(self, box: BoundingBox, margin: float = 0) -> bool:
+        """Check if a box overlaps any registered box (with margin)."""
+        for cell in self._cell_range(box, margin):
+            for other in self.cells.get(cell, ()):
+                if box.overlaps(other, margin):
+                    return True
+        return False
+
+    def __iter__(self):
+        return iter(self.boxes)
+
+    def __len__(self):
+        return len(self.boxes)
+
+
 def find_non_overlapping_position(
     desired_x: float,
     desired_y: float,
@@ -639,17 +701,25 @@ def find_non_overlapping_position(
         desired_y: Desired Y position (center or top)
         width: Element width
         height: Element height
-        existing_boxes: List of BoundingBox objects already placed
+        existing_boxes: List of BoundingBox objects already placed, or a
+            SpatialGrid for large diagrams
         margin: Minimum spacing between elements
         max_attempts: Maximum position adjustment attempts
 
     Returns:
         Tuple of (x, y) for non-overlapping position, or original if can't find one
     """
+    if isinstance(existing_boxes, SpatialGrid):
+        collides = existing_boxes.overlaps_any
+    else:
+
+        def collides(test_box, margin):
+            return any(test_box.overlaps(box, margin) for box in existing_boxes)
+
     # Try the desired position first
     test_box = BoundingBox(desired_x - width / 2, desired_y - height / 2, width, height)
 
-    if not any(test_box.overlaps(box, margin) for box in existing_boxes):
+    if not collides(test_box, margin):
         return (desired_x, desired_y)
 
     # Try moving vertically (up then down)
@@ -663,7 +733,7 @@ def find_non_overlapping_position(
             desired_x - width / 2, test_y - height / 2, width, height
         )
 
-        if not any(test_box.overlaps(box, margin) for box in existing_boxes):
+        if not collides(test_box, margin):
             return (desired_x, test_y)
 
     # Try moving horizontally if vertical didn't work
@@ -677,7 +747,7 @@ def find_non_overlapping_position(
             test_x - width / 2, desired_y - height / 2, width, height
         )
 
-        if not any(test_box.overlaps(box, margin) for box in existing_boxes):
+        if not collides(test_box, margin):
             return (test_x, desired_y)
 
     # If all else fails, return original position
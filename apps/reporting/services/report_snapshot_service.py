@@ -0,0 +1,266 @@
+"""
+Scheduled report history with delta compression.
+
+Velocity, team metrics and CFD reports are captured per project on a
+schedule. Each series (project + report type) stores a full keyframe every
+REPORT_SNAPSHOT_KEYFRAME_INTERVAL snapshots and compact JSON deltas against
+the previous snapshot in between, so history costs a fraction of the full
+blobs and any snapshot can be rebuilt from at most one keyframe plus a
+bounded number of deltas, without touching live issue tables.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.reporting.models import ReportSnapshot
+
+from .analytics_service import AnalyticsService
+
+logger = logging.getLogger(__name__)
+
+# Report types captured by the scheduled snapshot task
+SCHEDULED_REPORT_TYPES = ("velocity", "team_metrics", "cfd")
+
+# Longest prefix of an old list searched when detecting a shifted window
+MAX_LIST_SHIFT = 64
+
+
+# ============================================================================
+# JSON DELTAS
+# ============================================================================
+#
+# A delta is always a dict:
+#   dicts: {"s": {key: new value}, "d": [removed keys], "p": {key: sub-delta}}
+#   lists: {"h": n, "t": [items]}          drop n leading items, append items
+#          {"l": [start, stop, [items]]}   replace old[start:stop] with items
+# Values whose type changes are replaced wholesale through "s".
+
+
+def compute_delta(old: Any, new: Any) -> Optional[Dict]:
+    """
+    Compute a delta turning old into new.
+
+    Returns:
+        Delta dict, or None if both values are equal
+    """
+    if old == new:
+        return None
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        delta: Dict[str, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                delta.setdefault("s", {})[key] = value
+                continue
+            sub_delta = _value_delta(old[key], value)
+            if sub_delta is None:
+                continue
+            if "=" in sub_delta:
+                delta.setdefault("s", {})[key] = sub_delta["="]
+            else:
+                delta.setdefault("p", {})[key] = sub_delta
+        removed = [key for key in old if key not in new]
+        if removed:
+            delta["d"] = removed
+        return delta
+
+    if isinstance(old, list) and isinstance(new, list):
+        return _list_delta(old, new)
+
+    return {"=": new}
+
+
+def apply_delta(old: Any, delta: Optional[Dict]) -> Any:
+    """Apply a delta produced by compute_delta() to old."""
+    if delta is None:
+        return old
+    if "=" in delta:
+        return delta["="]
+    if "h" in delta:
+        return old[delta["h"] :] + delta["t"]
+    if "l" in delta:
+        start, stop, items = delta["l"]
+        return old[:start] + items + old[stop:]
+
+    result = {key: value for key, value in old.items() if key not in delta.get("d", ())}
+    for key, sub_delta in delta.get("p", {}).items():
+        result[key] = apply_delta(old[key], sub_delta)
+    result.update(delta.get("s", {}))
+    return result
+
+
+def _value_delta(old: Any, new: Any) -> Optional[Dict]:
+    if old == new:
+        return None
+    if type(old) is not type(new) or not isinstance(old, (dict, list)):
+        return {"=": new}
+    return compute_delta(old, new)
+
+
+def _list_delta(old: List, new: List) -> Dict:
+    # Sliding windows (e.g. CFD dates) drop leading items and append new ones
+    if new:
+        for shift in range(1, min(len(old), MAX_LIST_SHIFT) + 1):
+            overlap = len(old) - shift
+            if overlap <= len(new) and old[shift:] == new[:overlap]:
+                return {"h": shift, "t": new[overlap:]}
+
+    # Otherwise replace only the changed middle section
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end_old, end_new = len(old), len(new)
+    while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+    return {"l": [start, end_old, new[start:end_new]]}
+
+
+# ============================================================================
+# SNAPSHOT SERVICE
+# ============================================================================
+
+
+class ReportSnapshotService:
+    """Capture and reconstruct scheduled report snapshots."""
+
+    DATA_CACHE_KEY = "report_snapshot_data:{snapshot_id}"
+
+    def __init__(self):
+        self.keyframe_interval = getattr(
+            settings, "REPORT_SNAPSHOT_KEYFRAME_INTERVAL", 10
+        )
+        self.cache_ttl = getattr(settings, "REPORT_SNAPSHOT_CACHE_TTL_SECONDS", 86400)
+
+    # ------------------------------------------------------------------
+    # Capture
+    # ------------------------------------------------------------------
+
+    def capture_project(self, project) -> Dict[str, ReportSnapshot]:
+        """Capture every scheduled report type for a project."""
+        analytics = AnalyticsService()
+        generators = {
+            "velocity": analytics.generate_velocity_chart,
+            "team_metrics": analytics.generate_team_metrics,
+            "cfd": analytics.generate_cumulative_flow_diagram,
+        }
+
+        snapshots = {}
+        for report_type in SCHEDULED_REPORT_TYPES:
+            try:
+                data = generators[report_type](project)
+                snapshots[report_type] = self.capture(project, report_type, data)
+            except Exception as e:
+                logger.error(
+                    f"[SNAPSHOT] Failed to capture {report_type} for project {project.id}: {e}",  # noqa: E501
+                    exc_info=True,
+                )
+        return snapshots
+
+    def capture(self, project, report_type: str, data: Dict) -> ReportSnapshot:
+        """
+        Store a scheduled snapshot, as a delta when the series allows it.
+
+        A keyframe is written for the first snapshot of a series, every
+        keyframe_interval snapshots, and whenever the delta would not be
+        smaller than the full report.
+        """
+        # Normalize to what the JSON column will hand back (str dates, etc.)
+        data = json.loads(json.dumps(data, default=str))
+
+        previous = self._series(project, report_type).order_by("-generated_at").first()
+
+        report_data, is_keyframe, chain_position = data, True, 0
+        if previous and previous.chain_position + 1 < self.keyframe_interval:
+            delta = compute_delta(self.get_data(previous), data) or {}
+            if len(json.dumps(delta)) < len(json.dumps(data)):
+                report_data = delta
+                is_keyframe = False
+                chain_position = previous.chain_position + 1
+
+        snapshot = ReportSnapshot.objects.create(
+            project=project,
+            report_type=report_type,
+            report_data=report_data,
+            source="scheduled",
+            is_keyframe=is_keyframe,
+            chain_position=chain_position,
+        )
+        self._cache_data(snapshot.id, data)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Reconstruction
+    # ------------------------------------------------------------------
+
+    def get_data(self, snapshot: ReportSnapshot) -> Dict:
+        """Return the full report data of a snapshot."""
+        if snapshot.is_keyframe:
+            return snapshot.report_data
+
+        cache_key = self.DATA_CACHE_KEY.format(snapshot_id=snapshot.id)
+        data = cache.get(cache_key)
+        if data is not None:
+            return data
+
+        # The keyframe and every delta up to this snapshot, newest first
+        chain = list(
+            self._series(snapshot.project_id, snapshot.report_type)
+            .filter(generated_at__lte=snapshot.generated_at)
+            .order_by("-generated_at")
+            .values_list("report_data", "is_keyframe")[: snapshot.chain_position + 1]
+        )
+        if not chain or not chain[-1][1]:
+            raise ValueError(f"Snapshot {snapshot.id} has no keyframe to rebuild from")
+
+        chain.reverse()
+        data = chain[0][0]
+        for delta, _is_keyframe in chain[1:]:
+            data = apply_delta(data, delta)
+
+        self._cache_data(snapshot.id, data)
+        return data
+
+    def get_snapshot_at(
+        self, project, report_type: str, at
+    ) -> Optional[ReportSnapshot]:
+        """Latest scheduled snapshot generated at or before the given time."""
+        return (
+            self._series(project, report_type)
+            .filter(generated_at__lte=at)
+            .order_by("-generated_at")
+            .first()
+        )
+
+    def get_timeline(self, project, report_type: str, limit: int = 100) -> List[Dict]:
+        """Snapshot metadata of a series, newest first, without report data."""
+        return list(
+            self._series(project, report_type)
+            .order_by("-generated_at")
+            .values("id", "generated_at", "is_keyframe")[:limit]
+        )
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _series(self, project, report_type: str):
+        project_id = getattr(project, "id", project)
+        return ReportSnapshot.objects.filter(
+            project_id=project_id, report_type=report_type, source="scheduled"
+        )
+
+    def _cache_data(self, snapshot_id, data: Dict):
+        try:
+            cache.set(
+                self.DATA_CACHE_KEY.format(snapshot_id=snapshot_id),
+                data,
+                timeout=self.cache_ttl,
+            )
+        except Exception as e:
+            logger.warning(f"[SNAPSHOT] Could not cache snapshot data: {e}")
@@ -2,12 +2,21 @@
 SVG Element Builder Utilities.
 
 Provides reusable functions for building SVG elements with consistent styling,
-following the design system defined in diagram_utils.py.
+following the design system defined in diagram_utils.py, plus SVGWriter for
+assembling whole documents in a single buffer.
 """
 
-from typing import List, Optional, Tuple
+import io
+import uuid
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
-from .diagram_utils import DesignSystem, escape_svg_text, truncate_text, wrap_text
+from .diagram_utils import (
+    DesignSystem,
+    escape_svg_text,
+    estimate_text_width,
+    truncate_text,
+    wrap_text,
+)
 
 # ============================================================================
 # CORE SVG STRUCTURE
@@ -379,6 +388,27 @@ def create_arrow(
     Returns:
         SVG line or path element with arrow marker
     """
+    marker, stroke, path = _arrow_geometry(x1, y1, x2, y2, curve, arrow_type, stroke)
+
+    if path:
+        return (
+            f'<path d="{path}" fill="none" stroke="{stroke}" '
+            f'stroke-width="{width}" marker-end="url(#{marker})"/>'
+        )
+    else:
+        # Straight line
+        return create_line(
+            x1, y1, x2, y2, stroke=stroke, width=width, marker_end=marker
+        )
+
+
+def _arrow_geometry(x1, y1, x2, y2, curve, arrow_type, stroke):
+    """
+    Resolve marker, stroke color and bezier path for an arrow.
+
+    Returns:
+        Tuple of (marker id, stroke color, path data or None for a straight line)
+    """
     ds = DesignSystem
 
     # Determine marker and color based on type
@@ -395,17 +425,9 @@ def create_arrow(
         mid_x = (x1 + x2) / 2
         control_offset = abs(y2 - y1) * 0.3
         control_y = min(y1, y2) - control_offset
+        return marker, stroke, f"M{x1},{y1} Q{mid_x},{control_y} {x2},{y2}"
 
-        path = f"M{x1},{y1} Q{mid_x},{control_y} {x2},{y2}"
-        return (
-            f'<path d="{path}" fill="none" stroke="{stroke}" '
-            f'stroke-width="{width}" marker-end="url(#{marker})"/>'
-        )
-    else:
-        # Straight line
-        return create_line(
-            x1, y1, x2, y2, stroke=stroke, width=width, marker_end=marker
-        )
+    return marker, stroke, None
 
 
 def create_path(
@@ -864,3 +886,305 @@ def create_axes(
 
     parts.append("</g>")
     return "\n".join(parts)
+
+
+# ============================================================================
+# STREAMING WRITER
+# ============================================================================
+
+
+class SVGWriter:
+    """
+    Incremental SVG document writer.
+
+    Elements are appended to a single buffer instead of building one string
+    per element and joining them at the end. Presentation attributes shared
+    by many elements (fill, stroke, font settings) are emitted once as CSS
+    classes in a <style> block, which keeps large diagrams small. Class names
+    carry a per-document prefix and the text rule is scoped to the <svg> id,
+    so several diagrams inlined in one page do not restyle each other.
+
+    Usage:
+        svg = SVGWriter(1200, 800)
+        svg.write(create_svg_defs())
+        svg.rect(0, 0, 1200, 800, fill="#FFFFFF")
+        svg.text(600, 40, "Title", size=18, anchor="middle")
+        content = svg.getvalue()  # or: StreamingHttpResponse(svg.iter_chunks())
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        view_box: Optional[str] = None,
+        style: str = "shape-rendering: crispEdges; text-rendering: optimizeLegibility;",  # noqa: E501
+    ):
+        self.width = width
+        self.height = height
+        self.view_box = view_box or f"0 0 {width} {height}"
+        self.style = style
+        self.doc_id = f"d{uuid.uuid4().hex[:8]}"
+        self._body = io.StringIO()
+        self._classes: Dict[str, str] = {}
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield the document in chunks, suitable for a streaming response."""
+        yield self._opening_tag()
+        yield self._stylesheet()
+        body = self._body.getvalue()
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+        yield close_svg()
+
+    def write_to(self, stream: TextIO):
+        """Write the whole document to a file-like object."""
+        for chunk in self.iter_chunks():
+            stream.write(chunk)
+
+    def getvalue(self) -> str:
+        return (
+            self._opening_tag()
+            + self._stylesheet()
+            + self._body.getvalue()
+            + close_svg()
+        )
+
+    # ------------------------------------------------------------------
+    # Elements
+    # ------------------------------------------------------------------
+
+    def write(self, markup: str):
+        """Append pre-built markup (e.g. from the create_* helpers)."""
+        self._body.write(markup)
+        self._body.write("\n")
+
+    def rect(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        fill: str,
+        stroke: Optional[str] = None,
+        stroke_width: int = 2,
+        radius: int = 6,
+        opacity: float = 1.0,
+        shadow: bool = False,
+    ):
+        """Append a rectangle (see create_rect)."""
+        declarations = f"fill:{fill};opacity:{opacity}"
+        if stroke:
+            declarations += f";stroke:{stroke};stroke-width:{stroke_width}"
+        filter_attr = ' filter="url(#shadow)"' if shadow else ""
+        self._body.write(
+            f'<rect x="{x}" y="{y}" width="{width}" height="{height}" '
+            f'rx="{radius}" class="{self._class_for(declarations)}"{filter_attr}/>\n'
+        )
+
+    def circle(
+        self,
+        cx: float,
+        cy: float,
+        r: float,
+        fill: str,
+        stroke: Optional[str] = None,
+        stroke_width: int = 2,
+    ):
+        """Append a circle (see create_circle)."""
+        declarations = f"fill:{fill}"
+        if stroke:
+            declarations += f";stroke:{stroke};stroke-width:{stroke_width}"
+        self._body.write(
+            f'<circle cx="{cx}" cy="{cy}" r="{r}" '
+            f'class="{self._class_for(declarations)}"/>\n'
+        )
+
+    def text(
+        self,
+        x: float,
+        y: float,
+        text: str,
+        size: int = 12,
+        fill: Optional[str] = None,
+        anchor: str = "start",
+        weight: str = "normal",
+        truncate_at: Optional[int] = None,
+    ):
+        """Append a text element (see create_text)."""
+        fill = fill or DesignSystem.COLORS["text_primary"]
+        if truncate_at:
+            text = truncate_text(text, truncate_at)
+
+        declarations = (
+            f"font-size:{size}px;fill:{fill};"
+            f"text-anchor:{anchor};font-weight:{weight}"
+        )
+        self._body.write(
+            f'<text x="{x}" y="{y}" class="{self._class_for(declarations)}">'
+            f"{escape_svg_text(text)}</text>\n"
+        )
+
+    def text_with_background(
+        self,
+        x: float,
+        y: float,
+        text: str,
+        size: int = 12,
+        fill: Optional[str] = None,
+        anchor: str = "middle",
+        weight: str = "normal",
+        bg_fill: str = "#FFFFFF",
+        bg_opacity: float = 0.9,
+        padding: int = 4,
+        truncate_at: Optional[int] = None,
+    ):
+        """Append text over a background box (see create_text_with_background)."""
+        if truncate_at:
+            text = truncate_text(text, truncate_at)
+
+        bg_width = estimate_text_width(text, size) + (padding * 2)
+        bg_height = size + (padding * 2)
+        if anchor == "middle":
+            bg_x = x - bg_width / 2
+        elif anchor == "end":
+            bg_x = x - bg_width
+        else:  # start
+            bg_x = x
+
+        self.rect(
+            bg_x,
+            y - size + (padding / 2),
+            bg_width,
+            bg_height,
+            fill=bg_fill,
+            radius=3,
+            opacity=bg_opacity,
+        )
+        self.text(x, y, text, size=size, fill=fill, anchor=anchor, weight=weight)
+
+    def line(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        stroke: Optional[str] = None,
+        width: int = 2,
+        dashed: bool = False,
+        marker_end: Optional[str] = None,
+        opacity: float = 1.0,
+    ):
+        """Append a line (see create_line)."""
+        stroke = stroke or DesignSystem.COLORS["border"]
+        declarations = f"stroke:{stroke};stroke-width:{width};opacity:{opacity}"
+        if dashed:
+            declarations += f";stroke-dasharray:{DesignSystem.CHART['grid_line_dash']}"
+        marker_attr = f' marker-end="url(#{marker_end})"' if marker_end else ""
+        self._body.write(
+            f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+            f'class="{self._class_for(declarations)}"{marker_attr}/>\n'
+        )
+
+    def arrow(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        curve: bool = True,
+        arrow_type: str = "default",
+        stroke: Optional[str] = None,
+        width: int = 2,
+    ):
+        """Append an arrow (see create_arrow)."""
+        marker, stroke, path = _arrow_geometry(
+            x1, y1, x2, y2, curve, arrow_type, stroke
+        )
+        if not path:
+            self.line(x1, y1, x2, y2, stroke=stroke, width=width, marker_end=marker)
+            return
+
+        declarations = f"fill:none;stroke:{stroke};stroke-width:{width}"
+        self._body.write(
+            f'<path d="{path}" class="{self._class_for(declarations)}" '
+            f'marker-end="url(#{marker})"/>\n'
+        )
+
+    def title(self, text: str, x: float, y: float, subtitle: Optional[str] = None):
+        """Append a diagram title (see create_title)."""
+        ds = DesignSystem
+        self.text(
+            x, y, text, size=ds.FONTS["size_title"], anchor="middle", weight="bold"
+        )
+        if subtitle:
+            self.text(
+                x,
+                y + 20,
+                subtitle,
+                size=ds.FONTS["size_small"],
+                fill=ds.COLORS["text_secondary"],
+                anchor="middle",
+            )
+
+    def legend(
+        self, x: float, y: float, items: List[Tuple[str, str]], title: str = "Legend"
+    ):
+        """Append a legend box (see create_legend)."""
+        ds = DesignSystem
+        height = 30 + (len(items) * 25)
+
+        self._body.write("<g>\n")
+        self.rect(
+            x,
+            y,
+            ds.LAYOUT["chart_legend_width"],
+            height,
+            fill=ds.COLORS["bg_primary"],
+            stroke=ds.COLORS["border"],
+        )
+        self.text(x + 10, y + 20, title, size=ds.FONTS["size_small"], weight="bold")
+
+        for i, (label, color) in enumerate(items):
+            item_y = y + 40 + (i * 25)
+            self.rect(
+                x + 10,
+                item_y - 8,
+                16,
+                16,
+                fill=color,
+                stroke=ds.COLORS["border"],
+                radius=3,
+            )
+            self.text(
+                x + 32, item_y + 4, label, size=ds.FONTS["size_small"], truncate_at=18
+            )
+        self._body.write("</g>\n")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _class_for(self, declarations: str) -> str:
+        """Return the CSS class for a style declaration, registering it once."""
+        name = self._classes.get(declarations)
+        if name is None:
+            name = self._classes[declarations] = f"{self.doc_id}-s{len(self._classes)}"
+        return name
+
+    def _opening_tag(self) -> str:
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" id="{self.doc_id}" '
+            f'width="{self.width}" height="{self.height}" '
+            f'viewBox="{self.view_box}" style="{self.style}">\n'
+        )
+
+    def _stylesheet(self) -> str:
+        rules = [f"#{self.doc_id} text{{font-family:{DesignSystem.FONTS['family']}}}"]
+        rules.extend(
+            f".{name}{{{declarations}}}" for declarations, name in self._classes.items()
+        )
+        return "<style>\n" + "\n".join(rules) + "\n</style>\n"
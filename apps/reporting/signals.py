@@ -17,15 +17,25 @@ import logging
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db import IntegrityError
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from apps.projects.models import Board, Issue, Project, Sprint
+from apps.projects.models import (
+    Board,
+    Issue,
+    IssueLink,
+    Project,
+    Sprint,
+    WorkflowStatus,
+    WorkflowTransition,
+)
 from apps.workspaces.models import Workspace
 
 from .middleware import get_current_request, get_current_user
 from .models import ActivityLog
+from .services.dependency_analysis_service import DependencyAnalysisService
+from .services.diagram_prerender_service import DiagramPrerenderService
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -215,6 +225,69 @@ def create_activity_log(user, action_type, obj, changes=None, request=None):
         logger.error(f"[ACTIVITY] Failed to create activity log: {e}", exc_info=True)
 
 
+def create_activity_logs(user, entries, request=None):
+    """
+    Bulk variant of create_activity_log for objects changed together.
+
+    Used by bulk updates, which bypass post_save. Applies the same
+    anti-duplication per object and action with one cache round trip and
+    inserts all rows at once. Never blocks the main operation.
+
+    Args:
+        user: User performing the action
+        entries: List of (action_type, obj, changes) for issues, boards or
+            sprints with project and project.workspace loaded
+        request: HTTP request (optional)
+    """
+    try:
+        if not entries:
+            return
+
+        cache_keys = [
+            f"activity_log_{obj._meta.model_name}_{obj.id}_{action_type}"
+            for action_type, obj, _ in entries
+        ]
+        try:
+            recent = cache.get_many(cache_keys)
+            cache.set_many({key: True for key in cache_keys}, 60)
+        except Exception as e:
+            logger.warning(f"[ACTIVITY] Cache unavailable for deduplication: {e}")
+            recent = {}
+
+        content_type = ContentType.objects.get_for_model(entries[0][1])
+        ip_address = get_client_ip(request) if request else None
+
+        logs = []
+        for cache_key, (action_type, obj, changes) in zip(cache_keys, entries):
+            if cache_key in recent:
+                continue
+            actor = user or get_actor(obj)
+            if not actor:
+                continue
+            project = obj.project
+            workspace = project.workspace if project else None
+            logs.append(
+                ActivityLog(
+                    user=actor,
+                    action_type=action_type,
+                    content_type=content_type,
+                    object_id=str(obj.id),
+                    object_repr=str(obj),
+                    project=project,
+                    workspace=workspace,
+                    organization_id=workspace.organization_id if workspace else None,
+                    changes=changes or {},
+                    ip_address=ip_address,
+                )
+            )
+        # Savepoint: a failed insert must not break the caller's transaction
+        with transaction.atomic():
+            ActivityLog.objects.bulk_create(logs)
+
+    except Exception as e:
+        logger.error(f"[ACTIVITY] Failed to create activity logs: {e}", exc_info=True)
+
+
 # ============================================================================
 # BOARD SIGNALS
 # ============================================================================
@@ -255,21 +328,6 @@ def log_board_delete(sender, instance, **kwargs):
 # ============================================================================
 
 
-@receiver(pre_save, sender=Sprint)
-def store_sprint_old_values_for_activity(sender, instance, **kwargs):
-    """Store old values before save to detect status transitions."""
-    if instance.pk:
-        try:
-            old_instance = Sprint.objects.get(pk=instance.pk)
-            instance._old_activity_values = {
-                "status": old_instance.status,
-            }
-        except Sprint.DoesNotExist:
-            instance._old_activity_values = {}
-    else:
-        instance._old_activity_values = {}
-
-
 @receiver(post_save, sender=Sprint)
 def log_sprint_activity(sender, instance, created, **kwargs):
     """Log Sprint create/update with status transition detection."""
@@ -282,24 +340,24 @@ def log_sprint_activity(sender, instance, created, **kwargs):
             request=get_current_request(),
         )
     else:
-        # Check for status transitions
-        if hasattr(instance, "_old_activity_values"):
-            old_status = instance._old_activity_values.get("status")
+        # Check for status transitions (diff collected by Sprint.save)
+        changes = getattr(instance, "changes", None)
+        if changes and changes.has_changed("status"):
+            old_status = changes.old("status")
             new_status = instance.status
 
-            if old_status != new_status:
-                # Log status transition
-                create_activity_log(
-                    user=None,
-                    action_type="transitioned",
-                    obj=instance,
-                    changes={
-                        "field": "status",
-                        "old_value": old_status,
-                        "new_value": new_status,
-                    },
-                    request=get_current_request(),
-                )
+            # Log status transition
+            create_activity_log(
+                user=None,
+                action_type="transitioned",
+                obj=instance,
+                changes={
+                    "field": "status",
+                    "old_value": old_status,
+                    "new_value": new_status,
+                },
+                request=get_current_request(),
+            )
 
         # Log general update
         create_activity_log(
@@ -327,24 +385,6 @@ def log_sprint_delete(sender, instance, **kwargs):
 # ============================================================================
 
 
-@receiver(pre_save, sender=Issue)
-def store_issue_old_values_for_activity(sender, instance, **kwargs):
-    """Store old values before save to detect field changes."""
-    if instance.pk:
-        try:
-            old_instance = Issue.objects.get(pk=instance.pk)
-            instance._old_activity_values = {
-                "status_id": old_instance.status_id,
-                "assignee_id": old_instance.assignee_id,
-                "priority": old_instance.priority,
-                "sprint_id": old_instance.sprint_id,
-            }
-        except Issue.DoesNotExist:
-            instance._old_activity_values = {}
-    else:
-        instance._old_activity_values = {}
-
-
 @receiver(post_save, sender=Issue)
 def log_issue_activity(sender, instance, created, **kwargs):
     """Log Issue create/update with detailed field change detection."""
@@ -357,13 +397,12 @@ def log_issue_activity(sender, instance, created, **kwargs):
             request=get_current_request(),
         )
     else:
-        # Detect and log specific field changes
-        if hasattr(instance, "_old_activity_values"):
-            old_values = instance._old_activity_values
-
+        # Detect and log specific field changes (diff collected by Issue.save)
+        changes = getattr(instance, "changes", None)
+        if changes:
             # Status change
-            if old_values.get("status_id") != instance.status_id:
-                old_status = old_values.get("status_id")
+            if changes.has_changed("status_id"):
+                old_status = changes.old("status_id")
                 try:
                     from apps.projects.models import WorkflowStatus
 
@@ -392,8 +431,8 @@ def log_issue_activity(sender, instance, created, **kwargs):
                 )
 
             # Assignee change
-            if old_values.get("assignee_id") != instance.assignee_id:
-                old_assignee = old_values.get("assignee_id")
+            if changes.has_changed("assignee_id"):
+                old_assignee = changes.old("assignee_id")
                 try:
                     from django.contrib.auth import get_user_model
 
@@ -425,8 +464,8 @@ def log_issue_activity(sender, instance, created, **kwargs):
                 )
 
             # Sprint change
-            if old_values.get("sprint_id") != instance.sprint_id:
-                if instance.sprint_id and not old_values.get("sprint_id"):
+            if changes.has_changed("sprint_id"):
+                if instance.sprint_id and not changes.old("sprint_id"):
                     # Added to sprint
                     create_activity_log(
                         user=None,
@@ -440,7 +479,7 @@ def log_issue_activity(sender, instance, created, **kwargs):
                         },
                         request=get_current_request(),
                     )
-                elif not instance.sprint_id and old_values.get("sprint_id"):
+                elif not instance.sprint_id and changes.old("sprint_id"):
                     # Removed from sprint
                     create_activity_log(
                         user=None,
@@ -539,3 +578,74 @@ def log_workspace_delete(sender, instance, **kwargs):
         )
     except Exception as e:
         logger.error(f"[SIGNAL] Workspace deletion logging failed: {e}")
+
+
+# ============================================================================
+# DIAGRAM PRE-RENDER SIGNALS
+# ============================================================================
+
+# Diagram types affected by changes to each model
+PRERENDER_TRIGGERS = {
+    Issue: ("workflow", "dependency", "roadmap", "velocity", "burndown"),
+    Sprint: ("roadmap", "velocity", "burndown"),
+    IssueLink: ("dependency",),
+    WorkflowStatus: ("workflow",),
+    WorkflowTransition: ("workflow",),
+}
+
+
+def schedule_diagram_prerender(sender, instance, **kwargs):
+    """Schedule a debounced re-render of diagrams affected by this change."""
+    try:
+        if isinstance(instance, IssueLink):
+            project_id = instance.source_issue.project_id
+        else:
+            project_id = instance.project_id
+
+        DiagramPrerenderService.schedule(project_id, PRERENDER_TRIGGERS[sender])
+    except Exception as e:
+        logger.error(f"[SIGNAL] Diagram pre-render scheduling failed: {e}")
+
+
+for _model in PRERENDER_TRIGGERS:
+    post_save.connect(
+        schedule_diagram_prerender,
+        sender=_model,
+        dispatch_uid=f"prerender_diagrams_save_{_model.__name__}",
+    )
+    post_delete.connect(
+        schedule_diagram_prerender,
+        sender=_model,
+        dispatch_uid=f"prerender_diagrams_delete_{_model.__name__}",
+    )
+
+
+# ============================================================================
+# DEPENDENCY GRAPH CACHE SIGNALS
+# ============================================================================
+
+
+def invalidate_dependency_graph(sender, instance, **kwargs):
+    """Drop the cached dependency graph of the project this change belongs to."""
+    try:
+        if isinstance(instance, IssueLink):
+            project_id = instance.source_issue.project_id
+        else:
+            project_id = instance.project_id
+
+        DependencyAnalysisService.invalidate(project_id)
+    except Exception as e:
+        logger.error(f"[SIGNAL] Dependency graph invalidation failed: {e}")
+
+
+for _model in (Issue, IssueLink):
+    post_save.connect(
+        invalidate_dependency_graph,
+        sender=_model,
+        dispatch_uid=f"invalidate_dependency_graph_save_{_model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_dependency_graph,
+        sender=_model,
+        dispatch_uid=f"invalidate_dependency_graph_delete_{_model.__name__}",
+    )
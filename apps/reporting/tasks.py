@@ -0,0 +1,81 @@
+"""
+Celery tasks for reporting app.
+
+Background rendering of diagram artifacts and scheduled report snapshots.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="apps.reporting.tasks.prerender_project_diagrams")
+def prerender_project_diagrams(self, project_id, diagram_types=None):
+    """
+    Re-render SVG/PNG artifacts for a project after its data changed.
+
+    Scheduled by DiagramPrerenderService.schedule() with a debounce delay; the
+    diagram types to render are taken from the project's pending set unless
+    given explicitly.
+
+    Args:
+        project_id: Project UUID
+        diagram_types: Optional list of diagram types to render
+
+    Returns:
+        dict: Number of artifacts rendered per diagram type
+    """
+    from apps.projects.models import Project
+    from apps.reporting.services.diagram_prerender_service import (
+        DiagramPrerenderService,
+    )
+
+    pending = DiagramPrerenderService.pop_pending(project_id)
+    diagram_types = diagram_types or pending
+
+    if not diagram_types:
+        logger.debug(f"No pending diagram renders for project {project_id}")
+        return {}
+
+    try:
+        project = Project.objects.get(id=project_id)
+    except Project.DoesNotExist:
+        logger.warning(f"Project {project_id} not found, skipping pre-render")
+        return {}
+
+    rendered = DiagramPrerenderService().render_project(project, diagram_types)
+    logger.info(f"Pre-rendered diagrams for project {project_id}: {rendered}")
+    return rendered
+
+
+@shared_task(bind=True, name="apps.reporting.tasks.capture_report_snapshots")
+def capture_report_snapshots(self):
+    """
+    Capture velocity, team metrics and CFD snapshots for every open project.
+
+    Snapshots are stored as deltas against the previous capture with periodic
+    keyframes (see ReportSnapshotService).
+
+    Returns:
+        dict: Number of projects processed and snapshots stored
+    """
+    from apps.projects.models import Project
+    from apps.reporting.services.report_snapshot_service import ReportSnapshotService
+
+    service = ReportSnapshotService()
+    projects = Project.objects.filter(
+        is_active=True, status__in=["planning", "active", "on_hold"]
+    )
+
+    project_count = 0
+    snapshot_count = 0
+    for project in projects.iterator():
+        snapshot_count += len(service.capture_project(project))
+        project_count += 1
+
+    logger.info(
+        f"Captured {snapshot_count} report snapshots for {project_count} projects"
+    )
+    return {"projects": project_count, "snapshots": snapshot_count}
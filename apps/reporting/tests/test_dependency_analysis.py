@@ -0,0 +1,200 @@
+"""
+Tests for dependency analysis (critical path, cycles, blocking chains).
+"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.tests.factories import (
+    IssueFactory,
+    IssueLinkFactory,
+    ProjectFactory,
+    ProjectTeamMemberFactory,
+    WorkflowStatusFactory,
+)
+from apps.reporting.services.dependency_analysis_service import (
+    DependencyAnalysisService,
+)
+from apps.reporting.services.dependency_graph import (
+    DependencyGraph,
+    longest_weighted_path,
+    strongly_connected_components,
+    topological_order,
+    transitive_predecessors,
+)
+
+
+class TestDependencyAlgorithms:
+    def test_longest_weighted_path_prefers_heavier_chain(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b", "c", "d"],
+            [("a", "b", "blocks"), ("b", "d", "blocks"), ("c", "d", "blocks")],
+        )
+        order, _ = topological_order(graph)
+
+        path, total = longest_weighted_path(graph, order, [1, 2, 8, 1])
+
+        assert path == [2, 3]
+        assert total == 9
+
+    def test_cycles_are_reported_as_components(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b", "c", "d"],
+            [("a", "b", "blocks"), ("b", "c", "blocks"), ("c", "a", "blocks")],
+        )
+
+        cycles = strongly_connected_components(graph)
+
+        assert [sorted(cycle) for cycle in cycles] == [[0, 1, 2]]
+
+    def test_transitive_predecessors_track_depth(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b", "c"],
+            [("a", "b", "blocks"), ("c", "b", "dependency_of"), ("b", "c", "blocks")],
+        )
+
+        assert transitive_predecessors(graph, 2) == {1: 1, 0: 2}
+
+
+@pytest.mark.django_db
+class TestDependencyAnalysisService:
+    def setup_method(self):
+        cache.clear()
+        self.service = DependencyAnalysisService()
+        self.project = ProjectFactory()
+        self.open_status = WorkflowStatusFactory(
+            project=self.project, category="in_progress"
+        )
+        self.done_status = WorkflowStatusFactory(project=self.project, category="done")
+
+    def _issue(self, story_points, status=None):
+        return IssueFactory(
+            project=self.project,
+            status=status or self.open_status,
+            story_points=story_points,
+        )
+
+    def _link(self, source, target, link_type="blocks"):
+        return IssueLinkFactory(
+            source_issue=source, target_issue=target, link_type=link_type
+        )
+
+    def test_critical_path_follows_remaining_story_points(self):
+        design, backend, frontend, release = (
+            self._issue(3),
+            self._issue(8),
+            self._issue(2),
+            self._issue(1),
+        )
+        self._link(design, backend)
+        self._link(design, frontend)
+        self._link(release, backend, link_type="depends_on")
+        self._link(release, frontend, link_type="depends_on")
+
+        analysis = self.service.analyze(self.project)
+
+        path = analysis["critical_path"]
+        assert [issue["key"] for issue in path["issues"]] == [
+            design.key,
+            backend.key,
+            release.key,
+        ]
+        assert path["total_weight"] == 12
+        assert analysis["has_cycles"] is False
+
+    def test_done_issues_do_not_count_unless_requested(self):
+        first = self._issue(5, status=self.done_status)
+        second = self._issue(2)
+        self._link(first, second)
+
+        remaining = self.service.analyze(self.project)
+        total = self.service.analyze(self.project, include_done=True)
+
+        assert remaining["critical_path"]["total_weight"] == 2
+        assert total["critical_path"]["total_weight"] == 7
+
+    def test_invalid_weight_field_is_rejected(self):
+        with pytest.raises(ValueError):
+            self.service.analyze(self.project, weight_field="priority")
+
+    def test_blocking_chain_is_transitive(self):
+        root, middle, leaf = (
+            self._issue(1, status=self.done_status),
+            self._issue(1),
+            self._issue(1),
+        )
+        self._link(root, middle)
+        self._link(middle, leaf)
+
+        chain = self.service.get_blocking_chain(leaf)
+
+        assert [(b["key"], b["depth"]) for b in chain["blockers"]] == [
+            (middle.key, 1),
+            (root.key, 2),
+        ]
+        assert chain["unresolved_count"] == 1
+
+    def test_graph_is_cached_until_links_change(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        first, second = self._issue(1), self._issue(1)
+        self.service.analyze(self.project)
+
+        with django_assert_num_queries(0):
+            self.service.analyze(self.project)
+
+        # The cached graph is only dropped once the link is committed
+        with django_capture_on_commit_callbacks() as callbacks:
+            self._link(first, second)
+            assert self.service.analyze(self.project)["dependency_count"] == 0
+        for callback in callbacks:
+            callback()
+
+        analysis = self.service.analyze(self.project)
+        assert analysis["dependency_count"] == 1
+
+
+@pytest.mark.django_db
+class TestDependencyAnalysisEndpoints:
+    def setup_method(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+
+    def test_dependency_analysis_endpoint(self, api_client):
+        api_client.force_authenticate(user=self.user)
+        blocker = IssueFactory(project=self.project)
+        IssueLinkFactory(source_issue=blocker, link_type="blocks")
+
+        response = api_client.get(
+            reverse("report-dependency-analysis"), {"project": str(self.project.id)}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["dependency_count"] == 1
+        assert "critical_path" in response.data
+
+    def test_dependency_analysis_rejects_unknown_weight(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(
+            reverse("report-dependency-analysis"),
+            {"project": str(self.project.id), "weight": "priority"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_blocking_chain_requires_project_access(self, api_client):
+        api_client.force_authenticate(user=UserFactory())
+        issue = IssueFactory(project=self.project)
+
+        response = api_client.get(
+            reverse("report-blocking-chain"), {"issue": str(issue.id)}
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
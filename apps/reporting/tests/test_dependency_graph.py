@@ -0,0 +1,153 @@
+"""
+Tests for the dependency graph engine.
+"""
+
+import random
+import time
+
+from django.test import override_settings
+
+import pytest
+
+from apps.projects.tests.factories import IssueFactory, IssueLinkFactory, ProjectFactory
+from apps.reporting.services.dependency_graph import (
+    KIND_BLOCKS,
+    DependencyGraph,
+    assign_layers,
+    cluster_nodes,
+    layered_layout,
+    topological_order,
+)
+from apps.reporting.services.diagram_data_service import DiagramDataService
+from apps.reporting.services.diagram_generators import generate_dependency_graph_svg
+
+
+class TestDependencyGraph:
+    def test_links_point_from_prerequisite_to_dependent(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b", "c"],
+            [("a", "b", "blocks"), ("c", "b", "depends_on")],
+        )
+
+        assert list(graph.successors(0)) == [1]
+        assert list(graph.successors(1)) == [2]
+
+    def test_reciprocal_links_collapse_into_one_edge(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b"],
+            [("a", "b", "blocks"), ("b", "a", "blocked_by")],
+        )
+
+        assert graph.edge_count == 1
+        assert graph.kinds[0] == KIND_BLOCKS
+
+    def test_links_outside_node_set_are_ignored(self):
+        graph = DependencyGraph.from_links(["a"], [("a", "z", "blocks")])
+
+        assert graph.edge_count == 0
+
+    def test_layers_follow_dependency_chain(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b", "c", "d"],
+            [("a", "b", "blocks"), ("b", "c", "blocks"), ("a", "d", "relates_to")],
+        )
+
+        layout = layered_layout(graph, 100, 50, 150, 50)
+
+        assert list(layout.layers) == [0, 1, 2, 0]
+        assert layout.y[0] < layout.y[1] < layout.y[2]
+
+    def test_cycles_are_broken(self):
+        graph = DependencyGraph.from_links(
+            ["a", "b", "c"],
+            [("a", "b", "blocks"), ("b", "c", "blocks"), ("c", "a", "blocks")],
+        )
+
+        order, reversed_edges = topological_order(graph)
+
+        assert sorted(order) == [0, 1, 2]
+        assert reversed_edges == 1
+
+    def test_wide_layers_wrap_without_overlap(self):
+        graph = DependencyGraph(25, [])
+
+        layout = layered_layout(graph, 100, 50, 150, 50, max_row_width=10)
+
+        positions = set(zip(layout.x, layout.y))
+        assert len(positions) == 25
+        assert len(layout.rows) == 3
+
+    def test_clustering_respects_budget(self):
+        rng = random.Random(1)
+        links = [(rng.randrange(i), i, "blocks") for i in range(1, 2000)]
+        graph = DependencyGraph.from_links(list(range(2000)), links)
+        order, _ = topological_order(graph)
+        categories = [rng.choice(["todo", "in_progress", "done"]) for _ in range(2000)]
+
+        cluster_of, cluster_keys = cluster_nodes(
+            graph, assign_layers(graph, order), categories, max_clusters=60
+        )
+
+        assert len(cluster_keys) <= 60
+        assert len(cluster_of) == 2000
+
+    @pytest.mark.slow
+    def test_large_graph_layout_is_bounded(self):
+        rng = random.Random(2)
+        links = [
+            (rng.randrange(max(0, i - 200), i), i, "depends_on")
+            for i in range(1, 10000)
+            for _ in range(2)
+        ]
+
+        start = time.perf_counter()
+        graph = DependencyGraph.from_links(list(range(10000)), links)
+        layered_layout(graph, 220, 100, 280, 140)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 5
+
+
+@pytest.mark.django_db
+class TestDependencyDiagrams:
+    def setup_method(self):
+        self.project = ProjectFactory()
+
+    def test_data_includes_more_than_100_issues(self):
+        IssueFactory.create_batch(105, project=self.project)
+
+        data = DiagramDataService().get_dependency_data(self.project)
+
+        assert data["metadata"]["issue_count"] == 105
+        assert len(data["nodes"]) == 105
+        assert {"x", "y", "layer"} <= set(data["nodes"][0])
+
+    def test_data_edges_use_loaded_links(self):
+        link = IssueLinkFactory(
+            source_issue=IssueFactory(project=self.project), link_type="blocks"
+        )
+
+        data = DiagramDataService().get_dependency_data(self.project)
+
+        assert data["edges"][0]["source"] == f"issue-{link.source_issue_id}"
+        assert data["edges"][0]["type"] == "blocks"
+        layers = {node["id"]: node["layer"] for node in data["nodes"]}
+        assert layers[f"issue-{link.target_issue_id}"] == 1
+
+    @override_settings(DEPENDENCY_GRAPH_MAX_DATA_NODES=5)
+    def test_large_projects_are_clustered(self):
+        IssueFactory.create_batch(12, project=self.project)
+
+        data = DiagramDataService().get_dependency_data(self.project)
+
+        assert data["metadata"]["clustered"] is True
+        assert data["metadata"]["issue_count"] == 12
+        assert all(node["is_cluster"] for node in data["nodes"])
+        assert sum(node["member_count"] for node in data["nodes"]) == 12
+
+    def test_svg_is_not_capped_at_50_issues(self):
+        IssueFactory.create_batch(60, project=self.project)
+
+        svg = generate_dependency_graph_svg(self.project)
+
+        assert "60 issues" in svg
@@ -0,0 +1,121 @@
+"""
+Tests for background diagram pre-rendering.
+"""
+
+from contextlib import suppress
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import transaction
+
+import pytest
+
+from apps.projects.tests.factories import IssueFactory, ProjectFactory
+from apps.reporting.services.diagram_prerender_service import DiagramPrerenderService
+
+
+@pytest.mark.django_db
+class TestDiagramPrerenderService:
+    def setup_method(self):
+        cache.clear()
+        self.service = DiagramPrerenderService()
+        self.project = ProjectFactory()
+
+    def test_render_stores_svg_artifact(self):
+        self.service.render(self.project, "workflow", formats=("svg",))
+
+        artifact = self.service.get_artifact(self.project, "workflow", "svg")
+        assert artifact is not None
+        assert "<svg" in artifact
+
+    def test_get_or_render_serves_stored_artifact(self):
+        first = self.service.get_or_render(self.project, "roadmap", "svg")
+        second = self.service.get_or_render(self.project, "roadmap", "svg")
+
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert first["content"] == second["content"]
+
+    @patch("apps.reporting.tasks.prerender_project_diagrams.apply_async")
+    def test_artifact_invalidated_when_data_changes(
+        self, apply_async, django_capture_on_commit_callbacks
+    ):
+        IssueFactory(project=self.project)
+        self.service.render(self.project, "dependency", formats=("svg",))
+        assert self.service.get_artifact(self.project, "dependency", "svg")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            IssueFactory(project=self.project)
+
+        assert self.service.get_artifact(self.project, "dependency", "svg") is None
+
+    @patch("apps.reporting.tasks.prerender_project_diagrams.apply_async")
+    def test_deleting_the_newest_issue_does_not_revive_an_old_artifact(
+        self, apply_async, django_capture_on_commit_callbacks
+    ):
+        IssueFactory(project=self.project)
+        self.service.render(self.project, "roadmap", formats=("svg",))
+        with django_capture_on_commit_callbacks(execute=True):
+            newest = IssueFactory(project=self.project)
+        self.service.render(self.project, "roadmap", formats=("svg",))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            newest.delete()
+
+        assert self.service.get_artifact(self.project, "roadmap", "svg") is None
+
+    def test_render_records_timing_metrics(self):
+        self.service.render(self.project, "velocity", formats=("svg",))
+        self.service.render(self.project, "velocity", formats=("svg",))
+
+        metrics = DiagramPrerenderService.get_render_metrics()
+        assert metrics["velocity"]["svg"]["count"] == 2
+        assert "avg_ms" in metrics["velocity"]["svg"]
+
+
+@pytest.mark.django_db
+class TestDiagramPrerenderScheduling:
+    def setup_method(self):
+        cache.clear()
+        self.project = ProjectFactory()
+
+    def test_changes_are_debounced_per_project(
+        self, django_capture_on_commit_callbacks
+    ):
+        with patch(
+            "apps.reporting.tasks.prerender_project_diagrams.apply_async"
+        ) as apply_async:
+            with django_capture_on_commit_callbacks(execute=True):
+                DiagramPrerenderService.schedule(self.project.id, ["workflow"])
+                DiagramPrerenderService.schedule(self.project.id, ["dependency"])
+
+        assert apply_async.call_count == 1
+        assert DiagramPrerenderService.pop_pending(self.project.id) == [
+            "dependency",
+            "workflow",
+        ]
+
+    def test_rolled_back_changes_leave_nothing_pending(
+        self, django_capture_on_commit_callbacks
+    ):
+        with patch(
+            "apps.reporting.tasks.prerender_project_diagrams.apply_async"
+        ) as apply_async:
+            with django_capture_on_commit_callbacks(execute=True):
+                with suppress(RuntimeError), transaction.atomic():
+                    DiagramPrerenderService.schedule(self.project.id, ["workflow"])
+                    raise RuntimeError
+
+        apply_async.assert_not_called()
+        assert DiagramPrerenderService.pop_pending(self.project.id) == []
+
+    def test_issue_save_schedules_prerender(self):
+        with patch.object(DiagramPrerenderService, "schedule") as schedule:
+            IssueFactory(project=self.project)
+
+        scheduled_types = {
+            diagram_type
+            for call in schedule.call_args_list
+            for diagram_type in call.args[1]
+        }
+        assert {"workflow", "dependency", "roadmap"} <= scheduled_types
@@ -0,0 +1,185 @@
+"""
+Tests for scheduled report snapshots (delta compression and time travel).
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.projects.tests.factories import ProjectFactory, ProjectTeamMemberFactory
+from apps.reporting.models import ReportSnapshot
+from apps.reporting.serializers import ReportSnapshotSerializer
+from apps.reporting.services.report_snapshot_service import (
+    ReportSnapshotService,
+    apply_delta,
+    compute_delta,
+)
+
+
+def _cfd(start_day, days=30, done=0):
+    return {
+        "dates": [f"2024-01-{day:02d}" for day in range(start_day, start_day + days)],
+        "status_counts": {
+            "To Do": [5] * days,
+            "Done": [done] * days,
+        },
+    }
+
+
+class TestJsonDelta:
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 2, 3]}),
+            ({"a": 1, "b": 2}, {"a": 1, "c": 3}),
+            ({"a": {"b": {"c": 1}}}, {"a": {"b": {"c": 2, "d": 3}}}),
+            ({"a": [1, 2, 3, 4]}, {"a": [1, 9, 9, 4]}),
+            ({"a": [1, 2, 3]}, {"a": []}),
+            ({"a": [1, 2]}, {"a": "changed"}),
+        ],
+    )
+    def test_delta_round_trip(self, old, new):
+        assert apply_delta(old, compute_delta(old, new)) == new
+
+    def test_equal_values_have_no_delta(self):
+        assert compute_delta({"a": [1]}, {"a": [1]}) is None
+
+    def test_sliding_window_only_stores_new_tail(self):
+        old, new = _cfd(1), _cfd(2)
+
+        delta = compute_delta(old, new)
+
+        assert delta["p"]["dates"] == {"h": 1, "t": ["2024-01-31"]}
+        assert apply_delta(old, delta) == new
+
+
+@pytest.mark.django_db
+class TestReportSnapshotService:
+    def setup_method(self):
+        cache.clear()
+        self.service = ReportSnapshotService()
+        self.project = ProjectFactory()
+
+    def test_snapshots_between_keyframes_store_deltas(self):
+        first = self.service.capture(self.project, "cfd", _cfd(1))
+        second = self.service.capture(self.project, "cfd", _cfd(2))
+
+        assert first.is_keyframe and first.chain_position == 0
+        assert not second.is_keyframe and second.chain_position == 1
+        assert "dates" not in second.report_data
+
+    @override_settings(REPORT_SNAPSHOT_KEYFRAME_INTERVAL=3)
+    def test_keyframe_is_written_every_interval(self):
+        service = ReportSnapshotService()
+        snapshots = [
+            service.capture(self.project, "cfd", _cfd(day)) for day in (1, 2, 3, 4)
+        ]
+
+        assert [s.is_keyframe for s in snapshots] == [True, False, False, True]
+
+    def test_large_changes_are_stored_as_keyframes(self):
+        self.service.capture(self.project, "velocity", {"labels": ["a"]})
+
+        snapshot = self.service.capture(self.project, "velocity", {"other": [1, 2]})
+
+        assert snapshot.is_keyframe
+
+    def test_deltas_are_rebuilt_from_keyframe(self, django_assert_num_queries):
+        for day in (1, 2, 3):
+            snapshot = self.service.capture(self.project, "cfd", _cfd(day, done=day))
+        cache.clear()
+        snapshot = ReportSnapshot.objects.get(id=snapshot.id)
+
+        with django_assert_num_queries(1):
+            data = self.service.get_data(snapshot)
+
+        assert data == _cfd(3, done=3)
+
+    def test_serializer_returns_full_report_data(self):
+        self.service.capture(self.project, "cfd", _cfd(1))
+        snapshot = self.service.capture(self.project, "cfd", _cfd(2))
+        cache.clear()
+
+        data = ReportSnapshotSerializer(ReportSnapshot.objects.get(id=snapshot.id)).data
+
+        assert data["report_data"] == _cfd(2)
+        assert data["source"] == "scheduled"
+
+
+@pytest.mark.django_db
+class TestReportHistoryEndpoint:
+    def setup_method(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.project = ProjectFactory()
+        ProjectTeamMemberFactory(project=self.project, user=self.user)
+        service = ReportSnapshotService()
+
+        now = timezone.now()
+        self.times = [now - timedelta(days=2 - i) for i in range(3)]
+        for day, generated_at in zip((1, 2, 3), self.times):
+            snapshot = service.capture(self.project, "cfd", _cfd(day))
+            ReportSnapshot.objects.filter(id=snapshot.id).update(
+                generated_at=generated_at
+            )
+        cache.clear()
+
+    def test_timeline_without_at(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(
+            reverse("report-history"),
+            {"project": str(self.project.id), "report_type": "cfd"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["snapshots"]) == 3
+        assert "report_data" not in response.data["snapshots"][0]
+
+    def test_time_travel_with_comparison(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(
+            reverse("report-history"),
+            {
+                "project": str(self.project.id),
+                "report_type": "cfd",
+                "at": (self.times[1] + timedelta(hours=1)).isoformat(),
+                "compare_to": self.times[0].isoformat(),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["at"]["report_data"] == _cfd(2)
+        assert response.data["compare_to"]["report_data"] == _cfd(1)
+
+    def test_no_snapshot_before_first_capture(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(
+            reverse("report-history"),
+            {
+                "project": str(self.project.id),
+                "report_type": "cfd",
+                "at": (self.times[0] - timedelta(days=1)).isoformat(),
+            },
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_rejects_unknown_report_type(self, api_client):
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(
+            reverse("report-history"),
+            {"project": str(self.project.id), "report_type": "burndown"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
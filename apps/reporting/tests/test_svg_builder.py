@@ -0,0 +1,127 @@
+"""
+Tests for the SVG writer and text metrics.
+"""
+
+import io
+from datetime import timedelta
+
+from django.utils import timezone
+
+import pytest
+
+from apps.projects.tests.factories import (
+    IssueFactory,
+    ProjectFactory,
+    SprintFactory,
+    WorkflowStatusFactory,
+)
+from apps.reporting.services.diagram_generators import (
+    generate_roadmap_timeline_svg,
+    generate_workflow_diagram_svg,
+)
+from apps.reporting.services.diagram_utils import estimate_text_width
+from apps.reporting.services.svg_builder import SVGWriter
+
+
+class TestSVGWriter:
+    def test_repeated_styles_share_one_class(self):
+        svg = SVGWriter(200, 100)
+        for i in range(10):
+            svg.rect(i * 10, 0, 8, 8, fill="#FF0000")
+            svg.text(i * 10, 20, f"Label {i}", size=12)
+
+        content = svg.getvalue()
+
+        assert content.count("<style>") == 1
+        assert content.count("{fill:#FF0000;opacity:1.0}") == 1
+        assert content.count(f'class="{svg.doc_id}-s0"') == 10
+        assert content.count(f'class="{svg.doc_id}-s1"') == 10
+
+    def test_styles_are_scoped_to_the_document(self):
+        first, second = SVGWriter(200, 100), SVGWriter(200, 100)
+        for svg in (first, second):
+            svg.rect(0, 0, 8, 8, fill="#FF0000")
+
+        content = first.getvalue()
+
+        assert first.doc_id != second.doc_id
+        assert f'id="{first.doc_id}"' in content
+        assert f"#{first.doc_id} text{{" in content
+        assert f".{first.doc_id}-s0{{" in content
+        assert second.doc_id not in content
+
+    def test_chunks_match_full_document(self):
+        svg = SVGWriter(200, 100)
+        for i in range(200):
+            svg.circle(i, i, 3, fill="#00FF00")
+
+        chunks = list(svg.iter_chunks(chunk_size=512))
+        stream = io.StringIO()
+        svg.write_to(stream)
+
+        assert len(chunks) > 3
+        assert "".join(chunks) == svg.getvalue() == stream.getvalue()
+        assert chunks[0].startswith("<svg") and chunks[-1] == "</svg>"
+
+    def test_text_is_escaped_and_truncated(self):
+        svg = SVGWriter(200, 100)
+        svg.text(0, 0, "<b>Tom & Jerry's long adventure</b>", truncate_at=12)
+
+        content = svg.getvalue()
+
+        assert "&lt;b&gt;Tom &amp; ..." in content
+        assert "<b>" not in content
+
+
+class TestTextMetrics:
+    def test_width_matches_per_character_table(self):
+        # "Wi": 0.9 + 0.3 em, plus the 20% safety buffer
+        assert estimate_text_width("Wi", 10) == pytest.approx(14.4)
+        assert estimate_text_width("", 10) == 0
+
+    def test_unknown_characters_use_default_width(self):
+        assert estimate_text_width("ü", 10) == pytest.approx(0.55 * 10 * 1.2)
+
+    def test_repeated_measurements_hit_cache(self):
+        estimate_text_width.cache_clear()
+        estimate_text_width("In Progress", 12)
+        estimate_text_width("In Progress", 12)
+
+        assert estimate_text_width.cache_info().hits == 1
+
+
+@pytest.mark.django_db
+class TestGeneratorQueries:
+    def setup_method(self):
+        self.project = ProjectFactory()
+
+    def test_workflow_query_count_does_not_grow_with_statuses(
+        self, django_assert_max_num_queries
+    ):
+        for _ in range(6):
+            IssueFactory(
+                project=self.project,
+                status=WorkflowStatusFactory(project=self.project),
+            )
+
+        with django_assert_max_num_queries(3):
+            svg = generate_workflow_diagram_svg(self.project)
+
+        assert "1 issue<" in svg
+
+    def test_roadmap_query_count_does_not_grow_with_sprints(
+        self, django_assert_max_num_queries
+    ):
+        start = timezone.now().date()
+        for i in range(5):
+            sprint = SprintFactory(
+                project=self.project,
+                start_date=start + timedelta(days=14 * i),
+                end_date=start + timedelta(days=14 * i + 13),
+            )
+            IssueFactory(project=self.project, sprint=sprint)
+
+        with django_assert_max_num_queries(2):
+            svg = generate_roadmap_timeline_svg(self.project)
+
+        assert "1 issues" in svg
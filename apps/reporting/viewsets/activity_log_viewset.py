@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated
 
 from apps.reporting.models import ActivityLog
 from apps.reporting.serializers import ActivityLogSerializer
+from base.pagination import CursorOptInPagination
 
 
 class ActivityLogFilter(filters.FilterSet):
@@ -101,7 +102,9 @@ class ActivityLogFilter(filters.FilterSet):
             "**Pagination:**\n"
             "- Control page size: `?page_size=5` (default: 20, max: 100)\n"
             "- Navigate pages: `?page=1`, `?page=2`, etc.\n"
-            "- Example: `?page=1&page_size=10` - Get first 10 results"
+            "- Example: `?page=1&page_size=10` - Get first 10 results\n"
+            "- Deep history: `?pagination=cursor`, then follow `next`/`previous` "
+            "(newest first, no total count)"
         ),
         parameters=[
             OpenApiParameter(
@@ -215,6 +218,7 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_class = ActivityLogFilter
     ordering_fields = ["created_at", "action_type"]
     ordering = ["-created_at"]
+    pagination_class = CursorOptInPagination
 
     def get_queryset(self):
         """
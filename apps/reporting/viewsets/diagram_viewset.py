@@ -17,7 +17,12 @@ from apps.reporting.serializers import (
     DiagramRequestSerializer,
     DiagramResponseSerializer,
 )
+from apps.reporting.services.diagram_prerender_service import (
+    PRERENDER_DIAGRAM_TYPES,
+    DiagramPrerenderService,
+)
 from apps.reporting.services.diagram_service import DiagramService
+from base.utils.access_scope import AccessScope
 
 
 @extend_schema_view(
@@ -74,25 +79,7 @@ class DiagramViewSet(viewsets.ViewSet):
 
     def _user_has_project_access(self, project):
         """Check if request user has access to project."""
-        from apps.projects.models import ProjectTeamMember
-        from apps.workspaces.models import WorkspaceMember
-
-        user = self.request.user
-
-        # Check project membership
-        is_project_member = ProjectTeamMember.objects.filter(
-            project=project, user=user, is_active=True
-        ).exists()
-
-        if is_project_member:
-            return True
-
-        # Check workspace membership
-        is_workspace_member = WorkspaceMember.objects.filter(
-            workspace=project.workspace, user=user, is_active=True
-        ).exists()
-
-        return is_workspace_member
+        return AccessScope.for_user(self.request.user).can_access_project(project)
 
     @extend_schema(
         summary="Generate diagram",
@@ -351,6 +338,11 @@ class DiagramViewSet(viewsets.ViewSet):
         - `workflow`: Workflow status diagram
         - `dependency`: Issue dependency graph
         - `roadmap`: Project roadmap timeline
+        - `velocity`: Velocity chart
+        - `burndown`: Sprint burndown chart (requires `parameters.sprint_id`)
+
+        Unfiltered exports are served from pre-rendered artifacts that are
+        refreshed in the background when project data changes.
 
         **Response:**
         - SVG: Returns SVG XML as text/xml
@@ -392,11 +384,11 @@ class DiagramViewSet(viewsets.ViewSet):
             )
 
         # Validate diagram type supports export
-        if diagram_type not in ["workflow", "dependency", "roadmap"]:
+        if diagram_type not in PRERENDER_DIAGRAM_TYPES:
             return Response(
                 {
                     "error": f"Diagram type '{diagram_type}' does not support export",
-                    "detail": "Supported types: workflow, dependency, roadmap",
+                    "detail": "Supported types: workflow, dependency, roadmap, velocity, burndown",  # noqa: E501
                     "code": "UNSUPPORTED_DIAGRAM_TYPE",
                 },
                 status=status.HTTP_400_BAD_REQUEST,
@@ -416,23 +408,40 @@ class DiagramViewSet(viewsets.ViewSet):
             )
 
         try:
-            # Generate SVG diagram
             from apps.reporting.services.diagram_generators import (
                 generate_dependency_graph_svg,
-                generate_roadmap_timeline_svg,
-                generate_workflow_diagram_svg,
             )
 
             logger.info(
                 f"Exporting {diagram_type} diagram as {export_format} for project {project.key}"  # noqa: E501
             )
 
-            # Generate SVG based on diagram type
-            if diagram_type == "workflow":
-                svg_content = generate_workflow_diagram_svg(project)
-            elif diagram_type == "dependency":
-                # Extract filters for dependency diagram
-                filters = {}
+            prerender_service = DiagramPrerenderService()
+
+            sprint = None
+            if diagram_type == "burndown":
+                from apps.projects.models import Sprint
+
+                sprint_id = parameters.get("sprint_id")
+                try:
+                    sprint = Sprint.objects.filter(
+                        id=sprint_id, project=project
+                    ).first()
+                except ValidationError:
+                    sprint = None
+                if sprint is None:
+                    return Response(
+                        {
+                            "error": "Valid sprint_id parameter is required",
+                            "detail": "Burndown export needs a sprint of this project",  # noqa: E501
+                            "code": "INVALID_OPTIONS",
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+            # Extract filters for dependency diagram
+            filters = {}
+            if diagram_type == "dependency":
                 if "sprint_id" in parameters:
                     filters["sprint_id"] = parameters["sprint_id"]
                 if "status_ids" in parameters:
@@ -448,71 +457,50 @@ class DiagramViewSet(viewsets.ViewSet):
                 if "search" in parameters:
                     filters["search"] = parameters["search"]
 
+            if filters:
+                # Filtered graphs are not pre-rendered
                 svg_content = generate_dependency_graph_svg(project, filters)
-            elif diagram_type == "roadmap":
-                svg_content = generate_roadmap_timeline_svg(project)
-
-            # Return SVG format
-            if export_format == "svg":
-                from django.http import HttpResponse
-
-                response = HttpResponse(svg_content, content_type="image/svg+xml")
-                response[
-                    "Content-Disposition"
-                ] = f'attachment; filename="{project.key}_{diagram_type}.svg"'
-                response["X-Diagram-Type"] = diagram_type
-                response["X-Export-Format"] = "svg"
-
-                logger.info(f"SVG export successful: {len(svg_content)} bytes")
-                return response
-
-            # Convert SVG to PNG
-            elif export_format == "png":
-                try:
-                    pass
-
-                    import cairosvg
-
-                    # Convert SVG to PNG
-                    png_data = cairosvg.svg2png(bytestring=svg_content.encode("utf-8"))
+                artifact = {"content": svg_content, "cached": False}
+                if export_format == "png":
+                    artifact["content"] = prerender_service.svg_to_png(svg_content)
+            else:
+                # Serve the stored artifact for the current data version
+                artifact = prerender_service.get_or_render(
+                    project, diagram_type, export_format, sprint=sprint
+                )
 
-                    from django.http import HttpResponse
+            content = artifact["content"]
+            content_type = "image/svg+xml" if export_format == "svg" else "image/png"
 
-                    response = HttpResponse(png_data, content_type="image/png")
-                    response[
-                        "Content-Disposition"
-                    ] = f'attachment; filename="{project.key}_{diagram_type}.png"'
-                    response["X-Diagram-Type"] = diagram_type
-                    response["X-Export-Format"] = "png"
+            from django.http import HttpResponse
 
-                    logger.info(f"PNG export successful: {len(png_data)} bytes")
-                    return response
+            response = HttpResponse(content, content_type=content_type)
+            response[
+                "Content-Disposition"
+            ] = f'attachment; filename="{project.key}_{diagram_type}.{export_format}"'
+            response["X-Diagram-Type"] = diagram_type
+            response["X-Export-Format"] = export_format
+            response["X-Cache-Status"] = "HIT" if artifact["cached"] else "MISS"
 
-                except ImportError:
-                    return Response(
-                        {
-                            "error": "PNG export not available",
-                            "detail": "cairosvg library is not installed. Install it with: pip install cairosvg",  # noqa: E501
-                            "code": "PNG_NOT_SUPPORTED",
-                            "alternatives": [
-                                "Use SVG format instead",
-                                "Convert SVG to PNG in frontend using canvas",
-                                "Install cairosvg: pip install cairosvg",
-                            ],
-                        },
-                        status=status.HTTP_501_NOT_IMPLEMENTED,
-                    )
-                except Exception as e:
-                    logger.error(f"PNG conversion failed: {str(e)}")
-                    return Response(
-                        {
-                            "error": "PNG conversion failed",
-                            "detail": str(e),
-                            "code": "PNG_CONVERSION_ERROR",
-                        },
-                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    )
+            logger.info(
+                f"{export_format.upper()} export successful: {len(content)} bytes"
+            )
+            return response
 
+        except ImportError:
+            return Response(
+                {
+                    "error": "PNG export not available",
+                    "detail": "cairosvg library is not installed. Install it with: pip install cairosvg",  # noqa: E501
+                    "code": "PNG_NOT_SUPPORTED",
+                    "alternatives": [
+                        "Use SVG format instead",
+                        "Convert SVG to PNG in frontend using canvas",
+                        "Install cairosvg: pip install cairosvg",
+                    ],
+                },
+                status=status.HTTP_501_NOT_IMPLEMENTED,
+            )
         except Exception as e:
             logger.error(f"Export failed: {str(e)}", exc_info=True)
             return Response(
@@ -520,6 +508,20 @@ class DiagramViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @extend_schema(
+        summary="Diagram render timing metrics",
+        tags=["Reporting"],
+        description="Returns per-diagram-type render timing stats (count, average, max and last render time in ms) for SVG and PNG artifacts.",  # noqa: E501
+        responses={
+            200: OpenApiResponse(description="Render timing metrics"),
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="render-metrics")
+    def render_metrics(self, request):
+        return Response(
+            DiagramPrerenderService.get_render_metrics(), status=status.HTTP_200_OK
+        )
+
     def list(self, request):
         from apps.reporting.models import DiagramCache
 
@@ -1,5 +1,7 @@
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
@@ -17,6 +19,14 @@ from apps.reporting.models import ReportSnapshot
 from apps.reporting.permissions import CanExportData, CanGenerateReports
 from apps.reporting.serializers import ExportRequestSerializer, ReportSnapshotSerializer
 from apps.reporting.services.analytics_service import AnalyticsService
+from apps.reporting.services.dependency_analysis_service import (
+    DependencyAnalysisService,
+)
+from apps.reporting.services.report_snapshot_service import (
+    SCHEDULED_REPORT_TYPES,
+    ReportSnapshotService,
+)
+from base.utils.access_scope import AccessScope
 
 
 @extend_schema_view(
@@ -85,27 +95,27 @@ class ReportViewSet(viewsets.ViewSet):
         except Sprint.DoesNotExist:
             raise ValidationError("Sprint not found")
 
-    def _user_has_project_access(self, project):
-        """Check if request user has access to project."""
-        from apps.projects.models import ProjectTeamMember
-        from apps.workspaces.models import WorkspaceMember
-
-        user = self.request.user
+    def _get_issue_or_error(self, issue_id):
+        """Get issue by ID or raise appropriate error."""
+        from apps.projects.models import Issue
 
-        # Check project membership
-        is_project_member = ProjectTeamMember.objects.filter(
-            project=project, user=user, is_active=True
-        ).exists()
+        try:
+            self._validate_uuid(issue_id, "issue")
+            issue = Issue.objects.select_related("project").get(
+                id=issue_id, is_active=True
+            )
 
-        if is_project_member:
-            return True
+            # Check user has access to issue's project
+            if not self._user_has_project_access(issue.project):
+                raise PermissionDenied("You do not have access to this issue")
 
-        # Check workspace membership
-        is_workspace_member = WorkspaceMember.objects.filter(
-            workspace=project.workspace, user=user, is_active=True
-        ).exists()
+            return issue
+        except Issue.DoesNotExist:
+            raise ValidationError("Issue not found")
 
-        return is_workspace_member
+    def _user_has_project_access(self, project):
+        """Check if request user has access to project."""
+        return AccessScope.for_user(self.request.user).can_access_project(project)
 
     @extend_schema(
         summary="Generate velocity chart",
@@ -567,6 +577,259 @@ class ReportViewSet(viewsets.ViewSet):
 
         return Response(dashboard_data, status=status.HTTP_200_OK)
 
+    @extend_schema(
+        summary="Analyze issue dependencies",
+        tags=["Reporting"],
+        description="Computes the critical path (longest chain of blocking/depends-on links weighted by story points or estimated hours), dependency cycles and a topological order of the project's issues.",  # noqa: E501
+        parameters=[
+            OpenApiParameter(
+                name="project",
+                type=OpenApiTypes.UUID,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Project UUID to analyze",
+            ),
+            OpenApiParameter(
+                name="weight",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=["story_points", "estimated_hours"],
+                description="Issue field used as path weight (default: story_points)",  # noqa: E501
+            ),
+            OpenApiParameter(
+                name="include_done",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Count finished issues towards the path weight (default: false)",  # noqa: E501
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Dependency analysis computed"),
+            400: OpenApiResponse(description="Missing or invalid parameters"),
+            403: OpenApiResponse(description="No permission to access this project"),
+            404: OpenApiResponse(description="Project not found"),
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="dependency-analysis")
+    def dependency_analysis(self, request):
+        project_id = request.query_params.get("project")
+
+        if not project_id:
+            return Response(
+                {
+                    "error": "project parameter is required",
+                    "detail": "Provide project UUID in query params",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            project = self._get_project_or_error(project_id)
+        except ValidationError as e:
+            return Response(
+                {"error": str(e)},
+                status=(
+                    status.HTTP_400_BAD_REQUEST
+                    if "format" in str(e)
+                    else status.HTTP_404_NOT_FOUND
+                ),
+            )
+        except PermissionDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+
+        weight = request.query_params.get("weight", "story_points")
+        include_done = request.query_params.get("include_done", "").lower() in (
+            "1",
+            "true",
+        )
+
+        try:
+            analysis = DependencyAnalysisService().analyze(
+                project, weight_field=weight, include_done=include_done
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(analysis, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Get blocking chain of an issue",
+        tags=["Reporting"],
+        description="Lists every issue the given issue transitively waits on through blocks/depends-on links, ordered by distance, with how many are still unresolved.",  # noqa: E501
+        parameters=[
+            OpenApiParameter(
+                name="issue",
+                type=OpenApiTypes.UUID,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Issue UUID to trace blockers for",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Blocking chain computed"),
+            400: OpenApiResponse(description="Missing or invalid issue parameter"),
+            403: OpenApiResponse(description="No permission to access this issue"),
+            404: OpenApiResponse(description="Issue not found"),
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="blocking-chain")
+    def blocking_chain(self, request):
+        issue_id = request.query_params.get("issue")
+
+        if not issue_id:
+            return Response(
+                {
+                    "error": "issue parameter is required",
+                    "detail": "Provide issue UUID in query params",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            issue = self._get_issue_or_error(issue_id)
+        except ValidationError as e:
+            return Response(
+                {"error": str(e)},
+                status=(
+                    status.HTTP_400_BAD_REQUEST
+                    if "format" in str(e)
+                    else status.HTTP_404_NOT_FOUND
+                ),
+            )
+        except PermissionDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+
+        chain = DependencyAnalysisService().get_blocking_chain(issue)
+
+        return Response(chain, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Get report history",
+        tags=["Reporting"],
+        description="Time travel over scheduled report snapshots. Without `at`, lists the snapshot timeline of a report type; with `at`, returns the report as it was at that time, optionally alongside the report at `compare_to`.",  # noqa: E501
+        parameters=[
+            OpenApiParameter(
+                name="project",
+                type=OpenApiTypes.UUID,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Project UUID",
+            ),
+            OpenApiParameter(
+                name="report_type",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                enum=list(SCHEDULED_REPORT_TYPES),
+                description="Report type to look up",
+            ),
+            OpenApiParameter(
+                name="at",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Return the latest snapshot taken at or before this time (ISO 8601)",  # noqa: E501
+            ),
+            OpenApiParameter(
+                name="compare_to",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description="Also return the snapshot at this time for comparison (ISO 8601)",  # noqa: E501
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Report history retrieved"),
+            400: OpenApiResponse(description="Missing or invalid parameters"),
+            403: OpenApiResponse(description="No permission to access this project"),
+            404: OpenApiResponse(description="Project or snapshot not found"),
+        },
+    )
+    @action(detail=False, methods=["get"], url_path="history")
+    def history(self, request):
+        project_id = request.query_params.get("project")
+        report_type = request.query_params.get("report_type")
+
+        if not project_id:
+            return Response(
+                {
+                    "error": "project parameter is required",
+                    "detail": "Provide project UUID in query params",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if report_type not in SCHEDULED_REPORT_TYPES:
+            return Response(
+                {
+                    "error": "Invalid report_type",
+                    "detail": f"Use one of: {', '.join(SCHEDULED_REPORT_TYPES)}",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        timestamps = {}
+        for param in ("at", "compare_to"):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            parsed = parse_datetime(value)
+            if parsed is None:
+                return Response(
+                    {
+                        "error": f"Invalid {param} parameter",
+                        "detail": "Use ISO 8601 format, e.g. 2024-01-31T00:00:00Z",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed)
+            timestamps[param] = parsed
+
+        try:
+            project = self._get_project_or_error(project_id)
+        except ValidationError as e:
+            return Response(
+                {"error": str(e)},
+                status=(
+                    status.HTTP_400_BAD_REQUEST
+                    if "format" in str(e)
+                    else status.HTTP_404_NOT_FOUND
+                ),
+            )
+        except PermissionDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+
+        service = ReportSnapshotService()
+
+        if "at" not in timestamps:
+            return Response(
+                {
+                    "project": str(project.id),
+                    "report_type": report_type,
+                    "snapshots": service.get_timeline(project, report_type),
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        result = {"project": str(project.id), "report_type": report_type}
+        for param, at in timestamps.items():
+            snapshot = service.get_snapshot_at(project, report_type, at)
+            if snapshot is None:
+                return Response(
+                    {"error": f"No {report_type} snapshot exists at {at.isoformat()}"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            result[param] = {
+                "id": str(snapshot.id),
+                "generated_at": snapshot.generated_at,
+                "report_data": service.get_data(snapshot),
+            }
+
+        return Response(result, status=status.HTTP_200_OK)
+
     def list(self, request):
         project_id = request.query_params.get("project")
 
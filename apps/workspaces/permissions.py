@@ -5,8 +5,9 @@ Implements role-based access control for workspaces and workspace members.
 
 from rest_framework import permissions
 
-from apps.organizations.models import OrganizationMembership
-from apps.workspaces.models import WorkspaceMember
+from base.utils.access_scope import AccessScope
+
+ORGANIZATION_ADMIN_ROLES = ("owner", "admin")
 
 
 class IsWorkspaceMember(permissions.BasePermission):
@@ -23,9 +24,7 @@ class IsWorkspaceMember(permissions.BasePermission):
         else:
             workspace = obj
 
-        return WorkspaceMember.objects.filter(
-            workspace=workspace, user=request.user, is_active=True
-        ).exists()
+        return AccessScope.for_user(request.user).is_workspace_member(workspace.id)
 
 
 class IsWorkspaceAdmin(permissions.BasePermission):
@@ -46,23 +45,17 @@ class IsWorkspaceAdmin(permissions.BasePermission):
         else:
             workspace = obj
 
-        # Check workspace admin role
-        workspace_member = WorkspaceMember.objects.filter(
-            workspace=workspace, user=request.user, role="admin", is_active=True
-        ).first()
+        scope = AccessScope.for_user(request.user)
 
-        if workspace_member:
+        # Check workspace admin role
+        if scope.workspace_role(workspace.id) == "admin":
             return True
 
         # Organization owners and admins also have admin access to workspaces
-        org_membership = OrganizationMembership.objects.filter(
-            organization=workspace.organization,
-            user=request.user,
-            role__in=["owner", "admin"],
-            is_active=True,
-        ).first()
-
-        return org_membership is not None
+        return (
+            scope.organization_role(workspace.organization_id)
+            in ORGANIZATION_ADMIN_ROLES
+        )
 
 
 class CanAccessWorkspace(permissions.BasePermission):
@@ -80,34 +73,23 @@ class CanAccessWorkspace(permissions.BasePermission):
         else:
             workspace = obj
 
-        # Check if user is workspace member
-        is_workspace_member = WorkspaceMember.objects.filter(
-            workspace=workspace, user=request.user, is_active=True
-        ).exists()
+        scope = AccessScope.for_user(request.user)
 
-        if is_workspace_member:
+        # Check if user is workspace member
+        if scope.is_workspace_member(workspace.id):
             return True
 
         # If workspace is public or restricted, organization members can view
-        if workspace.visibility in ["public", "restricted"]:
-            is_org_member = OrganizationMembership.objects.filter(
-                organization=workspace.organization, user=request.user, is_active=True
-            ).exists()
-
+        org_role = scope.organization_role(workspace.organization_id)
+        if org_role is not None:
             # Public workspaces: all org members can read
-            if workspace.visibility == "public" and is_org_member:
+            if workspace.visibility == "public":
                 if request.method in permissions.SAFE_METHODS:
                     return True
 
             # Restricted workspaces: org admins can access
-            if workspace.visibility == "restricted" and is_org_member:
-                org_membership = OrganizationMembership.objects.filter(
-                    organization=workspace.organization,
-                    user=request.user,
-                    role__in=["owner", "admin"],
-                    is_active=True,
-                ).first()
-                if org_membership:
+            if workspace.visibility == "restricted":
+                if org_role in ORGANIZATION_ADMIN_ROLES:
                     return True
 
         return False
@@ -132,20 +114,14 @@ class CanManageWorkspaceMembers(permissions.BasePermission):
         # obj is WorkspaceMember
         workspace = obj.workspace
 
-        # Check if user is workspace admin
-        is_workspace_admin = WorkspaceMember.objects.filter(
-            workspace=workspace, user=request.user, role="admin", is_active=True
-        ).exists()
+        scope = AccessScope.for_user(request.user)
 
-        if is_workspace_admin:
+        # Check if user is workspace admin
+        if scope.workspace_role(workspace.id) == "admin":
             return True
 
         # Check if user is organization owner/admin
-        is_org_admin = OrganizationMembership.objects.filter(
-            organization=workspace.organization,
-            user=request.user,
-            role__in=["owner", "admin"],
-            is_active=True,
-        ).exists()
-
-        return is_org_admin
+        return (
+            scope.organization_role(workspace.organization_id)
+            in ORGANIZATION_ADMIN_ROLES
+        )
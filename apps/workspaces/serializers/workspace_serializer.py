@@ -5,11 +5,13 @@ from rest_framework import serializers
 from apps.organizations.models import Organization
 from apps.workspaces.models import Workspace
 from base.serializers import OrganizationBasicSerializer, UserBasicSerializer
+from base.utils.access_scope import AccessScope
 
 
 class WorkspaceSerializer(serializers.ModelSerializer):
-    member_count = serializers.ReadOnlyField()
-    project_count = serializers.ReadOnlyField()
+    member_count = serializers.SerializerMethodField()
+    project_count = serializers.SerializerMethodField()
+    user_role = serializers.SerializerMethodField()
     cover_image_url = serializers.SerializerMethodField()
     organization = serializers.UUIDField(write_only=True, required=True)
     organization_details = OrganizationBasicSerializer(
@@ -42,6 +44,7 @@ class WorkspaceSerializer(serializers.ModelSerializer):
             "created_by",
             "member_count",
             "project_count",
+            "user_role",
             "active_projects_count",
             "active_projects_change_pct",
             "team_members_count",
@@ -64,6 +67,25 @@ class WorkspaceSerializer(serializers.ModelSerializer):
             return obj.cover_image.url
         return None
 
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_member_count(self, obj):
+        # Annotated on list; counted per object otherwise
+        count = getattr(obj, "team_members_count", None)
+        return obj.member_count if count is None else count
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_project_count(self, obj):
+        count = getattr(obj, "total_projects_count", None)
+        return obj.project_count if count is None else count
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_user_role(self, obj):
+        """Role of the requesting user, from their cached access scope."""
+        request = self.context.get("request")
+        if request and request.user.is_authenticated:
+            return AccessScope.for_user(request.user).workspace_role(obj.id)
+        return None
+
     def validate_organization(self, value):
         """Validate that organization exists and user has access."""
         request = self.context.get("request")
@@ -0,0 +1,109 @@
+"""
+Query counts of the workspace list and dashboard statistics.
+"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.authentication.tests.factories import UserFactory
+from apps.organizations.tests.factories import OrganizationFactory
+from apps.projects.tests.factories import ProjectFactory
+from apps.workspaces.tests.factories import WorkspaceFactory, WorkspaceMemberFactory
+from base.utils.access_scope import AccessScope
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestWorkspaceListQueries:
+    def setup_method(self):
+        self.user = UserFactory()
+        organization = OrganizationFactory()
+        self.workspaces = [
+            WorkspaceFactory(organization=organization, slug=f"ws-{index}")
+            for index in range(100)
+        ]
+        for index, workspace in enumerate(self.workspaces):
+            WorkspaceMemberFactory(
+                workspace=workspace,
+                user=self.user,
+                role="admin" if index % 2 else "member",
+            )
+        WorkspaceFactory(organization=organization, slug="other")
+
+    def test_list_of_100_workspaces_runs_a_fixed_number_of_queries(
+        self, api_client, django_assert_max_num_queries
+    ):
+        api_client.force_authenticate(user=self.user)
+
+        with django_assert_max_num_queries(6):
+            response = api_client.get(reverse("workspaces-list"), {"page_size": 100})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 100
+        roles = {row["id"]: row["user_role"] for row in response.data["results"]}
+        assert roles[str(self.workspaces[0].id)] == "member"
+        assert roles[str(self.workspaces[1].id)] == "admin"
+
+    def test_counts_include_every_member_not_just_the_requester(self, api_client):
+        workspace = self.workspaces[0]
+        WorkspaceMemberFactory.create_batch(2, workspace=workspace)
+        WorkspaceMemberFactory(workspace=workspace, is_active=False)
+        ProjectFactory.create_batch(2, workspace=workspace, status="active")
+        ProjectFactory(workspace=workspace, is_active=False)
+        api_client.force_authenticate(user=self.user)
+
+        response = api_client.get(reverse("workspaces-list"), {"page_size": 100})
+
+        row = next(
+            row for row in response.data["results"] if row["id"] == str(workspace.id)
+        )
+        assert row["member_count"] == row["team_members_count"] == 3
+        assert row["project_count"] == 2
+        assert row["active_projects_count"] == 2
+
+
+@pytest.mark.django_db
+class TestWorkspaceDashboardStats:
+    def setup_method(self):
+        self.user = UserFactory()
+        self.workspace = WorkspaceFactory()
+        WorkspaceMemberFactory(workspace=self.workspace, user=self.user)
+        WorkspaceMemberFactory.create_batch(2, workspace=self.workspace)
+        ProjectFactory.create_batch(3, workspace=self.workspace, status="active")
+        self.url = reverse("workspaces-dashboard-stats")
+
+    def test_stats_are_one_query_and_cached(
+        self, api_client, django_assert_num_queries
+    ):
+        api_client.force_authenticate(user=self.user)
+        # The access scope is loaded and cached separately
+        AccessScope.for_user(self.user)
+
+        with django_assert_num_queries(1):
+            first = api_client.get(self.url)
+        with django_assert_num_queries(0):
+            second = api_client.get(self.url)
+
+        assert first.data == second.data
+        # The user's personal workspace counts too
+        assert first.data["total_workspaces"] == 2
+        assert first.data["team_members"] == 4
+        assert first.data["active_projects"] >= 3
+
+    def test_leaving_a_workspace_refreshes_the_stats(self, api_client):
+        api_client.force_authenticate(user=self.user)
+        before = api_client.get(self.url).data
+
+        self.workspace.members.filter(user=self.user).delete()
+
+        after = api_client.get(self.url).data
+        assert after["total_workspaces"] == before["total_workspaces"] - 1
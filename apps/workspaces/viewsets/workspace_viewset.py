@@ -1,8 +1,9 @@
 from datetime import timedelta
 
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, OuterRef, Q, Sum
 from django.utils import timezone
+
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -11,11 +12,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from apps.workspaces.models import Workspace, WorkspaceMember
-from apps.workspaces.permissions import (
-    CanAccessWorkspace,
-    IsWorkspaceAdmin,
-)
+from apps.workspaces.permissions import CanAccessWorkspace, IsWorkspaceAdmin
 from apps.workspaces.serializers import WorkspaceMemberSerializer, WorkspaceSerializer
+from base.utils.access_scope import AccessScope
+from base.utils.dashboard_stats import SubqueryCount, cached_dashboard_stats
 from base.utils.file_handlers import upload_workspace_asset_to_s3
 
 
@@ -64,49 +64,48 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
         return [IsAuthenticated()]
 
     def get_queryset(self):
-        queryset = (
-            Workspace.objects.filter(
-                members__user=self.request.user, members__is_active=True
-            )
-            .select_related("organization", "created_by")
-            .distinct()
+        queryset = self._member_workspaces().select_related(
+            "organization", "created_by"
         )
 
         if self.action == "list":
             week_ago = timezone.now() - timedelta(days=7)
-            queryset = queryset.annotate(
-                active_projects_count=Count(
-                    "projects",
-                    filter=Q(projects__status="active"),
-                    distinct=True,
-                ),
-                team_members_count=Count(
-                    "members",
-                    filter=Q(members__is_active=True),
-                    distinct=True,
-                ),
-                prev_active_projects=Count(
-                    "projects",
-                    filter=Q(
-                        projects__status="active",
-                        projects__created_at__lte=week_ago,
-                    ),
-                    distinct=True,
-                ),
-                prev_team_members=Count(
-                    "members",
-                    filter=Q(
-                        members__is_active=True,
-                        members__joined_at__lte=week_ago,
-                    ),
-                    distinct=True,
-                ),
-            )
+            queryset = self._annotate_counts(queryset, week_ago)
         else:
             queryset = queryset.prefetch_related("members", "members__user", "projects")
 
         return queryset
 
+    def _member_workspaces(self):
+        """
+        Workspaces the user is an active member of.
+
+        Filtered by ID rather than through the member join, which would also
+        restrict the member counts to the user's own membership.
+        """
+        scope = AccessScope.for_user(self.request.user)
+        return Workspace.objects.filter(id__in=scope.workspace_ids)
+
+    @staticmethod
+    def _annotate_counts(queryset, week_ago):
+        """Per-workspace counts, now and a week ago, as subqueries."""
+        from apps.projects.models import Project
+
+        projects = Project.objects.filter(workspace=OuterRef("pk"))
+        active_projects = projects.filter(status="active")
+        members = WorkspaceMember.objects.filter(
+            workspace=OuterRef("pk"), is_active=True
+        )
+        return queryset.annotate(
+            active_projects_count=SubqueryCount(active_projects),
+            team_members_count=SubqueryCount(members),
+            total_projects_count=SubqueryCount(projects.filter(is_active=True)),
+            prev_active_projects=SubqueryCount(
+                active_projects.filter(created_at__lte=week_ago)
+            ),
+            prev_team_members=SubqueryCount(members.filter(joined_at__lte=week_ago)),
+        )
+
     @transaction.atomic
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -148,18 +147,17 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
 
     def _get_global_stats(self):
         """Calculate global statistics once for all items in list."""
-        user = self.request.user
         week_ago = timezone.now() - timedelta(days=7)
 
-        workspaces = Workspace.objects.filter(
-            members__user=user, members__is_active=True
-        ).distinct()
-
-        current_count = workspaces.count()
-        previous_count = workspaces.filter(created_at__lte=week_ago).count()
+        counts = self._member_workspaces().aggregate(
+            current=Count("pk"),
+            previous=Count("pk", filter=Q(created_at__lte=week_ago)),
+        )
 
         return {
-            "workspaces_change_pct": self._calc_pct(current_count, previous_count),
+            "workspaces_change_pct": self._calc_pct(
+                counts["current"], counts["previous"]
+            ),
         }
 
     def _calc_pct(self, current, previous):
@@ -224,70 +222,43 @@ class WorkspaceViewSet(viewsets.ModelViewSet):
         description=(
             "Aggregated statistics across all workspaces user has access to. "
             "Includes percentage changes compared to 7 days ago. "
-            "Optimized with single query using annotations."
+            "Computed in one query and cached briefly per user."
         ),
     )
     @action(detail=False, methods=["get"], url_path="dashboard-stats")
     def dashboard_stats(self, request):
-        """Return dashboard statistics optimized with annotations."""
-        user = request.user
-        week_ago = timezone.now() - timedelta(days=7)
+        """Return dashboard statistics, cached briefly per user."""
+        return Response(
+            cached_dashboard_stats(
+                "workspaces", request.user, self._compute_dashboard_stats
+            ),
+            status=status.HTTP_200_OK,
+        )
 
-        workspaces = Workspace.objects.filter(
-            members__user=user, members__is_active=True
-        ).distinct()
+    def _compute_dashboard_stats(self):
+        """Totals over the per-workspace counts, in one query."""
+        week_ago = timezone.now() - timedelta(days=7)
 
-        current_stats = workspaces.aggregate(
-            total_active_projects=Count(
-                "projects",
-                filter=Q(projects__status="active"),
-                distinct=True,
-            ),
-            total_team_members=Count(
-                "members", filter=Q(members__is_active=True), distinct=True
-            ),
-            total_workspaces=Count("id", distinct=True),
+        stats = self._annotate_counts(self._member_workspaces(), week_ago).aggregate(
+            total_active_projects=Sum("active_projects_count"),
+            total_team_members=Sum("team_members_count"),
+            total_workspaces=Count("pk"),
+            prev_projects=Sum("prev_active_projects"),
+            prev_members=Sum("prev_team_members"),
+            prev_workspaces=Count("pk", filter=Q(created_at__lte=week_ago)),
         )
 
-        previous_stats = workspaces.aggregate(
-            prev_projects=Count(
-                "projects",
-                filter=Q(
-                    projects__status="active",
-                    projects__created_at__lte=week_ago,
-                ),
-                distinct=True,
+        return {
+            "active_projects": stats["total_active_projects"] or 0,
+            "active_projects_change_pct": self._calc_pct(
+                stats["total_active_projects"], stats["prev_projects"]
             ),
-            prev_members=Count(
-                "members",
-                filter=Q(
-                    members__is_active=True,
-                    members__joined_at__lte=week_ago,
-                ),
-                distinct=True,
+            "team_members": stats["total_team_members"] or 0,
+            "team_members_change_pct": self._calc_pct(
+                stats["total_team_members"], stats["prev_members"]
             ),
-            prev_workspaces=Count(
-                "id", filter=Q(created_at__lte=week_ago), distinct=True
+            "total_workspaces": stats["total_workspaces"] or 0,
+            "total_workspaces_change_pct": self._calc_pct(
+                stats["total_workspaces"], stats["prev_workspaces"]
             ),
-        )
-
-        return Response(
-            {
-                "active_projects": current_stats["total_active_projects"] or 0,
-                "active_projects_change_pct": self._calc_pct(
-                    current_stats["total_active_projects"],
-                    previous_stats["prev_projects"],
-                ),
-                "team_members": current_stats["total_team_members"] or 0,
-                "team_members_change_pct": self._calc_pct(
-                    current_stats["total_team_members"],
-                    previous_stats["prev_members"],
-                ),
-                "total_workspaces": current_stats["total_workspaces"] or 0,
-                "total_workspaces_change_pct": self._calc_pct(
-                    current_stats["total_workspaces"],
-                    previous_stats["prev_workspaces"],
-                ),
-            },
-            status=status.HTTP_200_OK,
-        )
+        }
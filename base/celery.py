@@ -53,6 +53,26 @@ app.conf.beat_schedule = {
         "task": "apps.ai_assistant.tasks.reindex_stale_issues",
         "schedule": crontab(hour=4, minute=0),
     },
+    # Outbox Dispatch Safety Net (Every minute)
+    "dispatch-outbox-events": {
+        "task": "apps.projects.tasks.dispatch_outbox_events",
+        "schedule": crontab(),
+    },
+    # Outbox Cleanup (Daily, 3:30 AM)
+    "purge-outbox-events": {
+        "task": "apps.projects.tasks.purge_outbox_events",
+        "schedule": crontab(hour=3, minute=30),
+    },
+    # Report Snapshot History (Daily, 00:30 AM)
+    "capture-report-snapshots": {
+        "task": "apps.reporting.tasks.capture_report_snapshots",
+        "schedule": crontab(hour=0, minute=30),
+    },
+    # Log Partition Maintenance (Daily, 00:15 AM)
+    "maintain-log-partitions": {
+        "task": "apps.logging.tasks.maintain_log_partitions",
+        "schedule": crontab(hour=0, minute=15),
+    },
 }
 
 # Celery configuration
@@ -2,7 +2,17 @@
 Custom pagination classes for DRF.
 """
 
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.encoding import force_str
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -24,3 +34,175 @@ class CustomPageNumberPagination(PageNumberPagination):
     )
     max_page_size = 100  # Maximum allowed page size
     page_query_param = "page"  # Page number parameter
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on a unique ordering such as (-created_at, -id).
+
+    Each page filters on the last row of the previous one
+    (created_at < x OR created_at = x AND id < y) instead of using OFFSET, so
+    deep pages cost the same as the first one, and no COUNT(*) is run.
+
+    The ordering comes from the view's keyset_ordering (default
+    ("-created_at", "-id")) and replaces any ?ordering= of the request. All
+    fields must sort in the same direction, and the last one must be unique.
+
+    Query parameters:
+    - cursor: Opaque cursor from the next/previous links
+    - page_size: Number of results per page (default: 20, max: 100)
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    default_ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = tuple(
+            getattr(view, "keyset_ordering", None) or self.default_ordering
+        )
+        self.fields = [field.lstrip("-") for field in self.ordering]
+        descending = self.ordering[0].startswith("-")
+
+        values, backwards = self.decode_cursor(request, queryset.model)
+
+        if backwards:
+            order_by = [field if descending else f"-{field}" for field in self.fields]
+        else:
+            order_by = list(self.ordering)
+        queryset = queryset.order_by(*order_by)
+        if values is not None:
+            queryset = queryset.filter(
+                self._after(values, descending=descending != backwards)
+            )
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if backwards:
+            rows.reverse()
+
+        # Going back from a cursor means there are rows after this page
+        self.has_next = has_more if not backwards else values is not None
+        self.has_previous = values is not None if not backwards else has_more
+        self.first_row = rows[0] if rows else None
+        self.last_row = rows[-1] if rows else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or self.last_row is None:
+            return None
+        return self._link(self.last_row, backwards=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.first_row is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.first_row, backwards=True)
+
+    # ------------------------------------------------------------------
+    # Cursors
+    # ------------------------------------------------------------------
+
+    def _after(self, values, descending):
+        """Rows strictly after the given key in the requested direction."""
+        lookup = "lt" if descending else "gt"
+        condition = Q()
+        for index, field in enumerate(self.fields):
+            equal = {name: values[i] for i, name in enumerate(self.fields[:index])}
+            condition |= Q(**equal, **{f"{field}__{lookup}": values[index]})
+        return condition
+
+    def _link(self, row, backwards):
+        key = [self._encode_value(getattr(row, field)) for field in self.fields]
+        payload = json.dumps({"k": key, "b": int(backwards)}, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    @staticmethod
+    def _encode_value(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return force_str(value) if value is not None else None
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            key = payload["k"]
+            if len(key) != len(self.fields):
+                raise ValueError("cursor does not match ordering")
+            values = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, key)
+            ]
+            return values, bool(payload.get("b"))
+        except Exception:
+            raise NotFound("Invalid cursor")
+
+
+class CursorOptInPagination(CustomPageNumberPagination):
+    """
+    Page numbers by default, keyset pagination on request.
+
+    Clients opt in with ?pagination=cursor (first page) and then follow the
+    next/previous links, which carry ?cursor=. Page-number responses are
+    unchanged for existing clients.
+    """
+
+    mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in request.query_params
+        ):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
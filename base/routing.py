@@ -1,7 +1,9 @@
 from django.urls import path
 
+from apps.notifications.consumers import NotificationConsumer
 from apps.projects.consumers import BoardConsumer
 
 websocket_urlpatterns = [
     path("ws/boards/<uuid:board_id>/", BoardConsumer.as_asgi()),
+    path("ws/notifications/", NotificationConsumer.as_asgi()),
 ]
@@ -2,7 +2,7 @@ import os
 from pathlib import Path
 from urllib.parse import parse_qsl, urlparse
 
-from decouple import config
+from decouple import Csv, config
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -85,6 +85,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "apps.reporting.middleware.ActivityLogMiddleware",  # Track user for ActivityLog
     "apps.admin_tools.middleware.PerformanceMonitoringMiddleware",  # Monitor performance  # noqa: E501
+    "apps.admin_tools.middleware.ProfilingMiddleware",  # Opt-in sampled profiling
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -182,6 +183,9 @@ if USE_S3 and AWS_STORAGE_BUCKET_NAME and AWS_ACCESS_KEY_ID and AWS_SECRET_ACCES
         "default": {
             "BACKEND": "base.storage.MediaStorage",
         },
+        "thumbnails": {
+            "BACKEND": "base.storage.ThumbnailStorage",
+        },
         "staticfiles": {
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
         },
@@ -200,6 +204,13 @@ else:
         "default": {
             "BACKEND": "django.core.files.storage.FileSystemStorage",
         },
+        "thumbnails": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {
+                "location": BASE_DIR / "media" / "thumbnails",
+                "base_url": "/media/thumbnails/",
+            },
+        },
         "staticfiles": {
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
         },
@@ -570,3 +581,174 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000
 
 # Celery Beat Schedule (defined in base/celery.py)
+
+# ==========================================================================
+# DIAGRAM PRE-RENDERING
+# ==========================================================================
+
+# Re-render exportable diagrams in the background when project data changes
+DIAGRAM_PRERENDER_ENABLED = config("DIAGRAM_PRERENDER_ENABLED", default=True, cast=bool)
+# Changes within this window are coalesced into a single render per project
+DIAGRAM_PRERENDER_DEBOUNCE_SECONDS = config(
+    "DIAGRAM_PRERENDER_DEBOUNCE_SECONDS", default=10, cast=int
+)
+DIAGRAM_ARTIFACT_TTL_SECONDS = config(
+    "DIAGRAM_ARTIFACT_TTL_SECONDS", default=86400, cast=int
+)
+
+# Dependency graphs larger than these node counts are collapsed into clusters
+# (status category x layer band) before layout
+DEPENDENCY_GRAPH_MAX_SVG_NODES = config(
+    "DEPENDENCY_GRAPH_MAX_SVG_NODES", default=300, cast=int
+)
+DEPENDENCY_GRAPH_MAX_DATA_NODES = config(
+    "DEPENDENCY_GRAPH_MAX_DATA_NODES", default=1000, cast=int
+)
+# Loaded issue/link rows behind the dependency analysis endpoints; entries are
+# also invalidated by a per-project version stamp when issues or links change
+DEPENDENCY_GRAPH_CACHE_TTL_SECONDS = config(
+    "DEPENDENCY_GRAPH_CACHE_TTL_SECONDS", default=3600, cast=int
+)
+
+# Scheduled report snapshots store a full keyframe every N snapshots per
+# project/report type and JSON deltas against the previous snapshot in between
+REPORT_SNAPSHOT_KEYFRAME_INTERVAL = config(
+    "REPORT_SNAPSHOT_KEYFRAME_INTERVAL", default=10, cast=int
+)
+REPORT_SNAPSHOT_CACHE_TTL_SECONDS = config(
+    "REPORT_SNAPSHOT_CACHE_TTL_SECONDS", default=86400, cast=int
+)
+
+# Transactional outbox for issue/sprint side effects (indexing, notifications,
+# board broadcasts). Events are dispatched after commit and retried with
+# exponential backoff; handlers that already succeeded are not re-run.
+OUTBOX_BATCH_SIZE = config("OUTBOX_BATCH_SIZE", default=100, cast=int)
+OUTBOX_MAX_ATTEMPTS = config("OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
+OUTBOX_LEASE_SECONDS = config("OUTBOX_LEASE_SECONDS", default=300, cast=int)
+OUTBOX_RETENTION_DAYS = config("OUTBOX_RETENTION_DAYS", default=7, cast=int)
+
+# Board WebSocket messages are sequenced per board; the last N messages are
+# buffered so clients that detect a gap can replay them instead of reloading
+BOARD_EVENT_BUFFER_SIZE = config("BOARD_EVENT_BUFFER_SIZE", default=200, cast=int)
+BOARD_EVENT_BUFFER_TTL_SECONDS = config(
+    "BOARD_EVENT_BUFFER_TTL_SECONDS", default=3600, cast=int
+)
+
+# Maximum number of issues per bulk transition/assign/sprint/board move request
+BULK_ISSUE_MAX_SIZE = config("BULK_ISSUE_MAX_SIZE", default=200, cast=int)
+
+# Per-project workflow transition graph (adjacency bitmap + column WIP limits).
+# Shared cache entries are replaced on workflow changes; each process rechecks
+# the version stamp of its in-memory copy at most every LOCAL_TTL seconds
+WORKFLOW_GRAPH_CACHE_TTL_SECONDS = config(
+    "WORKFLOW_GRAPH_CACHE_TTL_SECONDS", default=86400, cast=int
+)
+WORKFLOW_GRAPH_LOCAL_TTL_SECONDS = config(
+    "WORKFLOW_GRAPH_LOCAL_TTL_SECONDS", default=5, cast=int
+)
+
+# Per-user access scope (project, workspace and organization memberships).
+# Entries are replaced on membership changes; the TTL only bounds memory use
+ACCESS_SCOPE_CACHE_TTL_SECONDS = config(
+    "ACCESS_SCOPE_CACHE_TTL_SECONDS", default=3600, cast=int
+)
+
+# Request logging: SystemLog rows are queued in memory and bulk-written by a
+# background thread. Successful GETs are sampled; a full buffer drops records
+REQUEST_LOG_BUFFER_ASYNC = config("REQUEST_LOG_BUFFER_ASYNC", default=True, cast=bool)
+REQUEST_LOG_BUFFER_SIZE = config("REQUEST_LOG_BUFFER_SIZE", default=10000, cast=int)
+REQUEST_LOG_BATCH_SIZE = config("REQUEST_LOG_BATCH_SIZE", default=500, cast=int)
+REQUEST_LOG_FLUSH_INTERVAL_SECONDS = config(
+    "REQUEST_LOG_FLUSH_INTERVAL_SECONDS", default=2.0, cast=float
+)
+REQUEST_LOG_SAMPLE_RATE = config("REQUEST_LOG_SAMPLE_RATE", default=0.1, cast=float)
+
+# Alert rules: active rules are cached briefly and error counts are kept in
+# per-minute cache buckets instead of COUNT queries
+ALERT_RULE_CACHE_SECONDS = config("ALERT_RULE_CACHE_SECONDS", default=60, cast=int)
+ALERT_COUNTER_MAX_WINDOW_MINUTES = config(
+    "ALERT_COUNTER_MAX_WINDOW_MINUTES", default=1440, cast=int
+)
+
+# Log tables (system, error, audit, activity) are partitioned by month on
+# Postgres; partitions past retention are archived to S3 if a bucket is set,
+# then dropped
+LOG_PARTITION_MONTHS_AHEAD = config("LOG_PARTITION_MONTHS_AHEAD", default=3, cast=int)
+SYSTEM_LOG_RETENTION_MONTHS = config("SYSTEM_LOG_RETENTION_MONTHS", default=6, cast=int)
+ERROR_LOG_RETENTION_MONTHS = config("ERROR_LOG_RETENTION_MONTHS", default=12, cast=int)
+AUDIT_LOG_RETENTION_MONTHS = config("AUDIT_LOG_RETENTION_MONTHS", default=24, cast=int)
+ACTIVITY_LOG_RETENTION_MONTHS = config(
+    "ACTIVITY_LOG_RETENTION_MONTHS", default=24, cast=int
+)
+LOG_ARCHIVE_S3_BUCKET = config("LOG_ARCHIVE_S3_BUCKET", default="")
+LOG_ARCHIVE_S3_PREFIX = config("LOG_ARCHIVE_S3_PREFIX", default="log-archive")
+
+# Request performance monitoring (PerformanceMonitoringMiddleware). Metrics are
+# served at /metrics/ to scrapers sending "Authorization: Bearer <token>"
+SLOW_REQUEST_SECONDS = config("SLOW_REQUEST_SECONDS", default=2.0, cast=float)
+HIGH_DB_QUERY_COUNT = config("HIGH_DB_QUERY_COUNT", default=50, cast=int)
+N_PLUS_ONE_THRESHOLD = config("N_PLUS_ONE_THRESHOLD", default=10, cast=int)
+METRICS_AUTH_TOKEN = config("METRICS_AUTH_TOKEN", default="")
+
+# Opt-in profiling (apps.admin_tools.profiling). PROFILE_ENDPOINTS takes
+# "ViewSet.action" names or URL names, PROFILE_TASKS Celery task names; staff
+# can force a profile with the "X-Profile: 1" header
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=False, cast=bool)
+PROFILER = config("PROFILER", default="sampling")  # sampling | cprofile
+PROFILE_ENDPOINTS = config("PROFILE_ENDPOINTS", default="", cast=Csv())
+PROFILE_TASKS = config("PROFILE_TASKS", default="", cast=Csv())
+PROFILE_SAMPLE_RATE = config("PROFILE_SAMPLE_RATE", default=0.01, cast=float)
+PROFILE_SAMPLE_INTERVAL_MS = config("PROFILE_SAMPLE_INTERVAL_MS", default=5, cast=int)
+PROFILE_KEEP_TOP_N = config("PROFILE_KEEP_TOP_N", default=10, cast=int)
+PROFILE_OUTPUT_DIR = config(
+    "PROFILE_OUTPUT_DIR", default=str(BASE_DIR / "logs" / "profiles")
+)
+
+# Notification delivery: email and Slack are sent by Celery in batches of
+# NOTIFICATION_DELIVERY_BATCH_SIZE; rate limits are per worker, in batches
+NOTIFICATION_DELIVERY_BATCH_SIZE = config(
+    "NOTIFICATION_DELIVERY_BATCH_SIZE", default=100, cast=int
+)
+NOTIFICATION_EMAIL_RATE_LIMIT = config("NOTIFICATION_EMAIL_RATE_LIMIT", default="30/m")
+NOTIFICATION_SLACK_RATE_LIMIT = config("NOTIFICATION_SLACK_RATE_LIMIT", default="30/m")
+NOTIFICATION_SLACK_MAX_PER_SECOND = config(
+    "NOTIFICATION_SLACK_MAX_PER_SECOND", default=1.0, cast=float
+)
+# Recipients per digest email task
+NOTIFICATION_DIGEST_CHUNK_SIZE = config(
+    "NOTIFICATION_DIGEST_CHUNK_SIZE", default=200, cast=int
+)
+
+# Cached per-user unread notification count (kept current on create/read);
+# the TTL bounds drift from writes that bypass the counter
+NOTIFICATION_UNREAD_COUNT_TTL_SECONDS = config(
+    "NOTIFICATION_UNREAD_COUNT_TTL_SECONDS", default=300, cast=int
+)
+
+# Issue attachments are uploaded straight to S3 with presigned URLs; files
+# over ATTACHMENT_MULTIPART_THRESHOLD use multipart uploads in parts of
+# ATTACHMENT_UPLOAD_PART_SIZE (S3 requires at least 5 MB per part)
+ATTACHMENT_MAX_SIZE = config("ATTACHMENT_MAX_SIZE", default=50 * 1024 * 1024, cast=int)
+ATTACHMENT_MULTIPART_THRESHOLD = config(
+    "ATTACHMENT_MULTIPART_THRESHOLD", default=16 * 1024 * 1024, cast=int
+)
+ATTACHMENT_UPLOAD_PART_SIZE = config(
+    "ATTACHMENT_UPLOAD_PART_SIZE", default=8 * 1024 * 1024, cast=int
+)
+ATTACHMENT_UPLOAD_URL_EXPIRY_SECONDS = config(
+    "ATTACHMENT_UPLOAD_URL_EXPIRY_SECONDS", default=3600, cast=int
+)
+# WebP thumbnails of image attachments (longest side in pixels), generated by
+# Celery; served with signed URLs, from ATTACHMENT_THUMBNAIL_DOMAIN (a
+# CloudFront distribution, signed with AWS_CLOUDFRONT_KEY_ID/AWS_CLOUDFRONT_KEY)
+# when set. S3 signatures are valid for at most 7 days
+ATTACHMENT_THUMBNAIL_SIZE = config("ATTACHMENT_THUMBNAIL_SIZE", default=400, cast=int)
+ATTACHMENT_THUMBNAIL_DOMAIN = config("ATTACHMENT_THUMBNAIL_DOMAIN", default="")
+ATTACHMENT_THUMBNAIL_URL_EXPIRY_SECONDS = config(
+    "ATTACHMENT_THUMBNAIL_URL_EXPIRY_SECONDS", default=604800, cast=int
+)
+
+# Per-user dashboard statistics (organizations/workspaces dashboard-stats)
+DASHBOARD_STATS_CACHE_SECONDS = config(
+    "DASHBOARD_STATS_CACHE_SECONDS", default=60, cast=int
+)
@@ -25,3 +25,6 @@ CELERY_TASK_EAGER_PROPAGATES = True
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
+
+# Write request logs when they are queued instead of from a background thread
+REQUEST_LOG_BUFFER_ASYNC = False
@@ -1,3 +1,3 @@
-from .s3_storage import MediaStorage, StaticStorage
+from .s3_storage import MediaStorage, StaticStorage, ThumbnailStorage
 
-__all__ = ["MediaStorage", "StaticStorage"]
+__all__ = ["MediaStorage", "StaticStorage", "ThumbnailStorage"]
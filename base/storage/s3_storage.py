@@ -1,3 +1,6 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
 from storages.backends.s3boto3 import S3Boto3Storage
 
 
@@ -12,3 +15,39 @@ class MediaStorage(S3Boto3Storage):
     default_acl = None
     file_overwrite = False
     querystring_auth = True
+
+
+class ThumbnailStorage(S3Boto3Storage):
+    """
+    Generated attachment thumbnails.
+
+    Keys never change once written, so each signed URL can be cached privately
+    by the browser for as long as it is valid. URLs are signed for
+    ATTACHMENT_THUMBNAIL_URL_EXPIRY_SECONDS, by S3 or, when served from
+    ATTACHMENT_THUMBNAIL_DOMAIN, by CloudFront (AWS_CLOUDFRONT_KEY_ID and
+    AWS_CLOUDFRONT_KEY are then required).
+    """
+
+    location = "thumbnails"
+    default_acl = None
+    file_overwrite = True
+    querystring_auth = True
+
+    def __init__(self, **settings_overrides):
+        expiry = getattr(settings, "ATTACHMENT_THUMBNAIL_URL_EXPIRY_SECONDS", 604800)
+        settings_overrides.setdefault("querystring_expire", expiry)
+        settings_overrides.setdefault(
+            "object_parameters",
+            {"CacheControl": f"private, max-age={expiry}, immutable"},
+        )
+        domain = getattr(settings, "ATTACHMENT_THUMBNAIL_DOMAIN", "")
+        if domain:
+            settings_overrides.setdefault("custom_domain", domain)
+        super().__init__(**settings_overrides)
+
+        # django-storages serves custom domain URLs unsigned without a signer
+        if self.custom_domain and not self.cloudfront_signer:
+            raise ImproperlyConfigured(
+                "Thumbnails served from a custom domain need AWS_CLOUDFRONT_KEY_ID "
+                "and AWS_CLOUDFRONT_KEY to sign their URLs"
+            )
@@ -4,6 +4,8 @@ from django.contrib import admin
 from django.contrib.auth import views as auth_views
 from django.urls import include, path
 
+from apps.admin_tools.views import metrics_view
+
 from .spectacular_views import get_spectacular_urls
 
 urlpatterns = get_spectacular_urls() + [
@@ -21,6 +23,7 @@ urlpatterns = get_spectacular_urls() + [
     ),
     path("admin/logout/", auth_views.LogoutView.as_view(next_page="/"), name="logout"),
     path("admin/", admin.site.urls),
+    path("metrics/", metrics_view, name="metrics"),
     path("api/v1/auth/", include("apps.authentication.urls")),
     path("api/v1/orgs/", include("apps.organizations.urls")),
     path("api/v1/workspaces/", include("apps.workspaces.urls")),
@@ -0,0 +1,223 @@
+"""
+Per-user access scope: the projects, workspaces and organizations a user
+belongs to, with the role in each.
+
+Permission classes, queryset filters and WebSocket consumers used to run one
+to three EXISTS queries against the membership tables for every object they
+checked. AccessScope loads all active memberships of a user in one UNION
+query and is shared by all of them.
+
+Scopes are cached in the shared cache together with the version stamp they
+were built under. Saving or deleting a ProjectTeamMember, WorkspaceMember or
+OrganizationMembership replaces the user's stamp (see
+apps.authentication.signals). Within a request the scope is kept on the user
+object, so repeated checks cost nothing.
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, F, Q, Value
+
+logger = logging.getLogger(__name__)
+
+# Bumped by every invalidation in this process, so scopes kept on user
+# objects are dropped after a membership change in the same request
+_generation = 0
+
+
+class AccessScope:
+    """Active memberships of one user, keyed by object ID."""
+
+    def __init__(
+        self,
+        user_id,
+        version: int,
+        projects: Dict[str, str],
+        workspaces: Dict[str, str],
+        organizations: Dict[str, str],
+    ):
+        self.user_id = user_id
+        self.version = version
+        # Object ID -> role
+        self.projects = projects
+        self.workspaces = workspaces
+        self.organizations = organizations
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def project_role(self, project_id) -> Optional[str]:
+        return self.projects.get(str(project_id))
+
+    def workspace_role(self, workspace_id) -> Optional[str]:
+        return self.workspaces.get(str(workspace_id))
+
+    def organization_role(self, organization_id) -> Optional[str]:
+        return self.organizations.get(str(organization_id))
+
+    def is_project_member(self, project_id) -> bool:
+        return str(project_id) in self.projects
+
+    def is_workspace_member(self, workspace_id) -> bool:
+        return str(workspace_id) in self.workspaces
+
+    def is_organization_member(self, organization_id) -> bool:
+        return str(organization_id) in self.organizations
+
+    def can_access_project(self, project) -> bool:
+        """Project team member, or member of the project's workspace."""
+        return self.is_project_member(project.pk) or self.is_workspace_member(
+            project.workspace_id
+        )
+
+    @property
+    def project_ids(self):
+        return list(self.projects)
+
+    @property
+    def workspace_ids(self):
+        return list(self.workspaces)
+
+    @property
+    def organization_ids(self):
+        return list(self.organizations)
+
+    def project_filter(self, project_field: str = "project") -> Q:
+        """
+        Filter for objects whose project the user can access.
+
+        project_field is the path from the filtered model to its project, or
+        "" when filtering projects themselves. Plain IN lists on the object's
+        own columns: no membership join, so no duplicate rows or DISTINCT.
+        """
+        prefix = f"{project_field}__" if project_field else ""
+        project_ref = f"{project_field}_id" if project_field else "pk"
+        return Q(**{f"{project_ref}__in": self.project_ids}) | Q(
+            **{f"{prefix}workspace_id__in": self.workspace_ids}
+        )
+
+    # ------------------------------------------------------------------
+    # Caching
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def for_user(cls, user) -> "AccessScope":
+        """Scope of a user, from the user object or the cache when current."""
+        if not getattr(user, "is_authenticated", False):
+            return cls(None, 0, {}, {}, {})
+
+        scope = getattr(user, "_access_scope", None)
+        if scope is not None and user._access_scope_generation == _generation:
+            return scope
+
+        version_key, scope_key = cls._version_key(user.pk), cls._scope_key(user.pk)
+        cached = cache.get_many([version_key, scope_key])
+        version = cached.get(version_key)
+        if version is None:
+            cache.add(version_key, time.time_ns(), timeout=None)
+            version = cache.get(version_key)
+
+        data = cached.get(scope_key)
+        if data is not None and data.get("version") == version:
+            scope = cls.from_dict(user.pk, data)
+        else:
+            # The version was read before loading, so a membership change
+            # during the build leaves this copy stale and it is rebuilt
+            scope = cls.build(user.pk, version)
+            cache.set(
+                scope_key,
+                scope.to_dict(),
+                getattr(settings, "ACCESS_SCOPE_CACHE_TTL_SECONDS", 3600),
+            )
+
+        user._access_scope = scope
+        user._access_scope_generation = _generation
+        return scope
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """Drop cached scopes of a user in every process."""
+        global _generation
+        _generation += 1
+        # A new stamp rather than an increment, as for WorkflowGraph
+        cache.set(cls._version_key(user_id), time.time_ns(), timeout=None)
+
+    @staticmethod
+    def _version_key(user_id) -> str:
+        return f"access_scope:{user_id}:version"
+
+    @staticmethod
+    def _scope_key(user_id) -> str:
+        return f"access_scope:{user_id}"
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, user_id, version: int = 0) -> "AccessScope":
+        """Load a user's active memberships (one query)."""
+        from apps.organizations.models import OrganizationMembership
+        from apps.projects.models import ProjectTeamMember
+        from apps.workspaces.models import WorkspaceMember
+
+        def memberships(model, kind, field):
+            return (
+                model.objects.filter(user_id=user_id, is_active=True)
+                .annotate(
+                    scope_kind=Value(kind, output_field=CharField()),
+                    scope_id=F(field),
+                    scope_role=F("role"),
+                )
+                .values_list("scope_kind", "scope_id", "scope_role")
+                .order_by()
+            )
+
+        rows = memberships(ProjectTeamMember, "project", "project_id").union(
+            memberships(WorkspaceMember, "workspace", "workspace_id"),
+            memberships(OrganizationMembership, "organization", "organization_id"),
+            all=True,
+        )
+
+        roles: Dict[str, Dict[str, str]] = {
+            "project": {},
+            "workspace": {},
+            "organization": {},
+        }
+        for kind, object_id, role in rows:
+            roles[kind][str(object_id)] = role
+
+        logger.debug(
+            f"[ACCESS] Built scope for user {user_id}: "
+            f"{len(roles['project'])} projects, {len(roles['workspace'])} workspaces"
+        )
+        return cls(
+            user_id,
+            version,
+            roles["project"],
+            roles["workspace"],
+            roles["organization"],
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": self.version,
+            "projects": self.projects,
+            "workspaces": self.workspaces,
+            "organizations": self.organizations,
+        }
+
+    @classmethod
+    def from_dict(cls, user_id, data: Dict) -> "AccessScope":
+        return cls(
+            user_id,
+            data["version"],
+            data["projects"],
+            data["workspaces"],
+            data["organizations"],
+        )
@@ -0,0 +1,39 @@
+"""
+Helpers for per-object list counts and per-user dashboard statistics.
+
+Counts over related tables are correlated COUNT subqueries rather than joins:
+joining members, workspaces and projects to the same parent multiplies its
+rows and needs COUNT(DISTINCT) over the product. Dashboard totals are one
+aggregate over those per-object counts, cached per user for
+DASHBOARD_STATS_CACHE_SECONDS and keyed by the user's access scope version,
+so joining or leaving an organization or workspace shows up immediately.
+"""
+
+from typing import Callable, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import IntegerField, Subquery
+
+from base.utils.access_scope import AccessScope
+
+
+class SubqueryCount(Subquery):
+    """Number of rows of a (usually OuterRef-correlated) queryset."""
+
+    template = "(SELECT COUNT(*) FROM (%(subquery)s) _count)"
+    output_field = IntegerField()
+
+    def __init__(self, queryset, **extra):
+        super().__init__(queryset.order_by().values("pk"), **extra)
+
+
+def cached_dashboard_stats(name: str, user, compute: Callable[[], Dict]) -> Dict:
+    """Stats from compute(), cached per user and access scope version."""
+    version = AccessScope.for_user(user).version
+    key = f"dashboard_stats:{name}:{user.pk}:{version}"
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute()
+        cache.set(key, stats, getattr(settings, "DASHBOARD_STATS_CACHE_SECONDS", 60))
+    return stats
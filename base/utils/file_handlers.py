@@ -11,16 +11,19 @@ from PIL import Image
 def resize_image(
     image_file, max_width: int = 800, max_height: int = 600, quality: int = 85
 ) -> ContentFile:
+    """
+    Fit an image within max_width x max_height and encode it as WebP.
+
+    JPEGs are decoded at a reduced scale (draft) and thumbnail() resizes in
+    place, so memory is bounded by the target size rather than the source.
+    """
     image = Image.open(image_file)
+    image.draft("RGB", (max_width, max_height))
 
     if image.mode in ("RGBA", "LA", "P"):
         image = image.convert("RGB")
 
-    ratio = min(max_width / image.width, max_height / image.height)
-    if ratio < 1:
-        new_width = int(image.width * ratio)
-        new_height = int(image.height * ratio)
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
 
     output = io.BytesIO()
     image.save(output, format="WebP", quality=quality, optimize=True)